@@ -0,0 +1,16 @@
+namespace Nexora.Management.API.Common;
+
+public class AnalyticsRollupSettings
+{
+    public const string SectionName = "AnalyticsRollups";
+
+    /// <summary>
+    /// How often rollups are recomputed from source tables (corrects overdue drift)
+    /// </summary>
+    public int RebuildIntervalMinutes { get; set; } = 15;
+
+    /// <summary>
+    /// Whether rollups are rebuilt once when the host starts
+    /// </summary>
+    public bool RebuildOnStartup { get; set; } = true;
+}
@@ -0,0 +1,31 @@
+namespace Nexora.Management.API.Common;
+
+public class PresenceSettings
+{
+    public const string SectionName = "Presence";
+
+    /// <summary>
+    /// How often pending presence changes are written to the database
+    /// </summary>
+    public int FlushIntervalSeconds { get; set; } = 5;
+
+    /// <summary>
+    /// Maximum number of presence rows written per SaveChanges
+    /// </summary>
+    public int FlushBatchSize { get; set; } = 500;
+
+    /// <summary>
+    /// Heartbeats only persist LastSeen once it has advanced by at least this much
+    /// </summary>
+    public int LastSeenWriteIntervalSeconds { get; set; } = 60;
+
+    /// <summary>
+    /// How often the sweeper runs CleanupStaleConnectionsAsync
+    /// </summary>
+    public int CleanupIntervalSeconds { get; set; } = 60;
+
+    /// <summary>
+    /// Connections without a heartbeat for this long are considered gone
+    /// </summary>
+    public int StaleConnectionMinutes { get; set; } = 5;
+}
@@ -0,0 +1,21 @@
+namespace Nexora.Management.API.Common;
+
+public class TaskBroadcastSettings
+{
+    public const string SectionName = "TaskBroadcast";
+
+    /// <summary>
+    /// Maximum number of pending broadcast events; the oldest are dropped beyond this
+    /// </summary>
+    public int ChannelCapacity { get; set; } = 10000;
+
+    /// <summary>
+    /// How long the dispatcher waits after the first pending event so repeated changes can merge
+    /// </summary>
+    public int CoalesceWindowMilliseconds { get; set; } = 100;
+
+    /// <summary>
+    /// Maximum number of events drained from the channel per dispatch
+    /// </summary>
+    public int MaxBatchSize { get; set; } = 500;
+}
@@ -0,0 +1,17 @@
+namespace Nexora.Management.API.Common;
+
+public class TaskViewSyncSettings
+{
+    public const string SectionName = "TaskViewSync";
+
+    /// <summary>
+    /// How long removal tombstones are kept; clients that have not synced for
+    /// longer than this receive a full snapshot
+    /// </summary>
+    public int TombstoneRetentionDays { get; set; } = 30;
+
+    /// <summary>
+    /// How often expired tombstones are pruned
+    /// </summary>
+    public int PruneIntervalMinutes { get; set; } = 60;
+}
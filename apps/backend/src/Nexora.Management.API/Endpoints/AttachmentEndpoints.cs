@@ -1,14 +1,21 @@
 using Microsoft.AspNetCore.Mvc;
-using Microsoft.AspNetCore.SignalR;
 using Microsoft.EntityFrameworkCore;
 using MediatR;
+using Microsoft.Net.Http.Headers;
 using Nexora.Management.API.Extensions;
+using Nexora.Management.Application.Attachments;
+using Nexora.Management.Application.Attachments.Commands.AppendAttachmentUpload;
+using Nexora.Management.Application.Attachments.Commands.BeginAttachmentUpload;
+using Nexora.Management.Application.Attachments.Commands.CompleteAttachmentUpload;
 using Nexora.Management.Application.Attachments.Commands.DeleteAttachment;
+using Nexora.Management.Application.Attachments.DTOs;
 using Nexora.Management.Infrastructure.Interfaces;
 using Nexora.Management.Application.Attachments.Commands.UploadAttachment;
+using Nexora.Management.Application.Attachments.Queries.GetAttachmentUpload;
 using Nexora.Management.Application.Attachments.Queries.GetAttachments;
 using Nexora.Management.Infrastructure.Services;
 using Nexora.Management.API.Hubs;
+using Nexora.Management.API.Services;
 using Nexora.Management.Application.DTOs.SignalR;
 using System.Security.Claims;
 
@@ -30,15 +37,35 @@ public static class AttachmentEndpoints
             ".zip", ".rar", ".7z"
         };
 
-        // CRITICAL: Maximum file size (100MB)
-        const long maxFileSize = 100 * 1024 * 1024;
+        // Broadcast AttachmentUploaded to task's project group
+        static async Task PublishUploadedAsync(AttachmentDto attachment, ISender sender, ITaskBroadcaster broadcaster, HttpContext httpContext)
+        {
+            var currentUserId = httpContext.User.FindFirst(ClaimTypes.NameIdentifier)?.Value;
+            var message = new AttachmentUpdatedMessage
+            {
+                AttachmentId = attachment.Id,
+                TaskId = attachment.TaskId,
+                Type = "uploaded",
+                UpdatedBy = Guid.Parse(currentUserId ?? Guid.Empty.ToString()),
+                Timestamp = DateTime.UtcNow,
+                Data = attachment
+            };
+
+            // Get task's tasklist ID from database
+            var task = await sender.Send(new Nexora.Management.Application.Tasks.Queries.GetTaskByIdQuery(attachment.TaskId));
+            if (task.IsSuccess)
+            {
+                broadcaster.Publish(task.Value.TaskListId, TaskHubEvents.AttachmentUploaded, message.AttachmentId, message);
+            }
+        }
 
         // Upload attachment
         group.MapPost("/upload/{taskId:guid}", async (
             Guid taskId,
             IFormFile file,
             ISender sender,
-            IHubContext<TaskHub> taskHub,
+            ITaskBroadcaster broadcaster,
+            AttachmentSettings settings,
             HttpContext httpContext,
             CancellationToken ct) =>
         {
@@ -47,10 +74,10 @@ public static class AttachmentEndpoints
                 return Results.BadRequest("No file uploaded");
             }
 
-            // CRITICAL FIX: Validate file size
-            if (file.Length > maxFileSize)
+            // CRITICAL FIX: Validate file size (enforced again on the bytes actually stored)
+            if (file.Length > settings.MaxFileSizeBytes)
             {
-                return Results.BadRequest($"File size exceeds maximum allowed size of {maxFileSize / (1024 * 1024)}MB");
+                return Results.BadRequest($"File size exceeds maximum allowed size of {settings.MaxFileSizeBytes / (1024 * 1024)}MB");
             }
 
             // CRITICAL FIX: Validate file extension
@@ -63,7 +90,6 @@ public static class AttachmentEndpoints
             var command = new UploadAttachmentCommand(
                 taskId,
                 file.FileName,
-                file.Length,
                 file.ContentType,
                 file.OpenReadStream()
             );
@@ -74,33 +100,96 @@ public static class AttachmentEndpoints
                 return Results.BadRequest(result.Error);
             }
 
-            // Broadcast AttachmentUploaded to task's project group
-            var currentUserId = httpContext.User.FindFirst(ClaimTypes.NameIdentifier)?.Value;
-            var message = new AttachmentUpdatedMessage
+            await PublishUploadedAsync(result.Value!, sender, broadcaster, httpContext);
+
+            return Results.Ok(result.Value);
+        })
+        .WithName("UploadAttachment")
+        .WithOpenApi()
+        .RequirePermission("tasks", "edit")
+        .DisableAntiforgery();
+
+        // Start a chunked, resumable upload
+        group.MapPost("/uploads", async (
+            [FromBody] BeginAttachmentUploadCommand command,
+            ISender sender,
+            CancellationToken ct) =>
+        {
+            var fileExtension = Path.GetExtension(command.FileName);
+            if (!allowedExtensions.Contains(fileExtension))
             {
-                AttachmentId = result.Value.Id,
-                TaskId = result.Value.TaskId,
-                Type = "uploaded",
-                UpdatedBy = Guid.Parse(currentUserId ?? Guid.Empty.ToString()),
-                Timestamp = DateTime.UtcNow,
-                Data = result.Value
-            };
+                return Results.BadRequest($"File type '{fileExtension}' is not allowed");
+            }
 
-            // Get task's tasklist ID from database
-            var task = await sender.Send(new Nexora.Management.Application.Tasks.Queries.GetTaskByIdQuery(result.Value.TaskId));
-            if (task.IsSuccess)
+            var result = await sender.Send(command, ct);
+            return result.IsSuccess ? Results.Ok(result.Value) : Results.BadRequest(result.Error);
+        })
+        .WithName("BeginAttachmentUpload")
+        .WithOpenApi()
+        .RequirePermission("tasks", "edit");
+
+        // Get the offset a chunked upload resumes from
+        group.MapGet("/uploads/{uploadId:guid}", async (Guid uploadId, ISender sender, CancellationToken ct) =>
+        {
+            var result = await sender.Send(new GetAttachmentUploadQuery(uploadId), ct);
+            return result.IsSuccess ? Results.Ok(result.Value) : Results.NotFound(result.Error);
+        })
+        .WithName("GetAttachmentUpload")
+        .WithOpenApi()
+        .RequirePermission("tasks", "edit");
+
+        // Append a chunk: the raw request body, positioned by "Content-Range: bytes start-end/total"
+        // or ?offset=. A chunk at the wrong offset gets 409 with the offset to resume from.
+        group.MapPut("/uploads/{uploadId:guid}", async (
+            Guid uploadId,
+            long? offset,
+            HttpRequest request,
+            ISender sender,
+            CancellationToken ct) =>
+        {
+            var start = request.GetTypedHeaders().ContentRange?.From ?? offset;
+            if (start == null)
             {
-                await taskHub.Clients.Group($"tasklist_{task.Value.TaskListId}")
-                    .SendAsync("AttachmentUploaded", message);
+                return Results.BadRequest("Chunk offset is required");
             }
 
-            return Results.Ok(result.Value);
+            var result = await sender.Send(new AppendAttachmentUploadCommand(uploadId, start.Value, request.Body), ct);
+            if (result.IsFailure)
+            {
+                return Results.BadRequest(result.Error);
+            }
+
+            return result.Value!.Accepted
+                ? Results.Ok(result.Value.Upload)
+                : Results.Conflict(result.Value.Upload);
         })
-        .WithName("UploadAttachment")
+        .WithName("AppendAttachmentUpload")
         .WithOpenApi()
         .RequirePermission("tasks", "edit")
         .DisableAntiforgery();
 
+        // Finish a chunked upload and create the attachment
+        group.MapPost("/uploads/{uploadId:guid}/complete", async (
+            Guid uploadId,
+            ISender sender,
+            ITaskBroadcaster broadcaster,
+            HttpContext httpContext,
+            CancellationToken ct) =>
+        {
+            var result = await sender.Send(new CompleteAttachmentUploadCommand(uploadId), ct);
+            if (result.IsFailure)
+            {
+                return Results.BadRequest(result.Error);
+            }
+
+            await PublishUploadedAsync(result.Value!, sender, broadcaster, httpContext);
+
+            return Results.Ok(result.Value);
+        })
+        .WithName("CompleteAttachmentUpload")
+        .WithOpenApi()
+        .RequirePermission("tasks", "edit");
+
         // Get attachments for task
         group.MapGet("/task/{taskId:guid}", async (Guid taskId, ISender sender) =>
         {
@@ -120,6 +209,7 @@ public static class AttachmentEndpoints
             CancellationToken ct) =>
         {
             var attachment = await db.Attachments
+                .AsNoTracking()
                 .FirstOrDefaultAsync(a => a.Id == attachmentId, ct);
 
             if (attachment == null)
@@ -127,9 +217,25 @@ public static class AttachmentEndpoints
                 return Results.NotFound("Attachment not found");
             }
 
-            var (fileStream, contentType) = await fileStorageService.GetFileAsync(attachment.FilePath, ct);
+            var file = fileStorageService.GetFileInfo(attachment.FilePath, attachment.FileName);
+            if (file == null)
+            {
+                return Results.NotFound("File not found");
+            }
 
-            return Results.File(fileStream, contentType, attachment.FileName);
+            // Served from disk by path so the server can send the file directly and answer
+            // Range and If-None-Match / If-Range requests; content-addressed blobs never change
+            var entityTag = attachment.ContentHash != null
+                ? new EntityTagHeaderValue($"\"{attachment.ContentHash}\"")
+                : null;
+
+            return Results.File(
+                file.PhysicalPath,
+                file.ContentType,
+                attachment.FileName,
+                file.LastModified,
+                entityTag,
+                enableRangeProcessing: true);
         })
         .WithName("DownloadAttachment")
         .WithOpenApi()
@@ -139,7 +245,7 @@ public static class AttachmentEndpoints
         group.MapDelete("/{attachmentId:guid}", async (
             Guid attachmentId,
             ISender sender,
-            IHubContext<TaskHub> taskHub,
+            ITaskBroadcaster broadcaster,
             HttpContext httpContext) =>
         {
             var command = new DeleteAttachmentCommand(attachmentId);
@@ -167,8 +273,7 @@ public static class AttachmentEndpoints
                 var task = await sender.Send(new Nexora.Management.Application.Tasks.Queries.GetTaskByIdQuery(result.Value.Value));
                 if (task.IsSuccess)
                 {
-                    await taskHub.Clients.Group($"tasklist_{task.Value.TaskListId}")
-                        .SendAsync("AttachmentDeleted", message);
+                    broadcaster.Publish(task.Value.TaskListId, TaskHubEvents.AttachmentDeleted, message.AttachmentId, message);
                 }
             }
 
@@ -1,5 +1,4 @@
 using Microsoft.AspNetCore.Mvc;
-using Microsoft.AspNetCore.SignalR;
 using MediatR;
 using Nexora.Management.Application.Authorization;
 using Nexora.Management.API.Extensions;
@@ -9,6 +8,7 @@ using Nexora.Management.Application.Comments.Commands.UpdateComment;
 using Nexora.Management.Application.Comments.Queries.GetCommentReplies;
 using Nexora.Management.Application.Comments.Queries.GetComments;
 using Nexora.Management.API.Hubs;
+using Nexora.Management.API.Services;
 using Nexora.Management.Application.DTOs.SignalR;
 using System.Security.Claims;
 
@@ -25,7 +25,7 @@ public static class CommentEndpoints
         group.MapPost("", async (
             [FromBody] AddCommentCommand command,
             ISender sender,
-            IHubContext<TaskHub> taskHub,
+            ITaskBroadcaster broadcaster,
             HttpContext httpContext) =>
         {
             var result = await sender.Send(command);
@@ -50,8 +50,7 @@ public static class CommentEndpoints
             var task = await sender.Send(new Nexora.Management.Application.Tasks.Queries.GetTaskByIdQuery(result.Value.TaskId));
             if (task.IsSuccess)
             {
-                await taskHub.Clients.Group($"tasklist_{task.Value.TaskListId}")
-                    .SendAsync("CommentAdded", message);
+                broadcaster.Publish(task.Value.TaskListId, TaskHubEvents.CommentAdded, message.CommentId, message);
             }
 
             return Results.Ok(result.Value);
@@ -87,7 +86,7 @@ public static class CommentEndpoints
             Guid commentId,
             [FromBody] UpdateCommentCommand command,
             ISender sender,
-            IHubContext<TaskHub> taskHub,
+            ITaskBroadcaster broadcaster,
             HttpContext httpContext) =>
         {
             if (commentId != command.Id)
@@ -117,8 +116,7 @@ public static class CommentEndpoints
             var task = await sender.Send(new Nexora.Management.Application.Tasks.Queries.GetTaskByIdQuery(result.Value.TaskId));
             if (task.IsSuccess)
             {
-                await taskHub.Clients.Group($"tasklist_{task.Value.TaskListId}")
-                    .SendAsync("CommentUpdated", message);
+                broadcaster.Publish(task.Value.TaskListId, TaskHubEvents.CommentUpdated, message.CommentId, message);
             }
 
             return Results.Ok(result.Value);
@@ -131,7 +129,7 @@ public static class CommentEndpoints
         group.MapDelete("/{commentId:guid}", async (
             Guid commentId,
             ISender sender,
-            IHubContext<TaskHub> taskHub,
+            ITaskBroadcaster broadcaster,
             HttpContext httpContext) =>
         {
             var command = new DeleteCommentCommand(commentId);
@@ -159,8 +157,7 @@ public static class CommentEndpoints
                 var task = await sender.Send(new Nexora.Management.Application.Tasks.Queries.GetTaskByIdQuery(result.Value.Value));
                 if (task.IsSuccess)
                 {
-                    await taskHub.Clients.Group($"tasklist_{task.Value.TaskListId}")
-                        .SendAsync("CommentDeleted", message);
+                    broadcaster.Publish(task.Value.TaskListId, TaskHubEvents.CommentDeleted, message.CommentId, message);
                 }
             }
 
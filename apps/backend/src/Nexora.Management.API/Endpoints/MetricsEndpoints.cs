@@ -0,0 +1,144 @@
+using System.Globalization;
+using System.Net;
+using System.Text;
+using Nexora.Management.Application.Authorization;
+using Nexora.Management.Application.Diagnostics;
+using Nexora.Management.API.Services;
+
+namespace Nexora.Management.API.Endpoints;
+
+public static class MetricsEndpoints
+{
+    private const string PrometheusContentType = "text/plain; version=0.0.4; charset=utf-8";
+
+    public static void MapMetricsEndpoints(this IEndpointRouteBuilder app)
+    {
+        // Request, permission cache and broadcast counters in Prometheus text format.
+        // Unauthenticated, so only served to loopback clients unless explicitly allowed.
+        app.MapGet("/metrics", (
+            HttpContext httpContext,
+            RequestMetricsSettings settings,
+            RequestMetricsRegistry registry,
+            IPermissionCache permissionCache,
+            ITaskBroadcaster broadcaster) =>
+        {
+            var remoteAddress = httpContext.Connection.RemoteIpAddress;
+            if (!settings.AllowRemoteMetrics && (remoteAddress == null || !IPAddress.IsLoopback(remoteAddress)))
+            {
+                return Results.NotFound();
+            }
+
+            var text = new StringBuilder();
+            WriteRequestMetrics(text, registry.GetSnapshot());
+            WritePermissionCacheMetrics(text, permissionCache.GetStatistics());
+            WriteBroadcastMetrics(text, broadcaster.GetMetrics());
+
+            return Results.Text(text.ToString(), PrometheusContentType);
+        })
+        .WithName("GetMetrics")
+        .ExcludeFromDescription();
+    }
+
+    private static void WriteRequestMetrics(StringBuilder text, IReadOnlyList<RequestMetricsSnapshot> requests)
+    {
+        WriteHistogram(text, "nexora_request_duration_milliseconds", "Time spent handling a MediatR request",
+            requests, r => r.DurationMilliseconds);
+        WriteHistogram(text, "nexora_request_queries", "Database commands executed per MediatR request",
+            requests, r => r.Queries);
+        WriteHistogram(text, "nexora_request_rows_read", "Database rows read per MediatR request",
+            requests, r => r.RowsRead);
+
+        WriteHeader(text, "nexora_request_failures_total", "MediatR requests whose handler threw", "counter");
+        foreach (var request in requests)
+        {
+            WriteSample(text, "nexora_request_failures_total", RequestLabel(request), request.Failures);
+        }
+
+        WriteHeader(text, "nexora_request_slow_total", "MediatR requests over the query budget or latency threshold", "counter");
+        foreach (var request in requests)
+        {
+            WriteSample(text, "nexora_request_slow_total", RequestLabel(request), request.SlowRequests);
+        }
+    }
+
+    private static void WritePermissionCacheMetrics(StringBuilder text, PermissionCacheStatistics statistics)
+    {
+        WriteCounter(text, "nexora_permission_cache_hits_total", "Permission cache hits", statistics.Hits);
+        WriteCounter(text, "nexora_permission_cache_misses_total", "Permission cache misses", statistics.Misses);
+        WriteCounter(text, "nexora_permission_cache_evictions_total", "Permission sets evicted for capacity", statistics.Evictions);
+        WriteCounter(text, "nexora_permission_cache_invalidations_total", "Permission cache invalidations", statistics.Invalidations);
+        WriteGauge(text, "nexora_permission_cache_entries", "Permission sets currently cached", statistics.Count);
+    }
+
+    private static void WriteBroadcastMetrics(StringBuilder text, TaskBroadcastMetrics metrics)
+    {
+        WriteCounter(text, "nexora_task_broadcast_published_total", "TaskHub events queued for broadcast", metrics.Published);
+        WriteCounter(text, "nexora_task_broadcast_dropped_total", "TaskHub events dropped under backpressure", metrics.Dropped);
+        WriteCounter(text, "nexora_task_broadcast_coalesced_total", "TaskHub events merged into another change", metrics.Coalesced);
+        WriteCounter(text, "nexora_task_broadcast_batches_sent_total", "TasksChanged messages sent to tasklist groups", metrics.BatchesSent);
+        WriteGauge(text, "nexora_task_broadcast_queue_depth", "TaskHub events waiting for the dispatcher", metrics.QueueDepth);
+        WriteGauge(text, "nexora_task_broadcast_queue_depth_max", "Largest queue depth seen", metrics.MaxQueueDepth);
+        WriteGauge(text, "nexora_task_broadcast_last_dispatch_milliseconds", "Duration of the latest dispatch", metrics.LastDispatchMilliseconds);
+    }
+
+    private static void WriteHistogram(
+        StringBuilder text,
+        string name,
+        string help,
+        IReadOnlyList<RequestMetricsSnapshot> requests,
+        Func<RequestMetricsSnapshot, HistogramSnapshot> select)
+    {
+        WriteHeader(text, name, help, "histogram");
+
+        foreach (var request in requests)
+        {
+            var histogram = select(request);
+            var label = RequestLabel(request);
+            long cumulative = 0;
+
+            for (var i = 0; i < histogram.Bounds.Count; i++)
+            {
+                cumulative += histogram.BucketCounts[i];
+                WriteSample(text, $"{name}_bucket", $"{label},le=\"{Format(histogram.Bounds[i])}\"", cumulative);
+            }
+
+            WriteSample(text, $"{name}_bucket", $"{label},le=\"+Inf\"", histogram.Count);
+            WriteSample(text, $"{name}_sum", label, histogram.Sum);
+            WriteSample(text, $"{name}_count", label, histogram.Count);
+        }
+    }
+
+    private static void WriteCounter(StringBuilder text, string name, string help, double value)
+    {
+        WriteHeader(text, name, help, "counter");
+        WriteSample(text, name, null, value);
+    }
+
+    private static void WriteGauge(StringBuilder text, string name, string help, double value)
+    {
+        WriteHeader(text, name, help, "gauge");
+        WriteSample(text, name, null, value);
+    }
+
+    private static void WriteHeader(StringBuilder text, string name, string help, string type)
+    {
+        text.Append("# HELP ").Append(name).Append(' ').Append(help).Append('\n');
+        text.Append("# TYPE ").Append(name).Append(' ').Append(type).Append('\n');
+    }
+
+    private static void WriteSample(StringBuilder text, string name, string? labels, double value)
+    {
+        text.Append(name);
+        if (labels != null)
+        {
+            text.Append('{').Append(labels).Append('}');
+        }
+
+        text.Append(' ').Append(Format(value)).Append('\n');
+    }
+
+    // Request names are C# type names, so they never need escaping
+    private static string RequestLabel(RequestMetricsSnapshot request) => $"request=\"{request.RequestName}\"";
+
+    private static string Format(double value) => value.ToString("R", CultureInfo.InvariantCulture);
+}
@@ -0,0 +1,48 @@
+using MediatR;
+using Microsoft.AspNetCore.Mvc;
+using Nexora.Management.Application.Search.DTOs;
+using Nexora.Management.Application.Search.Queries;
+using Nexora.Management.API.Extensions;
+
+namespace Nexora.Management.API.Endpoints;
+
+public static class SearchEndpoints
+{
+    public static void MapSearchEndpoints(this IEndpointRouteBuilder app)
+    {
+        var group = app.MapGroup("/api/search")
+            .WithTags("Search")
+            .WithOpenApi()
+            .RequireAuthorization();
+
+        // Ranked search across pages, tasks and comments in a workspace
+        group.MapGet("/{workspaceId}", async (
+            Guid workspaceId,
+            [AsParameters] SearchRequest request,
+            ISender sender) =>
+        {
+            var types = string.IsNullOrWhiteSpace(request.Types)
+                ? null
+                : request.Types.Split(',', StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries);
+
+            var query = new SearchWorkspaceQuery(
+                workspaceId,
+                request.Q,
+                types,
+                request.Cursor,
+                request.Limit
+            );
+            var result = await sender.Send(query);
+
+            if (result.IsFailure)
+            {
+                return Results.BadRequest(new { error = result.Error });
+            }
+
+            return Results.Ok(result.Value);
+        })
+        .WithName("SearchWorkspace")
+        .WithSummary("Search pages, tasks and comments in a workspace (cursor-paged, ranked)")
+        .RequirePermission("tasks", "view");
+    }
+}
@@ -1,6 +1,5 @@
 using MediatR;
 using Microsoft.AspNetCore.Mvc;
-using Microsoft.AspNetCore.SignalR;
 using Nexora.Management.Application.Tasks.Commands.CreateTask;
 using Nexora.Management.Application.Tasks.Commands.DeleteTask;
 using Nexora.Management.Application.Tasks.Commands.UpdateTask;
@@ -8,7 +7,9 @@ using Nexora.Management.Application.Tasks.Commands.UpdateTaskStatus;
 using Nexora.Management.Application.Tasks.DTOs;
 using Nexora.Management.Application.Tasks.Queries;
 using Nexora.Management.Application.Tasks.Queries.ViewQueries;
+using Nexora.Management.API.Extensions;
 using Nexora.Management.API.Hubs;
+using Nexora.Management.API.Services;
 using Nexora.Management.Application.DTOs.SignalR;
 using System.Security.Claims;
 
@@ -26,7 +27,7 @@ public static class TaskEndpoints
         group.MapPost("/", async (
             CreateTaskRequest request,
             ISender sender,
-            IHubContext<TaskHub> taskHub,
+            ITaskBroadcaster broadcaster,
             HttpContext httpContext) =>
         {
             var command = new CreateTaskCommand(
@@ -59,8 +60,7 @@ public static class TaskEndpoints
                 Timestamp = DateTime.UtcNow,
                 Data = result.Value
             };
-            await taskHub.Clients.Group($"tasklist_{request.TaskListId}")
-                .SendAsync("TaskCreated", message);
+            broadcaster.Publish(request.TaskListId, TaskHubEvents.TaskCreated, message.TaskId, message);
 
             return Results.Created($"/api/tasks/{result.Value.Id}", result.Value);
         })
@@ -115,7 +115,7 @@ public static class TaskEndpoints
             Guid id,
             UpdateTaskRequest request,
             ISender sender,
-            IHubContext<TaskHub> taskHub,
+            ITaskBroadcaster broadcaster,
             HttpContext httpContext) =>
         {
             var command = new UpdateTaskCommand(
@@ -147,8 +147,7 @@ public static class TaskEndpoints
                 Timestamp = DateTime.UtcNow,
                 Data = result.Value
             };
-            await taskHub.Clients.Group($"tasklist_{result.Value.TaskListId}")
-                .SendAsync("TaskUpdated", message);
+            broadcaster.Publish(result.Value.TaskListId, TaskHubEvents.TaskUpdated, message.TaskId, message);
 
             return Results.Ok(result.Value);
         })
@@ -159,7 +158,7 @@ public static class TaskEndpoints
         group.MapDelete("/{id}", async (
             Guid id,
             ISender sender,
-            IHubContext<TaskHub> taskHub,
+            ITaskBroadcaster broadcaster,
             HttpContext httpContext) =>
         {
             var command = new DeleteTaskCommand(id);
@@ -183,8 +182,7 @@ public static class TaskEndpoints
                     Timestamp = DateTime.UtcNow,
                     Data = null
                 };
-                await taskHub.Clients.Group($"tasklist_{result.Value.Value}")
-                    .SendAsync("TaskDeleted", message);
+                broadcaster.Publish(result.Value.Value, TaskHubEvents.TaskDeleted, message.TaskId, message);
             }
 
             return Results.NoContent();
@@ -197,7 +195,7 @@ public static class TaskEndpoints
             Guid id,
             [FromBody] UpdateTaskStatusRequest request,
             ISender sender,
-            IHubContext<TaskHub> taskHub,
+            ITaskBroadcaster broadcaster,
             HttpContext httpContext) =>
         {
             var command = new UpdateTaskStatusCommand(id, request.StatusId);
@@ -219,18 +217,26 @@ public static class TaskEndpoints
                 Timestamp = DateTime.UtcNow,
                 Data = result.Value
             };
-            await taskHub.Clients.Group($"tasklist_{result.Value.TaskListId}")
-                .SendAsync("TaskStatusChanged", message);
+            broadcaster.Publish(result.Value.TaskListId, TaskHubEvents.TaskStatusChanged, message.TaskId, message);
 
             return Results.Ok(result.Value);
         })
         .WithName("UpdateTaskStatus")
         .WithSummary("Update task status");
 
-        // Board View - Get kanban board data
-        group.MapGet("/views/board/{taskListId}", async (Guid taskListId, ISender sender) =>
+        // Board View - Get kanban board data (pass ?since={version} for a delta)
+        group.MapGet("/views/board/{taskListId}", async (
+            Guid taskListId,
+            long? since,
+            HttpContext http,
+            ISender sender) =>
         {
-            var query = new GetBoardViewQuery(taskListId);
+            if (await IsNotModifiedAsync(http, sender, taskListId, null))
+            {
+                return Results.StatusCode(StatusCodes.Status304NotModified);
+            }
+
+            var query = new GetBoardViewQuery(taskListId, since);
             var result = await sender.Send(query);
 
             if (result.IsFailure)
@@ -238,15 +244,28 @@ public static class TaskEndpoints
                 return Results.BadRequest(new { error = result.Error });
             }
 
+            http.Response.SetVersionETag(ConditionalRequestExtensions.VersionETag(result.Value!.Version));
             return Results.Ok(result.Value);
         })
         .WithName("GetBoardView")
-        .WithSummary("Get board view data");
-
-        // Calendar View - Get calendar data
-        group.MapGet("/views/calendar/{taskListId}", async (Guid taskListId, int year, int month, ISender sender) =>
+        .WithSummary("Get board view data, or the changes since a version");
+
+        // Calendar View - Get calendar data (pass ?since={version} for a delta)
+        group.MapGet("/views/calendar/{taskListId}", async (
+            Guid taskListId,
+            int year,
+            int month,
+            long? since,
+            HttpContext http,
+            ISender sender) =>
         {
-            var query = new GetCalendarViewQuery(taskListId, year, month);
+            var discriminator = $"{year}-{month}";
+            if (await IsNotModifiedAsync(http, sender, taskListId, discriminator))
+            {
+                return Results.StatusCode(StatusCodes.Status304NotModified);
+            }
+
+            var query = new GetCalendarViewQuery(taskListId, year, month, since);
             var result = await sender.Send(query);
 
             if (result.IsFailure)
@@ -254,15 +273,25 @@ public static class TaskEndpoints
                 return Results.BadRequest(new { error = result.Error });
             }
 
+            http.Response.SetVersionETag(ConditionalRequestExtensions.VersionETag(result.Value!.Version, discriminator));
             return Results.Ok(result.Value);
         })
         .WithName("GetCalendarView")
-        .WithSummary("Get calendar view data");
+        .WithSummary("Get calendar view data, or the changes since a version");
 
-        // Gantt View - Get gantt chart data
-        group.MapGet("/views/gantt/{taskListId}", async (Guid taskListId, ISender sender) =>
+        // Gantt View - Get gantt chart data (pass ?since={version} for a delta)
+        group.MapGet("/views/gantt/{taskListId}", async (
+            Guid taskListId,
+            long? since,
+            HttpContext http,
+            ISender sender) =>
         {
-            var query = new GetGanttViewQuery(taskListId);
+            if (await IsNotModifiedAsync(http, sender, taskListId, null))
+            {
+                return Results.StatusCode(StatusCodes.Status304NotModified);
+            }
+
+            var query = new GetGanttViewQuery(taskListId, since);
             var result = await sender.Send(query);
 
             if (result.IsFailure)
@@ -270,10 +299,42 @@ public static class TaskEndpoints
                 return Results.BadRequest(new { error = result.Error });
             }
 
+            http.Response.SetVersionETag(ConditionalRequestExtensions.VersionETag(result.Value!.Version));
             return Results.Ok(result.Value);
         })
         .WithName("GetGanttView")
-        .WithSummary("Get gantt view data");
+        .WithSummary("Get gantt view data, or the changes since a version");
+    }
+
+    /// <summary>
+    /// Answers a conditional view request from the list's version alone, so an
+    /// unchanged list costs one primary-key lookup instead of a task query
+    /// </summary>
+    private static async Task<bool> IsNotModifiedAsync(
+        HttpContext http,
+        ISender sender,
+        Guid taskListId,
+        string? discriminator)
+    {
+        if (http.Request.Headers.IfNoneMatch.Count == 0)
+        {
+            return false;
+        }
+
+        var version = await sender.Send(new GetTaskListVersionQuery(taskListId));
+        if (version.IsFailure)
+        {
+            return false;
+        }
+
+        var etag = ConditionalRequestExtensions.VersionETag(version.Value, discriminator);
+        if (!http.Request.IfNoneMatchMatches(etag))
+        {
+            return false;
+        }
+
+        http.Response.SetVersionETag(etag);
+        return true;
     }
 }
 
@@ -9,10 +9,14 @@ using Nexora.Management.Application.TimeTracking.Commands.StopTime;
 using Nexora.Management.Application.TimeTracking.Commands.SubmitTimesheet;
 using Nexora.Management.Application.TimeTracking.DTOs;
 using Nexora.Management.Application.TimeTracking.Queries;
+using Nexora.Management.Application.TimeTracking.Queries.ExportTimeEntries;
 using Nexora.Management.Application.TimeTracking.Queries.GetActiveTimer;
 using Nexora.Management.Application.TimeTracking.Queries.GetTimeEntries;
 using Nexora.Management.Application.TimeTracking.Queries.GetTimesheet;
 using Nexora.Management.Application.TimeTracking.Queries.GetUserTimeReport;
+using Nexora.Management.Application.TimeTracking.Queries.GetWorkspaceDailyTime;
+using Nexora.Management.Application.TimeTracking.Queries.GetWorkspaceTimeReport;
+using Nexora.Management.Application.TimeTracking.Reporting;
 
 namespace Nexora.Management.API.Endpoints;
 
@@ -217,5 +221,86 @@ public static class TimeEndpoints
         })
         .WithName("GetTimeReport")
         .WithSummary("Get time report for a period");
+
+        // Get workspace time report
+        group.MapGet("/workspaces/{workspaceId:guid}/reports", async (
+            Guid workspaceId,
+            DateTime periodStart,
+            DateTime periodEnd,
+            Guid? userId,
+            string? groupBy,
+            ISender sender,
+            CancellationToken ct) =>
+        {
+            var query = new GetWorkspaceTimeReportQuery(workspaceId, periodStart, periodEnd, userId, groupBy);
+            var result = await sender.Send(query, ct);
+
+            if (result.IsFailure)
+            {
+                return Results.BadRequest(new { error = result.Error });
+            }
+
+            return Results.Ok(result.Value);
+        })
+        .WithName("GetWorkspaceTimeReport")
+        .WithSummary("Get time and billing report for all members of a workspace, grouped by user, task, tasklist and/or day");
+
+        // Get daily time totals
+        group.MapGet("/workspaces/{workspaceId:guid}/daily", async (
+            Guid workspaceId,
+            DateOnly from,
+            DateOnly to,
+            Guid? userId,
+            ISender sender,
+            CancellationToken ct) =>
+        {
+            var query = new GetWorkspaceDailyTimeQuery(workspaceId, from, to, userId);
+            var result = await sender.Send(query, ct);
+
+            if (result.IsFailure)
+            {
+                return Results.BadRequest(new { error = result.Error });
+            }
+
+            return Results.Ok(result.Value);
+        })
+        .WithName("GetWorkspaceDailyTime")
+        .WithSummary("Get per-user daily time totals for a workspace");
+
+        // Export time entries
+        group.MapGet("/workspaces/{workspaceId:guid}/export", async (
+            Guid workspaceId,
+            DateTime periodStart,
+            DateTime periodEnd,
+            Guid? userId,
+            string? format,
+            ISender sender,
+            CancellationToken ct) =>
+        {
+            format = (format ?? TimeEntryExportWriter.CsvFormat).ToLowerInvariant();
+            if (!TimeEntryExportWriter.IsSupportedFormat(format))
+            {
+                return Results.BadRequest(new { error = "Format must be 'csv' or 'ndjson'" });
+            }
+
+            var query = new ExportTimeEntriesQuery(workspaceId, periodStart, periodEnd, userId);
+            var result = await sender.Send(query, ct);
+
+            if (result.IsFailure)
+            {
+                return Results.BadRequest(new { error = result.Error });
+            }
+
+            // Rows are written as they are read from the database
+            var fileName = $"time-entries-{periodStart:yyyyMMdd}-{periodEnd:yyyyMMdd}.{format}";
+            return Results.Stream(
+                stream => format == TimeEntryExportWriter.NdjsonFormat
+                    ? TimeEntryExportWriter.WriteNdjsonAsync(result.Value!, stream, ct)
+                    : TimeEntryExportWriter.WriteCsvAsync(result.Value!, stream, ct),
+                TimeEntryExportWriter.GetContentType(format),
+                fileName);
+        })
+        .WithName("ExportTimeEntries")
+        .WithSummary("Stream a workspace's time entries as CSV or NDJSON");
     }
 }
@@ -0,0 +1,40 @@
+using Microsoft.AspNetCore.Http;
+using Microsoft.Net.Http.Headers;
+
+namespace Nexora.Management.API.Extensions;
+
+/// <summary>
+/// ETag helpers for versioned view endpoints
+/// </summary>
+public static class ConditionalRequestExtensions
+{
+    /// <summary>
+    /// Builds a strong ETag from a change version and any view-specific discriminator
+    /// (e.g. the calendar month)
+    /// </summary>
+    public static EntityTagHeaderValue VersionETag(long version, string? discriminator = null)
+    {
+        var tag = string.IsNullOrEmpty(discriminator) ? $"\"{version}\"" : $"\"{version}-{discriminator}\"";
+        return new EntityTagHeaderValue(tag);
+    }
+
+    /// <summary>
+    /// True if the request's If-None-Match header matches the given ETag
+    /// </summary>
+    public static bool IfNoneMatchMatches(this HttpRequest request, EntityTagHeaderValue etag)
+    {
+        var ifNoneMatch = request.GetTypedHeaders().IfNoneMatch;
+        return ifNoneMatch.Any(candidate => candidate.Equals(EntityTagHeaderValue.Any)
+            || candidate.Compare(etag, useStrongComparison: false));
+    }
+
+    /// <summary>
+    /// Sets ETag and requires clients to revalidate before reusing a cached copy
+    /// </summary>
+    public static void SetVersionETag(this HttpResponse response, EntityTagHeaderValue etag)
+    {
+        var headers = response.GetTypedHeaders();
+        headers.ETag = etag;
+        headers.CacheControl = new CacheControlHeaderValue { NoCache = true, Private = true };
+    }
+}
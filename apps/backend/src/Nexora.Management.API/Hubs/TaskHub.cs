@@ -65,5 +65,5 @@ public class TaskHub : Hub
         await base.OnDisconnectedAsync(exception);
     }
 
-    private static string GetTaskListGroupName(Guid taskListId) => $"tasklist_{taskListId}";
+    internal static string GetTaskListGroupName(Guid taskListId) => $"tasklist_{taskListId}";
 }
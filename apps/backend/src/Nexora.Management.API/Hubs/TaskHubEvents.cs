@@ -0,0 +1,34 @@
+namespace Nexora.Management.API.Hubs;
+
+/// <summary>
+/// Event names carried by TaskHub broadcasts
+/// </summary>
+public static class TaskHubEvents
+{
+    /// <summary>
+    /// Client method receiving <see cref="Application.DTOs.SignalR.TasksChangedMessage"/> batches
+    /// </summary>
+    public const string TasksChanged = "TasksChanged";
+
+    public const string TaskCreated = "TaskCreated";
+    public const string TaskUpdated = "TaskUpdated";
+    public const string TaskDeleted = "TaskDeleted";
+    public const string TaskStatusChanged = "TaskStatusChanged";
+    public const string CommentAdded = "CommentAdded";
+    public const string CommentUpdated = "CommentUpdated";
+    public const string CommentDeleted = "CommentDeleted";
+    public const string AttachmentUploaded = "AttachmentUploaded";
+    public const string AttachmentDeleted = "AttachmentDeleted";
+
+    /// <summary>
+    /// True for events that introduce an entity clients have not seen yet
+    /// </summary>
+    public static bool IsCreation(string eventName) =>
+        eventName is TaskCreated or CommentAdded or AttachmentUploaded;
+
+    /// <summary>
+    /// True for events that remove an entity
+    /// </summary>
+    public static bool IsDeletion(string eventName) =>
+        eventName is TaskDeleted or CommentDeleted or AttachmentDeleted;
+}
@@ -0,0 +1,59 @@
+using Microsoft.EntityFrameworkCore.Infrastructure;
+using Microsoft.EntityFrameworkCore.Migrations;
+using Nexora.Management.Infrastructure.Persistence;
+
+#nullable disable
+
+namespace Nexora.Management.API.Persistence.Migrations
+{
+    /// <inheritdoc />
+    [DbContext(typeof(AppDbContext))]
+    [Migration("20260110090000_AddAnalyticsRollups")]
+    public partial class AddAnalyticsRollups : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            // Create analytics rollups table (populated by the rollup rebuild job on startup)
+            migrationBuilder.CreateTable(
+                name: "analytics_rollups",
+                columns: table => new
+                {
+                    Id = table.Column<Guid>(type: "uuid", nullable: false, defaultValueSql: "uuid_generate_v4()"),
+                    WorkspaceId = table.Column<Guid>(type: "uuid", nullable: false),
+                    ScopeType = table.Column<string>(type: "character varying(20)", maxLength: 20, nullable: false),
+                    ScopeId = table.Column<Guid>(type: "uuid", nullable: false),
+                    TotalTasks = table.Column<int>(type: "integer", nullable: false, defaultValue: 0),
+                    CompletedTasks = table.Column<int>(type: "integer", nullable: false, defaultValue: 0),
+                    InProgressTasks = table.Column<int>(type: "integer", nullable: false, defaultValue: 0),
+                    OverdueTasks = table.Column<int>(type: "integer", nullable: false, defaultValue: 0),
+                    ApprovedMinutes = table.Column<long>(type: "bigint", nullable: false, defaultValue: 0L),
+                    CreatedAt = table.Column<DateTime>(type: "timestamp with time zone", nullable: false),
+                    UpdatedAt = table.Column<DateTime>(type: "timestamp with time zone", nullable: false)
+                },
+                constraints: table =>
+                {
+                    table.PrimaryKey("PK_analytics_rollups", x => x.Id);
+                    table.ForeignKey(
+                        name: "FK_analytics_rollups_Workspaces_WorkspaceId",
+                        column: x => x.WorkspaceId,
+                        principalTable: "Workspaces",
+                        principalColumn: "Id",
+                        onDelete: ReferentialAction.Cascade);
+                });
+
+            migrationBuilder.CreateIndex(
+                name: "uq_analytics_rollups_scope",
+                table: "analytics_rollups",
+                columns: new[] { "WorkspaceId", "ScopeType", "ScopeId" },
+                unique: true);
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.DropTable(
+                name: "analytics_rollups");
+        }
+    }
+}
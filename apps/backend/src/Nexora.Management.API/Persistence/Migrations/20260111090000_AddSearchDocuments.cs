@@ -0,0 +1,243 @@
+using Microsoft.EntityFrameworkCore.Infrastructure;
+using Microsoft.EntityFrameworkCore.Migrations;
+using Nexora.Management.Infrastructure.Persistence;
+
+#nullable disable
+
+namespace Nexora.Management.API.Persistence.Migrations
+{
+    /// <inheritdoc />
+    [DbContext(typeof(AppDbContext))]
+    [Migration("20260111090000_AddSearchDocuments")]
+    public partial class AddSearchDocuments : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            // Denormalized search index over pages, tasks and comments.
+            // Maintained by triggers, queried with raw SQL (not part of the EF model).
+            migrationBuilder.Sql(@"
+                CREATE TABLE search_documents (
+                    ""Id"" uuid NOT NULL DEFAULT uuid_generate_v4(),
+                    ""WorkspaceId"" uuid NOT NULL,
+                    ""EntityType"" character varying(20) NOT NULL,
+                    ""EntityId"" uuid NOT NULL,
+                    ""ParentId"" uuid NULL,
+                    ""Title"" text NOT NULL DEFAULT '',
+                    ""Body"" text NOT NULL DEFAULT '',
+                    ""IsDeleted"" boolean NOT NULL DEFAULT false,
+                    ""SearchVector"" tsvector GENERATED ALWAYS AS (
+                        setweight(to_tsvector('english', ""Title""), 'A') ||
+                        setweight(to_tsvector('english', ""Body""), 'B')
+                    ) STORED,
+                    ""UpdatedAt"" timestamp with time zone NOT NULL DEFAULT now(),
+                    CONSTRAINT ""PK_search_documents"" PRIMARY KEY (""Id""),
+                    CONSTRAINT ""FK_search_documents_Workspaces_WorkspaceId"" FOREIGN KEY (""WorkspaceId"")
+                        REFERENCES ""Workspaces"" (""Id"") ON DELETE CASCADE
+                );
+
+                CREATE UNIQUE INDEX uq_search_documents_entity ON search_documents (""EntityType"", ""EntityId"");
+                CREATE INDEX idx_search_documents_workspace ON search_documents (""WorkspaceId"", ""EntityType"");
+                CREATE INDEX idx_search_documents_vector ON search_documents USING gin (""SearchVector"");
+                CREATE INDEX idx_search_documents_title_trgm ON search_documents USING gin (""Title"" gin_trgm_ops);
+                CREATE INDEX idx_search_documents_parent ON search_documents (""ParentId"") WHERE ""EntityType"" = 'comment';
+            ");
+
+            // Extract plain text from TipTap JSON (every ""text"" node, document order)
+            migrationBuilder.Sql(@"
+                CREATE OR REPLACE FUNCTION search_extract_text(doc jsonb)
+                RETURNS text AS $$
+                    SELECT left(coalesce(string_agg(node #>> '{}', ' '), ''), 500000)
+                    FROM jsonb_path_query(doc, 'strict $.**.text', '{}', true) AS node
+                    WHERE jsonb_typeof(node) = 'string';
+                $$ LANGUAGE sql IMMUTABLE;
+            ");
+
+            // Pages
+            migrationBuilder.Sql(@"
+                CREATE OR REPLACE FUNCTION search_documents_sync_page()
+                RETURNS TRIGGER AS $$
+                BEGIN
+                    IF TG_OP = 'DELETE' THEN
+                        DELETE FROM search_documents WHERE ""EntityType"" = 'page' AND ""EntityId"" = OLD.""Id"";
+                        RETURN OLD;
+                    END IF;
+
+                    -- Skip saves that do not touch indexed fields (position moves, favorites)
+                    IF TG_OP = 'UPDATE'
+                       AND NEW.""Title"" IS NOT DISTINCT FROM OLD.""Title""
+                       AND NEW.""Content"" IS NOT DISTINCT FROM OLD.""Content""
+                       AND NEW.""Status"" IS NOT DISTINCT FROM OLD.""Status""
+                       AND NEW.""ParentPageId"" IS NOT DISTINCT FROM OLD.""ParentPageId""
+                       AND NEW.""WorkspaceId"" IS NOT DISTINCT FROM OLD.""WorkspaceId"" THEN
+                        RETURN NEW;
+                    END IF;
+
+                    INSERT INTO search_documents
+                        (""WorkspaceId"", ""EntityType"", ""EntityId"", ""ParentId"", ""Title"", ""Body"", ""IsDeleted"", ""UpdatedAt"")
+                    VALUES
+                        (NEW.""WorkspaceId"", 'page', NEW.""Id"", NEW.""ParentPageId"", NEW.""Title"",
+                         search_extract_text(NEW.""Content""), NEW.""Status"" = 'deleted', NEW.""UpdatedAt"")
+                    ON CONFLICT (""EntityType"", ""EntityId"") DO UPDATE SET
+                        ""WorkspaceId"" = EXCLUDED.""WorkspaceId"",
+                        ""ParentId"" = EXCLUDED.""ParentId"",
+                        ""Title"" = EXCLUDED.""Title"",
+                        ""Body"" = EXCLUDED.""Body"",
+                        ""IsDeleted"" = EXCLUDED.""IsDeleted"",
+                        ""UpdatedAt"" = EXCLUDED.""UpdatedAt"";
+
+                    RETURN NEW;
+                END;
+                $$ LANGUAGE plpgsql;
+
+                CREATE TRIGGER trigger_search_documents_pages
+                AFTER INSERT OR UPDATE OR DELETE ON ""Pages""
+                FOR EACH ROW
+                EXECUTE FUNCTION search_documents_sync_page();
+            ");
+
+            // Tasks
+            migrationBuilder.Sql(@"
+                CREATE OR REPLACE FUNCTION search_documents_sync_task()
+                RETURNS TRIGGER AS $$
+                DECLARE
+                    workspace_id uuid;
+                BEGIN
+                    IF TG_OP = 'DELETE' THEN
+                        DELETE FROM search_documents WHERE ""EntityType"" = 'task' AND ""EntityId"" = OLD.""Id"";
+                        RETURN OLD;
+                    END IF;
+
+                    IF TG_OP = 'UPDATE'
+                       AND NEW.""Title"" IS NOT DISTINCT FROM OLD.""Title""
+                       AND NEW.""Description"" IS NOT DISTINCT FROM OLD.""Description""
+                       AND NEW.""TaskListId"" IS NOT DISTINCT FROM OLD.""TaskListId"" THEN
+                        RETURN NEW;
+                    END IF;
+
+                    SELECT s.""WorkspaceId"" INTO workspace_id
+                    FROM ""TaskLists"" tl
+                    JOIN ""Spaces"" s ON s.""Id"" = tl.""SpaceId""
+                    WHERE tl.""Id"" = NEW.""TaskListId"";
+
+                    IF workspace_id IS NULL THEN
+                        RETURN NEW;
+                    END IF;
+
+                    INSERT INTO search_documents
+                        (""WorkspaceId"", ""EntityType"", ""EntityId"", ""ParentId"", ""Title"", ""Body"", ""UpdatedAt"")
+                    VALUES
+                        (workspace_id, 'task', NEW.""Id"", NEW.""TaskListId"", NEW.""Title"",
+                         coalesce(NEW.""Description"", ''), NEW.""UpdatedAt"")
+                    ON CONFLICT (""EntityType"", ""EntityId"") DO UPDATE SET
+                        ""WorkspaceId"" = EXCLUDED.""WorkspaceId"",
+                        ""ParentId"" = EXCLUDED.""ParentId"",
+                        ""Title"" = EXCLUDED.""Title"",
+                        ""Body"" = EXCLUDED.""Body"",
+                        ""UpdatedAt"" = EXCLUDED.""UpdatedAt"";
+
+                    -- Comments follow their task when it moves to another workspace
+                    IF TG_OP = 'UPDATE' AND NEW.""TaskListId"" IS DISTINCT FROM OLD.""TaskListId"" THEN
+                        UPDATE search_documents SET ""WorkspaceId"" = workspace_id
+                        WHERE ""EntityType"" = 'comment'
+                          AND ""ParentId"" = NEW.""Id""
+                          AND ""WorkspaceId"" <> workspace_id;
+                    END IF;
+
+                    RETURN NEW;
+                END;
+                $$ LANGUAGE plpgsql;
+
+                CREATE TRIGGER trigger_search_documents_tasks
+                AFTER INSERT OR UPDATE OR DELETE ON ""Tasks""
+                FOR EACH ROW
+                EXECUTE FUNCTION search_documents_sync_task();
+            ");
+
+            // Comments
+            migrationBuilder.Sql(@"
+                CREATE OR REPLACE FUNCTION search_documents_sync_comment()
+                RETURNS TRIGGER AS $$
+                DECLARE
+                    workspace_id uuid;
+                BEGIN
+                    IF TG_OP = 'DELETE' THEN
+                        DELETE FROM search_documents WHERE ""EntityType"" = 'comment' AND ""EntityId"" = OLD.""Id"";
+                        RETURN OLD;
+                    END IF;
+
+                    IF TG_OP = 'UPDATE' AND NEW.""Content"" IS NOT DISTINCT FROM OLD.""Content"" THEN
+                        RETURN NEW;
+                    END IF;
+
+                    SELECT s.""WorkspaceId"" INTO workspace_id
+                    FROM ""Tasks"" t
+                    JOIN ""TaskLists"" tl ON tl.""Id"" = t.""TaskListId""
+                    JOIN ""Spaces"" s ON s.""Id"" = tl.""SpaceId""
+                    WHERE t.""Id"" = NEW.""TaskId"";
+
+                    IF workspace_id IS NULL THEN
+                        RETURN NEW;
+                    END IF;
+
+                    INSERT INTO search_documents
+                        (""WorkspaceId"", ""EntityType"", ""EntityId"", ""ParentId"", ""Body"", ""UpdatedAt"")
+                    VALUES
+                        (workspace_id, 'comment', NEW.""Id"", NEW.""TaskId"", NEW.""Content"", NEW.""UpdatedAt"")
+                    ON CONFLICT (""EntityType"", ""EntityId"") DO UPDATE SET
+                        ""WorkspaceId"" = EXCLUDED.""WorkspaceId"",
+                        ""Body"" = EXCLUDED.""Body"",
+                        ""UpdatedAt"" = EXCLUDED.""UpdatedAt"";
+
+                    RETURN NEW;
+                END;
+                $$ LANGUAGE plpgsql;
+
+                CREATE TRIGGER trigger_search_documents_comments
+                AFTER INSERT OR UPDATE OR DELETE ON ""Comments""
+                FOR EACH ROW
+                EXECUTE FUNCTION search_documents_sync_comment();
+            ");
+
+            // Backfill existing rows
+            migrationBuilder.Sql(@"
+                INSERT INTO search_documents
+                    (""WorkspaceId"", ""EntityType"", ""EntityId"", ""ParentId"", ""Title"", ""Body"", ""IsDeleted"", ""UpdatedAt"")
+                SELECT p.""WorkspaceId"", 'page', p.""Id"", p.""ParentPageId"", p.""Title"",
+                       search_extract_text(p.""Content""), p.""Status"" = 'deleted', p.""UpdatedAt""
+                FROM ""Pages"" p;
+
+                INSERT INTO search_documents
+                    (""WorkspaceId"", ""EntityType"", ""EntityId"", ""ParentId"", ""Title"", ""Body"", ""UpdatedAt"")
+                SELECT s.""WorkspaceId"", 'task', t.""Id"", t.""TaskListId"", t.""Title"",
+                       coalesce(t.""Description"", ''), t.""UpdatedAt""
+                FROM ""Tasks"" t
+                JOIN ""TaskLists"" tl ON tl.""Id"" = t.""TaskListId""
+                JOIN ""Spaces"" s ON s.""Id"" = tl.""SpaceId"";
+
+                INSERT INTO search_documents
+                    (""WorkspaceId"", ""EntityType"", ""EntityId"", ""ParentId"", ""Body"", ""UpdatedAt"")
+                SELECT s.""WorkspaceId"", 'comment', c.""Id"", c.""TaskId"", c.""Content"", c.""UpdatedAt""
+                FROM ""Comments"" c
+                JOIN ""Tasks"" t ON t.""Id"" = c.""TaskId""
+                JOIN ""TaskLists"" tl ON tl.""Id"" = t.""TaskListId""
+                JOIN ""Spaces"" s ON s.""Id"" = tl.""SpaceId"";
+
+                ANALYZE search_documents;
+            ");
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.Sql(@"DROP TRIGGER IF EXISTS trigger_search_documents_comments ON ""Comments"";");
+            migrationBuilder.Sql(@"DROP TRIGGER IF EXISTS trigger_search_documents_tasks ON ""Tasks"";");
+            migrationBuilder.Sql(@"DROP TRIGGER IF EXISTS trigger_search_documents_pages ON ""Pages"";");
+            migrationBuilder.Sql("DROP FUNCTION IF EXISTS search_documents_sync_comment();");
+            migrationBuilder.Sql("DROP FUNCTION IF EXISTS search_documents_sync_task();");
+            migrationBuilder.Sql("DROP FUNCTION IF EXISTS search_documents_sync_page();");
+            migrationBuilder.Sql("DROP FUNCTION IF EXISTS search_extract_text(jsonb);");
+            migrationBuilder.Sql("DROP TABLE IF EXISTS search_documents;");
+        }
+    }
+}
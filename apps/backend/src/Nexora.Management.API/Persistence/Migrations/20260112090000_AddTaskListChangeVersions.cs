@@ -0,0 +1,159 @@
+using Microsoft.EntityFrameworkCore.Infrastructure;
+using Microsoft.EntityFrameworkCore.Migrations;
+using Nexora.Management.Infrastructure.Persistence;
+
+#nullable disable
+
+namespace Nexora.Management.API.Persistence.Migrations
+{
+    /// <inheritdoc />
+    [DbContext(typeof(AppDbContext))]
+    [Migration("20260112090000_AddTaskListChangeVersions")]
+    public partial class AddTaskListChangeVersions : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.AddColumn<long>(
+                name: "ChangeVersion",
+                table: "TaskLists",
+                type: "bigint",
+                nullable: false,
+                defaultValue: 0L);
+
+            migrationBuilder.AddColumn<long>(
+                name: "TombstoneFloorVersion",
+                table: "TaskLists",
+                type: "bigint",
+                nullable: false,
+                defaultValue: 0L);
+
+            migrationBuilder.AddColumn<long>(
+                name: "ChangeVersion",
+                table: "Tasks",
+                type: "bigint",
+                nullable: false,
+                defaultValue: 0L);
+
+            migrationBuilder.CreateTable(
+                name: "task_tombstones",
+                columns: table => new
+                {
+                    Id = table.Column<Guid>(type: "uuid", nullable: false, defaultValueSql: "uuid_generate_v4()"),
+                    TaskListId = table.Column<Guid>(type: "uuid", nullable: false),
+                    TaskId = table.Column<Guid>(type: "uuid", nullable: false),
+                    ChangeVersion = table.Column<long>(type: "bigint", nullable: false),
+                    CreatedAt = table.Column<DateTime>(type: "timestamp with time zone", nullable: false),
+                    UpdatedAt = table.Column<DateTime>(type: "timestamp with time zone", nullable: false)
+                },
+                constraints: table =>
+                {
+                    table.PrimaryKey("PK_task_tombstones", x => x.Id);
+                    table.ForeignKey(
+                        name: "FK_task_tombstones_TaskLists_TaskListId",
+                        column: x => x.TaskListId,
+                        principalTable: "TaskLists",
+                        principalColumn: "Id",
+                        onDelete: ReferentialAction.Cascade);
+                });
+
+            migrationBuilder.CreateIndex(
+                name: "idx_tasks_tasklist_version",
+                table: "Tasks",
+                columns: new[] { "TaskListId", "ChangeVersion" });
+
+            migrationBuilder.CreateIndex(
+                name: "idx_task_tombstones_tasklist_version",
+                table: "task_tombstones",
+                columns: new[] { "TaskListId", "ChangeVersion" });
+
+            // Seed versions so existing tasks are part of the first snapshot
+            migrationBuilder.Sql(@"
+                UPDATE ""TaskLists"" tl
+                SET ""ChangeVersion"" = counts.task_count
+                FROM (SELECT ""TaskListId"", count(*) AS task_count FROM ""Tasks"" GROUP BY ""TaskListId"") counts
+                WHERE counts.""TaskListId"" = tl.""Id"";
+
+                UPDATE ""Tasks"" t
+                SET ""ChangeVersion"" = numbered.version
+                FROM (
+                    SELECT ""Id"", row_number() OVER (PARTITION BY ""TaskListId"" ORDER BY ""UpdatedAt"", ""Id"") AS version
+                    FROM ""Tasks""
+                ) numbered
+                WHERE numbered.""Id"" = t.""Id"";
+            ");
+
+            // Every task write bumps its list's version and stamps the task with it.
+            // The row lock on the TaskLists row is held until commit, so versions
+            // become visible in order within a list.
+            migrationBuilder.Sql(@"
+                CREATE OR REPLACE FUNCTION tasks_change_version()
+                RETURNS TRIGGER AS $$
+                DECLARE
+                    version bigint;
+                BEGIN
+                    -- Removal from a list (delete, or move to another list) leaves a tombstone
+                    IF TG_OP = 'DELETE' OR (TG_OP = 'UPDATE' AND NEW.""TaskListId"" IS DISTINCT FROM OLD.""TaskListId"") THEN
+                        UPDATE ""TaskLists"" SET ""ChangeVersion"" = ""ChangeVersion"" + 1
+                        WHERE ""Id"" = OLD.""TaskListId""
+                        RETURNING ""ChangeVersion"" INTO version;
+
+                        -- Not found when the list itself is being deleted (cascade)
+                        IF FOUND THEN
+                            INSERT INTO task_tombstones (""TaskListId"", ""TaskId"", ""ChangeVersion"", ""CreatedAt"", ""UpdatedAt"")
+                            VALUES (OLD.""TaskListId"", OLD.""Id"", version, now(), now());
+                        END IF;
+                    END IF;
+
+                    IF TG_OP = 'DELETE' THEN
+                        RETURN OLD;
+                    END IF;
+
+                    UPDATE ""TaskLists"" SET ""ChangeVersion"" = ""ChangeVersion"" + 1
+                    WHERE ""Id"" = NEW.""TaskListId""
+                    RETURNING ""ChangeVersion"" INTO NEW.""ChangeVersion"";
+
+                    -- A task moved back into a list is no longer removed from it
+                    IF TG_OP = 'UPDATE' AND NEW.""TaskListId"" IS DISTINCT FROM OLD.""TaskListId"" THEN
+                        DELETE FROM task_tombstones
+                        WHERE ""TaskListId"" = NEW.""TaskListId"" AND ""TaskId"" = NEW.""Id"";
+                    END IF;
+
+                    RETURN NEW;
+                END;
+                $$ LANGUAGE plpgsql;
+
+                CREATE TRIGGER trigger_tasks_change_version
+                BEFORE INSERT OR UPDATE OR DELETE ON ""Tasks""
+                FOR EACH ROW
+                EXECUTE FUNCTION tasks_change_version();
+            ");
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.Sql(@"DROP TRIGGER IF EXISTS trigger_tasks_change_version ON ""Tasks"";");
+            migrationBuilder.Sql("DROP FUNCTION IF EXISTS tasks_change_version();");
+
+            migrationBuilder.DropTable(
+                name: "task_tombstones");
+
+            migrationBuilder.DropIndex(
+                name: "idx_tasks_tasklist_version",
+                table: "Tasks");
+
+            migrationBuilder.DropColumn(
+                name: "ChangeVersion",
+                table: "Tasks");
+
+            migrationBuilder.DropColumn(
+                name: "TombstoneFloorVersion",
+                table: "TaskLists");
+
+            migrationBuilder.DropColumn(
+                name: "ChangeVersion",
+                table: "TaskLists");
+        }
+    }
+}
@@ -0,0 +1,52 @@
+using Microsoft.EntityFrameworkCore.Infrastructure;
+using Microsoft.EntityFrameworkCore.Migrations;
+using Nexora.Management.Infrastructure.Persistence;
+
+#nullable disable
+
+namespace Nexora.Management.API.Persistence.Migrations
+{
+    /// <inheritdoc />
+    [DbContext(typeof(AppDbContext))]
+    [Migration("20260113090000_AddPageVersionKeyframes")]
+    public partial class AddPageVersionKeyframes : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            // Existing versions are full copies, i.e. keyframes of themselves;
+            // the page history backfill compacts them into keyframes plus diffs
+            migrationBuilder.AddColumn<bool>(
+                name: "IsKeyframe",
+                table: "PageVersions",
+                type: "boolean",
+                nullable: false,
+                defaultValue: true);
+
+            migrationBuilder.AddColumn<int>(
+                name: "KeyframeVersionNumber",
+                table: "PageVersions",
+                type: "integer",
+                nullable: false,
+                defaultValue: 0);
+
+            migrationBuilder.Sql("""
+                UPDATE "PageVersions" SET "KeyframeVersionNumber" = "VersionNumber";
+                """);
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            // Diff rows are unreadable without these columns; only roll back
+            // before any history has been written or compacted as diffs
+            migrationBuilder.DropColumn(
+                name: "IsKeyframe",
+                table: "PageVersions");
+
+            migrationBuilder.DropColumn(
+                name: "KeyframeVersionNumber",
+                table: "PageVersions");
+        }
+    }
+}
@@ -0,0 +1,59 @@
+using Microsoft.EntityFrameworkCore.Infrastructure;
+using Microsoft.EntityFrameworkCore.Migrations;
+using Nexora.Management.Infrastructure.Persistence;
+
+#nullable disable
+
+namespace Nexora.Management.API.Persistence.Migrations
+{
+    /// <inheritdoc />
+    [DbContext(typeof(AppDbContext))]
+    [Migration("20260114090000_AddContentAddressedFileBlobs")]
+    public partial class AddContentAddressedFileBlobs : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            // Existing attachments keep their flat-directory paths (ContentHash stays null)
+            migrationBuilder.AddColumn<string>(
+                name: "ContentHash",
+                table: "Attachments",
+                type: "character varying(64)",
+                maxLength: 64,
+                nullable: true);
+
+            migrationBuilder.CreateTable(
+                name: "file_blobs",
+                columns: table => new
+                {
+                    Id = table.Column<Guid>(type: "uuid", nullable: false, defaultValueSql: "uuid_generate_v4()"),
+                    ContentHash = table.Column<string>(type: "character varying(64)", maxLength: 64, nullable: false),
+                    SizeBytes = table.Column<long>(type: "bigint", nullable: false),
+                    ReferenceCount = table.Column<int>(type: "integer", nullable: false),
+                    CreatedAt = table.Column<DateTime>(type: "timestamp with time zone", nullable: false),
+                    UpdatedAt = table.Column<DateTime>(type: "timestamp with time zone", nullable: false)
+                },
+                constraints: table =>
+                {
+                    table.PrimaryKey("PK_file_blobs", x => x.Id);
+                });
+
+            migrationBuilder.CreateIndex(
+                name: "uq_file_blobs_content_hash",
+                table: "file_blobs",
+                column: "ContentHash",
+                unique: true);
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.DropTable(
+                name: "file_blobs");
+
+            migrationBuilder.DropColumn(
+                name: "ContentHash",
+                table: "Attachments");
+        }
+    }
+}
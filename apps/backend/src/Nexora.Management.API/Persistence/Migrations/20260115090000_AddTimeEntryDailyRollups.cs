@@ -0,0 +1,73 @@
+using Microsoft.EntityFrameworkCore.Infrastructure;
+using Microsoft.EntityFrameworkCore.Migrations;
+using Nexora.Management.Infrastructure.Persistence;
+
+#nullable disable
+
+namespace Nexora.Management.API.Persistence.Migrations
+{
+    /// <inheritdoc />
+    [DbContext(typeof(AppDbContext))]
+    [Migration("20260115090000_AddTimeEntryDailyRollups")]
+    public partial class AddTimeEntryDailyRollups : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            // Create daily time rollups table (populated by the rollup rebuild job on startup)
+            migrationBuilder.CreateTable(
+                name: "time_entry_daily_rollups",
+                columns: table => new
+                {
+                    Id = table.Column<Guid>(type: "uuid", nullable: false, defaultValueSql: "uuid_generate_v4()"),
+                    WorkspaceId = table.Column<Guid>(type: "uuid", nullable: false),
+                    UserId = table.Column<Guid>(type: "uuid", nullable: false),
+                    TaskId = table.Column<Guid>(type: "uuid", nullable: false),
+                    Day = table.Column<DateOnly>(type: "date", nullable: false),
+                    EntryCount = table.Column<int>(type: "integer", nullable: false, defaultValue: 0),
+                    TotalMinutes = table.Column<long>(type: "bigint", nullable: false, defaultValue: 0L),
+                    BillableMinutes = table.Column<long>(type: "bigint", nullable: false, defaultValue: 0L),
+                    CreatedAt = table.Column<DateTime>(type: "timestamp with time zone", nullable: false),
+                    UpdatedAt = table.Column<DateTime>(type: "timestamp with time zone", nullable: false)
+                },
+                constraints: table =>
+                {
+                    table.PrimaryKey("PK_time_entry_daily_rollups", x => x.Id);
+                    table.ForeignKey(
+                        name: "FK_time_entry_daily_rollups_Workspaces_WorkspaceId",
+                        column: x => x.WorkspaceId,
+                        principalTable: "Workspaces",
+                        principalColumn: "Id",
+                        onDelete: ReferentialAction.Cascade);
+                });
+
+            migrationBuilder.CreateIndex(
+                name: "uq_time_entry_daily_rollups_scope",
+                table: "time_entry_daily_rollups",
+                columns: new[] { "WorkspaceId", "UserId", "TaskId", "Day" },
+                unique: true);
+
+            migrationBuilder.CreateIndex(
+                name: "idx_time_entry_daily_rollups_workspace_day",
+                table: "time_entry_daily_rollups",
+                columns: new[] { "WorkspaceId", "Day" });
+
+            // Workspace reports and exports scan a period of one workspace
+            migrationBuilder.CreateIndex(
+                name: "idx_time_entries_workspace_time",
+                table: "time_entries",
+                columns: new[] { "WorkspaceId", "StartTime" });
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.DropIndex(
+                name: "idx_time_entries_workspace_time",
+                table: "time_entries");
+
+            migrationBuilder.DropTable(
+                name: "time_entry_daily_rollups");
+        }
+    }
+}
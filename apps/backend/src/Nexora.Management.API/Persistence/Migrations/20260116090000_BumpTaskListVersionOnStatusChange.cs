@@ -0,0 +1,51 @@
+using Microsoft.EntityFrameworkCore.Infrastructure;
+using Microsoft.EntityFrameworkCore.Migrations;
+using Nexora.Management.Infrastructure.Persistence;
+
+#nullable disable
+
+namespace Nexora.Management.API.Persistence.Migrations
+{
+    /// <inheritdoc />
+    [DbContext(typeof(AppDbContext))]
+    [Migration("20260116090000_BumpTaskListVersionOnStatusChange")]
+    public partial class BumpTaskListVersionOnStatusChange : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            // Board columns come from TaskStatuses, so a status write must change the
+            // list's version too; otherwise If-None-Match clients get a 304 for it
+            migrationBuilder.Sql(@"
+                CREATE OR REPLACE FUNCTION taskstatuses_change_version()
+                RETURNS TRIGGER AS $$
+                BEGIN
+                    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                        UPDATE ""TaskLists"" SET ""ChangeVersion"" = ""ChangeVersion"" + 1
+                        WHERE ""Id"" = OLD.""TaskListId"";
+                    END IF;
+
+                    IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.""TaskListId"" IS DISTINCT FROM OLD.""TaskListId"") THEN
+                        UPDATE ""TaskLists"" SET ""ChangeVersion"" = ""ChangeVersion"" + 1
+                        WHERE ""Id"" = NEW.""TaskListId"";
+                    END IF;
+
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+
+                CREATE TRIGGER trigger_taskstatuses_change_version
+                AFTER INSERT OR UPDATE OR DELETE ON ""TaskStatuses""
+                FOR EACH ROW
+                EXECUTE FUNCTION taskstatuses_change_version();
+            ");
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.Sql(@"DROP TRIGGER IF EXISTS trigger_taskstatuses_change_version ON ""TaskStatuses"";");
+            migrationBuilder.Sql("DROP FUNCTION IF EXISTS taskstatuses_change_version();");
+        }
+    }
+}
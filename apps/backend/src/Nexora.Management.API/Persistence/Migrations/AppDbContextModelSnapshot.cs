@@ -82,6 +82,64 @@ namespace Nexora.Management.API.Persistence.Migrations
                     b.ToTable("ActivityLog", (string)null);
                 });
 
+            modelBuilder.Entity("Nexora.Management.Domain.Entities.AnalyticsRollup", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uuid")
+                        .HasDefaultValueSql("uuid_generate_v4()");
+
+                    b.Property<long>("ApprovedMinutes")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bigint")
+                        .HasDefaultValue(0L);
+
+                    b.Property<int>("CompletedTasks")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("integer")
+                        .HasDefaultValue(0);
+
+                    b.Property<DateTime>("CreatedAt")
+                        .HasColumnType("timestamp with time zone");
+
+                    b.Property<int>("InProgressTasks")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("integer")
+                        .HasDefaultValue(0);
+
+                    b.Property<int>("OverdueTasks")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("integer")
+                        .HasDefaultValue(0);
+
+                    b.Property<Guid>("ScopeId")
+                        .HasColumnType("uuid");
+
+                    b.Property<string>("ScopeType")
+                        .IsRequired()
+                        .HasMaxLength(20)
+                        .HasColumnType("character varying(20)");
+
+                    b.Property<int>("TotalTasks")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("integer")
+                        .HasDefaultValue(0);
+
+                    b.Property<DateTime>("UpdatedAt")
+                        .HasColumnType("timestamp with time zone");
+
+                    b.Property<Guid>("WorkspaceId")
+                        .HasColumnType("uuid");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("WorkspaceId", "ScopeType", "ScopeId")
+                        .IsUnique()
+                        .HasDatabaseName("uq_analytics_rollups_scope");
+
+                    b.ToTable("analytics_rollups", (string)null);
+                });
+
             modelBuilder.Entity("Nexora.Management.Domain.Entities.Attachment", b =>
                 {
                     b.Property<Guid>("Id")
@@ -89,6 +147,10 @@ namespace Nexora.Management.API.Persistence.Migrations
                         .HasColumnType("uuid")
                         .HasDefaultValueSql("uuid_generate_v4()");
 
+                    b.Property<string>("ContentHash")
+                        .HasMaxLength(64)
+                        .HasColumnType("character varying(64)");
+
                     b.Property<DateTime>("CreatedAt")
                         .HasColumnType("timestamp with time zone");
 
@@ -224,6 +286,39 @@ namespace Nexora.Management.API.Persistence.Migrations
                     b.ToTable("dashboards", (string)null);
                 });
 
+            modelBuilder.Entity("Nexora.Management.Domain.Entities.FileBlob", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uuid")
+                        .HasDefaultValueSql("uuid_generate_v4()");
+
+                    b.Property<string>("ContentHash")
+                        .IsRequired()
+                        .HasMaxLength(64)
+                        .HasColumnType("character varying(64)");
+
+                    b.Property<DateTime>("CreatedAt")
+                        .HasColumnType("timestamp with time zone");
+
+                    b.Property<int>("ReferenceCount")
+                        .HasColumnType("integer");
+
+                    b.Property<long>("SizeBytes")
+                        .HasColumnType("bigint");
+
+                    b.Property<DateTime>("UpdatedAt")
+                        .HasColumnType("timestamp with time zone");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("ContentHash")
+                        .IsUnique()
+                        .HasDatabaseName("uq_file_blobs_content_hash");
+
+                    b.ToTable("file_blobs", (string)null);
+                });
+
             modelBuilder.Entity("Nexora.Management.Domain.Entities.Folder", b =>
                 {
                     b.Property<Guid>("Id")
@@ -810,6 +905,12 @@ namespace Nexora.Management.API.Persistence.Migrations
                         .HasColumnType("uuid")
                         .HasDefaultValueSql("uuid_generate_v4()");
 
+                    b.Property<bool>("IsKeyframe")
+                        .HasColumnType("boolean");
+
+                    b.Property<int>("KeyframeVersionNumber")
+                        .HasColumnType("integer");
+
                     b.Property<Guid>("PageId")
                         .ValueGeneratedOnAdd()
                         .HasColumnType("uuid")
@@ -1098,6 +1199,11 @@ namespace Nexora.Management.API.Persistence.Migrations
                     b.Property<Guid?>("AssigneeId")
                         .HasColumnType("uuid");
 
+                    b.Property<long>("ChangeVersion")
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("bigint")
+                        .HasDefaultValue(0L);
+
                     b.Property<DateTime>("CreatedAt")
                         .HasColumnType("timestamp with time zone");
 
@@ -1186,6 +1292,9 @@ namespace Nexora.Management.API.Persistence.Migrations
                     b.HasIndex("TaskListId")
                         .HasDatabaseName("idx_tasks_tasklist");
 
+                    b.HasIndex("TaskListId", "ChangeVersion")
+                        .HasDatabaseName("idx_tasks_tasklist_version");
+
                     b.HasIndex("ProjectId", "StatusId", "PositionOrder")
                         .HasDatabaseName("idx_tasks_list");
 
@@ -1199,6 +1308,11 @@ namespace Nexora.Management.API.Persistence.Migrations
                         .HasColumnType("uuid")
                         .HasDefaultValueSql("uuid_generate_v4()");
 
+                    b.Property<long>("ChangeVersion")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bigint")
+                        .HasDefaultValue(0L);
+
                     b.Property<string>("Color")
                         .HasMaxLength(7)
                         .HasColumnType("character varying(7)");
@@ -1250,6 +1364,11 @@ namespace Nexora.Management.API.Persistence.Migrations
                         .HasColumnType("character varying(20)")
                         .HasDefaultValue("active");
 
+                    b.Property<long>("TombstoneFloorVersion")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bigint")
+                        .HasDefaultValue(0L);
+
                     b.Property<DateTime>("UpdatedAt")
                         .HasColumnType("timestamp with time zone");
 
@@ -1327,6 +1446,36 @@ namespace Nexora.Management.API.Persistence.Migrations
                     b.ToTable("TaskStatuses", (string)null);
                 });
 
+            modelBuilder.Entity("Nexora.Management.Domain.Entities.TaskTombstone", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uuid")
+                        .HasDefaultValueSql("uuid_generate_v4()");
+
+                    b.Property<long>("ChangeVersion")
+                        .HasColumnType("bigint");
+
+                    b.Property<DateTime>("CreatedAt")
+                        .HasColumnType("timestamp with time zone");
+
+                    b.Property<Guid>("TaskId")
+                        .HasColumnType("uuid");
+
+                    b.Property<Guid>("TaskListId")
+                        .HasColumnType("uuid");
+
+                    b.Property<DateTime>("UpdatedAt")
+                        .HasColumnType("timestamp with time zone");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("TaskListId", "ChangeVersion")
+                        .HasDatabaseName("idx_task_tombstones_tasklist_version");
+
+                    b.ToTable("task_tombstones", (string)null);
+                });
+
             modelBuilder.Entity("Nexora.Management.Domain.Entities.TimeEntry", b =>
                 {
                     b.Property<Guid>("Id")
@@ -1398,9 +1547,64 @@ namespace Nexora.Management.API.Persistence.Migrations
                     b.HasIndex("UserId", "StartTime")
                         .HasDatabaseName("idx_time_entries_user_time");
 
+                    b.HasIndex("WorkspaceId", "StartTime")
+                        .HasDatabaseName("idx_time_entries_workspace_time");
+
                     b.ToTable("time_entries", (string)null);
                 });
 
+            modelBuilder.Entity("Nexora.Management.Domain.Entities.TimeEntryDailyRollup", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uuid")
+                        .HasDefaultValueSql("uuid_generate_v4()");
+
+                    b.Property<long>("BillableMinutes")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bigint")
+                        .HasDefaultValue(0L);
+
+                    b.Property<DateTime>("CreatedAt")
+                        .HasColumnType("timestamp with time zone");
+
+                    b.Property<DateOnly>("Day")
+                        .HasColumnType("date");
+
+                    b.Property<int>("EntryCount")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("integer")
+                        .HasDefaultValue(0);
+
+                    b.Property<Guid>("TaskId")
+                        .HasColumnType("uuid");
+
+                    b.Property<long>("TotalMinutes")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bigint")
+                        .HasDefaultValue(0L);
+
+                    b.Property<DateTime>("UpdatedAt")
+                        .HasColumnType("timestamp with time zone");
+
+                    b.Property<Guid>("UserId")
+                        .HasColumnType("uuid");
+
+                    b.Property<Guid>("WorkspaceId")
+                        .HasColumnType("uuid");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("WorkspaceId", "Day")
+                        .HasDatabaseName("idx_time_entry_daily_rollups_workspace_day");
+
+                    b.HasIndex("WorkspaceId", "UserId", "TaskId", "Day")
+                        .IsUnique()
+                        .HasDatabaseName("uq_time_entry_daily_rollups_scope");
+
+                    b.ToTable("time_entry_daily_rollups", (string)null);
+                });
+
             modelBuilder.Entity("Nexora.Management.Domain.Entities.TimeRate", b =>
                 {
                     b.Property<Guid>("Id")
@@ -1670,6 +1874,17 @@ namespace Nexora.Management.API.Persistence.Migrations
                     b.Navigation("Workspace");
                 });
 
+            modelBuilder.Entity("Nexora.Management.Domain.Entities.AnalyticsRollup", b =>
+                {
+                    b.HasOne("Nexora.Management.Domain.Entities.Workspace", "Workspace")
+                        .WithMany()
+                        .HasForeignKey("WorkspaceId")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.Navigation("Workspace");
+                });
+
             modelBuilder.Entity("Nexora.Management.Domain.Entities.Attachment", b =>
                 {
                     b.HasOne("Nexora.Management.Domain.Entities.Task", "Task")
@@ -2079,6 +2294,17 @@ namespace Nexora.Management.API.Persistence.Migrations
                     b.Navigation("TaskList");
                 });
 
+            modelBuilder.Entity("Nexora.Management.Domain.Entities.TaskTombstone", b =>
+                {
+                    b.HasOne("Nexora.Management.Domain.Entities.TaskList", "TaskList")
+                        .WithMany()
+                        .HasForeignKey("TaskListId")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.Navigation("TaskList");
+                });
+
             modelBuilder.Entity("Nexora.Management.Domain.Entities.TimeEntry", b =>
                 {
                     b.HasOne("Nexora.Management.Domain.Entities.Task", "Task")
@@ -2104,6 +2330,17 @@ namespace Nexora.Management.API.Persistence.Migrations
                     b.Navigation("Workspace");
                 });
 
+            modelBuilder.Entity("Nexora.Management.Domain.Entities.TimeEntryDailyRollup", b =>
+                {
+                    b.HasOne("Nexora.Management.Domain.Entities.Workspace", "Workspace")
+                        .WithMany()
+                        .HasForeignKey("WorkspaceId")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.Navigation("Workspace");
+                });
+
             modelBuilder.Entity("Nexora.Management.Domain.Entities.TimeRate", b =>
                 {
                     b.HasOne("Nexora.Management.Domain.Entities.Project", "Project")
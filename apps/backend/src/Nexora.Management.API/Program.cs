@@ -12,8 +12,13 @@ using Nexora.Management.Infrastructure.Persistence;
 using Nexora.Management.API.Endpoints;
 using Nexora.Management.API.Middlewares;
 using Nexora.Management.Infrastructure.Services;
+using Nexora.Management.Application.Analytics.Rollups;
+using Nexora.Management.Application.Attachments;
 using Nexora.Management.Application.Authorization;
 using Nexora.Management.Application.Common;
+using Nexora.Management.Application.Diagnostics;
+using Nexora.Management.Application.Documents.Versioning;
+using Nexora.Management.Application.TimeTracking.Reporting;
 using Nexora.Management.API.Hubs;
 using Nexora.Management.API.Services;
 using Nexora.Management.API.Common;
@@ -64,6 +69,13 @@ builder.Services.AddAuthorization(options =>
 // Register Permission Authorization Policy Provider
 builder.Services.AddSingleton<IAuthorizationPolicyProvider, PermissionAuthorizationPolicyProvider>();
 
+// Register Permission Cache (singleton, shared across requests) and Resolver (scoped to get DbContext)
+var permissionCacheSettings = new PermissionCacheSettings();
+builder.Configuration.GetSection(PermissionCacheSettings.SectionName).Bind(permissionCacheSettings);
+builder.Services.AddSingleton(permissionCacheSettings);
+builder.Services.AddSingleton<IPermissionCache, PermissionCache>();
+builder.Services.AddScoped<IPermissionResolver, PermissionResolver>();
+
 // Register Permission Authorization Handler (scoped to get DbContext)
 builder.Services.AddScoped<IAuthorizationHandler, PermissionAuthorizationHandler>();
 
@@ -109,11 +121,22 @@ builder.Services.AddSwaggerGen(options =>
     });
 });
 
+// Register request instrumentation (handler latency, queries and rows per request, served on /metrics)
+var requestMetricsSettings = new RequestMetricsSettings();
+builder.Configuration.GetSection(RequestMetricsSettings.SectionName).Bind(requestMetricsSettings);
+builder.Services.AddSingleton(requestMetricsSettings);
+builder.Services.AddSingleton<RequestMetricsRegistry>();
+builder.Services.AddSingleton<QueryMetricsInterceptor>();
+
 // Register Application layer services
-builder.Services.AddMediatR(cfg => cfg.RegisterServicesFromAssembly(typeof(Nexora.Management.Application.Common.ApiResponse<>).Assembly));
+builder.Services.AddMediatR(cfg =>
+{
+    cfg.RegisterServicesFromAssembly(typeof(Nexora.Management.Application.Common.ApiResponse<>).Assembly);
+    cfg.AddOpenBehavior(typeof(RequestMetricsBehavior<,>));
+});
 
 // Register Infrastructure layer services
-builder.Services.AddDbContext<AppDbContext>(options =>
+builder.Services.AddDbContext<AppDbContext>((provider, options) =>
 {
     options.UseNpgsql(builder.Configuration.GetConnectionString("DefaultConnection"),
         npgsqlOptions => npgsqlOptions
@@ -121,6 +144,7 @@ builder.Services.AddDbContext<AppDbContext>(options =>
             .EnableRetryOnFailure(3, TimeSpan.FromSeconds(30), null));
     options.EnableSensitiveDataLogging(builder.Environment.IsDevelopment());
     options.EnableDetailedErrors(builder.Environment.IsDevelopment());
+    options.AddInterceptors(provider.GetRequiredService<QueryMetricsInterceptor>());
 
     // Ignore pending model changes warning - expected when adding new migrations
     options.ConfigureWarnings(warnings => warnings.Ignore(
@@ -140,8 +164,13 @@ builder.Services.AddScoped<IPasswordHasher<User>, PasswordHasher<User>>();
 // Register User Context
 builder.Services.AddScoped<IUserContext, UserContext>();
 
-// Register File Storage Service
+// Register File Storage Service (content-addressed blobs plus resumable chunked uploads)
+var attachmentSettings = new AttachmentSettings();
+builder.Configuration.GetSection(AttachmentSettings.SectionName).Bind(attachmentSettings);
+builder.Services.AddSingleton(attachmentSettings);
+builder.Services.AddScoped<IFileBlobReferenceStore, FileBlobReferenceStore>();
 builder.Services.AddScoped<IFileStorageService, LocalFileStorageService>();
+builder.Services.AddHostedService<AttachmentUploadCleanupService>();
 
 // Register SignalR
 builder.Services.AddSignalR(options =>
@@ -150,12 +179,47 @@ builder.Services.AddSignalR(options =>
     options.KeepAliveInterval = TimeSpan.FromSeconds(10);
     options.ClientTimeoutInterval = TimeSpan.FromSeconds(30);
     options.HandshakeTimeout = TimeSpan.FromSeconds(15);
-});
+})
+.AddMessagePackProtocol();
+
+// Register TaskHub broadcast pipeline (endpoints enqueue, the dispatcher coalesces and fans out)
+var taskBroadcastSettings = new TaskBroadcastSettings();
+builder.Configuration.GetSection(TaskBroadcastSettings.SectionName).Bind(taskBroadcastSettings);
+builder.Services.AddSingleton(taskBroadcastSettings);
+builder.Services.AddSingleton<TaskBroadcastQueue>();
+builder.Services.AddSingleton<ITaskBroadcaster>(provider => provider.GetRequiredService<TaskBroadcastQueue>());
+builder.Services.AddHostedService<TaskBroadcastDispatcher>();
 
 // Register Presence and Notification Services
-builder.Services.AddScoped<IPresenceService, PresenceService>();
+// Presence is a process-wide registry; changes are written behind by the hosted sweeper
+var presenceSettings = new PresenceSettings();
+builder.Configuration.GetSection(PresenceSettings.SectionName).Bind(presenceSettings);
+builder.Services.AddSingleton(presenceSettings);
+builder.Services.AddSingleton<IPresenceService, PresenceService>();
+builder.Services.AddHostedService<PresenceBackgroundService>();
 builder.Services.AddScoped<INotificationService, NotificationService>();
 
+// Register analytics and daily time rollups (incremental counters plus a periodic rebuild)
+var analyticsRollupSettings = new AnalyticsRollupSettings();
+builder.Configuration.GetSection(AnalyticsRollupSettings.SectionName).Bind(analyticsRollupSettings);
+builder.Services.AddSingleton(analyticsRollupSettings);
+builder.Services.AddScoped<IAnalyticsRollupStore, AnalyticsRollupStore>();
+builder.Services.AddScoped<ITimeRollupStore, TimeRollupStore>();
+builder.Services.AddHostedService<AnalyticsRollupRebuildService>();
+
+// Register task view sync (tombstone retention for delta views)
+var taskViewSyncSettings = new TaskViewSyncSettings();
+builder.Configuration.GetSection(TaskViewSyncSettings.SectionName).Bind(taskViewSyncSettings);
+builder.Services.AddSingleton(taskViewSyncSettings);
+builder.Services.AddHostedService<TaskTombstonePruneService>();
+
+// Register page version store (keyframes plus diffs, per-user coalescing, optional startup backfill)
+var pageVersionSettings = new PageVersionSettings();
+builder.Configuration.GetSection(PageVersionSettings.SectionName).Bind(pageVersionSettings);
+builder.Services.AddSingleton(pageVersionSettings);
+builder.Services.AddScoped<IPageVersionStore, PageVersionStore>();
+builder.Services.AddHostedService<PageHistoryCompactionService>();
+
 var app = builder.Build();
 
 // Auto-apply database migrations
@@ -229,11 +293,17 @@ app.MapTimeEndpoints();
 app.MapAnalyticsEndpoints();
 app.MapDashboardEndpoints();
 
+// Map Search endpoints
+app.MapSearchEndpoints();
+
 // Map SignalR Hubs
 app.MapHub<TaskHub>("/hubs/tasks");
 app.MapHub<PresenceHub>("/hubs/presence");
 app.MapHub<NotificationHub>("/hubs/notifications");
 
+// Map local metrics endpoint
+app.MapMetricsEndpoints();
+
 // Health check endpoint
 app.MapGet("/health", () => Results.Ok(new
 {
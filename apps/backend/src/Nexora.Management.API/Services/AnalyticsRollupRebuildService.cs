@@ -0,0 +1,76 @@
+using Nexora.Management.API.Common;
+using Nexora.Management.Application.Analytics.Rollups;
+using Nexora.Management.Application.TimeTracking.Reporting;
+
+namespace Nexora.Management.API.Services;
+
+/// <summary>
+/// Periodically recomputes analytics and daily time rollups. Task and time tracking
+/// handlers keep the counters current; the rebuild corrects time-based drift (tasks
+/// becoming overdue) and anything missed by bulk operations.
+/// </summary>
+public class AnalyticsRollupRebuildService : BackgroundService
+{
+    private readonly IServiceScopeFactory _scopeFactory;
+    private readonly AnalyticsRollupSettings _settings;
+    private readonly ILogger<AnalyticsRollupRebuildService> _logger;
+
+    public AnalyticsRollupRebuildService(
+        IServiceScopeFactory scopeFactory,
+        AnalyticsRollupSettings settings,
+        ILogger<AnalyticsRollupRebuildService> logger)
+    {
+        _scopeFactory = scopeFactory;
+        _settings = settings;
+        _logger = logger;
+    }
+
+    protected override async Task ExecuteAsync(CancellationToken stoppingToken)
+    {
+        if (_settings.RebuildOnStartup)
+        {
+            await RebuildAsync(stoppingToken);
+        }
+
+        using var timer = new PeriodicTimer(TimeSpan.FromMinutes(Math.Max(1, _settings.RebuildIntervalMinutes)));
+
+        try
+        {
+            while (await timer.WaitForNextTickAsync(stoppingToken))
+            {
+                await RebuildAsync(stoppingToken);
+            }
+        }
+        catch (OperationCanceledException)
+        {
+            // Host is shutting down
+        }
+    }
+
+    private async Task RebuildAsync(CancellationToken ct)
+    {
+        try
+        {
+            using var scope = _scopeFactory.CreateScope();
+            var store = scope.ServiceProvider.GetRequiredService<IAnalyticsRollupStore>();
+            await store.RebuildAsync(ct: ct);
+            _logger.LogInformation("Analytics rollups rebuilt");
+        }
+        catch (Exception ex) when (ex is not OperationCanceledException)
+        {
+            _logger.LogError(ex, "Analytics rollup rebuild failed");
+        }
+
+        try
+        {
+            using var scope = _scopeFactory.CreateScope();
+            var store = scope.ServiceProvider.GetRequiredService<ITimeRollupStore>();
+            await store.RebuildAsync(ct: ct);
+            _logger.LogInformation("Daily time rollups rebuilt");
+        }
+        catch (Exception ex) when (ex is not OperationCanceledException)
+        {
+            _logger.LogError(ex, "Daily time rollup rebuild failed");
+        }
+    }
+}
@@ -0,0 +1,55 @@
+using Nexora.Management.Application.Attachments;
+using Nexora.Management.Infrastructure.Services;
+
+namespace Nexora.Management.API.Services;
+
+/// <summary>
+/// Periodically removes chunked attachment uploads that were abandoned before completion
+/// </summary>
+public class AttachmentUploadCleanupService : BackgroundService
+{
+    private readonly IServiceScopeFactory _scopeFactory;
+    private readonly AttachmentSettings _settings;
+    private readonly ILogger<AttachmentUploadCleanupService> _logger;
+
+    public AttachmentUploadCleanupService(
+        IServiceScopeFactory scopeFactory,
+        AttachmentSettings settings,
+        ILogger<AttachmentUploadCleanupService> logger)
+    {
+        _scopeFactory = scopeFactory;
+        _settings = settings;
+        _logger = logger;
+    }
+
+    protected override async Task ExecuteAsync(CancellationToken stoppingToken)
+    {
+        using var timer = new PeriodicTimer(TimeSpan.FromMinutes(Math.Max(1, _settings.UploadCleanupIntervalMinutes)));
+
+        try
+        {
+            while (await timer.WaitForNextTickAsync(stoppingToken))
+            {
+                try
+                {
+                    using var scope = _scopeFactory.CreateScope();
+                    var storage = scope.ServiceProvider.GetRequiredService<IFileStorageService>();
+
+                    var deleted = storage.DeleteStaleUploads(TimeSpan.FromHours(Math.Max(1, _settings.UploadExpiryHours)));
+                    if (deleted > 0)
+                    {
+                        _logger.LogInformation("Removed {UploadCount} expired attachment uploads", deleted);
+                    }
+                }
+                catch (Exception ex) when (ex is not OperationCanceledException)
+                {
+                    _logger.LogError(ex, "Attachment upload cleanup failed");
+                }
+            }
+        }
+        catch (OperationCanceledException)
+        {
+            // Host is shutting down
+        }
+    }
+}
@@ -0,0 +1,96 @@
+using Microsoft.EntityFrameworkCore;
+using Nexora.Management.Application.Documents.Versioning;
+using Nexora.Management.Infrastructure.Interfaces;
+
+namespace Nexora.Management.API.Services;
+
+/// <summary>
+/// One-off backfill that compacts existing page history into keyframes and diffs.
+/// Runs on startup when PageVersions:CompactOnStartup is set; safe to re-run, as
+/// already compacted pages are left unchanged.
+/// </summary>
+public class PageHistoryCompactionService : BackgroundService
+{
+    private readonly IServiceScopeFactory _scopeFactory;
+    private readonly PageVersionSettings _settings;
+    private readonly ILogger<PageHistoryCompactionService> _logger;
+
+    public PageHistoryCompactionService(
+        IServiceScopeFactory scopeFactory,
+        PageVersionSettings settings,
+        ILogger<PageHistoryCompactionService> logger)
+    {
+        _scopeFactory = scopeFactory;
+        _settings = settings;
+        _logger = logger;
+    }
+
+    protected override async Task ExecuteAsync(CancellationToken stoppingToken)
+    {
+        if (!_settings.CompactOnStartup)
+        {
+            return;
+        }
+
+        var batchSize = Math.Max(1, _settings.CompactBatchSize);
+        var lastPageId = Guid.Empty;
+        var pages = 0;
+        var removed = 0;
+        long bytesBefore = 0;
+        long bytesAfter = 0;
+
+        try
+        {
+            while (true)
+            {
+                List<Guid> pageIds;
+                using (var scope = _scopeFactory.CreateScope())
+                {
+                    var db = scope.ServiceProvider.GetRequiredService<IAppDbContext>();
+                    pageIds = await db.PageVersions
+                        .Where(v => v.PageId.CompareTo(lastPageId) > 0)
+                        .Select(v => v.PageId)
+                        .Distinct()
+                        .OrderBy(id => id)
+                        .Take(batchSize)
+                        .ToListAsync(stoppingToken);
+                }
+
+                if (pageIds.Count == 0)
+                {
+                    break;
+                }
+
+                foreach (var pageId in pageIds)
+                {
+                    try
+                    {
+                        // Fresh scope per page so the change tracker does not grow with the backfill
+                        using var scope = _scopeFactory.CreateScope();
+                        var store = scope.ServiceProvider.GetRequiredService<IPageVersionStore>();
+                        var result = await store.CompactAsync(pageId, stoppingToken);
+
+                        pages++;
+                        removed += result.VersionsRemoved;
+                        bytesBefore += result.BytesBefore;
+                        bytesAfter += result.BytesAfter;
+                    }
+                    catch (Exception ex) when (ex is not OperationCanceledException)
+                    {
+                        _logger.LogError(ex, "Page history compaction failed for page {PageId}", pageId);
+                    }
+                }
+
+                lastPageId = pageIds[^1];
+            }
+
+            _logger.LogInformation(
+                "Page history compacted: {PageCount} pages, {RemovedCount} versions merged, {BytesBefore} -> {BytesAfter} bytes",
+                pages, removed, bytesBefore, bytesAfter);
+        }
+        catch (OperationCanceledException)
+        {
+            // Host is shutting down
+        }
+    }
+}
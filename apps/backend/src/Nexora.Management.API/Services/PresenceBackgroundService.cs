@@ -0,0 +1,77 @@
+using Nexora.Management.API.Common;
+using Nexora.Management.Infrastructure.Interfaces;
+
+namespace Nexora.Management.API.Services;
+
+/// <summary>
+/// Hosted sweeper for the presence registry: flushes pending presence changes
+/// on a short interval and runs stale connection cleanup on a longer one
+/// </summary>
+public class PresenceBackgroundService : BackgroundService
+{
+    private readonly IPresenceService _presenceService;
+    private readonly PresenceSettings _settings;
+    private readonly ILogger<PresenceBackgroundService> _logger;
+
+    public PresenceBackgroundService(
+        IPresenceService presenceService,
+        PresenceSettings settings,
+        ILogger<PresenceBackgroundService> logger)
+    {
+        _presenceService = presenceService;
+        _settings = settings;
+        _logger = logger;
+    }
+
+    protected override async Task ExecuteAsync(CancellationToken stoppingToken)
+    {
+        var flushInterval = TimeSpan.FromSeconds(Math.Max(1, _settings.FlushIntervalSeconds));
+        var cleanupInterval = TimeSpan.FromSeconds(Math.Max(1, _settings.CleanupIntervalSeconds));
+        var nextCleanup = DateTime.UtcNow + cleanupInterval;
+
+        using var timer = new PeriodicTimer(flushInterval);
+
+        try
+        {
+            while (await timer.WaitForNextTickAsync(stoppingToken))
+            {
+                try
+                {
+                    if (DateTime.UtcNow >= nextCleanup)
+                    {
+                        // Cleanup flushes pending changes itself
+                        await _presenceService.CleanupStaleConnectionsAsync();
+                        nextCleanup = DateTime.UtcNow + cleanupInterval;
+                    }
+                    else
+                    {
+                        await _presenceService.FlushPendingChangesAsync(stoppingToken);
+                    }
+                }
+                catch (Exception ex) when (ex is not OperationCanceledException)
+                {
+                    _logger.LogError(ex, "Presence sweep failed");
+                }
+            }
+        }
+        catch (OperationCanceledException)
+        {
+            // Host is shutting down
+        }
+    }
+
+    public override async Task StopAsync(CancellationToken cancellationToken)
+    {
+        await base.StopAsync(cancellationToken);
+
+        // Final flush so the last heartbeats and disconnects are not lost
+        try
+        {
+            await _presenceService.FlushPendingChangesAsync(cancellationToken);
+        }
+        catch (Exception ex)
+        {
+            _logger.LogWarning(ex, "Final presence flush failed");
+        }
+    }
+}
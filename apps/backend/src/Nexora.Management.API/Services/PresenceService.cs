@@ -1,157 +1,446 @@
-using Microsoft.AspNetCore.SignalR;
 using Microsoft.EntityFrameworkCore;
-using Nexora.Management.API.Hubs;
+using Nexora.Management.API.Common;
 using Nexora.Management.Domain.Entities;
 using Nexora.Management.Infrastructure.Interfaces;
-using Nexora.Management.Infrastructure.Persistence;
-using System.Collections.Concurrent;
 using Task = System.Threading.Tasks.Task;
 
 namespace Nexora.Management.API.Services;
 
 /// <summary>
-/// In-memory and database-backed service for tracking user presence
+/// Process-wide presence registry indexed by user, workspace and connection.
+/// Reads are answered from memory; LastSeen/IsOnline changes are coalesced per
+/// user and workspace and written to UserPresences in batches by FlushPendingChangesAsync.
+/// Must be registered as Singleton.
 /// </summary>
 public class PresenceService : IPresenceService
 {
-    private readonly IAppDbContext _dbContext;
-    private readonly IHubContext<PresenceHub> _presenceHub;
+    private readonly IServiceScopeFactory _scopeFactory;
+    private readonly PresenceSettings _settings;
     private readonly ILogger<PresenceService> _logger;
 
-    // In-memory cache for active connections
-    private readonly ConcurrentDictionary<string, (Guid UserId, Guid WorkspaceId, DateTime LastSeen)> _activeConnections = new();
+    // All registry state is guarded by _sync; every operation touches O(connections of one user)
+    private readonly object _sync = new();
+    private readonly Dictionary<string, ConnectionEntry> _connections = new();
+    private readonly Dictionary<Guid, HashSet<string>> _connectionsByUser = new();
+    private readonly Dictionary<(Guid UserId, Guid WorkspaceId), PresenceEntry> _presences = new();
+    private readonly Dictionary<Guid, HashSet<Guid>> _onlineUsersByWorkspace = new();
+    private readonly HashSet<(Guid UserId, Guid WorkspaceId)> _dirty = new();
 
     public PresenceService(
-        IAppDbContext dbContext,
-        IHubContext<PresenceHub> presenceHub,
+        IServiceScopeFactory scopeFactory,
+        PresenceSettings settings,
         ILogger<PresenceService> logger)
     {
-        _dbContext = dbContext;
-        _presenceHub = presenceHub;
+        _scopeFactory = scopeFactory;
+        _settings = settings;
         _logger = logger;
     }
 
-    public async Task TrackConnectionAsync(Guid userId, Guid workspaceId, string connectionId)
+    public Task TrackConnectionAsync(Guid userId, Guid workspaceId, string connectionId)
     {
-        // Update in-memory cache
-        _activeConnections.AddOrUpdate(
-            connectionId,
-            (userId, workspaceId, DateTime.UtcNow),
-            (key, existing) => (existing.UserId, existing.WorkspaceId, DateTime.UtcNow)
-        );
+        var now = DateTime.UtcNow;
 
-        // Update or create database record
-        var existingPresence = await _dbContext.UserPresences
-            .FirstOrDefaultAsync(up => up.UserId == userId && up.WorkspaceId == workspaceId);
-
-        if (existingPresence != null)
+        lock (_sync)
         {
-            existingPresence.ConnectionId = connectionId;
-            existingPresence.LastSeen = DateTime.UtcNow;
-            existingPresence.IsOnline = true;
+            if (!_connections.TryGetValue(connectionId, out var connection))
+            {
+                connection = new ConnectionEntry(userId);
+                _connections[connectionId] = connection;
+                GetOrAdd(_connectionsByUser, userId).Add(connectionId);
+            }
+
+            connection.LastSeen = now;
+            connection.WorkspaceIds.Add(workspaceId);
+
+            var key = (userId, workspaceId);
+            if (!_presences.TryGetValue(key, out var presence))
+            {
+                presence = new PresenceEntry();
+                _presences[key] = presence;
+            }
+
+            presence.ConnectionIds.Add(connectionId);
+            presence.LastConnectionId = connectionId;
+            presence.LastSeen = now;
+            GetOrAdd(_onlineUsersByWorkspace, workspaceId).Add(userId);
+            _dirty.Add(key);
         }
-        else
+
+        _logger.LogDebug("Tracked connection for user {UserId} in workspace {WorkspaceId}", userId, workspaceId);
+        return Task.CompletedTask;
+    }
+
+    public Task RemoveConnectionAsync(string connectionId)
+    {
+        lock (_sync)
         {
-            var newPresence = new UserPresence
+            if (!_connections.Remove(connectionId, out var connection))
             {
-                UserId = userId,
-                WorkspaceId = workspaceId,
-                ConnectionId = connectionId,
-                LastSeen = DateTime.UtcNow,
-                IsOnline = true
-            };
-            _dbContext.UserPresences.Add(newPresence);
+                return Task.CompletedTask;
+            }
+
+            RemoveFromIndex(_connectionsByUser, connection.UserId, connectionId);
+            DetachConnection(connectionId, connection, DateTime.UtcNow);
         }
 
-        await _dbContext.SaveChangesAsync();
-        _logger.LogDebug("Tracked connection for user {UserId} in workspace {WorkspaceId}", userId, workspaceId);
+        _logger.LogDebug("Removed connection {ConnectionId}", connectionId);
+        return Task.CompletedTask;
     }
 
-    public async Task RemoveConnectionAsync(string connectionId)
+    public Task UpdateLastSeenAsync(Guid userId)
     {
-        if (_activeConnections.TryRemove(connectionId, out var connectionInfo))
+        var now = DateTime.UtcNow;
+        var writeInterval = TimeSpan.FromSeconds(_settings.LastSeenWriteIntervalSeconds);
+
+        lock (_sync)
         {
-            // Check if user has other active connections
-            var hasOtherConnections = _activeConnections.Values
-                .Any(c => c.UserId == connectionInfo.UserId && c.WorkspaceId == connectionInfo.WorkspaceId);
+            if (!_connectionsByUser.TryGetValue(userId, out var connectionIds))
+            {
+                return Task.CompletedTask;
+            }
 
-            if (!hasOtherConnections)
+            foreach (var connectionId in connectionIds)
             {
-                // Mark as offline if no other connections
-                var presence = await _dbContext.UserPresences
-                    .FirstOrDefaultAsync(up => up.UserId == connectionInfo.UserId && up.WorkspaceId == connectionInfo.WorkspaceId);
+                var connection = _connections[connectionId];
+                connection.LastSeen = now;
 
-                if (presence != null)
+                foreach (var workspaceId in connection.WorkspaceIds)
                 {
-                    presence.IsOnline = false;
-                    presence.LastSeen = DateTime.UtcNow;
-                    await _dbContext.SaveChangesAsync();
+                    var key = (userId, workspaceId);
+                    var presence = _presences[key];
+                    presence.LastSeen = now;
+
+                    // Heartbeats only reach the database once LastSeen has moved noticeably
+                    if (now - presence.PersistedLastSeen >= writeInterval)
+                    {
+                        _dirty.Add(key);
+                    }
                 }
             }
-
-            _logger.LogDebug("Removed connection {ConnectionId}", connectionId);
         }
+
+        return Task.CompletedTask;
     }
 
-    public async Task UpdateLastSeenAsync(Guid userId)
+    public async Task<List<UserPresence>> GetOnlineUsersAsync(Guid workspaceId)
     {
-        var presences = await _dbContext.UserPresences
-            .Where(up => up.UserId == userId)
-            .ToListAsync();
+        List<UserPresence> presences;
 
-        foreach (var presence in presences)
+        lock (_sync)
+        {
+            if (!_onlineUsersByWorkspace.TryGetValue(workspaceId, out var userIds))
+            {
+                return new List<UserPresence>();
+            }
+
+            presences = userIds
+                .Select(userId => ToUserPresence(userId, workspaceId, _presences[(userId, workspaceId)]))
+                .ToList();
+        }
+
+        if (presences.Count == 0)
         {
-            presence.LastSeen = DateTime.UtcNow;
+            return presences;
         }
 
-        await _dbContext.SaveChangesAsync();
-    }
+        // Attach user profiles with a single primary-key lookup
+        var ids = presences.Select(p => p.UserId).ToList();
 
-    public async Task<List<UserPresence>> GetOnlineUsersAsync(Guid workspaceId)
-    {
-        return await _dbContext.UserPresences
-            .Where(up => up.WorkspaceId == workspaceId && up.IsOnline)
-            .Include(up => up.User)
-            .ToListAsync();
+        using var scope = _scopeFactory.CreateScope();
+        var dbContext = scope.ServiceProvider.GetRequiredService<IAppDbContext>();
+        var users = await dbContext.Users
+            .AsNoTracking()
+            .Where(u => ids.Contains(u.Id))
+            .ToDictionaryAsync(u => u.Id);
+
+        foreach (var presence in presences)
+        {
+            presence.User = users.GetValueOrDefault(presence.UserId);
+        }
+
+        return presences;
     }
 
     public async Task<UserPresence?> GetUserPresenceAsync(Guid userId, Guid workspaceId)
     {
-        return await _dbContext.UserPresences
+        UserPresence? presence = null;
+
+        lock (_sync)
+        {
+            if (_presences.TryGetValue((userId, workspaceId), out var entry))
+            {
+                presence = ToUserPresence(userId, workspaceId, entry);
+            }
+        }
+
+        using var scope = _scopeFactory.CreateScope();
+        var dbContext = scope.ServiceProvider.GetRequiredService<IAppDbContext>();
+
+        if (presence != null)
+        {
+            presence.User = await dbContext.Users
+                .AsNoTracking()
+                .FirstOrDefaultAsync(u => u.Id == userId);
+            return presence;
+        }
+
+        // Not connected to this instance: fall back to the last persisted state
+        return await dbContext.UserPresences
+            .AsNoTracking()
             .Include(up => up.User)
             .FirstOrDefaultAsync(up => up.UserId == userId && up.WorkspaceId == workspaceId);
     }
 
     public async Task CleanupStaleConnectionsAsync()
     {
-        var cutoffTime = DateTime.UtcNow.AddMinutes(-5);
+        var now = DateTime.UtcNow;
+        var cutoffTime = now.AddMinutes(-_settings.StaleConnectionMinutes);
+        var removedConnections = 0;
+
+        // Clean up in-memory registry
+        lock (_sync)
+        {
+            var staleConnections = _connections
+                .Where(kvp => kvp.Value.LastSeen < cutoffTime)
+                .ToList();
+
+            foreach (var (connectionId, connection) in staleConnections)
+            {
+                _connections.Remove(connectionId);
+                RemoveFromIndex(_connectionsByUser, connection.UserId, connectionId);
+                DetachConnection(connectionId, connection, now);
+            }
 
-        // Find stale connections in database
-        var stalePresences = await _dbContext.UserPresences
+            removedConnections = staleConnections.Count;
+        }
+
+        // Persist offline state for the connections just removed
+        await FlushPendingChangesAsync();
+
+        // Rows left online by a crashed or restarted instance
+        using var scope = _scopeFactory.CreateScope();
+        var dbContext = scope.ServiceProvider.GetRequiredService<IAppDbContext>();
+        var stalePresences = await dbContext.UserPresences
             .Where(up => up.IsOnline && up.LastSeen < cutoffTime)
-            .ToListAsync();
+            .ExecuteUpdateAsync(setters => setters
+                .SetProperty(up => up.IsOnline, false)
+                .SetProperty(up => up.UpdatedAt, now));
+
+        if (removedConnections > 0 || stalePresences > 0)
+        {
+            _logger.LogInformation(
+                "Cleaned up {ConnectionCount} stale connections and {PresenceCount} stale presence records",
+                removedConnections,
+                stalePresences);
+        }
+    }
+
+    public async Task FlushPendingChangesAsync(CancellationToken cancellationToken = default)
+    {
+        var batchSize = Math.Max(1, _settings.FlushBatchSize);
+
+        while (!cancellationToken.IsCancellationRequested)
+        {
+            var batch = TakeDirtyBatch(batchSize);
+            if (batch.Count == 0)
+            {
+                return;
+            }
+
+            try
+            {
+                await WriteBatchAsync(batch, cancellationToken);
+                MarkPersisted(batch);
+            }
+            catch (Exception ex)
+            {
+                // Keep the changes queued; the next flush retries them
+                lock (_sync)
+                {
+                    foreach (var write in batch)
+                    {
+                        _dirty.Add((write.UserId, write.WorkspaceId));
+                    }
+                }
+
+                _logger.LogWarning(ex, "Failed to flush {Count} presence changes", batch.Count);
+                return;
+            }
+        }
+    }
 
-        foreach (var presence in stalePresences)
+    private List<PresenceWrite> TakeDirtyBatch(int batchSize)
+    {
+        lock (_sync)
         {
-            presence.IsOnline = false;
+            var batch = new List<PresenceWrite>(Math.Min(batchSize, _dirty.Count));
+
+            foreach (var key in _dirty)
+            {
+                if (batch.Count == batchSize)
+                {
+                    break;
+                }
+
+                if (_presences.TryGetValue(key, out var presence))
+                {
+                    batch.Add(new PresenceWrite(
+                        key.UserId,
+                        key.WorkspaceId,
+                        presence.LastConnectionId,
+                        presence.LastSeen,
+                        presence.ConnectionIds.Count > 0));
+                }
+            }
+
+            foreach (var write in batch)
+            {
+                _dirty.Remove((write.UserId, write.WorkspaceId));
+            }
+
+            return batch;
         }
+    }
 
-        await _dbContext.SaveChangesAsync();
+    private async Task WriteBatchAsync(List<PresenceWrite> batch, CancellationToken cancellationToken)
+    {
+        var userIds = batch.Select(w => w.UserId).Distinct().ToList();
+        var workspaceIds = batch.Select(w => w.WorkspaceId).Distinct().ToList();
+
+        using var scope = _scopeFactory.CreateScope();
+        var dbContext = scope.ServiceProvider.GetRequiredService<IAppDbContext>();
 
-        // Clean up in-memory cache
-        var staleConnections = _activeConnections
-            .Where(kvp => kvp.Value.LastSeen < cutoffTime)
-            .Select(kvp => kvp.Key)
-            .ToList();
+        var existing = await dbContext.UserPresences
+            .Where(up => userIds.Contains(up.UserId) && workspaceIds.Contains(up.WorkspaceId))
+            .ToDictionaryAsync(up => (up.UserId, up.WorkspaceId), cancellationToken);
 
-        foreach (var connectionId in staleConnections)
+        foreach (var write in batch)
         {
-            _activeConnections.TryRemove(connectionId, out _);
+            if (existing.TryGetValue((write.UserId, write.WorkspaceId), out var presence))
+            {
+                presence.ConnectionId = write.ConnectionId;
+                presence.LastSeen = write.LastSeen;
+                presence.IsOnline = write.IsOnline;
+            }
+            else
+            {
+                dbContext.UserPresences.Add(new UserPresence
+                {
+                    UserId = write.UserId,
+                    WorkspaceId = write.WorkspaceId,
+                    ConnectionId = write.ConnectionId,
+                    LastSeen = write.LastSeen,
+                    IsOnline = write.IsOnline
+                });
+            }
         }
 
-        if (stalePresences.Count > 0)
+        await dbContext.SaveChangesAsync(cancellationToken);
+    }
+
+    private void MarkPersisted(List<PresenceWrite> batch)
+    {
+        lock (_sync)
         {
-            _logger.LogInformation("Cleaned up {Count} stale connections", stalePresences.Count);
+            foreach (var write in batch)
+            {
+                var key = (write.UserId, write.WorkspaceId);
+                if (!_presences.TryGetValue(key, out var presence))
+                {
+                    continue;
+                }
+
+                presence.PersistedLastSeen = write.LastSeen;
+
+                // Offline entries only stay in memory until their final state is written
+                if (presence.ConnectionIds.Count == 0 && !_dirty.Contains(key))
+                {
+                    _presences.Remove(key);
+                }
+            }
         }
     }
+
+    // Caller must hold _sync
+    private void DetachConnection(string connectionId, ConnectionEntry connection, DateTime now)
+    {
+        foreach (var workspaceId in connection.WorkspaceIds)
+        {
+            var key = (connection.UserId, workspaceId);
+            if (!_presences.TryGetValue(key, out var presence))
+            {
+                continue;
+            }
+
+            presence.ConnectionIds.Remove(connectionId);
+
+            // Mark as offline if no other connections
+            if (presence.ConnectionIds.Count == 0)
+            {
+                presence.LastSeen = now;
+                RemoveFromIndex(_onlineUsersByWorkspace, workspaceId, connection.UserId);
+                _dirty.Add(key);
+            }
+        }
+    }
+
+    private static UserPresence ToUserPresence(Guid userId, Guid workspaceId, PresenceEntry entry)
+    {
+        return new UserPresence
+        {
+            UserId = userId,
+            WorkspaceId = workspaceId,
+            ConnectionId = entry.LastConnectionId,
+            LastSeen = entry.LastSeen,
+            IsOnline = entry.ConnectionIds.Count > 0
+        };
+    }
+
+    private static HashSet<TValue> GetOrAdd<TKey, TValue>(Dictionary<TKey, HashSet<TValue>> index, TKey key)
+        where TKey : notnull
+    {
+        if (!index.TryGetValue(key, out var set))
+        {
+            set = new HashSet<TValue>();
+            index[key] = set;
+        }
+
+        return set;
+    }
+
+    private static void RemoveFromIndex<TKey, TValue>(Dictionary<TKey, HashSet<TValue>> index, TKey key, TValue value)
+        where TKey : notnull
+    {
+        if (index.TryGetValue(key, out var set) && set.Remove(value) && set.Count == 0)
+        {
+            index.Remove(key);
+        }
+    }
+
+    private sealed class ConnectionEntry
+    {
+        public ConnectionEntry(Guid userId)
+        {
+            UserId = userId;
+        }
+
+        public Guid UserId { get; }
+        public HashSet<Guid> WorkspaceIds { get; } = new();
+        public DateTime LastSeen { get; set; }
+    }
+
+    private sealed class PresenceEntry
+    {
+        public HashSet<string> ConnectionIds { get; } = new();
+        public string? LastConnectionId { get; set; }
+        public DateTime LastSeen { get; set; }
+        public DateTime PersistedLastSeen { get; set; } = DateTime.MinValue;
+    }
+
+    private sealed record PresenceWrite(
+        Guid UserId,
+        Guid WorkspaceId,
+        string? ConnectionId,
+        DateTime LastSeen,
+        bool IsOnline);
 }
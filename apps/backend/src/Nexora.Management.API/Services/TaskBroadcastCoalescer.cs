@@ -0,0 +1,105 @@
+using Nexora.Management.API.Hubs;
+using Nexora.Management.Application.DTOs.SignalR;
+
+namespace Nexora.Management.API.Services;
+
+/// <summary>
+/// Merges a window of broadcast events into one <see cref="TasksChangedMessage"/> per tasklist
+/// </summary>
+public static class TaskBroadcastCoalescer
+{
+    /// <summary>
+    /// Groups events by tasklist and keeps one change per entity, in order of first appearance:
+    /// later events replace earlier ones, a creation stays a creation when updated again,
+    /// and an entity both created and deleted inside the window is left out entirely.
+    /// Tasklists in <paramref name="resyncTaskListIds"/> are flagged, with an empty batch if needed.
+    /// </summary>
+    public static List<TasksChangedMessage> Coalesce(
+        IReadOnlyList<TaskBroadcastEvent> events,
+        IReadOnlySet<Guid>? resyncTaskListIds = null)
+    {
+        var batches = new Dictionary<Guid, TaskListBatch>();
+
+        foreach (var e in events)
+        {
+            if (!batches.TryGetValue(e.TaskListId, out var batch))
+            {
+                batch = new TaskListBatch();
+                batches[e.TaskListId] = batch;
+            }
+
+            if (!batch.Changes.TryGetValue(e.EntityId, out var existing))
+            {
+                batch.Order.Add(e.EntityId);
+                batch.Changes[e.EntityId] = new TaskChangeEntry
+                {
+                    Event = e.EventName,
+                    EntityId = e.EntityId,
+                    Message = e.Message
+                };
+                continue;
+            }
+
+            if (TaskHubEvents.IsCreation(existing.Event) && TaskHubEvents.IsDeletion(e.EventName))
+            {
+                // Clients never saw it; the slot stays in Order and is skipped below
+                batch.Changes.Remove(e.EntityId);
+                continue;
+            }
+
+            if (!TaskHubEvents.IsCreation(existing.Event) || TaskHubEvents.IsDeletion(e.EventName))
+            {
+                existing.Event = e.EventName;
+            }
+            existing.Message = e.Message;
+        }
+
+        if (resyncTaskListIds != null)
+        {
+            foreach (var taskListId in resyncTaskListIds)
+            {
+                if (!batches.TryGetValue(taskListId, out var batch))
+                {
+                    batch = new TaskListBatch();
+                    batches[taskListId] = batch;
+                }
+                batch.ResyncRequired = true;
+            }
+        }
+
+        var messages = new List<TasksChangedMessage>(batches.Count);
+        foreach (var (taskListId, batch) in batches)
+        {
+            var changes = new List<TaskChangeEntry>(batch.Changes.Count);
+            foreach (var entityId in batch.Order)
+            {
+                // Removing as we go emits an entity re-created after a cancelled create only once
+                if (batch.Changes.Remove(entityId, out var change))
+                {
+                    changes.Add(change);
+                }
+            }
+
+            if (changes.Count == 0 && !batch.ResyncRequired)
+            {
+                continue;
+            }
+
+            messages.Add(new TasksChangedMessage
+            {
+                TaskListId = taskListId,
+                Changes = changes,
+                ResyncRequired = batch.ResyncRequired
+            });
+        }
+
+        return messages;
+    }
+
+    private sealed class TaskListBatch
+    {
+        public List<Guid> Order { get; } = new();
+        public Dictionary<Guid, TaskChangeEntry> Changes { get; } = new();
+        public bool ResyncRequired { get; set; }
+    }
+}
@@ -0,0 +1,93 @@
+using System.Diagnostics;
+using Microsoft.AspNetCore.SignalR;
+using Nexora.Management.API.Common;
+using Nexora.Management.API.Hubs;
+
+namespace Nexora.Management.API.Services;
+
+/// <summary>
+/// Hosted consumer of <see cref="TaskBroadcastQueue"/>: waits one coalescing window after
+/// the first pending event, drains the channel and sends one TasksChanged batch per tasklist group
+/// </summary>
+public class TaskBroadcastDispatcher : BackgroundService
+{
+    private readonly TaskBroadcastQueue _queue;
+    private readonly IHubContext<TaskHub> _taskHub;
+    private readonly TaskBroadcastSettings _settings;
+    private readonly ILogger<TaskBroadcastDispatcher> _logger;
+
+    public TaskBroadcastDispatcher(
+        TaskBroadcastQueue queue,
+        IHubContext<TaskHub> taskHub,
+        TaskBroadcastSettings settings,
+        ILogger<TaskBroadcastDispatcher> logger)
+    {
+        _queue = queue;
+        _taskHub = taskHub;
+        _settings = settings;
+        _logger = logger;
+    }
+
+    protected override async Task ExecuteAsync(CancellationToken stoppingToken)
+    {
+        var window = TimeSpan.FromMilliseconds(Math.Max(0, _settings.CoalesceWindowMilliseconds));
+        var maxBatchSize = Math.Max(1, _settings.MaxBatchSize);
+        var events = new List<TaskBroadcastEvent>(maxBatchSize);
+
+        try
+        {
+            while (await _queue.Reader.WaitToReadAsync(stoppingToken))
+            {
+                if (window > TimeSpan.Zero)
+                {
+                    await Task.Delay(window, stoppingToken);
+                }
+
+                events.Clear();
+                while (events.Count < maxBatchSize && _queue.Reader.TryRead(out var e))
+                {
+                    events.Add(e);
+                }
+
+                try
+                {
+                    await DispatchAsync(events, stoppingToken);
+                }
+                catch (Exception ex) when (ex is not OperationCanceledException)
+                {
+                    _logger.LogError(ex, "Task broadcast dispatch failed for {EventCount} events", events.Count);
+                }
+            }
+        }
+        catch (OperationCanceledException)
+        {
+            // Host is shutting down
+        }
+    }
+
+    public override async Task StopAsync(CancellationToken cancellationToken)
+    {
+        _queue.Complete();
+        await base.StopAsync(cancellationToken);
+    }
+
+    private async Task DispatchAsync(List<TaskBroadcastEvent> events, CancellationToken ct)
+    {
+        var stopwatch = Stopwatch.StartNew();
+        var resyncTaskListIds = _queue.TakeResyncTaskListIds();
+        if (resyncTaskListIds.Count > 0)
+        {
+            _logger.LogWarning("Task broadcast queue overflowed; {TaskListCount} tasklists asked to resync", resyncTaskListIds.Count);
+        }
+
+        var batches = TaskBroadcastCoalescer.Coalesce(events, resyncTaskListIds);
+
+        // Groups are independent, so fan out to all of them at once
+        await Task.WhenAll(batches.Select(batch => _taskHub.Clients
+            .Group(TaskHub.GetTaskListGroupName(batch.TaskListId))
+            .SendAsync(TaskHubEvents.TasksChanged, batch, ct)));
+
+        _queue.RecordDispatch(events.Count, batches.Sum(b => b.Changes.Count), batches.Count, stopwatch.Elapsed);
+        _logger.LogDebug("Dispatched {EventCount} task events as {BatchCount} batches", events.Count, batches.Count);
+    }
+}
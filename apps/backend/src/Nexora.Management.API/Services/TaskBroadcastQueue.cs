@@ -0,0 +1,138 @@
+using System.Collections.Concurrent;
+using System.Threading.Channels;
+using Nexora.Management.API.Common;
+
+namespace Nexora.Management.API.Services;
+
+/// <summary>
+/// A change to broadcast to the subscribers of a tasklist
+/// </summary>
+/// <param name="TaskListId">Tasklist whose group receives the event</param>
+/// <param name="EventName">One of <see cref="Hubs.TaskHubEvents"/></param>
+/// <param name="EntityId">Task, comment or attachment the event is about; events for the same entity are merged</param>
+/// <param name="Message">Payload sent to clients</param>
+public readonly record struct TaskBroadcastEvent(Guid TaskListId, string EventName, Guid EntityId, object Message);
+
+/// <summary>
+/// Point-in-time counters for the broadcast pipeline
+/// </summary>
+public record TaskBroadcastMetrics(
+    long Published,
+    long Dropped,
+    long Coalesced,
+    long BatchesSent,
+    int QueueDepth,
+    int MaxQueueDepth,
+    double LastDispatchMilliseconds);
+
+/// <summary>
+/// Takes TaskHub broadcasts off the request path
+/// </summary>
+public interface ITaskBroadcaster
+{
+    /// <summary>
+    /// Queues an event for the dispatcher. Never blocks; under backpressure the
+    /// oldest pending event is dropped and its tasklist is told to resync.
+    /// </summary>
+    void Publish(Guid taskListId, string eventName, Guid entityId, object message);
+
+    TaskBroadcastMetrics GetMetrics();
+}
+
+/// <summary>
+/// Bounded channel between the endpoints and <see cref="TaskBroadcastDispatcher"/>.
+/// Must be registered as Singleton.
+/// </summary>
+public class TaskBroadcastQueue : ITaskBroadcaster
+{
+    private readonly Channel<TaskBroadcastEvent> _channel;
+    private readonly ConcurrentDictionary<Guid, byte> _resyncTaskListIds = new();
+
+    private long _published;
+    private long _dropped;
+    private long _coalesced;
+    private long _batchesSent;
+    private int _maxQueueDepth;
+    private long _lastDispatchTicks;
+
+    public TaskBroadcastQueue(TaskBroadcastSettings settings)
+    {
+        var options = new BoundedChannelOptions(Math.Max(1, settings.ChannelCapacity))
+        {
+            FullMode = BoundedChannelFullMode.DropOldest,
+            SingleReader = true,
+            SingleWriter = false
+        };
+
+        _channel = Channel.CreateBounded<TaskBroadcastEvent>(options, OnDropped);
+    }
+
+    public ChannelReader<TaskBroadcastEvent> Reader => _channel.Reader;
+
+    public void Publish(Guid taskListId, string eventName, Guid entityId, object message)
+    {
+        // DropOldest means TryWrite only fails once the channel is completed
+        if (!_channel.Writer.TryWrite(new TaskBroadcastEvent(taskListId, eventName, entityId, message)))
+        {
+            return;
+        }
+
+        Interlocked.Increment(ref _published);
+
+        var depth = _channel.Reader.Count;
+        int observed;
+        while (depth > (observed = Volatile.Read(ref _maxQueueDepth)))
+        {
+            if (Interlocked.CompareExchange(ref _maxQueueDepth, depth, observed) == observed)
+            {
+                break;
+            }
+        }
+    }
+
+    public TaskBroadcastMetrics GetMetrics() => new(
+        Interlocked.Read(ref _published),
+        Interlocked.Read(ref _dropped),
+        Interlocked.Read(ref _coalesced),
+        Interlocked.Read(ref _batchesSent),
+        _channel.Reader.Count,
+        Volatile.Read(ref _maxQueueDepth),
+        TimeSpan.FromTicks(Interlocked.Read(ref _lastDispatchTicks)).TotalMilliseconds);
+
+    /// <summary>
+    /// Returns and clears the tasklists that lost events since the last call
+    /// </summary>
+    public IReadOnlySet<Guid> TakeResyncTaskListIds()
+    {
+        if (_resyncTaskListIds.IsEmpty)
+        {
+            return new HashSet<Guid>();
+        }
+
+        var taskListIds = new HashSet<Guid>();
+        foreach (var taskListId in _resyncTaskListIds.Keys)
+        {
+            if (_resyncTaskListIds.TryRemove(taskListId, out _))
+            {
+                taskListIds.Add(taskListId);
+            }
+        }
+
+        return taskListIds;
+    }
+
+    public void RecordDispatch(int events, int changes, int batches, TimeSpan elapsed)
+    {
+        Interlocked.Add(ref _coalesced, events - changes);
+        Interlocked.Add(ref _batchesSent, batches);
+        Interlocked.Exchange(ref _lastDispatchTicks, elapsed.Ticks);
+    }
+
+    public void Complete() => _channel.Writer.TryComplete();
+
+    private void OnDropped(TaskBroadcastEvent dropped)
+    {
+        Interlocked.Increment(ref _dropped);
+        _resyncTaskListIds.TryAdd(dropped.TaskListId, 0);
+    }
+}
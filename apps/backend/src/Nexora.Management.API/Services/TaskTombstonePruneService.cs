@@ -0,0 +1,57 @@
+using Nexora.Management.API.Common;
+using Nexora.Management.Application.Tasks.Queries.ViewQueries;
+using Nexora.Management.Infrastructure.Interfaces;
+
+namespace Nexora.Management.API.Services;
+
+/// <summary>
+/// Periodically prunes task tombstones older than the retention window
+/// </summary>
+public class TaskTombstonePruneService : BackgroundService
+{
+    private readonly IServiceScopeFactory _scopeFactory;
+    private readonly TaskViewSyncSettings _settings;
+    private readonly ILogger<TaskTombstonePruneService> _logger;
+
+    public TaskTombstonePruneService(
+        IServiceScopeFactory scopeFactory,
+        TaskViewSyncSettings settings,
+        ILogger<TaskTombstonePruneService> logger)
+    {
+        _scopeFactory = scopeFactory;
+        _settings = settings;
+        _logger = logger;
+    }
+
+    protected override async Task ExecuteAsync(CancellationToken stoppingToken)
+    {
+        using var timer = new PeriodicTimer(TimeSpan.FromMinutes(Math.Max(1, _settings.PruneIntervalMinutes)));
+
+        try
+        {
+            while (await timer.WaitForNextTickAsync(stoppingToken))
+            {
+                try
+                {
+                    using var scope = _scopeFactory.CreateScope();
+                    var db = scope.ServiceProvider.GetRequiredService<IAppDbContext>();
+                    var cutoff = DateTime.UtcNow.AddDays(-Math.Max(1, _settings.TombstoneRetentionDays));
+
+                    var pruned = await TaskViewSync.PruneTombstonesAsync(db, cutoff);
+                    if (pruned > 0)
+                    {
+                        _logger.LogInformation("Pruned task tombstones for {TaskListCount} task lists", pruned);
+                    }
+                }
+                catch (Exception ex) when (ex is not OperationCanceledException)
+                {
+                    _logger.LogError(ex, "Task tombstone pruning failed");
+                }
+            }
+        }
+        catch (OperationCanceledException)
+        {
+            // Host is shutting down
+        }
+    }
+}
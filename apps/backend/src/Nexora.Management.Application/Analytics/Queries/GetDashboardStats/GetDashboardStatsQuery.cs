@@ -3,6 +3,7 @@ using Microsoft.EntityFrameworkCore;
 using Nexora.Management.Application.Analytics.DTOs;
 using Nexora.Management.Application.Common;
 using Nexora.Management.Infrastructure.Interfaces;
+using AnalyticsRollup = Nexora.Management.Domain.Entities.AnalyticsRollup;
 
 namespace Nexora.Management.Application.Analytics.Queries.GetDashboardStats;
 
@@ -19,21 +20,19 @@ public class GetDashboardStatsQueryHandler : IRequestHandler<GetDashboardStatsQu
 
     public async Task<Result<DashboardStatsDto>> Handle(GetDashboardStatsQuery request, CancellationToken ct)
     {
-        // Get task statistics
-        var totalTasks = await _db.Tasks
-            .CountAsync(t => t.TaskList != null && t.TaskList.Space != null && t.TaskList.Space.WorkspaceId == request.WorkspaceId, ct);
+        // Get task statistics from the workspace rollup (maintained incrementally)
+        var taskStats = await _db.AnalyticsRollups
+            .AsNoTracking()
+            .Where(r => r.WorkspaceId == request.WorkspaceId
+                     && r.ScopeType == AnalyticsRollup.WorkspaceScope
+                     && r.ScopeId == request.WorkspaceId)
+            .Select(r => new { r.TotalTasks, r.CompletedTasks, r.InProgressTasks, r.OverdueTasks })
+            .FirstOrDefaultAsync(ct);
 
-        var completedTasks = await _db.Tasks
-            .CountAsync(t => t.TaskList != null && t.TaskList.Space != null && t.TaskList.Space.WorkspaceId == request.WorkspaceId
-                           && t.Status != null && t.Status.Name == "complete", ct);
-
-        var inProgressTasks = await _db.Tasks
-            .CountAsync(t => t.TaskList != null && t.TaskList.Space != null && t.TaskList.Space.WorkspaceId == request.WorkspaceId
-                           && t.Status != null && t.Status.Name == "inProgress", ct);
-
-        var overdueTasks = await _db.Tasks
-            .CountAsync(t => t.TaskList != null && t.TaskList.Space != null && t.TaskList.Space.WorkspaceId == request.WorkspaceId
-                           && t.DueDate.HasValue && t.DueDate < DateTime.UtcNow && (t.Status == null || t.Status.Name != "complete"), ct);
+        var totalTasks = taskStats?.TotalTasks ?? 0;
+        var completedTasks = taskStats?.CompletedTasks ?? 0;
+        var inProgressTasks = taskStats?.InProgressTasks ?? 0;
+        var overdueTasks = taskStats?.OverdueTasks ?? 0;
 
         // Get project statistics (TaskLists)
         var totalProjects = await _db.TaskLists
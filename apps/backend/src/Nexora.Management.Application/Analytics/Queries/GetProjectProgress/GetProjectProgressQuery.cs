@@ -3,6 +3,7 @@ using Microsoft.EntityFrameworkCore;
 using Nexora.Management.Application.Analytics.DTOs;
 using Nexora.Management.Application.Common;
 using Nexora.Management.Infrastructure.Interfaces;
+using AnalyticsRollup = Nexora.Management.Domain.Entities.AnalyticsRollup;
 
 namespace Nexora.Management.Application.Analytics.Queries.GetProjectProgress;
 
@@ -19,17 +20,23 @@ public class GetProjectProgressQueryHandler : IRequestHandler<GetProjectProgress
 
     public async Task<Result<List<ProjectProgressDto>>> Handle(GetProjectProgressQuery request, CancellationToken ct)
     {
-        // Single query with aggregation - eliminates N+1 problem
-        var projectStats = await _db.TaskLists
-            .Where(tl => tl.Space != null && tl.Space.WorkspaceId == request.WorkspaceId)
-            .Select(tl => new
+        // Single query joining each tasklist to its precomputed rollup
+        var rollups = _db.AnalyticsRollups
+            .Where(r => r.WorkspaceId == request.WorkspaceId && r.ScopeType == AnalyticsRollup.TaskListScope);
+
+        var projectStats = await (
+            from tl in _db.TaskLists.AsNoTracking()
+            where tl.Space.WorkspaceId == request.WorkspaceId
+            join r in rollups on tl.Id equals r.ScopeId into rollupGroup
+            from r in rollupGroup.DefaultIfEmpty()
+            select new
             {
                 tl.Id,
                 tl.Name,
                 tl.Color,
-                TotalTasks = _db.Tasks.Count(t => t.TaskListId == tl.Id),
-                CompletedTasks = _db.Tasks.Count(t => t.TaskListId == tl.Id && t.Status != null && t.Status.Name == "complete"),
-                InProgressTasks = _db.Tasks.Count(t => t.TaskListId == tl.Id && t.Status != null && t.Status.Name == "inProgress")
+                TotalTasks = r != null ? r.TotalTasks : 0,
+                CompletedTasks = r != null ? r.CompletedTasks : 0,
+                InProgressTasks = r != null ? r.InProgressTasks : 0
             })
             .ToListAsync(ct);
 
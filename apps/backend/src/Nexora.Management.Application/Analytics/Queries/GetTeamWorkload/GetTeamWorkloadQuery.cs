@@ -3,6 +3,7 @@ using Microsoft.EntityFrameworkCore;
 using Nexora.Management.Application.Analytics.DTOs;
 using Nexora.Management.Application.Common;
 using Nexora.Management.Infrastructure.Interfaces;
+using AnalyticsRollup = Nexora.Management.Domain.Entities.AnalyticsRollup;
 
 namespace Nexora.Management.Application.Analytics.Queries.GetTeamWorkload;
 
@@ -19,42 +20,25 @@ public class GetTeamWorkloadQueryHandler : IRequestHandler<GetTeamWorkloadQuery,
 
     public async Task<Result<List<TeamWorkloadDto>>> Handle(GetTeamWorkloadQuery request, CancellationToken ct)
     {
-        // Single query with LEFT JOINs and aggregation - eliminates N+1 problem
-        var teamStats = await _db.WorkspaceMembers
-            .Where(wm => wm.WorkspaceId == request.WorkspaceId)
-            .Select(wm => new
+        // Single query joining each member to their precomputed rollup
+        var rollups = _db.AnalyticsRollups
+            .Where(r => r.WorkspaceId == request.WorkspaceId && r.ScopeType == AnalyticsRollup.MemberScope);
+
+        var teamStats = await (
+            from wm in _db.WorkspaceMembers.AsNoTracking()
+            where wm.WorkspaceId == request.WorkspaceId
+            join r in rollups on wm.UserId equals r.ScopeId into rollupGroup
+            from r in rollupGroup.DefaultIfEmpty()
+            select new
             {
                 wm.UserId,
                 UserName = wm.User.Name,
                 UserAvatar = wm.User.AvatarUrl,
                 RoleName = wm.Role.Name,
-                // Task counts
-                AssignedTasks = _db.Tasks.Count(t =>
-                    t.AssigneeId == wm.UserId &&
-                    t.TaskList != null &&
-                    t.TaskList.Space != null &&
-                    t.TaskList.Space.WorkspaceId == request.WorkspaceId),
-                CompletedTasks = _db.Tasks.Count(t =>
-                    t.AssigneeId == wm.UserId &&
-                    t.Status != null &&
-                    t.Status.Name == "complete" &&
-                    t.TaskList != null &&
-                    t.TaskList.Space != null &&
-                    t.TaskList.Space.WorkspaceId == request.WorkspaceId),
-                InProgressTasks = _db.Tasks.Count(t =>
-                    t.AssigneeId == wm.UserId &&
-                    t.Status != null &&
-                    t.Status.Name == "inProgress" &&
-                    t.TaskList != null &&
-                    t.TaskList.Space != null &&
-                    t.TaskList.Space.WorkspaceId == request.WorkspaceId),
-                // Time entries sum
-                TotalHours = _db.TimeEntries
-                    .Where(te =>
-                        te.UserId == wm.UserId &&
-                        te.WorkspaceId == request.WorkspaceId &&
-                        te.Status == "approved")
-                    .Sum(te => (double?)te.DurationMinutes) / 60.0 ?? 0.0
+                AssignedTasks = r != null ? r.TotalTasks : 0,
+                CompletedTasks = r != null ? r.CompletedTasks : 0,
+                InProgressTasks = r != null ? r.InProgressTasks : 0,
+                ApprovedMinutes = r != null ? r.ApprovedMinutes : 0L
             })
             .ToListAsync(ct);
 
@@ -69,7 +53,7 @@ public class GetTeamWorkloadQueryHandler : IRequestHandler<GetTeamWorkloadQuery,
                 CompletionRate: ts.AssignedTasks > 0
                     ? Math.Round((decimal)ts.CompletedTasks / ts.AssignedTasks * 100, 2)
                     : 0,
-                TotalHours: (int)Math.Round(ts.TotalHours)
+                TotalHours: (int)Math.Round(ts.ApprovedMinutes / 60.0)
             ))
             .ToList();
 
@@ -0,0 +1,251 @@
+using System.Text;
+using Microsoft.EntityFrameworkCore;
+using Nexora.Management.Infrastructure.Interfaces;
+using AnalyticsRollup = Nexora.Management.Domain.Entities.AnalyticsRollup;
+using DomainTask = Nexora.Management.Domain.Entities.Task;
+
+namespace Nexora.Management.Application.Analytics.Rollups;
+
+/// <summary>
+/// Maintains per-workspace, per-tasklist and per-member analytics counters
+/// </summary>
+public interface IAnalyticsRollupStore
+{
+    /// <summary>
+    /// Captures how the task currently contributes to the rollups.
+    /// Returns null if the task's tasklist no longer resolves to a workspace.
+    /// </summary>
+    Task<TaskRollupSnapshot?> CaptureAsync(DomainTask task, CancellationToken ct = default);
+
+    /// <summary>
+    /// Applies the difference between two task snapshots to the stored counters
+    /// </summary>
+    Task ApplyTaskChangeAsync(TaskRollupSnapshot? before, TaskRollupSnapshot? after, CancellationToken ct = default);
+
+    /// <summary>
+    /// Adds the minutes of newly approved time entries to the stored counters
+    /// </summary>
+    Task AddApprovedMinutesAsync(IReadOnlyCollection<Guid> timeEntryIds, CancellationToken ct = default);
+
+    /// <summary>
+    /// Recomputes all rollups from scratch, for one workspace or for every workspace
+    /// </summary>
+    Task RebuildAsync(Guid? workspaceId = null, CancellationToken ct = default);
+}
+
+/// <summary>
+/// PostgreSQL-backed rollup store. Incremental changes are applied as a single
+/// multi-row upsert; the rebuild is one set-based statement per call.
+/// </summary>
+public class AnalyticsRollupStore : IAnalyticsRollupStore
+{
+    private const string UpsertPrefix = """
+        INSERT INTO analytics_rollups
+            ("Id", "WorkspaceId", "ScopeType", "ScopeId", "TotalTasks", "CompletedTasks",
+             "InProgressTasks", "OverdueTasks", "ApprovedMinutes", "CreatedAt", "UpdatedAt")
+        VALUES
+        """;
+
+    private const string UpsertSuffix = """
+
+        ON CONFLICT ("WorkspaceId", "ScopeType", "ScopeId") DO UPDATE SET
+            "TotalTasks" = analytics_rollups."TotalTasks" + EXCLUDED."TotalTasks",
+            "CompletedTasks" = analytics_rollups."CompletedTasks" + EXCLUDED."CompletedTasks",
+            "InProgressTasks" = analytics_rollups."InProgressTasks" + EXCLUDED."InProgressTasks",
+            "OverdueTasks" = analytics_rollups."OverdueTasks" + EXCLUDED."OverdueTasks",
+            "ApprovedMinutes" = analytics_rollups."ApprovedMinutes" + EXCLUDED."ApprovedMinutes",
+            "UpdatedAt" = now()
+        """;
+
+    private readonly IAppDbContext _db;
+
+    public AnalyticsRollupStore(IAppDbContext db)
+    {
+        _db = db;
+    }
+
+    public async Task<TaskRollupSnapshot?> CaptureAsync(DomainTask task, CancellationToken ct = default)
+    {
+        var workspaceId = await _db.TaskLists
+            .Where(tl => tl.Id == task.TaskListId)
+            .Select(tl => (Guid?)tl.Space.WorkspaceId)
+            .FirstOrDefaultAsync(ct);
+
+        if (workspaceId == null)
+        {
+            return null;
+        }
+
+        string? statusName = null;
+        if (task.StatusId.HasValue)
+        {
+            statusName = await _db.TaskStatuses
+                .Where(s => s.Id == task.StatusId.Value)
+                .Select(s => s.Name)
+                .FirstOrDefaultAsync(ct);
+        }
+
+        return TaskRollupSnapshot.Create(workspaceId.Value, task, statusName, DateTime.UtcNow);
+    }
+
+    public Task ApplyTaskChangeAsync(TaskRollupSnapshot? before, TaskRollupSnapshot? after, CancellationToken ct = default)
+    {
+        return UpsertAsync(TaskRollupSnapshot.ComputeDeltas(before, after));
+    }
+
+    public async Task AddApprovedMinutesAsync(IReadOnlyCollection<Guid> timeEntryIds, CancellationToken ct = default)
+    {
+        if (timeEntryIds.Count == 0)
+        {
+            return;
+        }
+
+        var entries = await _db.TimeEntries
+            .AsNoTracking()
+            .Where(te => timeEntryIds.Contains(te.Id) && te.WorkspaceId != null)
+            .Select(te => new
+            {
+                WorkspaceId = te.WorkspaceId!.Value,
+                te.UserId,
+                TaskListId = te.Task != null ? (Guid?)te.Task.TaskListId : null,
+                te.DurationMinutes
+            })
+            .ToListAsync(ct);
+
+        var deltas = new List<RollupDelta>();
+
+        foreach (var group in entries.GroupBy(e => e.WorkspaceId))
+        {
+            deltas.Add(MinutesDelta(group.Key, AnalyticsRollup.WorkspaceScope, group.Key, group.Sum(e => (long)e.DurationMinutes)));
+
+            deltas.AddRange(group
+                .GroupBy(e => e.UserId)
+                .Select(g => MinutesDelta(group.Key, AnalyticsRollup.MemberScope, g.Key, g.Sum(e => (long)e.DurationMinutes))));
+
+            deltas.AddRange(group
+                .Where(e => e.TaskListId.HasValue)
+                .GroupBy(e => e.TaskListId!.Value)
+                .Select(g => MinutesDelta(group.Key, AnalyticsRollup.TaskListScope, g.Key, g.Sum(e => (long)e.DurationMinutes))));
+        }
+
+        await UpsertAsync(deltas.Where(d => !d.IsEmpty).ToList());
+    }
+
+    public async Task RebuildAsync(Guid? workspaceId = null, CancellationToken ct = default)
+    {
+        var taskFilter = workspaceId.HasValue ? """AND s."WorkspaceId" = {0}""" : string.Empty;
+        var timeFilter = workspaceId.HasValue ? """AND te."WorkspaceId" = {0}""" : string.Empty;
+        var deleteFilter = workspaceId.HasValue ? """WHERE "WorkspaceId" = {0}""" : string.Empty;
+
+        // Delete and insert run as one command, so readers never observe empty rollups
+        var sql = $"""
+            DELETE FROM analytics_rollups {deleteFilter};
+
+            WITH task_facts AS (
+                SELECT
+                    s."WorkspaceId" AS workspace_id,
+                    t."TaskListId" AS tasklist_id,
+                    t."AssigneeId" AS assignee_id,
+                    CASE WHEN ts."Name" = '{TaskRollupSnapshot.CompleteStatusName}' THEN 1 ELSE 0 END AS completed,
+                    CASE WHEN ts."Name" = '{TaskRollupSnapshot.InProgressStatusName}' THEN 1 ELSE 0 END AS in_progress,
+                    CASE WHEN t."DueDate" < now()
+                          AND (ts."Name" IS NULL OR ts."Name" <> '{TaskRollupSnapshot.CompleteStatusName}')
+                         THEN 1 ELSE 0 END AS overdue
+                FROM "Tasks" t
+                JOIN "TaskLists" tl ON tl."Id" = t."TaskListId"
+                JOIN "Spaces" s ON s."Id" = tl."SpaceId"
+                LEFT JOIN "TaskStatuses" ts ON ts."Id" = t."StatusId"
+                WHERE TRUE {taskFilter}
+            ),
+            time_facts AS (
+                SELECT
+                    te."WorkspaceId" AS workspace_id,
+                    te."UserId" AS user_id,
+                    t."TaskListId" AS tasklist_id,
+                    te."DurationMinutes"::bigint AS minutes
+                FROM time_entries te
+                LEFT JOIN "Tasks" t ON t."Id" = te."TaskId"
+                WHERE te."Status" = 'approved' AND te."WorkspaceId" IS NOT NULL {timeFilter}
+            ),
+            facts AS (
+                SELECT workspace_id, '{AnalyticsRollup.WorkspaceScope}' AS scope_type, workspace_id AS scope_id,
+                       1 AS total, completed, in_progress, overdue, 0::bigint AS minutes
+                FROM task_facts
+                UNION ALL
+                SELECT workspace_id, '{AnalyticsRollup.TaskListScope}', tasklist_id, 1, completed, in_progress, overdue, 0
+                FROM task_facts
+                UNION ALL
+                SELECT workspace_id, '{AnalyticsRollup.MemberScope}', assignee_id, 1, completed, in_progress, overdue, 0
+                FROM task_facts WHERE assignee_id IS NOT NULL
+                UNION ALL
+                SELECT workspace_id, '{AnalyticsRollup.WorkspaceScope}', workspace_id, 0, 0, 0, 0, minutes
+                FROM time_facts
+                UNION ALL
+                SELECT workspace_id, '{AnalyticsRollup.MemberScope}', user_id, 0, 0, 0, 0, minutes
+                FROM time_facts
+                UNION ALL
+                SELECT workspace_id, '{AnalyticsRollup.TaskListScope}', tasklist_id, 0, 0, 0, 0, minutes
+                FROM time_facts WHERE tasklist_id IS NOT NULL
+            )
+            INSERT INTO analytics_rollups
+                ("Id", "WorkspaceId", "ScopeType", "ScopeId", "TotalTasks", "CompletedTasks",
+                 "InProgressTasks", "OverdueTasks", "ApprovedMinutes", "CreatedAt", "UpdatedAt")
+            SELECT uuid_generate_v4(), workspace_id, scope_type, scope_id,
+                   SUM(total), SUM(completed), SUM(in_progress), SUM(overdue), SUM(minutes), now(), now()
+            FROM facts
+            GROUP BY workspace_id, scope_type, scope_id;
+            """;
+
+        if (workspaceId.HasValue)
+        {
+            await _db.ExecuteSqlRawAsync(sql, workspaceId.Value);
+        }
+        else
+        {
+            await _db.ExecuteSqlRawAsync(sql);
+        }
+    }
+
+    private async Task UpsertAsync(List<RollupDelta> deltas)
+    {
+        if (deltas.Count == 0)
+        {
+            return;
+        }
+
+        // Stable row order keeps concurrent upserts from deadlocking each other
+        deltas = deltas
+            .OrderBy(d => d.WorkspaceId)
+            .ThenBy(d => d.ScopeType, StringComparer.Ordinal)
+            .ThenBy(d => d.ScopeId)
+            .ToList();
+
+        var sql = new StringBuilder(UpsertPrefix);
+        var parameters = new List<object>(deltas.Count * 8);
+
+        for (var i = 0; i < deltas.Count; i++)
+        {
+            var d = deltas[i];
+            var p = parameters.Count;
+
+            sql.Append(i == 0 ? "\n    " : ",\n    ");
+            sql.Append($"(uuid_generate_v4(), {{{p}}}, {{{p + 1}}}, {{{p + 2}}}, {{{p + 3}}}, {{{p + 4}}}, {{{p + 5}}}, {{{p + 6}}}, {{{p + 7}}}, now(), now())");
+
+            parameters.Add(d.WorkspaceId);
+            parameters.Add(d.ScopeType);
+            parameters.Add(d.ScopeId);
+            parameters.Add(d.TotalTasks);
+            parameters.Add(d.CompletedTasks);
+            parameters.Add(d.InProgressTasks);
+            parameters.Add(d.OverdueTasks);
+            parameters.Add(d.ApprovedMinutes);
+        }
+
+        sql.Append(UpsertSuffix);
+
+        await _db.ExecuteSqlRawAsync(sql.ToString(), parameters.ToArray());
+    }
+
+    private static RollupDelta MinutesDelta(Guid workspaceId, string scopeType, Guid scopeId, long minutes)
+        => new(workspaceId, scopeType, scopeId, 0, 0, 0, 0, minutes);
+}
@@ -0,0 +1,96 @@
+using AnalyticsRollup = Nexora.Management.Domain.Entities.AnalyticsRollup;
+using DomainTask = Nexora.Management.Domain.Entities.Task;
+
+namespace Nexora.Management.Application.Analytics.Rollups;
+
+/// <summary>
+/// Signed change to the counters of one rollup scope
+/// </summary>
+public record RollupDelta(
+    Guid WorkspaceId,
+    string ScopeType,
+    Guid ScopeId,
+    int TotalTasks,
+    int CompletedTasks,
+    int InProgressTasks,
+    int OverdueTasks,
+    long ApprovedMinutes
+)
+{
+    public bool IsEmpty => TotalTasks == 0 && CompletedTasks == 0 && InProgressTasks == 0
+        && OverdueTasks == 0 && ApprovedMinutes == 0;
+}
+
+/// <summary>
+/// How a single task contributes to the rollups at a point in time.
+/// Status classification happens once here instead of in every analytics query.
+/// </summary>
+public record TaskRollupSnapshot(
+    Guid WorkspaceId,
+    Guid TaskListId,
+    Guid? AssigneeId,
+    bool IsCompleted,
+    bool IsInProgress,
+    bool IsOverdue
+)
+{
+    public const string CompleteStatusName = "complete";
+    public const string InProgressStatusName = "inProgress";
+
+    public static TaskRollupSnapshot Create(Guid workspaceId, DomainTask task, string? statusName, DateTime now)
+    {
+        var isCompleted = statusName == CompleteStatusName;
+
+        return new TaskRollupSnapshot(
+            workspaceId,
+            task.TaskListId,
+            task.AssigneeId,
+            isCompleted,
+            statusName == InProgressStatusName,
+            task.DueDate.HasValue && task.DueDate < now && !isCompleted);
+    }
+
+    /// <summary>
+    /// Computes the counter changes for a task moving from one state to another.
+    /// Pass null for "before" on create and for "after" on delete.
+    /// </summary>
+    public static List<RollupDelta> ComputeDeltas(TaskRollupSnapshot? before, TaskRollupSnapshot? after)
+    {
+        var deltas = new Dictionary<(Guid WorkspaceId, string ScopeType, Guid ScopeId), RollupDelta>();
+
+        before?.Accumulate(deltas, -1);
+        after?.Accumulate(deltas, 1);
+
+        return deltas.Values.Where(d => !d.IsEmpty).ToList();
+    }
+
+    private void Accumulate(Dictionary<(Guid WorkspaceId, string ScopeType, Guid ScopeId), RollupDelta> deltas, int sign)
+    {
+        Add(deltas, AnalyticsRollup.WorkspaceScope, WorkspaceId, sign);
+        Add(deltas, AnalyticsRollup.TaskListScope, TaskListId, sign);
+
+        if (AssigneeId.HasValue)
+        {
+            Add(deltas, AnalyticsRollup.MemberScope, AssigneeId.Value, sign);
+        }
+    }
+
+    private void Add(
+        Dictionary<(Guid WorkspaceId, string ScopeType, Guid ScopeId), RollupDelta> deltas,
+        string scopeType,
+        Guid scopeId,
+        int sign)
+    {
+        var key = (WorkspaceId, scopeType, scopeId);
+        var current = deltas.GetValueOrDefault(key)
+            ?? new RollupDelta(WorkspaceId, scopeType, scopeId, 0, 0, 0, 0, 0);
+
+        deltas[key] = current with
+        {
+            TotalTasks = current.TotalTasks + sign,
+            CompletedTasks = current.CompletedTasks + (IsCompleted ? sign : 0),
+            InProgressTasks = current.InProgressTasks + (IsInProgress ? sign : 0),
+            OverdueTasks = current.OverdueTasks + (IsOverdue ? sign : 0)
+        };
+    }
+}
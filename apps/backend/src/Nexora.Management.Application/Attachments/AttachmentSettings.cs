@@ -0,0 +1,29 @@
+namespace Nexora.Management.Application.Attachments;
+
+/// <summary>
+/// Settings for attachment uploads
+/// </summary>
+public class AttachmentSettings
+{
+    public const string SectionName = "Attachments";
+
+    /// <summary>
+    /// Largest file accepted in a single upload request
+    /// </summary>
+    public long MaxFileSizeBytes { get; set; } = 100L * 1024 * 1024;
+
+    /// <summary>
+    /// Largest file accepted as a chunked, resumable upload
+    /// </summary>
+    public long MaxChunkedFileSizeBytes { get; set; } = 2L * 1024 * 1024 * 1024;
+
+    /// <summary>
+    /// Chunked uploads that receive no data for this many hours are discarded
+    /// </summary>
+    public int UploadExpiryHours { get; set; } = 24;
+
+    /// <summary>
+    /// How often expired chunked uploads are cleaned up
+    /// </summary>
+    public int UploadCleanupIntervalMinutes { get; set; } = 60;
+}
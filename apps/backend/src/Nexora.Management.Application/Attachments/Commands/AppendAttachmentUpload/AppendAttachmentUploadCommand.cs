@@ -0,0 +1,56 @@
+using MediatR;
+using Nexora.Management.Application.Common;
+using Nexora.Management.Application.Attachments.DTOs;
+using Nexora.Management.Infrastructure.Services;
+
+namespace Nexora.Management.Application.Attachments.Commands.AppendAttachmentUpload;
+
+/// <summary>
+/// Writes one chunk of a chunked upload. A chunk that does not start where the
+/// previous one ended is not accepted; the result carries the offset to resume from.
+/// </summary>
+public record AppendAttachmentUploadCommand(
+    Guid UploadId,
+    long Offset,
+    Stream Content
+) : IRequest<Result<AppendAttachmentUploadResult>>;
+
+public class AppendAttachmentUploadCommandHandler : IRequestHandler<AppendAttachmentUploadCommand, Result<AppendAttachmentUploadResult>>
+{
+    private readonly IUserContext _userContext;
+    private readonly IFileStorageService _fileStorageService;
+
+    public AppendAttachmentUploadCommandHandler(
+        IUserContext userContext,
+        IFileStorageService fileStorageService)
+    {
+        _userContext = userContext;
+        _fileStorageService = fileStorageService;
+    }
+
+    public async System.Threading.Tasks.Task<Result<AppendAttachmentUploadResult>> Handle(AppendAttachmentUploadCommand request, CancellationToken ct)
+    {
+        var session = await _fileStorageService.GetUploadAsync(request.UploadId, ct);
+        if (session == null || session.UserId != _userContext.UserId)
+        {
+            return Result<AppendAttachmentUploadResult>.Failure("Upload not found");
+        }
+
+        bool accepted;
+        try
+        {
+            accepted = request.Offset == session.ReceivedBytes
+                && await _fileStorageService.AppendUploadAsync(session, request.Offset, request.Content, ct);
+        }
+        catch (FileTooLargeException ex)
+        {
+            return Result<AppendAttachmentUploadResult>.Failure(ex.Message);
+        }
+
+        var current = await _fileStorageService.GetUploadAsync(request.UploadId, ct) ?? session;
+
+        return Result<AppendAttachmentUploadResult>.Success(new AppendAttachmentUploadResult(
+            accepted,
+            new AttachmentUploadDto(current.UploadId, current.TaskId, current.FileName, current.TotalBytes, current.ReceivedBytes)));
+    }
+}
@@ -0,0 +1,65 @@
+using MediatR;
+using Microsoft.EntityFrameworkCore;
+using Nexora.Management.Application.Common;
+using Nexora.Management.Application.Attachments.DTOs;
+using Nexora.Management.Infrastructure.Interfaces;
+using Nexora.Management.Infrastructure.Services;
+
+namespace Nexora.Management.Application.Attachments.Commands.BeginAttachmentUpload;
+
+public record BeginAttachmentUploadCommand(
+    Guid TaskId,
+    string FileName,
+    string? MimeType,
+    long TotalBytes
+) : IRequest<Result<AttachmentUploadDto>>;
+
+public class BeginAttachmentUploadCommandHandler : IRequestHandler<BeginAttachmentUploadCommand, Result<AttachmentUploadDto>>
+{
+    private readonly IAppDbContext _db;
+    private readonly IUserContext _userContext;
+    private readonly IFileStorageService _fileStorageService;
+    private readonly AttachmentSettings _settings;
+
+    public BeginAttachmentUploadCommandHandler(
+        IAppDbContext db,
+        IUserContext userContext,
+        IFileStorageService fileStorageService,
+        AttachmentSettings settings)
+    {
+        _db = db;
+        _userContext = userContext;
+        _fileStorageService = fileStorageService;
+        _settings = settings;
+    }
+
+    public async System.Threading.Tasks.Task<Result<AttachmentUploadDto>> Handle(BeginAttachmentUploadCommand request, CancellationToken ct)
+    {
+        if (request.TotalBytes <= 0)
+        {
+            return Result<AttachmentUploadDto>.Failure("File size must be greater than zero");
+        }
+
+        if (request.TotalBytes > _settings.MaxChunkedFileSizeBytes)
+        {
+            return Result<AttachmentUploadDto>.Failure($"File exceeds the maximum allowed size of {_settings.MaxChunkedFileSizeBytes} bytes");
+        }
+
+        var taskExists = await _db.Tasks.AnyAsync(t => t.Id == request.TaskId, ct);
+        if (!taskExists)
+        {
+            return Result<AttachmentUploadDto>.Failure("Task not found");
+        }
+
+        var session = await _fileStorageService.BeginUploadAsync(
+            request.TaskId,
+            _userContext.UserId,
+            request.FileName,
+            request.MimeType,
+            request.TotalBytes,
+            ct);
+
+        return Result<AttachmentUploadDto>.Success(
+            new AttachmentUploadDto(session.UploadId, session.TaskId, session.FileName, session.TotalBytes, session.ReceivedBytes));
+    }
+}
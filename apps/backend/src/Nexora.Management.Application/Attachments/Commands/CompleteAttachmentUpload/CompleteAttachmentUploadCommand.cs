@@ -0,0 +1,100 @@
+using MediatR;
+using Microsoft.EntityFrameworkCore;
+using Nexora.Management.Application.Common;
+using Nexora.Management.Application.Attachments.DTOs;
+using Nexora.Management.Domain.Entities;
+using Nexora.Management.Infrastructure.Interfaces;
+using Nexora.Management.Infrastructure.Services;
+
+namespace Nexora.Management.Application.Attachments.Commands.CompleteAttachmentUpload;
+
+/// <summary>
+/// Turns a fully received chunked upload into an attachment
+/// </summary>
+public record CompleteAttachmentUploadCommand(Guid UploadId) : IRequest<Result<AttachmentDto>>;
+
+public class CompleteAttachmentUploadCommandHandler : IRequestHandler<CompleteAttachmentUploadCommand, Result<AttachmentDto>>
+{
+    private readonly IAppDbContext _db;
+    private readonly IUserContext _userContext;
+    private readonly IFileStorageService _fileStorageService;
+
+    public CompleteAttachmentUploadCommandHandler(
+        IAppDbContext db,
+        IUserContext userContext,
+        IFileStorageService fileStorageService)
+    {
+        _db = db;
+        _userContext = userContext;
+        _fileStorageService = fileStorageService;
+    }
+
+    public async System.Threading.Tasks.Task<Result<AttachmentDto>> Handle(CompleteAttachmentUploadCommand request, CancellationToken ct)
+    {
+        var session = await _fileStorageService.GetUploadAsync(request.UploadId, ct);
+        if (session == null || session.UserId != _userContext.UserId)
+        {
+            return Result<AttachmentDto>.Failure("Upload not found");
+        }
+
+        if (session.ReceivedBytes != session.TotalBytes)
+        {
+            return Result<AttachmentDto>.Failure($"Upload is incomplete: {session.ReceivedBytes} of {session.TotalBytes} bytes received");
+        }
+
+        var taskExists = await _db.Tasks.AnyAsync(t => t.Id == session.TaskId, ct);
+        if (!taskExists)
+        {
+            return Result<AttachmentDto>.Failure("Task not found");
+        }
+
+        StoredFile stored;
+        try
+        {
+            stored = await _fileStorageService.CompleteUploadAsync(session, ct);
+        }
+        catch (IOException)
+        {
+            // Another request is writing or completing the same upload
+            return Result<AttachmentDto>.Failure("Upload is busy");
+        }
+
+        var attachment = new Attachment
+        {
+            TaskId = session.TaskId,
+            UserId = session.UserId,
+            FileName = session.FileName,
+            FilePath = stored.FilePath,
+            ContentHash = stored.ContentHash,
+            FileSizeBytes = stored.SizeBytes,
+            MimeType = session.MimeType
+        };
+
+        _db.Attachments.Add(attachment);
+        try
+        {
+            await _db.SaveChangesAsync(ct);
+        }
+        catch
+        {
+            await _fileStorageService.ReleaseAsync(stored.FilePath, stored.ContentHash, CancellationToken.None);
+            throw;
+        }
+
+        // Get user info for response
+        var user = await _db.Users.FirstOrDefaultAsync(u => u.Id == attachment.UserId, ct);
+
+        var attachmentDto = new AttachmentDto(
+            attachment.Id,
+            attachment.TaskId,
+            attachment.UserId,
+            user?.Name ?? string.Empty,
+            attachment.FileName,
+            attachment.FileSizeBytes,
+            attachment.MimeType,
+            attachment.CreatedAt
+        );
+
+        return Result<AttachmentDto>.Success(attachmentDto);
+    }
+}
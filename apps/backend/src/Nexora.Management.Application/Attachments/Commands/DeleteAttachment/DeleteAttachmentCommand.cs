@@ -40,13 +40,12 @@ public class DeleteAttachmentCommandHandler : IRequestHandler<DeleteAttachmentCo
 
         var taskId = attachment.TaskId;
 
-        // Delete file from storage
-        await _fileStorageService.DeleteFileAsync(attachment.FilePath, ct);
-
-        // Delete database record
+        // Delete database record, then drop its reference to the stored file
         _db.Attachments.Remove(attachment);
         await _db.SaveChangesAsync(ct);
 
+        await _fileStorageService.ReleaseAsync(attachment.FilePath, attachment.ContentHash, CancellationToken.None);
+
         return Result<Guid?>.Success(taskId);
     }
 }
@@ -11,7 +11,6 @@ namespace Nexora.Management.Application.Attachments.Commands.UploadAttachment;
 public record UploadAttachmentCommand(
     Guid TaskId,
     string FileName,
-    long FileSizeBytes,
     string? MimeType,
     Stream FileContent
 ) : IRequest<Result<AttachmentDto>>;
@@ -21,15 +20,18 @@ public class UploadAttachmentCommandHandler : IRequestHandler<UploadAttachmentCo
     private readonly IAppDbContext _db;
     private readonly IUserContext _userContext;
     private readonly IFileStorageService _fileStorageService;
+    private readonly AttachmentSettings _settings;
 
     public UploadAttachmentCommandHandler(
         IAppDbContext db,
         IUserContext userContext,
-        IFileStorageService fileStorageService)
+        IFileStorageService fileStorageService,
+        AttachmentSettings settings)
     {
         _db = db;
         _userContext = userContext;
         _fileStorageService = fileStorageService;
+        _settings = settings;
     }
 
     public async System.Threading.Tasks.Task<Result<AttachmentDto>> Handle(UploadAttachmentCommand request, CancellationToken ct)
@@ -41,21 +43,38 @@ public class UploadAttachmentCommandHandler : IRequestHandler<UploadAttachmentCo
             return Result<AttachmentDto>.Failure("Task not found");
         }
 
-        // Upload file
-        var filePath = await _fileStorageService.UploadFileAsync(request.FileContent, request.FileName, ct);
+        // Stream file to storage; the size recorded is what was received, not what the client claimed
+        StoredFile stored;
+        try
+        {
+            stored = await _fileStorageService.StoreAsync(request.FileContent, _settings.MaxFileSizeBytes, ct);
+        }
+        catch (FileTooLargeException ex)
+        {
+            return Result<AttachmentDto>.Failure(ex.Message);
+        }
 
         var attachment = new Attachment
         {
             TaskId = request.TaskId,
             UserId = _userContext.UserId,
             FileName = request.FileName,
-            FilePath = filePath,
-            FileSizeBytes = request.FileSizeBytes,
+            FilePath = stored.FilePath,
+            ContentHash = stored.ContentHash,
+            FileSizeBytes = stored.SizeBytes,
             MimeType = request.MimeType
         };
 
         _db.Attachments.Add(attachment);
-        await _db.SaveChangesAsync(ct);
+        try
+        {
+            await _db.SaveChangesAsync(ct);
+        }
+        catch
+        {
+            await _fileStorageService.ReleaseAsync(stored.FilePath, stored.ContentHash, CancellationToken.None);
+            throw;
+        }
 
         // Get user info for response
         var user = await _db.Users.FirstOrDefaultAsync(u => u.Id == attachment.UserId, ct);
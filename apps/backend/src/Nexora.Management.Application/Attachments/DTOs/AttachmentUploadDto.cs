@@ -0,0 +1,17 @@
+namespace Nexora.Management.Application.Attachments.DTOs;
+
+/// <summary>
+/// A chunked upload in progress. The next chunk must start at ReceivedBytes.
+/// </summary>
+public record AttachmentUploadDto(
+    Guid UploadId,
+    Guid TaskId,
+    string FileName,
+    long TotalBytes,
+    long ReceivedBytes
+);
+
+public record AppendAttachmentUploadResult(
+    bool Accepted,
+    AttachmentUploadDto Upload
+);
@@ -0,0 +1,34 @@
+using MediatR;
+using Nexora.Management.Application.Common;
+using Nexora.Management.Application.Attachments.DTOs;
+using Nexora.Management.Infrastructure.Services;
+
+namespace Nexora.Management.Application.Attachments.Queries.GetAttachmentUpload;
+
+public record GetAttachmentUploadQuery(Guid UploadId) : IRequest<Result<AttachmentUploadDto>>;
+
+public class GetAttachmentUploadQueryHandler : IRequestHandler<GetAttachmentUploadQuery, Result<AttachmentUploadDto>>
+{
+    private readonly IUserContext _userContext;
+    private readonly IFileStorageService _fileStorageService;
+
+    public GetAttachmentUploadQueryHandler(
+        IUserContext userContext,
+        IFileStorageService fileStorageService)
+    {
+        _userContext = userContext;
+        _fileStorageService = fileStorageService;
+    }
+
+    public async System.Threading.Tasks.Task<Result<AttachmentUploadDto>> Handle(GetAttachmentUploadQuery request, CancellationToken ct)
+    {
+        var session = await _fileStorageService.GetUploadAsync(request.UploadId, ct);
+        if (session == null || session.UserId != _userContext.UserId)
+        {
+            return Result<AttachmentUploadDto>.Failure("Upload not found");
+        }
+
+        return Result<AttachmentUploadDto>.Success(
+            new AttachmentUploadDto(session.UploadId, session.TaskId, session.FileName, session.TotalBytes, session.ReceivedBytes));
+    }
+}
@@ -0,0 +1,84 @@
+namespace Nexora.Management.Application.Authorization;
+
+/// <summary>
+/// Effective permissions of a single user, grouped by workspace.
+/// Permission names use the "resource:action" format (e.g., tasks:create).
+/// </summary>
+public sealed class UserPermissionSet
+{
+    public static readonly UserPermissionSet Empty = new(new Dictionary<Guid, HashSet<string>>());
+
+    private readonly Dictionary<Guid, HashSet<string>> _byWorkspace;
+    private readonly HashSet<string> _all;
+
+    public UserPermissionSet(Dictionary<Guid, HashSet<string>> byWorkspace)
+    {
+        _byWorkspace = byWorkspace;
+        _all = new HashSet<string>(StringComparer.Ordinal);
+
+        foreach (var permissions in byWorkspace.Values)
+        {
+            _all.UnionWith(permissions);
+        }
+    }
+
+    public IEnumerable<Guid> WorkspaceIds => _byWorkspace.Keys;
+
+    /// <summary>
+    /// Returns true if the user holds the permission in any of their workspaces
+    /// </summary>
+    public bool HasPermission(string permission) => _all.Contains(permission);
+
+    /// <summary>
+    /// Returns true if the user holds the permission in the given workspace
+    /// </summary>
+    public bool HasPermission(Guid workspaceId, string permission)
+        => _byWorkspace.TryGetValue(workspaceId, out var permissions) && permissions.Contains(permission);
+
+    public bool ContainsWorkspace(Guid workspaceId) => _byWorkspace.ContainsKey(workspaceId);
+}
+
+/// <summary>
+/// Snapshot of permission cache counters
+/// </summary>
+public record PermissionCacheStatistics(
+    long Hits,
+    long Misses,
+    long Evictions,
+    long Invalidations,
+    int Count
+)
+{
+    public double HitRatio => Hits + Misses == 0 ? 0 : (double)Hits / (Hits + Misses);
+}
+
+/// <summary>
+/// Process-wide cache of resolved user permission sets.
+/// Must be registered as Singleton; entries expire after a TTL and are
+/// evicted least-recently-used first once the cache is full.
+/// </summary>
+public interface IPermissionCache
+{
+    /// <summary>
+    /// Returns the cached permission set for the user, loading it with the given loader on a miss
+    /// </summary>
+    Task<UserPermissionSet> GetOrLoadAsync(
+        Guid userId,
+        Func<CancellationToken, Task<UserPermissionSet>> loader,
+        CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Drops the cached permission set of a single user
+    /// </summary>
+    void InvalidateUser(Guid userId);
+
+    /// <summary>
+    /// Drops the cached permission sets of every user that is a member of the workspace
+    /// </summary>
+    void InvalidateWorkspace(Guid workspaceId);
+
+    /// <summary>
+    /// Returns the current hit/miss/eviction counters
+    /// </summary>
+    PermissionCacheStatistics GetStatistics();
+}
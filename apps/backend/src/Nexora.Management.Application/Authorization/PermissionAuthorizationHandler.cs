@@ -2,7 +2,6 @@ using System.Security.Claims;
 using Microsoft.AspNetCore.Authorization;
 using Microsoft.Extensions.DependencyInjection;
 using Microsoft.Extensions.Options;
-using Nexora.Management.Infrastructure.Interfaces;
 
 namespace Nexora.Management.Application.Authorization;
 
@@ -24,15 +23,17 @@ public class PermissionRequirement : IAuthorizationRequirement
 /// <summary>
 /// Authorization handler that validates permissions against user roles
 /// Supports resource-action based permissions (e.g., tasks:create)
-/// Must be registered as Scoped to properly resolve IAppDbContext
+/// Permission sets are resolved through IPermissionResolver and cached per user,
+/// so most checks never reach the database.
+/// Must be registered as Scoped to properly resolve IPermissionResolver
 /// </summary>
 public class PermissionAuthorizationHandler : AuthorizationHandler<PermissionRequirement>
 {
-    private readonly IAppDbContext _db;
+    private readonly IPermissionResolver _permissionResolver;
 
-    public PermissionAuthorizationHandler(IAppDbContext db)
+    public PermissionAuthorizationHandler(IPermissionResolver permissionResolver)
     {
-        _db = db;
+        _permissionResolver = permissionResolver;
     }
 
     protected override async Task HandleRequirementAsync(
@@ -52,24 +53,11 @@ public class PermissionAuthorizationHandler : AuthorizationHandler<PermissionReq
             return;
         }
 
-        // Get user's roles and their permissions
-        var hasPermission = await _db.SqlQuerySingleAsync<bool>(
-            """
-            SELECT EXISTS (
-                SELECT 1
-                FROM "Users" u
-                JOIN "WorkspaceMembers" wm ON u."Id" = wm."UserId"
-                JOIN "Roles" r ON wm."RoleId" = r."Id"
-                JOIN "RolePermissions" rp ON r."Id" = rp."RoleId"
-                JOIN "Permissions" p ON rp."PermissionId" = p."Id"
-                WHERE u."Id" = {0}
-                AND p."Name" = {1}
-                LIMIT 1
-            )
-            """,
+        // Get user's roles and their permissions (cached)
+        var hasPermission = await _permissionResolver.HasPermissionAsync(
             userId,
-            $"{requirement.Resource}:{requirement.Action}"
-        );
+            requirement.Resource,
+            requirement.Action);
 
         if (hasPermission)
         {
@@ -0,0 +1,159 @@
+using System.Collections.Concurrent;
+
+namespace Nexora.Management.Application.Authorization;
+
+/// <summary>
+/// Bounded in-memory permission cache with TTL expiry and approximate LRU eviction.
+/// Loads that race with an invalidation are returned to the caller but not cached,
+/// so a stale permission set can never outlive the change that invalidated it.
+/// </summary>
+public class PermissionCache : IPermissionCache
+{
+    private readonly ConcurrentDictionary<Guid, CacheEntry> _entries = new();
+    private readonly object _evictionLock = new();
+    private readonly int _maxEntries;
+    private readonly long _timeToLiveMs;
+
+    private long _generation;
+    private long _hits;
+    private long _misses;
+    private long _evictions;
+    private long _invalidations;
+
+    public PermissionCache(PermissionCacheSettings settings)
+    {
+        _maxEntries = Math.Max(1, settings.MaxEntries);
+        _timeToLiveMs = Math.Max(0, settings.TimeToLiveSeconds) * 1000L;
+    }
+
+    public async Task<UserPermissionSet> GetOrLoadAsync(
+        Guid userId,
+        Func<CancellationToken, Task<UserPermissionSet>> loader,
+        CancellationToken cancellationToken = default)
+    {
+        var now = Environment.TickCount64;
+
+        if (_entries.TryGetValue(userId, out var entry))
+        {
+            if (entry.ExpiresAt > now)
+            {
+                entry.LastAccess = now;
+                Interlocked.Increment(ref _hits);
+                return entry.Permissions;
+            }
+
+            _entries.TryRemove(new KeyValuePair<Guid, CacheEntry>(userId, entry));
+        }
+
+        Interlocked.Increment(ref _misses);
+
+        var generation = Interlocked.Read(ref _generation);
+        var permissions = await loader(cancellationToken);
+
+        // Skip caching if an invalidation happened while the set was being loaded
+        if (Interlocked.Read(ref _generation) == generation)
+        {
+            EnsureCapacity();
+
+            now = Environment.TickCount64;
+            _entries[userId] = new CacheEntry(permissions, now + _timeToLiveMs, now);
+        }
+
+        return permissions;
+    }
+
+    public void InvalidateUser(Guid userId)
+    {
+        Interlocked.Increment(ref _generation);
+        Interlocked.Increment(ref _invalidations);
+        _entries.TryRemove(userId, out _);
+    }
+
+    public void InvalidateWorkspace(Guid workspaceId)
+    {
+        Interlocked.Increment(ref _generation);
+        Interlocked.Increment(ref _invalidations);
+
+        foreach (var (userId, entry) in _entries)
+        {
+            if (entry.Permissions.ContainsWorkspace(workspaceId))
+            {
+                _entries.TryRemove(userId, out _);
+            }
+        }
+    }
+
+    public PermissionCacheStatistics GetStatistics()
+    {
+        return new PermissionCacheStatistics(
+            Interlocked.Read(ref _hits),
+            Interlocked.Read(ref _misses),
+            Interlocked.Read(ref _evictions),
+            Interlocked.Read(ref _invalidations),
+            _entries.Count);
+    }
+
+    private void EnsureCapacity()
+    {
+        if (_entries.Count < _maxEntries)
+        {
+            return;
+        }
+
+        lock (_evictionLock)
+        {
+            if (_entries.Count < _maxEntries)
+            {
+                return;
+            }
+
+            var now = Environment.TickCount64;
+            var evicted = 0;
+
+            // Expired entries go first
+            foreach (var (userId, entry) in _entries)
+            {
+                if (entry.ExpiresAt <= now && _entries.TryRemove(userId, out _))
+                {
+                    evicted++;
+                }
+            }
+
+            // Still full: drop the least recently used tenth in one pass so
+            // eviction cost is amortized over many inserts
+            if (_entries.Count >= _maxEntries)
+            {
+                var toEvict = Math.Max(1, _maxEntries / 10);
+                var victims = _entries
+                    .OrderBy(kvp => kvp.Value.LastAccess)
+                    .Take(toEvict)
+                    .Select(kvp => kvp.Key)
+                    .ToList();
+
+                foreach (var userId in victims)
+                {
+                    if (_entries.TryRemove(userId, out _))
+                    {
+                        evicted++;
+                    }
+                }
+            }
+
+            Interlocked.Add(ref _evictions, evicted);
+        }
+    }
+
+    private sealed class CacheEntry
+    {
+        public CacheEntry(UserPermissionSet permissions, long expiresAt, long lastAccess)
+        {
+            Permissions = permissions;
+            ExpiresAt = expiresAt;
+            LastAccess = lastAccess;
+        }
+
+        public UserPermissionSet Permissions { get; }
+        public long ExpiresAt { get; }
+        public long LastAccess { get; set; }
+    }
+}
@@ -0,0 +1,19 @@
+namespace Nexora.Management.Application.Authorization;
+
+/// <summary>
+/// Settings for the in-memory permission cache used by PermissionAuthorizationHandler
+/// </summary>
+public class PermissionCacheSettings
+{
+    public const string SectionName = "PermissionCache";
+
+    /// <summary>
+    /// Maximum number of users whose permission sets are kept in memory
+    /// </summary>
+    public int MaxEntries { get; set; } = 10_000;
+
+    /// <summary>
+    /// How long a resolved permission set stays valid without an explicit invalidation
+    /// </summary>
+    public int TimeToLiveSeconds { get; set; } = 300;
+}
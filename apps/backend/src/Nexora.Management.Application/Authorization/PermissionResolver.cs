@@ -0,0 +1,78 @@
+using Microsoft.EntityFrameworkCore;
+using Nexora.Management.Infrastructure.Interfaces;
+
+namespace Nexora.Management.Application.Authorization;
+
+/// <summary>
+/// Resolves a user's effective permissions, backed by IPermissionCache
+/// </summary>
+public interface IPermissionResolver
+{
+    /// <summary>
+    /// Gets the user's permission set for every workspace they are a member of
+    /// </summary>
+    Task<UserPermissionSet> GetPermissionsAsync(Guid userId, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Checks whether the user holds "resource:action" in any of their workspaces
+    /// </summary>
+    Task<bool> HasPermissionAsync(Guid userId, string resource, string action, CancellationToken cancellationToken = default);
+}
+
+/// <summary>
+/// Loads all workspace memberships and role permissions of a user in a single query
+/// and caches the result, so repeated authorization checks are a dictionary lookup.
+/// Must be registered as Scoped to properly resolve IAppDbContext
+/// </summary>
+public class PermissionResolver : IPermissionResolver
+{
+    private readonly IAppDbContext _db;
+    private readonly IPermissionCache _cache;
+
+    public PermissionResolver(IAppDbContext db, IPermissionCache cache)
+    {
+        _db = db;
+        _cache = cache;
+    }
+
+    public Task<UserPermissionSet> GetPermissionsAsync(Guid userId, CancellationToken cancellationToken = default)
+    {
+        return _cache.GetOrLoadAsync(userId, ct => LoadAsync(userId, ct), cancellationToken);
+    }
+
+    public async Task<bool> HasPermissionAsync(Guid userId, string resource, string action, CancellationToken cancellationToken = default)
+    {
+        var permissions = await GetPermissionsAsync(userId, cancellationToken);
+        return permissions.HasPermission($"{resource}:{action}");
+    }
+
+    private async Task<UserPermissionSet> LoadAsync(Guid userId, CancellationToken ct)
+    {
+        var rows = await (
+            from wm in _db.WorkspaceMembers.AsNoTracking()
+            join rp in _db.RolePermissions.AsNoTracking() on wm.RoleId equals rp.RoleId
+            join p in _db.Permissions.AsNoTracking() on rp.PermissionId equals p.Id
+            where wm.UserId == userId
+            select new { wm.WorkspaceId, p.Resource, p.Action }
+        ).ToListAsync(ct);
+
+        if (rows.Count == 0)
+        {
+            return UserPermissionSet.Empty;
+        }
+
+        var byWorkspace = new Dictionary<Guid, HashSet<string>>();
+        foreach (var row in rows)
+        {
+            if (!byWorkspace.TryGetValue(row.WorkspaceId, out var permissions))
+            {
+                permissions = new HashSet<string>(StringComparer.Ordinal);
+                byWorkspace[row.WorkspaceId] = permissions;
+            }
+
+            permissions.Add($"{row.Resource}:{row.Action}");
+        }
+
+        return new UserPermissionSet(byWorkspace);
+    }
+}
@@ -0,0 +1,27 @@
+namespace Nexora.Management.Application.DTOs.SignalR;
+
+/// <summary>
+/// Batched message broadcasted to a tasklist group, replacing one message per event.
+/// Each entity appears at most once per batch with its latest change.
+/// </summary>
+public class TasksChangedMessage
+{
+    public Guid TaskListId { get; set; }
+    public List<TaskChangeEntry> Changes { get; set; } = new();
+
+    /// <summary>
+    /// Set when events for this tasklist were dropped under backpressure;
+    /// clients should refetch the view (or request a delta) instead of trusting the batch alone
+    /// </summary>
+    public bool ResyncRequired { get; set; }
+}
+
+/// <summary>
+/// One coalesced change inside a <see cref="TasksChangedMessage"/>
+/// </summary>
+public class TaskChangeEntry
+{
+    public string Event { get; set; } = string.Empty; // "TaskCreated", "TaskUpdated", "CommentAdded", etc.
+    public Guid EntityId { get; set; }
+    public object Message { get; set; } = null!; // TaskUpdatedMessage, CommentUpdatedMessage or AttachmentUpdatedMessage
+}
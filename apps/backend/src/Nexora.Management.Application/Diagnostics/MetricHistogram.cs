@@ -0,0 +1,99 @@
+namespace Nexora.Management.Application.Diagnostics;
+
+/// <summary>
+/// Point-in-time copy of a histogram
+/// </summary>
+/// <param name="Bounds">Inclusive upper bounds of the finite buckets, ascending</param>
+/// <param name="BucketCounts">Observations per bucket (not cumulative); the last entry is the overflow bucket</param>
+/// <param name="Count">Total number of observations</param>
+/// <param name="Sum">Sum of all observed values</param>
+public record HistogramSnapshot(
+    IReadOnlyList<double> Bounds,
+    IReadOnlyList<long> BucketCounts,
+    long Count,
+    double Sum)
+{
+    public double Mean => Count == 0 ? 0 : Sum / Count;
+
+    /// <summary>
+    /// Upper bound of the bucket that holds the given quantile (0..1). Observations in
+    /// the overflow bucket report the largest finite bound.
+    /// </summary>
+    public double Quantile(double quantile)
+    {
+        if (Count == 0)
+        {
+            return 0;
+        }
+
+        var rank = (long)Math.Ceiling(Math.Clamp(quantile, 0, 1) * Count);
+        long seen = 0;
+        for (var i = 0; i < Bounds.Count; i++)
+        {
+            seen += BucketCounts[i];
+            if (seen >= Math.Max(1, rank))
+            {
+                return Bounds[i];
+            }
+        }
+
+        return Bounds[^1];
+    }
+}
+
+/// <summary>
+/// Fixed-bucket histogram that can be recorded to concurrently without locks
+/// </summary>
+public class MetricHistogram
+{
+    public static readonly double[] LatencyMillisecondBounds = { 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000 };
+
+    public static readonly double[] QueryCountBounds = { 0, 1, 2, 3, 5, 10, 20, 50, 100 };
+
+    public static readonly double[] RowCountBounds = { 0, 1, 10, 100, 1000, 10000, 100000 };
+
+    private readonly double[] _bounds;
+    private readonly long[] _counts;
+    private double _sum;
+
+    public MetricHistogram(double[] bounds)
+    {
+        if (bounds.Length == 0)
+        {
+            throw new ArgumentException("At least one bucket bound is required", nameof(bounds));
+        }
+
+        _bounds = bounds.OrderBy(b => b).ToArray();
+        _counts = new long[_bounds.Length + 1];
+    }
+
+    public void Record(double value)
+    {
+        // Exact matches land in their own bucket, as bounds are inclusive
+        var bucket = Array.BinarySearch(_bounds, value);
+        if (bucket < 0)
+        {
+            bucket = ~bucket;
+        }
+
+        Interlocked.Increment(ref _counts[bucket]);
+
+        double observed;
+        do
+        {
+            observed = Volatile.Read(ref _sum);
+        }
+        while (Interlocked.CompareExchange(ref _sum, observed + value, observed) != observed);
+    }
+
+    public HistogramSnapshot Snapshot()
+    {
+        var counts = new long[_counts.Length];
+        for (var i = 0; i < counts.Length; i++)
+        {
+            counts[i] = Interlocked.Read(ref _counts[i]);
+        }
+
+        return new HistogramSnapshot(_bounds, counts, counts.Sum(), Volatile.Read(ref _sum));
+    }
+}
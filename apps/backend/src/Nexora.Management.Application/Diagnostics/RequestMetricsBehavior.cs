@@ -0,0 +1,64 @@
+using System.Diagnostics;
+using MediatR;
+using Microsoft.Extensions.Logging;
+using Nexora.Management.Infrastructure.Persistence;
+
+namespace Nexora.Management.Application.Diagnostics;
+
+/// <summary>
+/// Times every MediatR request, counts the database work it causes and logs
+/// requests that exceed the query budget or latency threshold
+/// </summary>
+public class RequestMetricsBehavior<TRequest, TResponse> : IPipelineBehavior<TRequest, TResponse>
+    where TRequest : notnull
+{
+    private static readonly string RequestName = typeof(TRequest).Name;
+
+    private readonly RequestMetricsRegistry _registry;
+    private readonly RequestMetricsSettings _settings;
+    private readonly ILogger<RequestMetricsBehavior<TRequest, TResponse>> _logger;
+
+    public RequestMetricsBehavior(
+        RequestMetricsRegistry registry,
+        RequestMetricsSettings settings,
+        ILogger<RequestMetricsBehavior<TRequest, TResponse>> logger)
+    {
+        _registry = registry;
+        _settings = settings;
+        _logger = logger;
+    }
+
+    public async Task<TResponse> Handle(TRequest request, RequestHandlerDelegate<TResponse> next, CancellationToken cancellationToken)
+    {
+        if (!_settings.Enabled)
+        {
+            return await next(cancellationToken);
+        }
+
+        using var queries = QueryScope.Begin();
+        var started = Stopwatch.GetTimestamp();
+        var failed = true;
+
+        try
+        {
+            var response = await next(cancellationToken);
+            failed = false;
+            return response;
+        }
+        finally
+        {
+            var elapsed = Stopwatch.GetElapsedTime(started);
+            var slow = queries.Queries > _settings.QueryBudget
+                || elapsed.TotalMilliseconds > _settings.SlowRequestMilliseconds;
+
+            _registry.Record(RequestName, elapsed, queries.Queries, queries.RowsRead, failed, slow);
+
+            if (slow)
+            {
+                _logger.LogWarning(
+                    "Slow request {RequestName}: {ElapsedMilliseconds:F1} ms, {QueryCount} queries ({DatabaseMilliseconds:F1} ms in database), {RowCount} rows read",
+                    RequestName, elapsed.TotalMilliseconds, queries.Queries, queries.DatabaseTime.TotalMilliseconds, queries.RowsRead);
+            }
+        }
+    }
+}
@@ -0,0 +1,68 @@
+using System.Collections.Concurrent;
+
+namespace Nexora.Management.Application.Diagnostics;
+
+/// <summary>
+/// Counters for one MediatR request type
+/// </summary>
+/// <param name="RequestName">Request type name, e.g. GetTasksQuery</param>
+/// <param name="DurationMilliseconds">Handling time, including nested requests</param>
+/// <param name="Queries">Database commands per request</param>
+/// <param name="RowsRead">Rows read from the database per request</param>
+/// <param name="Failures">Requests whose handler threw</param>
+/// <param name="SlowRequests">Requests over the query budget or latency threshold</param>
+public record RequestMetricsSnapshot(
+    string RequestName,
+    HistogramSnapshot DurationMilliseconds,
+    HistogramSnapshot Queries,
+    HistogramSnapshot RowsRead,
+    long Failures,
+    long SlowRequests);
+
+/// <summary>
+/// Process-wide per-request-type histograms fed by <see cref="RequestMetricsBehavior{TRequest, TResponse}"/>.
+/// Must be registered as Singleton.
+/// </summary>
+public class RequestMetricsRegistry
+{
+    private readonly ConcurrentDictionary<string, RequestMetrics> _requests = new(StringComparer.Ordinal);
+
+    public void Record(string requestName, TimeSpan elapsed, int queries, long rowsRead, bool failed, bool slow)
+    {
+        var metrics = _requests.GetOrAdd(requestName, _ => new RequestMetrics());
+
+        metrics.Duration.Record(elapsed.TotalMilliseconds);
+        metrics.Queries.Record(queries);
+        metrics.RowsRead.Record(rowsRead);
+
+        if (failed)
+        {
+            Interlocked.Increment(ref metrics.Failures);
+        }
+
+        if (slow)
+        {
+            Interlocked.Increment(ref metrics.SlowRequests);
+        }
+    }
+
+    public IReadOnlyList<RequestMetricsSnapshot> GetSnapshot() => _requests
+        .OrderBy(r => r.Key, StringComparer.Ordinal)
+        .Select(r => new RequestMetricsSnapshot(
+            r.Key,
+            r.Value.Duration.Snapshot(),
+            r.Value.Queries.Snapshot(),
+            r.Value.RowsRead.Snapshot(),
+            Interlocked.Read(ref r.Value.Failures),
+            Interlocked.Read(ref r.Value.SlowRequests)))
+        .ToList();
+
+    private sealed class RequestMetrics
+    {
+        public readonly MetricHistogram Duration = new(MetricHistogram.LatencyMillisecondBounds);
+        public readonly MetricHistogram Queries = new(MetricHistogram.QueryCountBounds);
+        public readonly MetricHistogram RowsRead = new(MetricHistogram.RowCountBounds);
+        public long Failures;
+        public long SlowRequests;
+    }
+}
@@ -0,0 +1,29 @@
+namespace Nexora.Management.Application.Diagnostics;
+
+/// <summary>
+/// Settings for per-request instrumentation of MediatR handlers
+/// </summary>
+public class RequestMetricsSettings
+{
+    public const string SectionName = "RequestMetrics";
+
+    /// <summary>
+    /// Records handler latency, query counts and rows read
+    /// </summary>
+    public bool Enabled { get; set; } = true;
+
+    /// <summary>
+    /// Requests executing more database commands than this are logged as slow
+    /// </summary>
+    public int QueryBudget { get; set; } = 20;
+
+    /// <summary>
+    /// Requests taking longer than this are logged as slow
+    /// </summary>
+    public int SlowRequestMilliseconds { get; set; } = 500;
+
+    /// <summary>
+    /// Serves /metrics to non-loopback clients; keep off unless the port is not publicly reachable
+    /// </summary>
+    public bool AllowRemoteMetrics { get; set; } = false;
+}
@@ -2,7 +2,7 @@ using MediatR;
 using Microsoft.EntityFrameworkCore;
 using Nexora.Management.Application.Common;
 using Nexora.Management.Application.Documents.DTOs;
-using Nexora.Management.Domain.Entities;
+using Nexora.Management.Application.Documents.Versioning;
 using Nexora.Management.Infrastructure.Interfaces;
 
 namespace Nexora.Management.Application.Documents.Commands.RestorePageVersion;
@@ -16,11 +16,13 @@ public class RestorePageVersionCommandHandler : IRequestHandler<RestorePageVersi
 {
     private readonly IAppDbContext _db;
     private readonly IUserContext _userContext;
+    private readonly IPageVersionStore _versionStore;
 
-    public RestorePageVersionCommandHandler(IAppDbContext db, IUserContext userContext)
+    public RestorePageVersionCommandHandler(IAppDbContext db, IUserContext userContext, IPageVersionStore versionStore)
     {
         _db = db;
         _userContext = userContext;
+        _versionStore = versionStore;
     }
 
     public async System.Threading.Tasks.Task<Result<PageDetailDto>> Handle(RestorePageVersionCommand request, CancellationToken ct)
@@ -36,33 +38,24 @@ public class RestorePageVersionCommandHandler : IRequestHandler<RestorePageVersi
             return Result<PageDetailDto>.Failure("Page not found");
         }
 
-        // Find the version to restore
-        var version = await _db.PageVersions
-            .FirstOrDefaultAsync(v => v.PageId == request.PageId && v.VersionNumber == request.VersionNumber, ct);
+        // Rebuild the version to restore from its keyframe
+        var content = await _versionStore.GetContentAsync(request.PageId, request.VersionNumber, ct);
 
-        if (version == null)
+        if (content == null)
         {
             return Result<PageDetailDto>.Failure("Version not found");
         }
 
         // Create a version snapshot of current state before restoring
-        var currentVersionNumber = await _db.PageVersions
-            .Where(v => v.PageId == page.Id)
-            .MaxAsync(v => (int?)v.VersionNumber) ?? 0;
-
-        var snapshotVersion = new PageVersion
-        {
-            PageId = page.Id,
-            VersionNumber = currentVersionNumber + 1,
-            Content = page.Content,
-            CommitMessage = $"Auto-save before restore to version {request.VersionNumber} by {_userContext.UserId}",
-            CreatedBy = _userContext.UserId
-        };
-
-        _db.PageVersions.Add(snapshotVersion);
+        await _versionStore.CaptureAsync(
+            page,
+            _userContext.UserId,
+            $"Auto-save before restore to version {request.VersionNumber} by {_userContext.UserId}",
+            coalesce: false,
+            ct);
 
         // Restore content from the version
-        page.Content = version.Content;
+        page.Content = content;
         page.UpdatedBy = _userContext.UserId;
 
         await _db.SaveChangesAsync(ct);
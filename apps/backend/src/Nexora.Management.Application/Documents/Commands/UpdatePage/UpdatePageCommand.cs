@@ -2,7 +2,7 @@ using MediatR;
 using Microsoft.EntityFrameworkCore;
 using Nexora.Management.Application.Common;
 using Nexora.Management.Application.Documents.DTOs;
-using Nexora.Management.Domain.Entities;
+using Nexora.Management.Application.Documents.Versioning;
 using Nexora.Management.Infrastructure.Interfaces;
 
 namespace Nexora.Management.Application.Documents.Commands.UpdatePage;
@@ -19,11 +19,13 @@ public class UpdatePageCommandHandler : IRequestHandler<UpdatePageCommand, Resul
 {
     private readonly IAppDbContext _db;
     private readonly IUserContext _userContext;
+    private readonly IPageVersionStore _versionStore;
 
-    public UpdatePageCommandHandler(IAppDbContext db, IUserContext userContext)
+    public UpdatePageCommandHandler(IAppDbContext db, IUserContext userContext, IPageVersionStore versionStore)
     {
         _db = db;
         _userContext = userContext;
+        _versionStore = versionStore;
     }
 
     public async System.Threading.Tasks.Task<Result<PageDetailDto>> Handle(UpdatePageCommand request, CancellationToken ct)
@@ -38,21 +40,13 @@ public class UpdatePageCommandHandler : IRequestHandler<UpdatePageCommand, Resul
             return Result<PageDetailDto>.Failure("Page not found");
         }
 
-        // Create version snapshot before update
-        var currentVersionNumber = await _db.PageVersions
-            .Where(v => v.PageId == page.Id)
-            .MaxAsync(v => (int?)v.VersionNumber) ?? 0;
-
-        var version = new PageVersion
-        {
-            PageId = page.Id,
-            VersionNumber = currentVersionNumber + 1,
-            Content = page.Content,
-            CommitMessage = $"Auto-save before edit by {_userContext.UserId}",
-            CreatedBy = _userContext.UserId
-        };
-
-        _db.PageVersions.Add(version);
+        // Create version snapshot before update (merged into the user's open version during autosave bursts)
+        await _versionStore.CaptureAsync(
+            page,
+            _userContext.UserId,
+            $"{PageVersionStore.EditCommitMessagePrefix} by {_userContext.UserId}",
+            coalesce: true,
+            ct);
 
         // Update page
         page.Title = request.Title;
@@ -2,6 +2,7 @@ using MediatR;
 using Microsoft.EntityFrameworkCore;
 using Nexora.Management.Application.Common;
 using Nexora.Management.Application.Documents.DTOs;
+using Nexora.Management.Application.Documents.Versioning;
 using Nexora.Management.Infrastructure.Interfaces;
 
 namespace Nexora.Management.Application.Documents.Queries;
@@ -26,23 +27,34 @@ public class GetPageHistoryQueryHandler : IRequestHandler<GetPageHistoryQuery, R
             return Result<List<PageVersionDto>>.Failure("Page not found");
         }
 
-        // Get version history with creator info
-        var versions = await _db.PageVersions
-            .Include(v => v.Creator)
+        // Load the whole history once; diff versions are rebuilt from their keyframes in memory
+        var rows = await _db.PageVersions
+            .AsNoTracking()
             .Where(v => v.PageId == request.PageId)
             .OrderByDescending(v => v.VersionNumber)
-            .Select(v => new PageVersionDto(
-                v.Id,
-                v.PageId,
-                v.VersionNumber,
-                v.Content,
-                v.CommitMessage,
-                v.CreatedBy,
-                v.Creator != null ? v.Creator.Email : null,
-                v.CreatedAt
-            ))
+            .Select(v => new
+            {
+                Version = v,
+                CreatedByName = v.Creator != null ? v.Creator.Email : null
+            })
             .ToListAsync(ct);
 
+        var versionsByNumber = rows.ToDictionary(r => r.Version.VersionNumber, r => r.Version);
+        var resolved = new Dictionary<int, System.Text.Json.JsonDocument>();
+
+        var versions = rows
+            .Select(r => new PageVersionDto(
+                r.Version.Id,
+                r.Version.PageId,
+                r.Version.VersionNumber,
+                PageVersionContent.Resolve(r.Version, versionsByNumber, resolved),
+                r.Version.CommitMessage,
+                r.Version.CreatedBy,
+                r.CreatedByName,
+                r.Version.CreatedAt
+            ))
+            .ToList();
+
         return Result<List<PageVersionDto>>.Success(versions);
     }
 }
@@ -2,6 +2,7 @@ using MediatR;
 using Microsoft.EntityFrameworkCore;
 using Nexora.Management.Application.Common;
 using Nexora.Management.Application.Documents.DTOs;
+using Nexora.Management.Application.Search;
 using Nexora.Management.Infrastructure.Interfaces;
 
 namespace Nexora.Management.Application.Documents.Queries;
@@ -46,14 +47,12 @@ public class SearchPagesQueryHandler : IRequestHandler<SearchPagesQuery, Result<
             query = query.Where(p => p.IsFavorite);
         }
 
-        // Apply search term
-        if (!string.IsNullOrEmpty(request.SearchTerm))
+        // Apply search term (title substring or full-text match on title and body)
+        if (!string.IsNullOrWhiteSpace(request.SearchTerm))
         {
-            var searchTerm = request.SearchTerm.ToLower();
-            query = query.Where(p =>
-                p.Title.ToLower().Contains(searchTerm) ||
-                p.Slug.ToLower().Contains(searchTerm)
-            );
+            var matchingIds = SearchIndex.MatchingEntityIds(
+                _db, SearchDocumentTypes.Page, request.SearchTerm.Trim(), request.WorkspaceId);
+            query = query.Where(p => matchingIds.Contains(p.Id));
         }
 
         // Get total count for pagination
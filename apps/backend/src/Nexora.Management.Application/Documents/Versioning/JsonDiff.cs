@@ -0,0 +1,210 @@
+using System.Globalization;
+using System.Text.Json.Nodes;
+
+namespace Nexora.Management.Application.Documents.Versioning;
+
+/// <summary>
+/// Structural diff between two JSON values, compact enough to store page versions as
+/// changes against a keyframe. A patch is a JSON object in one of these forms:
+/// <list type="bullet">
+/// <item><c>{}</c> - no change</item>
+/// <item><c>{"set": value}</c> - replace the value</item>
+/// <item><c>{"obj": {"key": patch, ...}, "del": ["key", ...]}</c> - patch or add properties, remove others</item>
+/// <item><c>{"arr": {"index": patch, ...}}</c> - patch elements in place (same length)</item>
+/// <item><c>{"splice": [start, deleteCount, [items...]]}</c> - replace a run of elements</item>
+/// </list>
+/// </summary>
+public static class JsonDiff
+{
+    private const string SetKey = "set";
+    private const string ObjectKey = "obj";
+    private const string RemoveKey = "del";
+    private const string ArrayKey = "arr";
+    private const string SpliceKey = "splice";
+
+    /// <summary>
+    /// Computes a patch that turns <paramref name="from"/> into <paramref name="to"/>
+    /// </summary>
+    public static JsonObject Diff(JsonNode? from, JsonNode? to)
+    {
+        return DiffCore(from, to) ?? new JsonObject();
+    }
+
+    /// <summary>
+    /// Applies a patch produced by <see cref="Diff"/>. The source is not modified.
+    /// </summary>
+    public static JsonNode? Apply(JsonNode? source, JsonObject patch)
+    {
+        return ApplyCore(source?.DeepClone(), patch);
+    }
+
+    private static JsonObject? DiffCore(JsonNode? from, JsonNode? to)
+    {
+        if (JsonNode.DeepEquals(from, to))
+        {
+            return null;
+        }
+
+        return (from, to) switch
+        {
+            (JsonObject fromObject, JsonObject toObject) => DiffObject(fromObject, toObject),
+            (JsonArray fromArray, JsonArray toArray) => DiffArray(fromArray, toArray),
+            _ => new JsonObject { [SetKey] = to?.DeepClone() }
+        };
+    }
+
+    private static JsonObject DiffObject(JsonObject from, JsonObject to)
+    {
+        var changes = new JsonObject();
+        foreach (var (key, value) in to)
+        {
+            if (!from.TryGetPropertyValue(key, out var previous))
+            {
+                changes[key] = new JsonObject { [SetKey] = value?.DeepClone() };
+            }
+            else if (DiffCore(previous, value) is { } patch)
+            {
+                changes[key] = patch;
+            }
+        }
+
+        var patchObject = new JsonObject { [ObjectKey] = changes };
+
+        var removed = new JsonArray();
+        foreach (var (key, _) in from)
+        {
+            if (!to.ContainsKey(key))
+            {
+                removed.Add(key);
+            }
+        }
+
+        if (removed.Count > 0)
+        {
+            patchObject[RemoveKey] = removed;
+        }
+
+        return patchObject;
+    }
+
+    private static JsonObject DiffArray(JsonArray from, JsonArray to)
+    {
+        // Editors mostly change a few adjacent blocks, so trim the unchanged ends first
+        var prefix = 0;
+        while (prefix < from.Count && prefix < to.Count && JsonNode.DeepEquals(from[prefix], to[prefix]))
+        {
+            prefix++;
+        }
+
+        var suffix = 0;
+        while (suffix < from.Count - prefix && suffix < to.Count - prefix
+               && JsonNode.DeepEquals(from[from.Count - 1 - suffix], to[to.Count - 1 - suffix]))
+        {
+            suffix++;
+        }
+
+        var fromCount = from.Count - prefix - suffix;
+        var toCount = to.Count - prefix - suffix;
+
+        if (fromCount == toCount)
+        {
+            var elements = new JsonObject();
+            for (var i = prefix; i < prefix + fromCount; i++)
+            {
+                if (DiffCore(from[i], to[i]) is { } patch)
+                {
+                    elements[i.ToString(CultureInfo.InvariantCulture)] = patch;
+                }
+            }
+
+            return new JsonObject { [ArrayKey] = elements };
+        }
+
+        var inserted = new JsonArray();
+        for (var i = prefix; i < prefix + toCount; i++)
+        {
+            inserted.Add(to[i]?.DeepClone());
+        }
+
+        return new JsonObject { [SpliceKey] = new JsonArray(prefix, fromCount, inserted) };
+    }
+
+    // Mutates node in place where it can; returns the node that should take its place
+    private static JsonNode? ApplyCore(JsonNode? node, JsonObject patch)
+    {
+        if (patch.TryGetPropertyValue(SetKey, out var value))
+        {
+            return value?.DeepClone();
+        }
+
+        if (patch.TryGetPropertyValue(ObjectKey, out var changes))
+        {
+            var target = node as JsonObject
+                ?? throw new FormatException("Object patch applied to a non-object value");
+
+            foreach (var (key, change) in changes!.AsObject())
+            {
+                target.TryGetPropertyValue(key, out var current);
+                var updated = ApplyCore(current, change!.AsObject());
+                if (!ReferenceEquals(updated, current) || !target.ContainsKey(key))
+                {
+                    target[key] = updated;
+                }
+            }
+
+            if (patch.TryGetPropertyValue(RemoveKey, out var removed))
+            {
+                foreach (var key in removed!.AsArray())
+                {
+                    target.Remove(key!.GetValue<string>());
+                }
+            }
+
+            return target;
+        }
+
+        if (patch.TryGetPropertyValue(ArrayKey, out var elements))
+        {
+            var target = node as JsonArray
+                ?? throw new FormatException("Array patch applied to a non-array value");
+
+            foreach (var (key, change) in elements!.AsObject())
+            {
+                var index = int.Parse(key, CultureInfo.InvariantCulture);
+                var current = target[index];
+                var updated = ApplyCore(current, change!.AsObject());
+                if (!ReferenceEquals(updated, current))
+                {
+                    target[index] = updated;
+                }
+            }
+
+            return target;
+        }
+
+        if (patch.TryGetPropertyValue(SpliceKey, out var splice))
+        {
+            var target = node as JsonArray
+                ?? throw new FormatException("Splice patch applied to a non-array value");
+
+            var args = splice!.AsArray();
+            var start = args[0]!.GetValue<int>();
+            var deleteCount = args[1]!.GetValue<int>();
+
+            for (var i = 0; i < deleteCount; i++)
+            {
+                target.RemoveAt(start);
+            }
+
+            var position = start;
+            foreach (var item in args[2]!.AsArray())
+            {
+                target.Insert(position++, item?.DeepClone());
+            }
+
+            return target;
+        }
+
+        return node;
+    }
+}
@@ -0,0 +1,77 @@
+using System.Text.Json;
+using System.Text.Json.Nodes;
+using PageVersion = Nexora.Management.Domain.Entities.PageVersion;
+
+namespace Nexora.Management.Application.Documents.Versioning;
+
+/// <summary>
+/// Encodes page content as a diff against a keyframe and rebuilds it again
+/// </summary>
+public static class PageVersionContent
+{
+    /// <summary>
+    /// Returns the diff from <paramref name="keyframe"/> to <paramref name="content"/>,
+    /// or null when the diff is larger than <paramref name="maxDeltaRatio"/> of the content
+    /// and a keyframe should be stored instead
+    /// </summary>
+    public static JsonDocument? EncodeDelta(JsonDocument keyframe, JsonDocument content, double maxDeltaRatio)
+    {
+        var delta = JsonDiff.Diff(ToNode(keyframe), ToNode(content)).ToJsonString();
+        var contentLength = content.RootElement.GetRawText().Length;
+
+        return delta.Length > contentLength * maxDeltaRatio
+            ? null
+            : JsonDocument.Parse(delta);
+    }
+
+    /// <summary>
+    /// Applies a diff produced by <see cref="EncodeDelta"/> to its keyframe
+    /// </summary>
+    public static JsonDocument Decode(JsonDocument keyframe, JsonDocument delta)
+    {
+        var patch = ToNode(delta) as JsonObject
+            ?? throw new FormatException("Page version delta must be a JSON object");
+
+        var content = JsonDiff.Apply(ToNode(keyframe), patch);
+        return JsonDocument.Parse(content?.ToJsonString() ?? "null");
+    }
+
+    /// <summary>
+    /// Rebuilds the full content of a version from the versions of the same page.
+    /// A delta's keyframe may itself have been re-encoded as a delta by a concurrent
+    /// compaction; it is resolved recursively, so such chains still read correctly.
+    /// </summary>
+    public static JsonDocument Resolve(
+        PageVersion version,
+        IReadOnlyDictionary<int, PageVersion> versionsByNumber,
+        IDictionary<int, JsonDocument>? resolved = null)
+    {
+        if (version.IsKeyframe)
+        {
+            return version.Content;
+        }
+
+        if (resolved != null && resolved.TryGetValue(version.VersionNumber, out var cached))
+        {
+            return cached;
+        }
+
+        if (version.KeyframeVersionNumber >= version.VersionNumber
+            || !versionsByNumber.TryGetValue(version.KeyframeVersionNumber, out var keyframe))
+        {
+            throw new InvalidOperationException(
+                $"Keyframe {version.KeyframeVersionNumber} for version {version.VersionNumber} of page {version.PageId} is missing");
+        }
+
+        var content = Decode(Resolve(keyframe, versionsByNumber, resolved), version.Content);
+        if (resolved != null)
+        {
+            resolved[version.VersionNumber] = content;
+        }
+
+        return content;
+    }
+
+    private static JsonNode? ToNode(JsonDocument document) =>
+        JsonNode.Parse(document.RootElement.GetRawText());
+}
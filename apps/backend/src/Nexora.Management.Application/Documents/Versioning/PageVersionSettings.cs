@@ -0,0 +1,34 @@
+namespace Nexora.Management.Application.Documents.Versioning;
+
+/// <summary>
+/// Settings for page version history storage
+/// </summary>
+public class PageVersionSettings
+{
+    public const string SectionName = "PageVersions";
+
+    /// <summary>
+    /// Saves by the same user within this many minutes of their last version are merged into it
+    /// </summary>
+    public int CoalesceWindowMinutes { get; set; } = 10;
+
+    /// <summary>
+    /// A full keyframe is stored at least every this many versions
+    /// </summary>
+    public int KeyframeInterval { get; set; } = 20;
+
+    /// <summary>
+    /// A diff larger than this fraction of the full content is stored as a keyframe instead
+    /// </summary>
+    public double MaxDeltaRatio { get; set; } = 0.5;
+
+    /// <summary>
+    /// Compact existing page history into keyframes and diffs once on startup
+    /// </summary>
+    public bool CompactOnStartup { get; set; }
+
+    /// <summary>
+    /// Number of pages loaded per batch while compacting
+    /// </summary>
+    public int CompactBatchSize { get; set; } = 100;
+}
@@ -0,0 +1,282 @@
+using System.Text.Json;
+using Microsoft.EntityFrameworkCore;
+using Nexora.Management.Infrastructure.Interfaces;
+using Page = Nexora.Management.Domain.Entities.Page;
+using PageVersion = Nexora.Management.Domain.Entities.PageVersion;
+
+namespace Nexora.Management.Application.Documents.Versioning;
+
+/// <summary>
+/// Outcome of compacting one page's version history
+/// </summary>
+public record PageHistoryCompactionResult(
+    int Versions,
+    int VersionsRemoved,
+    int VersionsRewritten,
+    long BytesBefore,
+    long BytesAfter);
+
+/// <summary>
+/// Compaction of a page history held in memory: the versions to delete and the outcome
+/// </summary>
+public record PageHistoryCompaction(IReadOnlyList<PageVersion> Removed, PageHistoryCompactionResult Result);
+
+/// <summary>
+/// Stores page versions as periodic keyframes plus JSON diffs against them
+/// </summary>
+public interface IPageVersionStore
+{
+    /// <summary>
+    /// Adds a version holding the page's current content, before the caller changes it.
+    /// With <paramref name="coalesce"/>, returns null without adding anything when the
+    /// same user's latest version is still inside the coalescing window.
+    /// The caller saves changes.
+    /// </summary>
+    Task<PageVersion?> CaptureAsync(Page page, Guid userId, string commitMessage, bool coalesce, CancellationToken ct = default);
+
+    /// <summary>
+    /// Rebuilds the full content of a version, or null if it does not exist
+    /// </summary>
+    Task<JsonDocument?> GetContentAsync(Guid pageId, int versionNumber, CancellationToken ct = default);
+
+    /// <summary>
+    /// Merges autosaves that fall inside the coalescing window and re-encodes the
+    /// remaining versions as keyframes plus diffs. Version numbers are kept.
+    /// </summary>
+    Task<PageHistoryCompactionResult> CompactAsync(Guid pageId, CancellationToken ct = default);
+}
+
+public class PageVersionStore : IPageVersionStore
+{
+    /// <summary>
+    /// Commit message prefix of versions captured by page edits; only these are merged by compaction
+    /// </summary>
+    public const string EditCommitMessagePrefix = "Auto-save before edit";
+
+    private readonly IAppDbContext _db;
+    private readonly PageVersionSettings _settings;
+
+    public PageVersionStore(IAppDbContext db, PageVersionSettings settings)
+    {
+        _db = db;
+        _settings = settings;
+    }
+
+    public async Task<PageVersion?> CaptureAsync(Page page, Guid userId, string commitMessage, bool coalesce, CancellationToken ct = default)
+    {
+        var latest = await _db.PageVersions
+            .AsNoTracking()
+            .Where(v => v.PageId == page.Id)
+            .OrderByDescending(v => v.VersionNumber)
+            .Select(v => new { v.VersionNumber, v.KeyframeVersionNumber, v.CreatedBy, v.CreatedAt })
+            .FirstOrDefaultAsync(ct);
+
+        if (coalesce
+            && latest != null
+            && ShouldCoalesce(userId, page.UpdatedBy, latest.CreatedBy, latest.CreatedAt, DateTime.UtcNow, _settings))
+        {
+            return null;
+        }
+
+        var versionNumber = (latest?.VersionNumber ?? 0) + 1;
+        var version = new PageVersion
+        {
+            PageId = page.Id,
+            VersionNumber = versionNumber,
+            CommitMessage = commitMessage,
+            CreatedBy = userId
+        };
+
+        JsonDocument? keyframe = null;
+        if (latest != null && versionNumber - latest.KeyframeVersionNumber < GetKeyframeInterval(_settings))
+        {
+            keyframe = await GetContentAsync(page.Id, latest.KeyframeVersionNumber, ct);
+        }
+
+        Encode(version, page.Content, keyframe, latest?.KeyframeVersionNumber ?? 0, _settings.MaxDeltaRatio);
+
+        _db.PageVersions.Add(version);
+        return version;
+    }
+
+    public async Task<JsonDocument?> GetContentAsync(Guid pageId, int versionNumber, CancellationToken ct = default)
+    {
+        var versionsByNumber = new Dictionary<int, PageVersion>();
+        var next = versionNumber;
+
+        // Normally the version and its keyframe; longer only after a concurrent compaction
+        while (true)
+        {
+            var version = await _db.PageVersions
+                .AsNoTracking()
+                .FirstOrDefaultAsync(v => v.PageId == pageId && v.VersionNumber == next, ct);
+
+            if (version == null)
+            {
+                return null;
+            }
+
+            versionsByNumber[version.VersionNumber] = version;
+            if (version.IsKeyframe || version.KeyframeVersionNumber >= version.VersionNumber)
+            {
+                break;
+            }
+
+            next = version.KeyframeVersionNumber;
+        }
+
+        return PageVersionContent.Resolve(versionsByNumber[versionNumber], versionsByNumber);
+    }
+
+    public async Task<PageHistoryCompactionResult> CompactAsync(Guid pageId, CancellationToken ct = default)
+    {
+        var versions = await _db.PageVersions
+            .Where(v => v.PageId == pageId)
+            .OrderBy(v => v.VersionNumber)
+            .ToListAsync(ct);
+
+        var compaction = Compact(versions, _settings);
+
+        if (compaction.Result.VersionsRemoved > 0 || compaction.Result.VersionsRewritten > 0)
+        {
+            _db.PageVersions.RemoveRange(compaction.Removed);
+            await _db.SaveChangesAsync(ct);
+        }
+
+        return compaction.Result;
+    }
+
+    /// <summary>
+    /// Whether a new capture should be skipped because the latest version already holds
+    /// the content from before this user's editing session
+    /// </summary>
+    public static bool ShouldCoalesce(
+        Guid userId,
+        Guid pageUpdatedBy,
+        Guid latestCreatedBy,
+        DateTime latestCreatedAt,
+        DateTime now,
+        PageVersionSettings settings)
+    {
+        return latestCreatedBy == userId
+            && pageUpdatedBy == userId
+            && now - latestCreatedAt < GetCoalesceWindow(settings);
+    }
+
+    /// <summary>
+    /// Sets the version's content to a diff against <paramref name="keyframe"/>, or to the
+    /// full content as a new keyframe when there is no keyframe or the diff is too large
+    /// </summary>
+    public static void Encode(PageVersion version, JsonDocument content, JsonDocument? keyframe, int keyframeVersionNumber, double maxDeltaRatio)
+    {
+        var delta = keyframe != null
+            ? PageVersionContent.EncodeDelta(keyframe, content, maxDeltaRatio)
+            : null;
+
+        version.Content = delta ?? content;
+        version.IsKeyframe = delta == null;
+        version.KeyframeVersionNumber = delta == null ? version.VersionNumber : keyframeVersionNumber;
+    }
+
+    /// <summary>
+    /// Merges and re-encodes a page's versions, ordered by version number, in place.
+    /// Merged versions are left in the list and returned as removed.
+    /// </summary>
+    public static PageHistoryCompaction Compact(IReadOnlyList<PageVersion> versions, PageVersionSettings settings)
+    {
+        if (versions.Count == 0)
+        {
+            return new PageHistoryCompaction(
+                Array.Empty<PageVersion>(),
+                new PageHistoryCompactionResult(0, 0, 0, 0, 0));
+        }
+
+        var coalesceWindow = GetCoalesceWindow(settings);
+        var keyframeInterval = GetKeyframeInterval(settings);
+
+        var versionsByNumber = versions.ToDictionary(v => v.VersionNumber);
+        var resolved = new Dictionary<int, JsonDocument>();
+        var contents = versions
+            .Select(v => PageVersionContent.Resolve(v, versionsByNumber, resolved))
+            .ToList();
+        var bytesBefore = versions.Sum(v => (long)v.Content.RootElement.GetRawText().Length);
+
+        // CaptureAsync only reads the latest version and its keyframe, so leaving that
+        // segment untouched keeps concurrent edits from diffing against a rewritten row
+        var latest = versions[^1];
+        var frozenFrom = latest.IsKeyframe ? latest.VersionNumber : latest.KeyframeVersionNumber;
+        var referencedByFrozen = versions
+            .Where(v => v.VersionNumber >= frozenFrom && !v.IsKeyframe)
+            .Select(v => v.KeyframeVersionNumber)
+            .ToHashSet();
+
+        var removed = new List<PageVersion>();
+        var rewritten = 0;
+        var bytesAfter = 0L;
+        PageVersion? previous = null;
+        JsonDocument? keyframeContent = null;
+        var keyframeNumber = 0;
+
+        for (var i = 0; i < versions.Count; i++)
+        {
+            var version = versions[i];
+
+            if (version.VersionNumber >= frozenFrom)
+            {
+                bytesAfter += version.Content.RootElement.GetRawText().Length;
+                continue;
+            }
+
+            // Same rule as CaptureAsync: an edit autosave soon after the same user's previous version
+            if (previous != null
+                && !referencedByFrozen.Contains(version.VersionNumber)
+                && version.CommitMessage?.StartsWith(EditCommitMessagePrefix, StringComparison.Ordinal) == true
+                && version.CreatedBy == previous.CreatedBy
+                && version.CreatedAt - previous.CreatedAt < coalesceWindow)
+            {
+                removed.Add(version);
+                continue;
+            }
+
+            previous = version;
+
+            var wasKeyframe = version.IsKeyframe;
+            var previousBase = version.KeyframeVersionNumber;
+            var previousContent = version.Content;
+            var previousText = previousContent.RootElement.GetRawText();
+
+            var withinInterval = keyframeContent != null && version.VersionNumber - keyframeNumber < keyframeInterval;
+            Encode(version, contents[i], withinInterval ? keyframeContent : null, keyframeNumber, settings.MaxDeltaRatio);
+
+            if (version.IsKeyframe)
+            {
+                keyframeContent = contents[i];
+                keyframeNumber = version.VersionNumber;
+            }
+
+            var encodedText = version.Content.RootElement.GetRawText();
+            bytesAfter += encodedText.Length;
+
+            if (version.IsKeyframe != wasKeyframe
+                || version.KeyframeVersionNumber != previousBase
+                || encodedText != previousText)
+            {
+                rewritten++;
+            }
+            else
+            {
+                // Keep the loaded document so the row is not saved again
+                version.Content = previousContent;
+            }
+        }
+
+        return new PageHistoryCompaction(
+            removed,
+            new PageHistoryCompactionResult(versions.Count, removed.Count, rewritten, bytesBefore, bytesAfter));
+    }
+
+    private static TimeSpan GetCoalesceWindow(PageVersionSettings settings) =>
+        TimeSpan.FromMinutes(Math.Max(0, settings.CoalesceWindowMinutes));
+
+    private static int GetKeyframeInterval(PageVersionSettings settings) => Math.Max(1, settings.KeyframeInterval);
+}
@@ -1,5 +1,6 @@
 using MediatR;
 using Microsoft.EntityFrameworkCore;
+using Nexora.Management.Application.Analytics.Rollups;
 using Nexora.Management.Application.Common;
 using Nexora.Management.Infrastructure.Interfaces;
 
@@ -10,10 +11,12 @@ public record DeleteFolderCommand(Guid Id) : IRequest<Result>;
 public class DeleteFolderCommandHandler : IRequestHandler<DeleteFolderCommand, Result>
 {
     private readonly IAppDbContext _db;
+    private readonly IAnalyticsRollupStore _rollups;
 
-    public DeleteFolderCommandHandler(IAppDbContext db)
+    public DeleteFolderCommandHandler(IAppDbContext db, IAnalyticsRollupStore rollups)
     {
         _db = db;
+        _rollups = rollups;
     }
 
     public async System.Threading.Tasks.Task<Result> Handle(DeleteFolderCommand request, CancellationToken ct)
@@ -24,9 +27,17 @@ public class DeleteFolderCommandHandler : IRequestHandler<DeleteFolderCommand, R
             return Result.Failure("Folder not found");
         }
 
+        var workspaceId = await _db.Spaces
+            .Where(s => s.Id == folder.SpaceId)
+            .Select(s => s.WorkspaceId)
+            .FirstOrDefaultAsync(ct);
+
         _db.Folders.Remove(folder);
         await _db.SaveChangesAsync(ct);
 
+        // Task lists and tasks were removed by cascade; recompute the workspace's rollups
+        await _rollups.RebuildAsync(workspaceId, ct);
+
         return Result.Success();
     }
 }
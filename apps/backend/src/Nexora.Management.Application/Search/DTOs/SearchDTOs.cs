@@ -0,0 +1,25 @@
+namespace Nexora.Management.Application.Search.DTOs;
+
+public record SearchResultDto(
+    string EntityType,
+    Guid EntityId,
+    Guid? ParentId,
+    string Title,
+    string? Snippet,
+    float Rank,
+    DateTime UpdatedAt
+);
+
+public record SearchResponseDto(
+    List<SearchResultDto> Items,
+    string? NextCursor,
+    int? EstimatedTotal,
+    bool EstimatedTotalIsCapped
+);
+
+public record SearchRequest(
+    string Q,
+    string? Types,
+    string? Cursor,
+    int Limit = 20
+);
@@ -0,0 +1,203 @@
+using MediatR;
+using Microsoft.EntityFrameworkCore;
+using Nexora.Management.Application.Common;
+using Nexora.Management.Application.Search.DTOs;
+using Nexora.Management.Infrastructure.Interfaces;
+
+namespace Nexora.Management.Application.Search.Queries;
+
+/// <summary>
+/// Ranked full-text search across pages, tasks and comments of one workspace.
+/// Results are ordered by (rank, entity id) descending and paged with a keyset cursor.
+/// </summary>
+public record SearchWorkspaceQuery(
+    Guid WorkspaceId,
+    string Term,
+    IReadOnlyCollection<string>? Types,
+    string? Cursor,
+    int Limit = 20
+) : IRequest<Result<SearchResponseDto>>;
+
+public class SearchWorkspaceQueryHandler : IRequestHandler<SearchWorkspaceQuery, Result<SearchResponseDto>>
+{
+    public const int MaxLimit = 100;
+
+    /// <summary>
+    /// The first page reports how many results exist, counting at most this many
+    /// </summary>
+    public const int MaxCountedResults = 1000;
+
+    private const string MatchSql = """
+        WITH q AS (
+            SELECT websearch_to_tsquery('english', {1}) AS query
+        )
+        """;
+
+    private const string FilterSql = """
+        FROM search_documents d, q
+        WHERE d."WorkspaceId" = {0}
+          AND NOT d."IsDeleted"
+          AND d."EntityType" = ANY({2})
+          AND (d."SearchVector" @@ q.query OR d."Title" % {1})
+        """;
+
+    private readonly IAppDbContext _db;
+    private readonly IUserContext _userContext;
+
+    public SearchWorkspaceQueryHandler(IAppDbContext db, IUserContext userContext)
+    {
+        _db = db;
+        _userContext = userContext;
+    }
+
+    public async System.Threading.Tasks.Task<Result<SearchResponseDto>> Handle(SearchWorkspaceQuery request, CancellationToken ct)
+    {
+        var term = request.Term?.Trim() ?? string.Empty;
+        if (term.Length == 0)
+        {
+            return Result<SearchResponseDto>.Failure("Search term is required");
+        }
+
+        var types = request.Types is { Count: > 0 }
+            ? request.Types.Select(t => t.Trim().ToLowerInvariant()).Distinct().ToArray()
+            : SearchDocumentTypes.All;
+
+        if (types.Any(t => !SearchDocumentTypes.All.Contains(t)))
+        {
+            return Result<SearchResponseDto>.Failure(
+                $"Types must be one of: {string.Join(", ", SearchDocumentTypes.All)}");
+        }
+
+        SearchCursor? cursor = null;
+        if (!string.IsNullOrEmpty(request.Cursor) && !SearchCursor.TryDecode(request.Cursor, out cursor))
+        {
+            return Result<SearchResponseDto>.Failure("Invalid cursor");
+        }
+
+        var isMember = await _db.WorkspaceMembers
+            .AnyAsync(wm => wm.WorkspaceId == request.WorkspaceId && wm.UserId == _userContext.UserId, ct);
+        if (!isMember)
+        {
+            return Result<SearchResponseDto>.Failure("Workspace not found or access denied");
+        }
+
+        var limit = Math.Clamp(request.Limit, 1, MaxLimit);
+
+        // Fetch one extra row to know whether another page exists
+        var hits = await FetchPageAsync(request.WorkspaceId, term, types, cursor, limit + 1);
+
+        string? nextCursor = null;
+        if (hits.Count > limit)
+        {
+            hits.RemoveAt(hits.Count - 1);
+            var last = hits[^1];
+            nextCursor = new SearchCursor(last.Rank, last.EntityId).Encode();
+        }
+
+        // Counting is bounded and only done for the first page
+        int? estimatedTotal = null;
+        var isCapped = false;
+        if (cursor == null)
+        {
+            if (nextCursor == null)
+            {
+                estimatedTotal = hits.Count;
+            }
+            else
+            {
+                var counted = await CountCappedAsync(request.WorkspaceId, term, types);
+                isCapped = counted > MaxCountedResults;
+                estimatedTotal = Math.Min(counted, MaxCountedResults);
+            }
+        }
+
+        var items = hits
+            .Select(h => new SearchResultDto(
+                h.EntityType,
+                h.EntityId,
+                h.ParentId,
+                h.Title,
+                h.Snippet,
+                h.Rank,
+                h.UpdatedAt))
+            .ToList();
+
+        return Result<SearchResponseDto>.Success(new SearchResponseDto(items, nextCursor, estimatedTotal, isCapped));
+    }
+
+    private Task<List<SearchHitRow>> FetchPageAsync(
+        Guid workspaceId,
+        string term,
+        string[] types,
+        SearchCursor? cursor,
+        int take)
+    {
+        var keyset = cursor != null
+            ? """WHERE ranked."Rank" < {4} OR (ranked."Rank" = {4} AND ranked."EntityId" < {5})"""
+            : string.Empty;
+
+        // Rank and keyset are evaluated over matching rows only; snippets and
+        // parent titles are computed for the returned page alone.
+        var sql = $$"""
+            {{MatchSql}},
+            ranked AS (
+                SELECT d."EntityType", d."EntityId", d."ParentId", d."Title", d."Body", d."UpdatedAt",
+                       (ts_rank_cd(d."SearchVector", q.query, 32) + 0.5 * similarity(d."Title", {1}))::real AS "Rank"
+                {{FilterSql}}
+            ),
+            page AS (
+                SELECT * FROM ranked
+                {{keyset}}
+                ORDER BY ranked."Rank" DESC, ranked."EntityId" DESC
+                LIMIT {3}
+            )
+            SELECT page."EntityType", page."EntityId", page."ParentId",
+                   CASE WHEN page."EntityType" = 'comment' THEN coalesce(parent."Title", '') ELSE page."Title" END AS "Title",
+                   NULLIF(ts_headline('english', left(page."Body", 5000), q.query,
+                          'MaxFragments=1, MaxWords=24, MinWords=8'), '') AS "Snippet",
+                   page."Rank", page."UpdatedAt"
+            FROM page
+            CROSS JOIN q
+            LEFT JOIN search_documents parent
+                   ON page."EntityType" = 'comment'
+                  AND parent."EntityType" = 'task'
+                  AND parent."EntityId" = page."ParentId"
+            ORDER BY page."Rank" DESC, page."EntityId" DESC
+            """;
+
+        var parameters = new List<object> { workspaceId, term, types, take };
+        if (cursor != null)
+        {
+            parameters.Add(cursor.Rank);
+            parameters.Add(cursor.EntityId);
+        }
+
+        return _db.SqlQueryRawAsync<SearchHitRow>(sql, parameters.ToArray());
+    }
+
+    private Task<int> CountCappedAsync(Guid workspaceId, string term, string[] types)
+    {
+        var sql = $$"""
+            {{MatchSql}}
+            SELECT count(*)::int AS "Value"
+            FROM (
+                SELECT 1
+                {{FilterSql}}
+                LIMIT {3}
+            ) capped
+            """;
+
+        return _db.SqlQuerySingleAsync<int>(sql, workspaceId, term, types, MaxCountedResults + 1);
+    }
+
+    private sealed class SearchHitRow
+    {
+        public string EntityType { get; set; } = string.Empty;
+        public Guid EntityId { get; set; }
+        public Guid? ParentId { get; set; }
+        public string Title { get; set; } = string.Empty;
+        public string? Snippet { get; set; }
+        public float Rank { get; set; }
+        public DateTime UpdatedAt { get; set; }
+    }
+}
@@ -0,0 +1,50 @@
+using System.Globalization;
+using System.Text;
+
+namespace Nexora.Management.Application.Search;
+
+/// <summary>
+/// Keyset position in a ranked result list: results continue strictly after (Rank, EntityId)
+/// in descending order. Encoded as an opaque URL-safe token for clients.
+/// </summary>
+public record SearchCursor(float Rank, Guid EntityId)
+{
+    public string Encode()
+    {
+        var raw = $"{Rank.ToString("R", CultureInfo.InvariantCulture)}|{EntityId:N}";
+        return Convert.ToBase64String(Encoding.UTF8.GetBytes(raw))
+            .TrimEnd('=')
+            .Replace('+', '-')
+            .Replace('/', '_');
+    }
+
+    public static bool TryDecode(string? token, out SearchCursor? cursor)
+    {
+        cursor = null;
+        if (string.IsNullOrWhiteSpace(token))
+        {
+            return false;
+        }
+
+        try
+        {
+            var base64 = token.Replace('-', '+').Replace('_', '/');
+            base64 = base64.PadRight(base64.Length + (4 - base64.Length % 4) % 4, '=');
+            var parts = Encoding.UTF8.GetString(Convert.FromBase64String(base64)).Split('|');
+
+            if (parts.Length == 2
+                && float.TryParse(parts[0], NumberStyles.Float, CultureInfo.InvariantCulture, out var rank)
+                && Guid.TryParseExact(parts[1], "N", out var entityId))
+            {
+                cursor = new SearchCursor(rank, entityId);
+                return true;
+            }
+        }
+        catch (FormatException)
+        {
+            // Fall through to invalid cursor
+        }
+
+        return false;
+    }
+}
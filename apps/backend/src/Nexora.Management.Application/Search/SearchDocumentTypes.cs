@@ -0,0 +1,13 @@
+namespace Nexora.Management.Application.Search;
+
+/// <summary>
+/// Entity types stored in the search_documents index
+/// </summary>
+public static class SearchDocumentTypes
+{
+    public const string Page = "page";
+    public const string Task = "task";
+    public const string Comment = "comment";
+
+    public static readonly string[] All = { Page, Task, Comment };
+}
@@ -0,0 +1,51 @@
+using Nexora.Management.Infrastructure.Interfaces;
+
+namespace Nexora.Management.Application.Search;
+
+/// <summary>
+/// Composable filters over the search_documents index for handlers that keep
+/// their own paging (page search, task list filtering)
+/// </summary>
+public static class SearchIndex
+{
+    /// <summary>
+    /// Ids of entities of the given type whose indexed text matches the term, either
+    /// by full-text match on title/body or by substring match on the title.
+    /// Intended for <c>query.Where(x => ids.Contains(x.Id))</c>, which becomes an IN subquery.
+    /// </summary>
+    public static IQueryable<Guid> MatchingEntityIds(
+        IAppDbContext db,
+        string entityType,
+        string term,
+        Guid? workspaceId = null)
+    {
+        var workspaceFilter = workspaceId.HasValue ? """AND "WorkspaceId" = {3}""" : string.Empty;
+
+        var sql = $$"""
+            SELECT "EntityId" AS "Value"
+            FROM search_documents
+            WHERE "EntityType" = {0}
+              AND ("SearchVector" @@ websearch_to_tsquery('english', {1}) OR "Title" ILIKE {2})
+              {{workspaceFilter}}
+            """;
+
+        var parameters = new List<object> { entityType, term, $"%{EscapeLikePattern(term)}%" };
+        if (workspaceId.HasValue)
+        {
+            parameters.Add(workspaceId.Value);
+        }
+
+        return db.SqlQueryRaw<Guid>(sql, parameters.ToArray());
+    }
+
+    /// <summary>
+    /// Escapes LIKE wildcards so user input is matched literally
+    /// </summary>
+    public static string EscapeLikePattern(string value)
+    {
+        return value
+            .Replace("\\", "\\\\")
+            .Replace("%", "\\%")
+            .Replace("_", "\\_");
+    }
+}
@@ -1,5 +1,6 @@
 using MediatR;
 using Microsoft.EntityFrameworkCore;
+using Nexora.Management.Application.Analytics.Rollups;
 using Nexora.Management.Application.Common;
 using Nexora.Management.Infrastructure.Interfaces;
 
@@ -10,10 +11,12 @@ public record DeleteSpaceCommand(Guid Id) : IRequest<Result>;
 public class DeleteSpaceCommandHandler : IRequestHandler<DeleteSpaceCommand, Result>
 {
     private readonly IAppDbContext _db;
+    private readonly IAnalyticsRollupStore _rollups;
 
-    public DeleteSpaceCommandHandler(IAppDbContext db)
+    public DeleteSpaceCommandHandler(IAppDbContext db, IAnalyticsRollupStore rollups)
     {
         _db = db;
+        _rollups = rollups;
     }
 
     public async System.Threading.Tasks.Task<Result> Handle(DeleteSpaceCommand request, CancellationToken ct)
@@ -27,6 +30,9 @@ public class DeleteSpaceCommandHandler : IRequestHandler<DeleteSpaceCommand, Res
         _db.Spaces.Remove(space);
         await _db.SaveChangesAsync(ct);
 
+        // Task lists and tasks were removed by cascade; recompute the workspace's rollups
+        await _rollups.RebuildAsync(space.WorkspaceId, ct);
+
         return Result.Success();
     }
 }
@@ -1,5 +1,6 @@
 using MediatR;
 using Microsoft.EntityFrameworkCore;
+using Nexora.Management.Application.Analytics.Rollups;
 using Nexora.Management.Application.Common;
 using Nexora.Management.Infrastructure.Interfaces;
 
@@ -10,10 +11,12 @@ public record DeleteTaskListCommand(Guid Id) : IRequest<Result>;
 public class DeleteTaskListCommandHandler : IRequestHandler<DeleteTaskListCommand, Result>
 {
     private readonly IAppDbContext _db;
+    private readonly IAnalyticsRollupStore _rollups;
 
-    public DeleteTaskListCommandHandler(IAppDbContext db)
+    public DeleteTaskListCommandHandler(IAppDbContext db, IAnalyticsRollupStore rollups)
     {
         _db = db;
+        _rollups = rollups;
     }
 
     public async System.Threading.Tasks.Task<Result> Handle(DeleteTaskListCommand request, CancellationToken ct)
@@ -24,9 +27,17 @@ public class DeleteTaskListCommandHandler : IRequestHandler<DeleteTaskListComman
             return Result.Failure("TaskList not found");
         }
 
+        var workspaceId = await _db.Spaces
+            .Where(s => s.Id == taskList.SpaceId)
+            .Select(s => s.WorkspaceId)
+            .FirstOrDefaultAsync(ct);
+
         _db.TaskLists.Remove(taskList);
         await _db.SaveChangesAsync(ct);
 
+        // Tasks were removed by cascade; recompute the workspace's rollups
+        await _rollups.RebuildAsync(workspaceId, ct);
+
         return Result.Success();
     }
 }
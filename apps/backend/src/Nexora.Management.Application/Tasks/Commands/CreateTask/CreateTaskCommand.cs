@@ -1,5 +1,6 @@
 using MediatR;
 using Microsoft.EntityFrameworkCore;
+using Nexora.Management.Application.Analytics.Rollups;
 using Nexora.Management.Application.Common;
 using Nexora.Management.Application.Tasks.DTOs;
 using Nexora.Management.Domain.Entities;
@@ -25,11 +26,13 @@ public class CreateTaskCommandHandler : IRequestHandler<CreateTaskCommand, Resul
 {
     private readonly IAppDbContext _db;
     private readonly IUserContext _userContext;
+    private readonly IAnalyticsRollupStore _rollups;
 
-    public CreateTaskCommandHandler(IAppDbContext db, IUserContext userContext)
+    public CreateTaskCommandHandler(IAppDbContext db, IUserContext userContext, IAnalyticsRollupStore rollups)
     {
         _db = db;
         _userContext = userContext;
+        _rollups = rollups;
     }
 
     public async System.Threading.Tasks.Task<Result<TaskDto>> Handle(CreateTaskCommand request, CancellationToken ct)
@@ -77,6 +80,9 @@ public class CreateTaskCommandHandler : IRequestHandler<CreateTaskCommand, Resul
         _db.Tasks.Add(task);
         await _db.SaveChangesAsync(ct);
 
+        // Update analytics rollups
+        await _rollups.ApplyTaskChangeAsync(null, await _rollups.CaptureAsync(task, ct), ct);
+
         var taskDto = new TaskDto(
             task.Id,
             task.TaskListId,
@@ -1,5 +1,6 @@
 using MediatR;
 using Microsoft.EntityFrameworkCore;
+using Nexora.Management.Application.Analytics.Rollups;
 using Nexora.Management.Application.Common;
 using Nexora.Management.Infrastructure.Interfaces;
 
@@ -10,10 +11,12 @@ public record DeleteTaskCommand(Guid Id) : IRequest<Result<Guid?>>;
 public class DeleteTaskCommandHandler : IRequestHandler<DeleteTaskCommand, Result<Guid?>>
 {
     private readonly IAppDbContext _db;
+    private readonly IAnalyticsRollupStore _rollups;
 
-    public DeleteTaskCommandHandler(IAppDbContext db)
+    public DeleteTaskCommandHandler(IAppDbContext db, IAnalyticsRollupStore rollups)
     {
         _db = db;
+        _rollups = rollups;
     }
 
     public async System.Threading.Tasks.Task<Result<Guid?>> Handle(DeleteTaskCommand request, CancellationToken ct)
@@ -31,10 +34,15 @@ public class DeleteTaskCommandHandler : IRequestHandler<DeleteTaskCommand, Resul
             return Result<Guid?>.Failure("Cannot delete task with subtasks. Delete or move subtasks first.");
         }
 
+        var before = await _rollups.CaptureAsync(task, ct);
+
         var taskListId = task.TaskListId;
         _db.Tasks.Remove(task);
         await _db.SaveChangesAsync(ct);
 
+        // Update analytics rollups
+        await _rollups.ApplyTaskChangeAsync(before, null, ct);
+
         return Result<Guid?>.Success(taskListId);
     }
 }
@@ -1,5 +1,6 @@
 using MediatR;
 using Microsoft.EntityFrameworkCore;
+using Nexora.Management.Application.Analytics.Rollups;
 using Nexora.Management.Application.Common;
 using Nexora.Management.Application.Tasks.DTOs;
 using Nexora.Management.Domain.Entities;
@@ -23,10 +24,12 @@ public record UpdateTaskCommand(
 public class UpdateTaskCommandHandler : IRequestHandler<UpdateTaskCommand, Result<TaskDto>>
 {
     private readonly IAppDbContext _db;
+    private readonly IAnalyticsRollupStore _rollups;
 
-    public UpdateTaskCommandHandler(IAppDbContext db)
+    public UpdateTaskCommandHandler(IAppDbContext db, IAnalyticsRollupStore rollups)
     {
         _db = db;
+        _rollups = rollups;
     }
 
     public async System.Threading.Tasks.Task<Result<TaskDto>> Handle(UpdateTaskCommand request, CancellationToken ct)
@@ -37,6 +40,8 @@ public class UpdateTaskCommandHandler : IRequestHandler<UpdateTaskCommand, Resul
             return Result<TaskDto>.Failure("Task not found");
         }
 
+        var before = await _rollups.CaptureAsync(task, ct);
+
         // Update fields
         task.Title = request.Title;
         task.Description = request.Description;
@@ -49,6 +54,9 @@ public class UpdateTaskCommandHandler : IRequestHandler<UpdateTaskCommand, Resul
 
         await _db.SaveChangesAsync(ct);
 
+        // Update analytics rollups
+        await _rollups.ApplyTaskChangeAsync(before, await _rollups.CaptureAsync(task, ct), ct);
+
         var taskDto = new TaskDto(
             task.Id,
             task.TaskListId,
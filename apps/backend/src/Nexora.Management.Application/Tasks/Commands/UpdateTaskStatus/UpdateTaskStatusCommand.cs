@@ -1,5 +1,6 @@
 using MediatR;
 using Microsoft.EntityFrameworkCore;
+using Nexora.Management.Application.Analytics.Rollups;
 using Nexora.Management.Application.Common;
 using Nexora.Management.Application.Tasks.DTOs;
 using Nexora.Management.Infrastructure.Interfaces;
@@ -14,10 +15,12 @@ public record UpdateTaskStatusCommand(
 public class UpdateTaskStatusCommandHandler : IRequestHandler<UpdateTaskStatusCommand, Result<TaskDto>>
 {
     private readonly IAppDbContext _db;
+    private readonly IAnalyticsRollupStore _rollups;
 
-    public UpdateTaskStatusCommandHandler(IAppDbContext db)
+    public UpdateTaskStatusCommandHandler(IAppDbContext db, IAnalyticsRollupStore rollups)
     {
         _db = db;
+        _rollups = rollups;
     }
 
     public async System.Threading.Tasks.Task<Result<TaskDto>> Handle(
@@ -30,10 +33,15 @@ public class UpdateTaskStatusCommandHandler : IRequestHandler<UpdateTaskStatusCo
             return Result<TaskDto>.Failure("Task not found");
         }
 
+        var before = await _rollups.CaptureAsync(task, ct);
+
         // Update status
         task.StatusId = request.StatusId;
         await _db.SaveChangesAsync(ct);
 
+        // Update analytics rollups
+        await _rollups.ApplyTaskChangeAsync(before, await _rollups.CaptureAsync(task, ct), ct);
+
         var taskDto = new TaskDto(
             task.Id,
             task.TaskListId,
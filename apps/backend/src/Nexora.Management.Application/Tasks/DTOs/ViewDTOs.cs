@@ -1,12 +1,44 @@
 namespace Nexora.Management.Application.Tasks.DTOs;
 
+// Versioned view payloads
+// A full snapshot replaces the client's copy. A delta lists the tasks added or changed
+// since the requested version; clients apply Tasks first, then RemovedTaskIds.
+// Version is the cursor to send as "since" on the next request.
+public record TaskViewDto<T>(
+    long Version,
+    bool IsFullSnapshot,
+    List<T> Tasks,
+    List<Guid> RemovedTaskIds
+);
+
 // Board View DTOs
 public record BoardColumnDto(
     string Id,
     string Name,
     string? Color,
-    int OrderIndex,
-    List<TaskDto> Tasks
+    int OrderIndex
+);
+
+public record BoardTaskDto(
+    Guid Id,
+    Guid? ParentTaskId,
+    string Title,
+    Guid? StatusId,
+    string Priority,
+    Guid? AssigneeId,
+    DateTime? DueDate,
+    DateTime? StartDate,
+    decimal? EstimatedHours,
+    int PositionOrder,
+    DateTime UpdatedAt
+);
+
+public record BoardViewDto(
+    long Version,
+    bool IsFullSnapshot,
+    List<BoardColumnDto> Columns,
+    List<BoardTaskDto> Tasks,
+    List<Guid> RemovedTaskIds
 );
 
 // Calendar View DTOs
@@ -20,6 +52,8 @@ public record CalendarTaskDto(
 );
 
 // Gantt View DTOs
+// Full snapshots are nested under root tasks; deltas are flat (Children empty)
+// and clients re-parent by ParentTaskId.
 public record GanttTaskDto(
     Guid Id,
     string Title,
@@ -1,6 +1,7 @@
 using MediatR;
 using Microsoft.EntityFrameworkCore;
 using Nexora.Management.Application.Common;
+using Nexora.Management.Application.Search;
 using Nexora.Management.Application.Tasks.DTOs;
 using Nexora.Management.Domain.Entities;
 using Nexora.Management.Infrastructure.Interfaces;
@@ -93,10 +94,8 @@ public class GetTasksQueryHandler : IRequestHandler<GetTasksQuery, Result<PagedR
 
         if (!string.IsNullOrWhiteSpace(request.Search))
         {
-            query = query.Where(t =>
-                t.Title.Contains(request.Search) ||
-                (t.Description != null && t.Description.Contains(request.Search))
-            );
+            var matchingIds = SearchIndex.MatchingEntityIds(_db, SearchDocumentTypes.Task, request.Search.Trim());
+            query = query.Where(t => matchingIds.Contains(t.Id));
         }
 
         // Get total count
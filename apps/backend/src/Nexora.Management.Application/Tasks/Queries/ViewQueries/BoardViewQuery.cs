@@ -6,9 +6,9 @@ using Nexora.Management.Infrastructure.Interfaces;
 
 namespace Nexora.Management.Application.Tasks.Queries.ViewQueries;
 
-public record GetBoardViewQuery(Guid TaskListId) : IRequest<Result<List<BoardColumnDto>>>;
+public record GetBoardViewQuery(Guid TaskListId, long? SinceVersion = null) : IRequest<Result<BoardViewDto>>;
 
-public class GetBoardViewQueryHandler : IRequestHandler<GetBoardViewQuery, Result<List<BoardColumnDto>>>
+public class GetBoardViewQueryHandler : IRequestHandler<GetBoardViewQuery, Result<BoardViewDto>>
 {
     private readonly IAppDbContext _db;
 
@@ -17,26 +17,47 @@ public class GetBoardViewQueryHandler : IRequestHandler<GetBoardViewQuery, Resul
         _db = db;
     }
 
-    public async System.Threading.Tasks.Task<Result<List<BoardColumnDto>>> Handle(
+    public async System.Threading.Tasks.Task<Result<BoardViewDto>> Handle(
         GetBoardViewQuery request,
         CancellationToken ct)
     {
-        // Get all statuses for the tasklist
-        var statuses = await _db.TaskStatuses
+        var sync = await TaskViewSync.ResolveAsync(_db, request.TaskListId, request.SinceVersion, ct);
+        if (sync == null)
+        {
+            return Result<BoardViewDto>.Failure("TaskList not found");
+        }
+
+        // Columns are few and always sent. Status writes bump the list's ChangeVersion
+        // (trigger_taskstatuses_change_version), so delta and If-None-Match clients see them
+        var columns = await _db.TaskStatuses
+            .AsNoTracking()
             .Where(s => s.TaskListId == request.TaskListId)
             .OrderBy(s => s.OrderIndex)
+            .Select(s => new BoardColumnDto(
+                s.Id.ToString(),
+                s.Name,
+                s.Color,
+                s.OrderIndex
+            ))
             .ToListAsync(ct);
 
-        // Get all tasks for the tasklist
-        var tasks = await _db.Tasks
-            .Where(t => t.TaskListId == request.TaskListId)
+        var query = _db.Tasks
+            .AsNoTracking()
+            .Where(t => t.TaskListId == request.TaskListId);
+
+        if (!sync.IsFullSnapshot)
+        {
+            var since = sync.SinceVersion!.Value;
+            query = query.Where(t => t.ChangeVersion > since);
+        }
+
+        // Cards only: descriptions are loaded by the task detail view
+        var tasks = await query
             .OrderBy(t => t.PositionOrder)
-            .Select(t => new TaskDto(
+            .Select(t => new BoardTaskDto(
                 t.Id,
-                t.TaskListId,
                 t.ParentTaskId,
                 t.Title,
-                t.Description,
                 t.StatusId,
                 t.Priority,
                 t.AssigneeId,
@@ -44,21 +65,15 @@ public class GetBoardViewQueryHandler : IRequestHandler<GetBoardViewQuery, Resul
                 t.StartDate,
                 t.EstimatedHours,
                 t.PositionOrder,
-                t.CreatedBy,
-                t.CreatedAt,
                 t.UpdatedAt
             ))
             .ToListAsync(ct);
 
-        // Group tasks by status
-        var columns = statuses.Select(status => new BoardColumnDto(
-            status.Id.ToString(),
-            status.Name,
-            status.Color,
-            status.OrderIndex,
-            tasks.Where(t => t.StatusId.HasValue && t.StatusId.Value == status.Id).ToList()
-        )).ToList();
+        var removed = sync.IsFullSnapshot
+            ? new List<Guid>()
+            : await TaskViewSync.GetRemovedTaskIdsAsync(_db, request.TaskListId, sync.SinceVersion!.Value, ct);
 
-        return Result<List<BoardColumnDto>>.Success(columns);
+        return Result<BoardViewDto>.Success(
+            new BoardViewDto(sync.Version, sync.IsFullSnapshot, columns, tasks, removed));
     }
 }
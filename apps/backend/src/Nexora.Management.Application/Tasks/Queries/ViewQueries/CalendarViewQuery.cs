@@ -6,9 +6,14 @@ using Nexora.Management.Infrastructure.Interfaces;
 
 namespace Nexora.Management.Application.Tasks.Queries.ViewQueries;
 
-public record GetCalendarViewQuery(Guid TaskListId, int Year, int Month) : IRequest<Result<List<CalendarTaskDto>>>;
+public record GetCalendarViewQuery(
+    Guid TaskListId,
+    int Year,
+    int Month,
+    long? SinceVersion = null
+) : IRequest<Result<TaskViewDto<CalendarTaskDto>>>;
 
-public class GetCalendarViewQueryHandler : IRequestHandler<GetCalendarViewQuery, Result<List<CalendarTaskDto>>>
+public class GetCalendarViewQueryHandler : IRequestHandler<GetCalendarViewQuery, Result<TaskViewDto<CalendarTaskDto>>>
 {
     private readonly IAppDbContext _db;
 
@@ -17,20 +22,56 @@ public class GetCalendarViewQueryHandler : IRequestHandler<GetCalendarViewQuery,
         _db = db;
     }
 
-    public async System.Threading.Tasks.Task<Result<List<CalendarTaskDto>>> Handle(
+    public async System.Threading.Tasks.Task<Result<TaskViewDto<CalendarTaskDto>>> Handle(
         GetCalendarViewQuery request,
         CancellationToken ct)
     {
-        // Calculate date range for the month
-        var startDate = new DateTime(request.Year, request.Month, 1);
-        var endDate = startDate.AddMonths(1).AddDays(-1);
-
-        // Get tasks with due dates in the specified month
-        var tasks = await _db.Tasks
-            .Where(t => t.TaskListId == request.TaskListId)
-            .Where(t => t.DueDate.HasValue &&
-                        t.DueDate.Value >= startDate &&
-                        t.DueDate.Value <= endDate)
+        if (request.Year < 1 || request.Year > 9999 || request.Month < 1 || request.Month > 12)
+        {
+            return Result<TaskViewDto<CalendarTaskDto>>.Failure("Invalid year or month");
+        }
+
+        var sync = await TaskViewSync.ResolveAsync(_db, request.TaskListId, request.SinceVersion, ct);
+        if (sync == null)
+        {
+            return Result<TaskViewDto<CalendarTaskDto>>.Failure("TaskList not found");
+        }
+
+        // Calculate date range for the month (end exclusive)
+        var startDate = new DateTime(request.Year, request.Month, 1, 0, 0, 0, DateTimeKind.Utc);
+        var endDate = startDate.AddMonths(1);
+
+        var query = _db.Tasks
+            .AsNoTracking()
+            .Where(t => t.TaskListId == request.TaskListId);
+
+        if (sync.IsFullSnapshot)
+        {
+            // Get tasks with due dates in the specified month
+            var monthTasks = await query
+                .Where(t => t.DueDate.HasValue &&
+                            t.DueDate.Value >= startDate &&
+                            t.DueDate.Value < endDate)
+                .OrderBy(t => t.DueDate)
+                .Select(t => new CalendarTaskDto(
+                    t.Id,
+                    t.Title,
+                    t.DueDate,
+                    t.StatusId,
+                    t.Priority,
+                    t.AssigneeId
+                ))
+                .ToListAsync(ct);
+
+            return Result<TaskViewDto<CalendarTaskDto>>.Success(
+                new TaskViewDto<CalendarTaskDto>(sync.Version, true, monthTasks, new List<Guid>()));
+        }
+
+        // Delta: changed tasks inside the month are upserts; changed tasks whose
+        // due date moved out of the month are removals for this view
+        var since = sync.SinceVersion!.Value;
+        var changed = await query
+            .Where(t => t.ChangeVersion > since)
             .OrderBy(t => t.DueDate)
             .Select(t => new CalendarTaskDto(
                 t.Id,
@@ -42,6 +83,14 @@ public class GetCalendarViewQueryHandler : IRequestHandler<GetCalendarViewQuery,
             ))
             .ToListAsync(ct);
 
-        return Result<List<CalendarTaskDto>>.Success(tasks);
+        var inMonth = changed
+            .Where(t => t.DueDate.HasValue && t.DueDate.Value >= startDate && t.DueDate.Value < endDate)
+            .ToList();
+
+        var removed = await TaskViewSync.GetRemovedTaskIdsAsync(_db, request.TaskListId, since, ct);
+        removed.AddRange(changed.Except(inMonth).Select(t => t.Id));
+
+        return Result<TaskViewDto<CalendarTaskDto>>.Success(
+            new TaskViewDto<CalendarTaskDto>(sync.Version, false, inMonth, removed));
     }
 }
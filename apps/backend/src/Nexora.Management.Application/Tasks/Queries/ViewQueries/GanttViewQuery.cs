@@ -6,9 +6,9 @@ using Nexora.Management.Infrastructure.Interfaces;
 
 namespace Nexora.Management.Application.Tasks.Queries.ViewQueries;
 
-public record GetGanttViewQuery(Guid TaskListId) : IRequest<Result<List<GanttTaskDto>>>;
+public record GetGanttViewQuery(Guid TaskListId, long? SinceVersion = null) : IRequest<Result<TaskViewDto<GanttTaskDto>>>;
 
-public class GetGanttViewQueryHandler : IRequestHandler<GetGanttViewQuery, Result<List<GanttTaskDto>>>
+public class GetGanttViewQueryHandler : IRequestHandler<GetGanttViewQuery, Result<TaskViewDto<GanttTaskDto>>>
 {
     private readonly IAppDbContext _db;
 
@@ -17,54 +17,90 @@ public class GetGanttViewQueryHandler : IRequestHandler<GetGanttViewQuery, Resul
         _db = db;
     }
 
-    public async System.Threading.Tasks.Task<Result<List<GanttTaskDto>>> Handle(
+    public async System.Threading.Tasks.Task<Result<TaskViewDto<GanttTaskDto>>> Handle(
         GetGanttViewQuery request,
         CancellationToken ct)
     {
-        // Get all tasks for the tasklist
-        var allTasks = await _db.Tasks
-            .Where(t => t.TaskListId == request.TaskListId)
+        var sync = await TaskViewSync.ResolveAsync(_db, request.TaskListId, request.SinceVersion, ct);
+        if (sync == null)
+        {
+            return Result<TaskViewDto<GanttTaskDto>>.Failure("TaskList not found");
+        }
+
+        var query = _db.Tasks
+            .AsNoTracking()
+            .Where(t => t.TaskListId == request.TaskListId);
+
+        if (!sync.IsFullSnapshot)
+        {
+            var since = sync.SinceVersion!.Value;
+            query = query.Where(t => t.ChangeVersion > since);
+        }
+
+        var tasks = await query
             .OrderBy(t => t.PositionOrder)
+            .Select(t => new GanttTaskDto(
+                t.Id,
+                t.Title,
+                t.StartDate,
+                t.DueDate,
+                0,
+                t.StatusId,
+                t.Priority,
+                t.ParentTaskId,
+                new List<GanttTaskDto>()
+            ))
             .ToListAsync(ct);
 
-        // Build hierarchical structure
-        var rootTasks = allTasks.Where(t => t.ParentTaskId == null).ToList();
-        var result = new List<GanttTaskDto>();
+        if (!sync.IsFullSnapshot)
+        {
+            var removed = await TaskViewSync.GetRemovedTaskIdsAsync(_db, request.TaskListId, sync.SinceVersion!.Value, ct);
+            var changed = tasks.Select(WithDuration).ToList();
+            return Result<TaskViewDto<GanttTaskDto>>.Success(
+                new TaskViewDto<GanttTaskDto>(sync.Version, false, changed, removed));
+        }
+
+        return Result<TaskViewDto<GanttTaskDto>>.Success(
+            new TaskViewDto<GanttTaskDto>(sync.Version, true, BuildTree(tasks), new List<Guid>()));
+    }
+
+    /// <summary>
+    /// Nests tasks under their parents in one pass over a list ordered by position.
+    /// Tasks whose parent is not in this list are treated as roots.
+    /// </summary>
+    public static List<GanttTaskDto> BuildTree(IReadOnlyList<GanttTaskDto> tasks)
+    {
+        var nodes = new Dictionary<Guid, GanttTaskDto>(tasks.Count);
+        foreach (var task in tasks)
+        {
+            nodes[task.Id] = WithDuration(task);
+        }
 
-        foreach (var task in rootTasks)
+        var roots = new List<GanttTaskDto>();
+        foreach (var task in tasks)
         {
-            var ganttTask = BuildGanttTask(task, allTasks);
-            result.Add(ganttTask);
+            var node = nodes[task.Id];
+            if (task.ParentTaskId.HasValue && nodes.TryGetValue(task.ParentTaskId.Value, out var parent))
+            {
+                parent.Children.Add(node);
+            }
+            else
+            {
+                roots.Add(node);
+            }
         }
 
-        return Result<List<GanttTaskDto>>.Success(result);
+        return roots;
     }
 
-    private GanttTaskDto BuildGanttTask(Domain.Entities.Task task, List<Domain.Entities.Task> allTasks)
+    private static GanttTaskDto WithDuration(GanttTaskDto task)
     {
-        // Calculate duration
-        int duration = 0;
+        var duration = 0;
         if (task.StartDate.HasValue && task.DueDate.HasValue)
         {
             duration = (int)(task.DueDate.Value - task.StartDate.Value).TotalDays + 1;
         }
 
-        // Find children
-        var children = allTasks
-            .Where(t => t.ParentTaskId == task.Id)
-            .Select(childTask => BuildGanttTask(childTask, allTasks))
-            .ToList();
-
-        return new GanttTaskDto(
-            task.Id,
-            task.Title,
-            task.StartDate,
-            task.DueDate,
-            duration,
-            task.StatusId,
-            task.Priority,
-            task.ParentTaskId,
-            children
-        );
+        return task with { Duration = duration };
     }
 }
@@ -0,0 +1,35 @@
+using MediatR;
+using Microsoft.EntityFrameworkCore;
+using Nexora.Management.Application.Common;
+using Nexora.Management.Infrastructure.Interfaces;
+
+namespace Nexora.Management.Application.Tasks.Queries.ViewQueries;
+
+/// <summary>
+/// Current change version of a TaskList; a primary-key lookup used to answer
+/// conditional view requests (If-None-Match) without loading any tasks
+/// </summary>
+public record GetTaskListVersionQuery(Guid TaskListId) : IRequest<Result<long>>;
+
+public class GetTaskListVersionQueryHandler : IRequestHandler<GetTaskListVersionQuery, Result<long>>
+{
+    private readonly IAppDbContext _db;
+
+    public GetTaskListVersionQueryHandler(IAppDbContext db)
+    {
+        _db = db;
+    }
+
+    public async System.Threading.Tasks.Task<Result<long>> Handle(GetTaskListVersionQuery request, CancellationToken ct)
+    {
+        var version = await _db.TaskLists
+            .AsNoTracking()
+            .Where(tl => tl.Id == request.TaskListId)
+            .Select(tl => (long?)tl.ChangeVersion)
+            .FirstOrDefaultAsync(ct);
+
+        return version.HasValue
+            ? Result<long>.Success(version.Value)
+            : Result<long>.Failure("TaskList not found");
+    }
+}
@@ -0,0 +1,92 @@
+using Microsoft.EntityFrameworkCore;
+using Nexora.Management.Infrastructure.Interfaces;
+
+namespace Nexora.Management.Application.Tasks.Queries.ViewQueries;
+
+/// <summary>
+/// Where a view request starts from: the list's current version and, for deltas,
+/// the version the client already has
+/// </summary>
+public record TaskViewSyncPoint(long Version, long? SinceVersion)
+{
+    public bool IsFullSnapshot => SinceVersion == null;
+}
+
+/// <summary>
+/// Shared version handling for the board, Gantt and calendar views
+/// </summary>
+public static class TaskViewSync
+{
+    /// <summary>
+    /// Reads the list's change version before any task rows, so a change racing the
+    /// request is re-sent on the next poll rather than lost. Falls back to a full
+    /// snapshot when the client's version is unknown, ahead of the server, or older
+    /// than the pruned tombstones. Returns null if the list does not exist.
+    /// </summary>
+    public static async System.Threading.Tasks.Task<TaskViewSyncPoint?> ResolveAsync(
+        IAppDbContext db,
+        Guid taskListId,
+        long? sinceVersion,
+        CancellationToken ct)
+    {
+        var list = await db.TaskLists
+            .AsNoTracking()
+            .Where(tl => tl.Id == taskListId)
+            .Select(tl => new { tl.ChangeVersion, tl.TombstoneFloorVersion })
+            .FirstOrDefaultAsync(ct);
+
+        if (list == null)
+        {
+            return null;
+        }
+
+        var canDelta = sinceVersion.HasValue
+            && sinceVersion.Value >= list.TombstoneFloorVersion
+            && sinceVersion.Value <= list.ChangeVersion;
+
+        return new TaskViewSyncPoint(list.ChangeVersion, canDelta ? sinceVersion : null);
+    }
+
+    /// <summary>
+    /// Ids of tasks deleted from or moved out of the list after the given version
+    /// </summary>
+    public static System.Threading.Tasks.Task<List<Guid>> GetRemovedTaskIdsAsync(
+        IAppDbContext db,
+        Guid taskListId,
+        long sinceVersion,
+        CancellationToken ct)
+    {
+        return db.TaskTombstones
+            .AsNoTracking()
+            .Where(t => t.TaskListId == taskListId && t.ChangeVersion > sinceVersion)
+            .Select(t => t.TaskId)
+            .Distinct()
+            .ToListAsync(ct);
+    }
+
+    /// <summary>
+    /// Deletes tombstones created before the cutoff and raises each affected list's
+    /// floor version, so clients older than the floor get a full snapshot instead of
+    /// a delta with missing removals. Returns the number of lists whose floor was raised.
+    /// </summary>
+    public static System.Threading.Tasks.Task<int> PruneTombstonesAsync(IAppDbContext db, DateTime createdBefore)
+    {
+        return db.ExecuteSqlRawAsync("""
+            WITH pruned AS (
+                DELETE FROM task_tombstones
+                WHERE "CreatedAt" < {0}
+                RETURNING "TaskListId", "ChangeVersion"
+            ),
+            floors AS (
+                SELECT "TaskListId", max("ChangeVersion") AS floor_version
+                FROM pruned
+                GROUP BY "TaskListId"
+            )
+            UPDATE "TaskLists" tl
+            SET "TombstoneFloorVersion" = floors.floor_version
+            FROM floors
+            WHERE tl."Id" = floors."TaskListId"
+              AND tl."TombstoneFloorVersion" < floors.floor_version
+            """, createdBefore);
+    }
+}
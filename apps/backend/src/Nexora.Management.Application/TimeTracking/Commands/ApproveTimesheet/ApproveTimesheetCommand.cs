@@ -1,5 +1,6 @@
 using MediatR;
 using Microsoft.EntityFrameworkCore;
+using Nexora.Management.Application.Analytics.Rollups;
 using Nexora.Management.Application.Common;
 using Nexora.Management.Application.TimeTracking.DTOs;
 using Nexora.Management.Domain.Entities;
@@ -17,10 +18,12 @@ public record ApproveTimesheetCommand(
 public class ApproveTimesheetCommandHandler : IRequestHandler<ApproveTimesheetCommand, Result>
 {
     private readonly IAppDbContext _db;
+    private readonly IAnalyticsRollupStore _rollups;
 
-    public ApproveTimesheetCommandHandler(IAppDbContext db)
+    public ApproveTimesheetCommandHandler(IAppDbContext db, IAnalyticsRollupStore rollups)
     {
         _db = db;
+        _rollups = rollups;
     }
 
     public async System.Threading.Tasks.Task<Result> Handle(ApproveTimesheetCommand request, CancellationToken ct)
@@ -53,6 +56,12 @@ public class ApproveTimesheetCommandHandler : IRequestHandler<ApproveTimesheetCo
 
         await _db.SaveChangesAsync(ct);
 
+        // Approved minutes feed the analytics rollups
+        if (request.Status == "approved")
+        {
+            await _rollups.AddApprovedMinutesAsync(entries.Select(e => e.Id).ToList(), ct);
+        }
+
         return Result.Success();
     }
 }
@@ -2,6 +2,7 @@ using MediatR;
 using Microsoft.EntityFrameworkCore;
 using Nexora.Management.Application.Common;
 using Nexora.Management.Application.TimeTracking.DTOs;
+using Nexora.Management.Application.TimeTracking.Reporting;
 using Nexora.Management.Domain.Entities;
 using Nexora.Management.Infrastructure.Interfaces;
 
@@ -21,11 +22,13 @@ public class LogTimeCommandHandler : IRequestHandler<LogTimeCommand, Result<Time
 {
     private readonly IAppDbContext _db;
     private readonly IUserContext _userContext;
+    private readonly ITimeRollupStore _rollups;
 
-    public LogTimeCommandHandler(IAppDbContext db, IUserContext userContext)
+    public LogTimeCommandHandler(IAppDbContext db, IUserContext userContext, ITimeRollupStore rollups)
     {
         _db = db;
         _userContext = userContext;
+        _rollups = rollups;
     }
 
     public async System.Threading.Tasks.Task<Result<TimeEntryDto>> Handle(LogTimeCommand request, CancellationToken ct)
@@ -95,6 +98,7 @@ public class LogTimeCommandHandler : IRequestHandler<LogTimeCommand, Result<Time
 
         _db.TimeEntries.Add(entry);
         await _db.SaveChangesAsync(ct);
+        await _rollups.ApplyAsync(entry, 1, entry.DurationMinutes, ct);
 
         var entryDto = new TimeEntryDto(
             entry.Id,
@@ -2,6 +2,7 @@ using MediatR;
 using Microsoft.EntityFrameworkCore;
 using Nexora.Management.Application.Common;
 using Nexora.Management.Application.TimeTracking.DTOs;
+using Nexora.Management.Application.TimeTracking.Reporting;
 using Nexora.Management.Domain.Entities;
 using Nexora.Management.Infrastructure.Interfaces;
 
@@ -18,11 +19,13 @@ public class StartTimeCommandHandler : IRequestHandler<StartTimeCommand, Result<
 {
     private readonly IAppDbContext _db;
     private readonly IUserContext _userContext;
+    private readonly ITimeRollupStore _rollups;
 
-    public StartTimeCommandHandler(IAppDbContext db, IUserContext userContext)
+    public StartTimeCommandHandler(IAppDbContext db, IUserContext userContext, ITimeRollupStore rollups)
     {
         _db = db;
         _userContext = userContext;
+        _rollups = rollups;
     }
 
     public async System.Threading.Tasks.Task<Result<TimeEntryDto>> Handle(StartTimeCommand request, CancellationToken ct)
@@ -87,6 +90,9 @@ public class StartTimeCommandHandler : IRequestHandler<StartTimeCommand, Result<
             return Result<TimeEntryDto>.Failure("A timer was already started. Please refresh and try again.");
         }
 
+        // Counted now; its minutes are added when the timer stops
+        await _rollups.ApplyAsync(entry, 1, 0, ct);
+
         var entryDto = new TimeEntryDto(
             entry.Id,
             entry.UserId,
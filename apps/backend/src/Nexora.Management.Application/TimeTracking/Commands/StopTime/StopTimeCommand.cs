@@ -2,6 +2,7 @@ using MediatR;
 using Microsoft.EntityFrameworkCore;
 using Nexora.Management.Application.Common;
 using Nexora.Management.Application.TimeTracking.DTOs;
+using Nexora.Management.Application.TimeTracking.Reporting;
 using Nexora.Management.Domain.Entities;
 using Nexora.Management.Infrastructure.Interfaces;
 
@@ -15,11 +16,13 @@ public class StopTimeCommandHandler : IRequestHandler<StopTimeCommand, Result<Ti
 {
     private readonly IAppDbContext _db;
     private readonly IUserContext _userContext;
+    private readonly ITimeRollupStore _rollups;
 
-    public StopTimeCommandHandler(IAppDbContext db, IUserContext userContext)
+    public StopTimeCommandHandler(IAppDbContext db, IUserContext userContext, ITimeRollupStore rollups)
     {
         _db = db;
         _userContext = userContext;
+        _rollups = rollups;
     }
 
     public async System.Threading.Tasks.Task<Result<TimeEntryDto>> Handle(StopTimeCommand request, CancellationToken ct)
@@ -34,6 +37,7 @@ public class StopTimeCommandHandler : IRequestHandler<StopTimeCommand, Result<Ti
         }
 
         // Stop the timer
+        var previousMinutes = entry.DurationMinutes;
         entry.EndTime = DateTime.UtcNow;
         entry.DurationMinutes = (int)(entry.EndTime.Value - entry.StartTime).TotalMinutes;
 
@@ -43,6 +47,7 @@ public class StopTimeCommandHandler : IRequestHandler<StopTimeCommand, Result<Ti
         }
 
         await _db.SaveChangesAsync(ct);
+        await _rollups.ApplyAsync(entry, 0, entry.DurationMinutes - previousMinutes, ct);
 
         var entryDto = new TimeEntryDto(
             entry.Id,
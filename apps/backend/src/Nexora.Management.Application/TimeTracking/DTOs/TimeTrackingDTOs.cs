@@ -85,6 +85,59 @@ public record TaskTimeBreakdownDto(
     int EntryCount
 );
 
+public record WorkspaceTimeReportDto(
+    Guid WorkspaceId,
+    DateTime PeriodStart,
+    DateTime PeriodEnd,
+    IReadOnlyList<string> GroupBy,
+    long TotalMinutes,
+    long BillableMinutes,
+    decimal TotalAmount,
+    List<TimeReportRowDto> Rows
+);
+
+/// <summary>
+/// One report row; only the dimensions the report is grouped by are set
+/// </summary>
+public record TimeReportRowDto(
+    Guid? UserId,
+    string? UserName,
+    Guid? TaskId,
+    string? TaskTitle,
+    Guid? TaskListId,
+    string? TaskListName,
+    DateTime? Day,
+    int EntryCount,
+    long TotalMinutes,
+    long BillableMinutes,
+    decimal Amount
+);
+
+public record DailyTimeRollupDto(
+    DateOnly Day,
+    Guid UserId,
+    int EntryCount,
+    long TotalMinutes,
+    long BillableMinutes
+);
+
+public record TimeEntryExportRow(
+    Guid EntryId,
+    DateTime StartTime,
+    DateTime? EndTime,
+    Guid UserId,
+    string UserName,
+    Guid? TaskId,
+    string? TaskTitle,
+    Guid? TaskListId,
+    int DurationMinutes,
+    bool IsBillable,
+    string Status,
+    decimal? HourlyRate,
+    decimal Amount,
+    string? Description
+);
+
 public record TimesheetSubmitRequest(
     Guid UserId,
     DateTime WeekStart,
@@ -0,0 +1,116 @@
+using System.Runtime.CompilerServices;
+using MediatR;
+using Microsoft.EntityFrameworkCore;
+using Nexora.Management.Application.Common;
+using Nexora.Management.Application.TimeTracking.DTOs;
+using Nexora.Management.Application.TimeTracking.Reporting;
+using Nexora.Management.Infrastructure.Interfaces;
+using TimeEntry = Nexora.Management.Domain.Entities.TimeEntry;
+
+namespace Nexora.Management.Application.TimeTracking.Queries.ExportTimeEntries;
+
+/// <summary>
+/// Priced time entries of a workspace for export. The rows are streamed from the
+/// database as they are enumerated, so the caller must enumerate them within the
+/// request that sent the query.
+/// </summary>
+public record ExportTimeEntriesQuery(
+    Guid WorkspaceId,
+    DateTime PeriodStart,
+    DateTime PeriodEnd,
+    Guid? UserId = null
+) : IRequest<Result<IAsyncEnumerable<TimeEntryExportRow>>>;
+
+public class ExportTimeEntriesQueryHandler : IRequestHandler<ExportTimeEntriesQuery, Result<IAsyncEnumerable<TimeEntryExportRow>>>
+{
+    private readonly IAppDbContext _db;
+    private readonly IUserContext _userContext;
+
+    public ExportTimeEntriesQueryHandler(IAppDbContext db, IUserContext userContext)
+    {
+        _db = db;
+        _userContext = userContext;
+    }
+
+    public async System.Threading.Tasks.Task<Result<IAsyncEnumerable<TimeEntryExportRow>>> Handle(ExportTimeEntriesQuery request, CancellationToken ct)
+    {
+        if (request.PeriodEnd < request.PeriodStart)
+        {
+            return Result<IAsyncEnumerable<TimeEntryExportRow>>.Failure("PeriodEnd cannot be before PeriodStart");
+        }
+
+        var isMember = await _db.WorkspaceMembers
+            .AnyAsync(wm => wm.WorkspaceId == request.WorkspaceId && wm.UserId == _userContext.UserId, ct);
+        if (!isMember)
+        {
+            return Result<IAsyncEnumerable<TimeEntryExportRow>>.Failure("Workspace not found or access denied");
+        }
+
+        var periodEnd = request.PeriodEnd.AddDays(1).AddSeconds(-1);
+
+        var entries = _db.TimeEntries
+            .AsNoTracking()
+            .Where(te => te.WorkspaceId == request.WorkspaceId
+                && te.StartTime >= request.PeriodStart
+                && te.StartTime <= periodEnd);
+
+        if (request.UserId.HasValue)
+        {
+            entries = entries.Where(te => te.UserId == request.UserId.Value);
+        }
+
+        var rates = await TimeReportAggregator.LoadRatesAsync(_db, request.PeriodStart, periodEnd, ct);
+
+        return Result<IAsyncEnumerable<TimeEntryExportRow>>.Success(StreamRows(entries, rates));
+    }
+
+    private static async IAsyncEnumerable<TimeEntryExportRow> StreamRows(
+        IQueryable<TimeEntry> entries,
+        TimeRateIndex rates,
+        [EnumeratorCancellation] CancellationToken ct = default)
+    {
+        // Untracked and unbuffered: rows are read from the data reader one at a time
+        var rows = entries
+            .OrderBy(te => te.StartTime)
+            .ThenBy(te => te.Id)
+            .Select(te => new
+            {
+                te.Id,
+                te.StartTime,
+                te.EndTime,
+                te.UserId,
+                UserName = te.User.Name,
+                te.TaskId,
+                TaskTitle = te.Task != null ? te.Task.Title : null,
+                TaskListId = (Guid?)te.Task!.TaskListId,
+                ProjectId = (Guid?)te.Task!.ProjectId,
+                te.DurationMinutes,
+                te.IsBillable,
+                te.Status,
+                te.Description
+            })
+            .AsAsyncEnumerable()
+            .WithCancellation(ct);
+
+        await foreach (var row in rows)
+        {
+            decimal? hourlyRate = row.IsBillable ? rates.Resolve(row.UserId, row.ProjectId, row.StartTime) : null;
+
+            yield return new TimeEntryExportRow(
+                row.Id,
+                row.StartTime,
+                row.EndTime,
+                row.UserId,
+                row.UserName ?? string.Empty,
+                row.TaskId,
+                row.TaskTitle,
+                row.TaskListId,
+                row.DurationMinutes,
+                row.IsBillable,
+                row.Status,
+                hourlyRate,
+                hourlyRate.HasValue ? Math.Round(row.DurationMinutes * hourlyRate.Value / 60m, 2) : 0m,
+                row.Description);
+        }
+    }
+}
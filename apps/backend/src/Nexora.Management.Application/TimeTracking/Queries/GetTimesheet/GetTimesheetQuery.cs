@@ -47,18 +47,26 @@ public class GetTimesheetQueryHandler : IRequestHandler<GetTimesheetQuery, Resul
             ))
             .ToListAsync(ct);
 
-        // Group by day
+        // Group by day in one pass over the (start-ordered) entries
+        var entriesByDay = new List<TimeEntryDto>[7];
+        for (var day = 0; day < 7; day++)
+        {
+            entriesByDay[day] = new List<TimeEntryDto>();
+        }
+
+        foreach (var entry in entries)
+        {
+            var day = (int)((entry.StartTime - request.WeekStart).Ticks / TimeSpan.TicksPerDay);
+            entriesByDay[day].Add(entry);
+        }
+
         var dailyTotals = new List<DailyTimeDto>();
         var totalMinutes = 0;
 
         for (var day = 0; day < 7; day++)
         {
             var currentDay = request.WeekStart.AddDays(day);
-            var nextDay = currentDay.AddDays(1);
-
-            var dayEntries = entries
-                .Where(e => e.StartTime >= currentDay && e.StartTime < nextDay)
-                .ToList();
+            var dayEntries = entriesByDay[day];
 
             var dayTotal = dayEntries.Sum(e => e.DurationMinutes);
             var billableTotal = dayEntries.Where(e => e.IsBillable).Sum(e => e.DurationMinutes);
@@ -2,7 +2,7 @@ using MediatR;
 using Microsoft.EntityFrameworkCore;
 using Nexora.Management.Application.Common;
 using Nexora.Management.Application.TimeTracking.DTOs;
-using Nexora.Management.Domain.Entities;
+using Nexora.Management.Application.TimeTracking.Reporting;
 using Nexora.Management.Infrastructure.Interfaces;
 
 namespace Nexora.Management.Application.TimeTracking.Queries.GetUserTimeReport;
@@ -26,51 +26,35 @@ public class GetUserTimeReportQueryHandler : IRequestHandler<GetUserTimeReportQu
     {
         var periodEnd = request.PeriodEnd.AddDays(1).AddSeconds(-1);
 
-        // Get all entries for the period
-        var entries = await _db.TimeEntries
+        var entries = _db.TimeEntries
+            .AsNoTracking()
             .Where(te => te.UserId == request.UserId
                 && te.StartTime >= request.PeriodStart
-                && te.StartTime <= periodEnd)
-            .Include(te => te.Task)
-            .ToListAsync(ct);
+                && te.StartTime <= periodEnd);
 
-        // Get all applicable rates for the user and projects
-        var projectIds = entries.Where(e => e.TaskId.HasValue).Select(e => e.Task!.ProjectId).Distinct().ToList();
-        var rates = await _db.TimeRates
-            .Where(r => (r.UserId == null || r.UserId == request.UserId)
-                && (r.ProjectId == null || projectIds.Contains(r.ProjectId.Value))
-                && r.EffectiveFrom <= periodEnd
-                && (r.EffectiveTo == null || r.EffectiveTo >= request.PeriodStart))
-            .ToListAsync(ct);
+        // Summed per task and day in SQL, priced with the rate index
+        var rates = await TimeReportAggregator.LoadRatesAsync(_db, request.PeriodStart, periodEnd, ct);
+        var buckets = await TimeReportAggregator.AggregateAsync(entries, rates, ct);
 
-        var totalMinutes = entries.Sum(e => e.DurationMinutes);
-        var billableMinutes = entries.Where(e => e.IsBillable).Sum(e => e.DurationMinutes);
-
-        // Calculate amount based on rates (use highest rate for each entry)
-        decimal totalAmount = 0;
-        foreach (var entry in entries.Where(e => e.IsBillable))
-        {
-            var applicableRates = rates
-                .Where(r => r.EffectiveFrom <= entry.StartTime
-                    && (r.EffectiveTo == null || r.EffectiveTo >= entry.StartTime)
-                    && (r.UserId == null || r.UserId == entry.UserId)
-                    && (r.ProjectId == null || (entry.Task?.ProjectId != null && r.ProjectId == entry.Task.ProjectId)))
-                .ToList();
-
-            // Use highest rate if multiple rates match
-            var rate = applicableRates.Any() ? applicableRates.Max(r => r.HourlyRate) : 50m; // Fallback to default
-            totalAmount += (entry.DurationMinutes / 60m) * rate;
-        }
+        var totalMinutes = (int)buckets.Sum(b => b.TotalMinutes);
+        var billableMinutes = (int)buckets.Sum(b => b.BillableMinutes);
+        var totalAmount = buckets.Sum(b => b.Amount);
 
         // Group by task
-        var taskBreakdown = entries
-            .Where(e => e.TaskId.HasValue)
-            .GroupBy(e => e.TaskId)
+        var taskIds = buckets.Where(b => b.TaskId.HasValue).Select(b => b.TaskId!.Value).Distinct().ToList();
+        var taskTitles = await _db.Tasks
+            .AsNoTracking()
+            .Where(t => taskIds.Contains(t.Id))
+            .ToDictionaryAsync(t => t.Id, t => t.Title, ct);
+
+        var taskBreakdown = buckets
+            .Where(b => b.TaskId.HasValue)
+            .GroupBy(b => b.TaskId!.Value)
             .Select(g => new TaskTimeBreakdownDto(
                 g.Key,
-                g.FirstOrDefault()?.Task?.Title,
-                g.Sum(e => e.DurationMinutes),
-                g.Count()
+                taskTitles.GetValueOrDefault(g.Key),
+                (int)g.Sum(b => b.TotalMinutes),
+                g.Sum(b => b.EntryCount)
             ))
             .OrderByDescending(b => b.TotalMinutes)
             .ToList();
@@ -0,0 +1,69 @@
+using MediatR;
+using Microsoft.EntityFrameworkCore;
+using Nexora.Management.Application.Common;
+using Nexora.Management.Application.TimeTracking.DTOs;
+using Nexora.Management.Infrastructure.Interfaces;
+
+namespace Nexora.Management.Application.TimeTracking.Queries.GetWorkspaceDailyTime;
+
+/// <summary>
+/// Per-user daily time totals for a workspace, read from the precomputed daily rollups
+/// </summary>
+public record GetWorkspaceDailyTimeQuery(
+    Guid WorkspaceId,
+    DateOnly From,
+    DateOnly To,
+    Guid? UserId = null
+) : IRequest<Result<List<DailyTimeRollupDto>>>;
+
+public class GetWorkspaceDailyTimeQueryHandler : IRequestHandler<GetWorkspaceDailyTimeQuery, Result<List<DailyTimeRollupDto>>>
+{
+    private readonly IAppDbContext _db;
+    private readonly IUserContext _userContext;
+
+    public GetWorkspaceDailyTimeQueryHandler(IAppDbContext db, IUserContext userContext)
+    {
+        _db = db;
+        _userContext = userContext;
+    }
+
+    public async System.Threading.Tasks.Task<Result<List<DailyTimeRollupDto>>> Handle(GetWorkspaceDailyTimeQuery request, CancellationToken ct)
+    {
+        if (request.To < request.From)
+        {
+            return Result<List<DailyTimeRollupDto>>.Failure("To cannot be before From");
+        }
+
+        var isMember = await _db.WorkspaceMembers
+            .AnyAsync(wm => wm.WorkspaceId == request.WorkspaceId && wm.UserId == _userContext.UserId, ct);
+        if (!isMember)
+        {
+            return Result<List<DailyTimeRollupDto>>.Failure("Workspace not found or access denied");
+        }
+
+        var rollups = _db.TimeEntryDailyRollups
+            .AsNoTracking()
+            .Where(r => r.WorkspaceId == request.WorkspaceId && r.Day >= request.From && r.Day <= request.To);
+
+        if (request.UserId.HasValue)
+        {
+            rollups = rollups.Where(r => r.UserId == request.UserId.Value);
+        }
+
+        // Rollups are per task; sum them per user and day
+        var days = await rollups
+            .GroupBy(r => new { r.Day, r.UserId })
+            .OrderBy(g => g.Key.Day)
+            .ThenBy(g => g.Key.UserId)
+            .Select(g => new DailyTimeRollupDto(
+                g.Key.Day,
+                g.Key.UserId,
+                g.Sum(r => r.EntryCount),
+                g.Sum(r => r.TotalMinutes),
+                g.Sum(r => r.BillableMinutes)
+            ))
+            .ToListAsync(ct);
+
+        return Result<List<DailyTimeRollupDto>>.Success(days);
+    }
+}
@@ -0,0 +1,136 @@
+using MediatR;
+using Microsoft.EntityFrameworkCore;
+using Nexora.Management.Application.Common;
+using Nexora.Management.Application.TimeTracking.DTOs;
+using Nexora.Management.Application.TimeTracking.Reporting;
+using Nexora.Management.Infrastructure.Interfaces;
+
+namespace Nexora.Management.Application.TimeTracking.Queries.GetWorkspaceTimeReport;
+
+/// <summary>
+/// Time and billing report across all members of a workspace.
+/// GroupBy is a comma-separated list of "user", "task", "tasklist" and "day".
+/// </summary>
+public record GetWorkspaceTimeReportQuery(
+    Guid WorkspaceId,
+    DateTime PeriodStart,
+    DateTime PeriodEnd,
+    Guid? UserId = null,
+    string? GroupBy = null
+) : IRequest<Result<WorkspaceTimeReportDto>>;
+
+public class GetWorkspaceTimeReportQueryHandler : IRequestHandler<GetWorkspaceTimeReportQuery, Result<WorkspaceTimeReportDto>>
+{
+    private static readonly string[] Dimensions = { "user", "task", "tasklist", "day" };
+
+    private readonly IAppDbContext _db;
+    private readonly IUserContext _userContext;
+
+    public GetWorkspaceTimeReportQueryHandler(IAppDbContext db, IUserContext userContext)
+    {
+        _db = db;
+        _userContext = userContext;
+    }
+
+    public async System.Threading.Tasks.Task<Result<WorkspaceTimeReportDto>> Handle(GetWorkspaceTimeReportQuery request, CancellationToken ct)
+    {
+        if (request.PeriodEnd < request.PeriodStart)
+        {
+            return Result<WorkspaceTimeReportDto>.Failure("PeriodEnd cannot be before PeriodStart");
+        }
+
+        var groupBy = (request.GroupBy ?? "user")
+            .Split(',', StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries)
+            .Select(d => d.ToLowerInvariant())
+            .Distinct()
+            .ToList();
+
+        var unknown = groupBy.FirstOrDefault(d => !Dimensions.Contains(d));
+        if (unknown != null)
+        {
+            return Result<WorkspaceTimeReportDto>.Failure($"Cannot group by '{unknown}'. Use {string.Join(", ", Dimensions)}");
+        }
+
+        var isMember = await _db.WorkspaceMembers
+            .AnyAsync(wm => wm.WorkspaceId == request.WorkspaceId && wm.UserId == _userContext.UserId, ct);
+        if (!isMember)
+        {
+            return Result<WorkspaceTimeReportDto>.Failure("Workspace not found or access denied");
+        }
+
+        var periodEnd = request.PeriodEnd.AddDays(1).AddSeconds(-1);
+
+        var entries = _db.TimeEntries
+            .AsNoTracking()
+            .Where(te => te.WorkspaceId == request.WorkspaceId
+                && te.StartTime >= request.PeriodStart
+                && te.StartTime <= periodEnd);
+
+        if (request.UserId.HasValue)
+        {
+            entries = entries.Where(te => te.UserId == request.UserId.Value);
+        }
+
+        var rates = await TimeReportAggregator.LoadRatesAsync(_db, request.PeriodStart, periodEnd, ct);
+        var buckets = await TimeReportAggregator.AggregateAsync(entries, rates, ct);
+
+        var byUser = groupBy.Contains("user");
+        var byTask = groupBy.Contains("task");
+        var byTaskList = groupBy.Contains("tasklist");
+        var byDay = groupBy.Contains("day");
+
+        var groups = buckets
+            .GroupBy(b => (
+                UserId: byUser ? b.UserId : (Guid?)null,
+                TaskId: byTask ? b.TaskId : null,
+                TaskListId: byTaskList ? b.TaskListId : null,
+                Day: byDay ? b.Day : (DateTime?)null))
+            .ToList();
+
+        // Resolve names for the grouped dimensions in one query each
+        var userIds = groups.Where(g => g.Key.UserId.HasValue).Select(g => g.Key.UserId!.Value).Distinct().ToList();
+        var taskIds = groups.Where(g => g.Key.TaskId.HasValue).Select(g => g.Key.TaskId!.Value).Distinct().ToList();
+        var taskListIds = groups.Where(g => g.Key.TaskListId.HasValue).Select(g => g.Key.TaskListId!.Value).Distinct().ToList();
+
+        var userNames = userIds.Count == 0
+            ? new Dictionary<Guid, string?>()
+            : await _db.Users.AsNoTracking().Where(u => userIds.Contains(u.Id)).ToDictionaryAsync(u => u.Id, u => u.Name, ct);
+        var taskTitles = taskIds.Count == 0
+            ? new Dictionary<Guid, string>()
+            : await _db.Tasks.AsNoTracking().Where(t => taskIds.Contains(t.Id)).ToDictionaryAsync(t => t.Id, t => t.Title, ct);
+        var taskListNames = taskListIds.Count == 0
+            ? new Dictionary<Guid, string>()
+            : await _db.TaskLists.AsNoTracking().Where(tl => taskListIds.Contains(tl.Id)).ToDictionaryAsync(tl => tl.Id, tl => tl.Name, ct);
+
+        var rows = groups
+            .Select(g => new TimeReportRowDto(
+                g.Key.UserId,
+                g.Key.UserId.HasValue ? userNames.GetValueOrDefault(g.Key.UserId.Value) : null,
+                g.Key.TaskId,
+                g.Key.TaskId.HasValue ? taskTitles.GetValueOrDefault(g.Key.TaskId.Value) : null,
+                g.Key.TaskListId,
+                g.Key.TaskListId.HasValue ? taskListNames.GetValueOrDefault(g.Key.TaskListId.Value) : null,
+                g.Key.Day,
+                g.Sum(b => b.EntryCount),
+                g.Sum(b => b.TotalMinutes),
+                g.Sum(b => b.BillableMinutes),
+                g.Sum(b => b.Amount)
+            ))
+            .OrderBy(r => r.Day)
+            .ThenByDescending(r => r.TotalMinutes)
+            .ToList();
+
+        var report = new WorkspaceTimeReportDto(
+            request.WorkspaceId,
+            request.PeriodStart,
+            request.PeriodEnd,
+            groupBy,
+            buckets.Sum(b => b.TotalMinutes),
+            buckets.Sum(b => b.BillableMinutes),
+            buckets.Sum(b => b.Amount),
+            rows
+        );
+
+        return Result<WorkspaceTimeReportDto>.Success(report);
+    }
+}
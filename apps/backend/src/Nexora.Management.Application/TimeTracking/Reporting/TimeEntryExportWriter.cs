@@ -0,0 +1,128 @@
+using System.Globalization;
+using System.Text;
+using System.Text.Json;
+using Nexora.Management.Application.TimeTracking.DTOs;
+
+namespace Nexora.Management.Application.TimeTracking.Reporting;
+
+/// <summary>
+/// Writes exported time entries as CSV or newline-delimited JSON, one row at a
+/// time, so memory use does not depend on the number of entries
+/// </summary>
+public static class TimeEntryExportWriter
+{
+    public const string CsvFormat = "csv";
+    public const string NdjsonFormat = "ndjson";
+
+    private const int FlushEveryRows = 1000;
+
+    private static readonly string[] CsvColumns =
+    {
+        "entry_id", "start_time", "end_time", "user_id", "user_name", "task_id", "task_title",
+        "task_list_id", "duration_minutes", "is_billable", "status", "hourly_rate", "amount", "description"
+    };
+
+    private static readonly JsonSerializerOptions JsonOptions = new(JsonSerializerDefaults.Web);
+
+    public static bool IsSupportedFormat(string format) =>
+        format == CsvFormat || format == NdjsonFormat;
+
+    public static string GetContentType(string format) =>
+        format == NdjsonFormat ? "application/x-ndjson" : "text/csv";
+
+    public static async Task<long> WriteCsvAsync(IAsyncEnumerable<TimeEntryExportRow> rows, Stream output, CancellationToken ct = default)
+    {
+        await using var writer = new StreamWriter(output, new UTF8Encoding(false), bufferSize: 64 * 1024, leaveOpen: true);
+        await writer.WriteLineAsync(string.Join(',', CsvColumns));
+
+        var line = new StringBuilder(256);
+        long count = 0;
+
+        await foreach (var row in rows.WithCancellation(ct))
+        {
+            line.Clear();
+            line.Append(row.EntryId).Append(',')
+                .Append(FormatTime(row.StartTime)).Append(',')
+                .Append(row.EndTime.HasValue ? FormatTime(row.EndTime.Value) : string.Empty).Append(',')
+                .Append(row.UserId).Append(',');
+            AppendText(line, row.UserName).Append(',')
+                .Append(row.TaskId).Append(',');
+            AppendText(line, row.TaskTitle).Append(',')
+                .Append(row.TaskListId).Append(',')
+                .Append(row.DurationMinutes.ToString(CultureInfo.InvariantCulture)).Append(',')
+                .Append(row.IsBillable ? "true" : "false").Append(',');
+            AppendText(line, row.Status).Append(',')
+                .Append(row.HourlyRate?.ToString(CultureInfo.InvariantCulture)).Append(',')
+                .Append(row.Amount.ToString(CultureInfo.InvariantCulture)).Append(',');
+            AppendText(line, row.Description);
+
+            await writer.WriteLineAsync(line, ct);
+
+            if (++count % FlushEveryRows == 0)
+            {
+                await writer.FlushAsync(ct);
+            }
+        }
+
+        await writer.FlushAsync(ct);
+        return count;
+    }
+
+    public static async Task<long> WriteNdjsonAsync(IAsyncEnumerable<TimeEntryExportRow> rows, Stream output, CancellationToken ct = default)
+    {
+        var buffer = new MemoryStream();
+        await using var json = new Utf8JsonWriter(buffer);
+        long count = 0;
+
+        await foreach (var row in rows.WithCancellation(ct))
+        {
+            JsonSerializer.Serialize(json, row, JsonOptions);
+            await json.FlushAsync(ct);
+            buffer.WriteByte((byte)'\n');
+            json.Reset();
+
+            if (++count % FlushEveryRows == 0)
+            {
+                await DrainAsync(buffer, output, ct);
+            }
+        }
+
+        await DrainAsync(buffer, output, ct);
+        return count;
+    }
+
+    private static async Task DrainAsync(MemoryStream buffer, Stream output, CancellationToken ct)
+    {
+        await output.WriteAsync(buffer.GetBuffer().AsMemory(0, (int)buffer.Length), ct);
+        await output.FlushAsync(ct);
+        buffer.SetLength(0);
+    }
+
+    private static string FormatTime(DateTime value) =>
+        value.ToString("yyyy-MM-dd'T'HH:mm:ss'Z'", CultureInfo.InvariantCulture);
+
+    // Quotes fields that need it, and defuses values a spreadsheet would run as formulas
+    private static StringBuilder AppendText(StringBuilder line, string? value)
+    {
+        if (string.IsNullOrEmpty(value))
+        {
+            return line;
+        }
+
+        var needsPrefix = value[0] is '=' or '+' or '-' or '@' or '\t' or '\r';
+        var needsQuotes = needsPrefix || value.AsSpan().IndexOfAny(",\"\r\n") >= 0;
+
+        if (!needsQuotes)
+        {
+            return line.Append(value);
+        }
+
+        line.Append('"');
+        if (needsPrefix)
+        {
+            line.Append('\'');
+        }
+
+        return line.Append(value.Replace("\"", "\"\"")).Append('"');
+    }
+}
@@ -0,0 +1,174 @@
+using TimeRate = Nexora.Management.Domain.Entities.TimeRate;
+
+namespace Nexora.Management.Application.TimeTracking.Reporting;
+
+/// <summary>
+/// Effective-dated hourly rates indexed by user/project pair. Each pair's rates are
+/// flattened into sorted, non-overlapping segments holding the highest rate in force,
+/// so a lookup is a binary search per pair instead of a scan over every rate.
+/// </summary>
+/// <remarks>
+/// A rate with no user or no project applies to every user or project. An entry is
+/// billed at the highest matching rate, or <see cref="DefaultHourlyRate"/> if none match.
+/// </remarks>
+public sealed class TimeRateIndex
+{
+    /// <summary>
+    /// Rate used for billable time no configured rate applies to
+    /// </summary>
+    public const decimal DefaultHourlyRate = 50m;
+
+    private readonly Dictionary<(Guid? UserId, Guid? ProjectId), RateSegment[]> _segments;
+
+    private TimeRateIndex(Dictionary<(Guid? UserId, Guid? ProjectId), RateSegment[]> segments)
+    {
+        _segments = segments;
+    }
+
+    public static TimeRateIndex Build(IEnumerable<TimeRate> rates)
+    {
+        var segments = rates
+            .GroupBy(r => (r.UserId, r.ProjectId))
+            .ToDictionary(g => g.Key, g => BuildSegments(g.ToList()));
+
+        return new TimeRateIndex(segments);
+    }
+
+    /// <summary>
+    /// Hourly rate for time started at <paramref name="at"/>
+    /// </summary>
+    public decimal Resolve(Guid userId, Guid? projectId, DateTime at)
+    {
+        decimal? rate = null;
+        foreach (var segments in GetCandidates(userId, projectId))
+        {
+            var index = FindSegment(segments, at);
+            if (index >= 0 && segments[index].End > at)
+            {
+                rate = Max(rate, segments[index].HourlyRate);
+            }
+        }
+
+        return rate ?? DefaultHourlyRate;
+    }
+
+    /// <summary>
+    /// Resolves the rate for all time started between <paramref name="from"/> and
+    /// <paramref name="to"/> (inclusive), if no rate change falls inside that range
+    /// </summary>
+    public bool TryResolveConstant(Guid userId, Guid? projectId, DateTime from, DateTime to, out decimal hourlyRate)
+    {
+        decimal? rate = null;
+        foreach (var segments in GetCandidates(userId, projectId))
+        {
+            var index = FindSegment(segments, from);
+            if (index >= 0 && segments[index].End > from)
+            {
+                if (segments[index].End <= to)
+                {
+                    hourlyRate = 0;
+                    return false;
+                }
+
+                rate = Max(rate, segments[index].HourlyRate);
+            }
+            else if (index + 1 < segments.Length && segments[index + 1].Start <= to)
+            {
+                hourlyRate = 0;
+                return false;
+            }
+        }
+
+        hourlyRate = rate ?? DefaultHourlyRate;
+        return true;
+    }
+
+    private IEnumerable<RateSegment[]> GetCandidates(Guid userId, Guid? projectId)
+    {
+        var keys = projectId.HasValue
+            ? new (Guid?, Guid?)[] { (userId, projectId), (null, projectId), (userId, null), (null, null) }
+            : new (Guid?, Guid?)[] { (userId, null), (null, null) };
+
+        foreach (var key in keys)
+        {
+            if (_segments.TryGetValue(key, out var segments))
+            {
+                yield return segments;
+            }
+        }
+    }
+
+    // Index of the last segment starting at or before the given time, or -1
+    private static int FindSegment(RateSegment[] segments, DateTime at)
+    {
+        int low = 0, high = segments.Length - 1, found = -1;
+        while (low <= high)
+        {
+            var mid = low + (high - low) / 2;
+            if (segments[mid].Start <= at)
+            {
+                found = mid;
+                low = mid + 1;
+            }
+            else
+            {
+                high = mid - 1;
+            }
+        }
+
+        return found;
+    }
+
+    private static RateSegment[] BuildSegments(List<TimeRate> rates)
+    {
+        // EffectiveTo is inclusive; segments are half-open
+        var intervals = rates
+            .Select(r => new RateSegment(
+                r.EffectiveFrom,
+                r.EffectiveTo is { } to && to < DateTime.MaxValue ? to.AddTicks(1) : DateTime.MaxValue,
+                r.HourlyRate))
+            .Where(r => r.End > r.Start)
+            .ToList();
+
+        var boundaries = intervals
+            .SelectMany(r => new[] { r.Start, r.End })
+            .Distinct()
+            .Order()
+            .ToList();
+
+        var segments = new List<RateSegment>();
+        for (var i = 0; i < boundaries.Count - 1; i++)
+        {
+            var start = boundaries[i];
+            decimal? rate = null;
+            foreach (var interval in intervals)
+            {
+                if (interval.Start <= start && interval.End > start)
+                {
+                    rate = Max(rate, interval.HourlyRate);
+                }
+            }
+
+            if (rate == null)
+            {
+                continue;
+            }
+
+            if (segments.Count > 0 && segments[^1].End == start && segments[^1].HourlyRate == rate)
+            {
+                segments[^1] = segments[^1] with { End = boundaries[i + 1] };
+            }
+            else
+            {
+                segments.Add(new RateSegment(start, boundaries[i + 1], rate.Value));
+            }
+        }
+
+        return segments.ToArray();
+    }
+
+    private static decimal Max(decimal? current, decimal rate) =>
+        current.HasValue ? Math.Max(current.Value, rate) : rate;
+
+    private readonly record struct RateSegment(DateTime Start, DateTime End, decimal HourlyRate);
+}
@@ -0,0 +1,113 @@
+using Microsoft.EntityFrameworkCore;
+using Nexora.Management.Infrastructure.Interfaces;
+using TimeEntry = Nexora.Management.Domain.Entities.TimeEntry;
+
+namespace Nexora.Management.Application.TimeTracking.Reporting;
+
+/// <summary>
+/// Time and billing totals for one user, task and UTC day
+/// </summary>
+public record TimeReportBucket(
+    Guid UserId,
+    Guid? TaskId,
+    Guid? TaskListId,
+    DateTime Day,
+    int EntryCount,
+    long TotalMinutes,
+    long BillableMinutes,
+    decimal Amount);
+
+/// <summary>
+/// Set-based time report aggregation. Entries are summed in SQL per user, task,
+/// day and billable flag; billable sums are priced with the <see cref="TimeRateIndex"/>.
+/// Only the rare group a rate change falls inside is priced entry by entry.
+/// </summary>
+public static class TimeReportAggregator
+{
+    /// <summary>
+    /// Loads the rates in force at any time during the period
+    /// </summary>
+    public static async Task<TimeRateIndex> LoadRatesAsync(IAppDbContext db, DateTime periodStart, DateTime periodEnd, CancellationToken ct)
+    {
+        var rates = await db.TimeRates
+            .AsNoTracking()
+            .Where(r => r.EffectiveFrom <= periodEnd && (r.EffectiveTo == null || r.EffectiveTo >= periodStart))
+            .ToListAsync(ct);
+
+        return TimeRateIndex.Build(rates);
+    }
+
+    public static async Task<List<TimeReportBucket>> AggregateAsync(
+        IQueryable<TimeEntry> entries,
+        TimeRateIndex rates,
+        CancellationToken ct)
+    {
+        var groups = await entries
+            .GroupBy(te => new
+            {
+                te.UserId,
+                te.TaskId,
+                TaskListId = (Guid?)te.Task!.TaskListId,
+                ProjectId = (Guid?)te.Task!.ProjectId,
+                Day = te.StartTime.Date,
+                te.IsBillable
+            })
+            .Select(g => new
+            {
+                g.Key.UserId,
+                g.Key.TaskId,
+                g.Key.TaskListId,
+                g.Key.ProjectId,
+                g.Key.Day,
+                g.Key.IsBillable,
+                EntryCount = g.Count(),
+                Minutes = g.Sum(te => (long)te.DurationMinutes),
+                FirstStart = g.Min(te => te.StartTime),
+                LastStart = g.Max(te => te.StartTime)
+            })
+            .ToListAsync(ct);
+
+        var buckets = new Dictionary<(Guid UserId, Guid? TaskId, DateTime Day), TimeReportBucket>();
+
+        foreach (var group in groups)
+        {
+            var amount = 0m;
+            if (group.IsBillable && group.Minutes != 0)
+            {
+                if (rates.TryResolveConstant(group.UserId, group.ProjectId, group.FirstStart, group.LastStart, out var hourlyRate))
+                {
+                    amount = group.Minutes * hourlyRate / 60m;
+                }
+                else
+                {
+                    // A rate changes during this day: price each entry at its own start time
+                    var dayEnd = group.Day.AddDays(1);
+                    var dayEntries = await entries
+                        .Where(te => te.UserId == group.UserId
+                            && te.TaskId == group.TaskId
+                            && te.IsBillable
+                            && te.StartTime >= group.Day
+                            && te.StartTime < dayEnd)
+                        .Select(te => new { te.StartTime, te.DurationMinutes })
+                        .ToListAsync(ct);
+
+                    amount = dayEntries.Sum(e => e.DurationMinutes * rates.Resolve(group.UserId, group.ProjectId, e.StartTime) / 60m);
+                }
+            }
+
+            var key = (group.UserId, group.TaskId, group.Day);
+            buckets.TryGetValue(key, out var bucket);
+            buckets[key] = new TimeReportBucket(
+                group.UserId,
+                group.TaskId,
+                group.TaskListId,
+                group.Day,
+                (bucket?.EntryCount ?? 0) + group.EntryCount,
+                (bucket?.TotalMinutes ?? 0) + group.Minutes,
+                (bucket?.BillableMinutes ?? 0) + (group.IsBillable ? group.Minutes : 0),
+                (bucket?.Amount ?? 0) + amount);
+        }
+
+        return buckets.Values.ToList();
+    }
+}
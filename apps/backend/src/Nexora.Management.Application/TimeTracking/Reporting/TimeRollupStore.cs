@@ -0,0 +1,99 @@
+using Nexora.Management.Infrastructure.Interfaces;
+using TimeEntry = Nexora.Management.Domain.Entities.TimeEntry;
+
+namespace Nexora.Management.Application.TimeTracking.Reporting;
+
+/// <summary>
+/// Maintains per-user, per-task, per-day time totals for each workspace
+/// </summary>
+public interface ITimeRollupStore
+{
+    /// <summary>
+    /// Adds an entry's contribution to its day's totals. Entries without a workspace are not rolled up.
+    /// </summary>
+    Task ApplyAsync(TimeEntry entry, int entryCountDelta, int minutesDelta, CancellationToken ct = default);
+
+    /// <summary>
+    /// Recomputes all daily rollups from time entries, for one workspace or for every workspace
+    /// </summary>
+    Task RebuildAsync(Guid? workspaceId = null, CancellationToken ct = default);
+}
+
+/// <summary>
+/// PostgreSQL-backed daily time rollups. Days are UTC calendar days.
+/// </summary>
+public class TimeRollupStore : ITimeRollupStore
+{
+    private const string UpsertSql = """
+        INSERT INTO time_entry_daily_rollups
+            ("Id", "WorkspaceId", "UserId", "TaskId", "Day", "EntryCount", "TotalMinutes", "BillableMinutes", "CreatedAt", "UpdatedAt")
+        VALUES (uuid_generate_v4(), {0}, {1}, {2}, {3}, {4}, {5}, {6}, now(), now())
+        ON CONFLICT ("WorkspaceId", "UserId", "TaskId", "Day") DO UPDATE SET
+            "EntryCount" = time_entry_daily_rollups."EntryCount" + EXCLUDED."EntryCount",
+            "TotalMinutes" = time_entry_daily_rollups."TotalMinutes" + EXCLUDED."TotalMinutes",
+            "BillableMinutes" = time_entry_daily_rollups."BillableMinutes" + EXCLUDED."BillableMinutes",
+            "UpdatedAt" = now()
+        """;
+
+    private readonly IAppDbContext _db;
+
+    public TimeRollupStore(IAppDbContext db)
+    {
+        _db = db;
+    }
+
+    public async Task ApplyAsync(TimeEntry entry, int entryCountDelta, int minutesDelta, CancellationToken ct = default)
+    {
+        if (entry.WorkspaceId == null || (entryCountDelta == 0 && minutesDelta == 0))
+        {
+            return;
+        }
+
+        await _db.ExecuteSqlRawAsync(
+            UpsertSql,
+            entry.WorkspaceId.Value,
+            entry.UserId,
+            entry.TaskId ?? Guid.Empty,
+            DateOnly.FromDateTime(entry.StartTime.ToUniversalTime()),
+            entryCountDelta,
+            (long)minutesDelta,
+            entry.IsBillable ? (long)minutesDelta : 0L);
+    }
+
+    public async Task RebuildAsync(Guid? workspaceId = null, CancellationToken ct = default)
+    {
+        var filter = workspaceId.HasValue ? """AND te."WorkspaceId" = {0}""" : string.Empty;
+        var deleteFilter = workspaceId.HasValue ? """WHERE "WorkspaceId" = {0}""" : string.Empty;
+
+        // Delete and insert run as one command, so readers never observe empty rollups
+        var sql = $"""
+            DELETE FROM time_entry_daily_rollups {deleteFilter};
+
+            INSERT INTO time_entry_daily_rollups
+                ("Id", "WorkspaceId", "UserId", "TaskId", "Day", "EntryCount", "TotalMinutes", "BillableMinutes", "CreatedAt", "UpdatedAt")
+            SELECT uuid_generate_v4(), workspace_id, user_id, task_id, day,
+                   COUNT(*), SUM(minutes), SUM(CASE WHEN is_billable THEN minutes ELSE 0 END), now(), now()
+            FROM (
+                SELECT
+                    te."WorkspaceId" AS workspace_id,
+                    te."UserId" AS user_id,
+                    COALESCE(te."TaskId", '00000000-0000-0000-0000-000000000000'::uuid) AS task_id,
+                    (te."StartTime" AT TIME ZONE 'UTC')::date AS day,
+                    te."DurationMinutes"::bigint AS minutes,
+                    te."IsBillable" AS is_billable
+                FROM time_entries te
+                WHERE te."WorkspaceId" IS NOT NULL {filter}
+            ) facts
+            GROUP BY workspace_id, user_id, task_id, day;
+            """;
+
+        if (workspaceId.HasValue)
+        {
+            await _db.ExecuteSqlRawAsync(sql, workspaceId.Value);
+        }
+        else
+        {
+            await _db.ExecuteSqlRawAsync(sql);
+        }
+    }
+}
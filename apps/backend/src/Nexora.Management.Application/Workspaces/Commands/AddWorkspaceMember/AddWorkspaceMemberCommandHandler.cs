@@ -2,6 +2,7 @@ using MediatR;
 using Microsoft.EntityFrameworkCore;
 using Nexora.Management.Application.Workspaces.Commands.AddWorkspaceMember;
 using Nexora.Management.Application.Workspaces.DTOs;
+using Nexora.Management.Application.Authorization;
 using Nexora.Management.Application.Common;
 using Nexora.Management.Domain.Entities;
 using Nexora.Management.Infrastructure.Interfaces;
@@ -15,10 +16,12 @@ namespace Nexora.Management.Application.Workspaces.Commands.AddWorkspaceMember;
 public class AddWorkspaceMemberCommandHandler : IRequestHandler<AddWorkspaceMemberCommand, Result<WorkspaceMemberResponse>>
 {
     private readonly AppDbContext _dbContext;
+    private readonly IPermissionCache _permissionCache;
 
-    public AddWorkspaceMemberCommandHandler(AppDbContext dbContext)
+    public AddWorkspaceMemberCommandHandler(AppDbContext dbContext, IPermissionCache permissionCache)
     {
         _dbContext = dbContext;
+        _permissionCache = permissionCache;
     }
 
     public async Task<Result<WorkspaceMemberResponse>> Handle(AddWorkspaceMemberCommand command, CancellationToken cancellationToken)
@@ -73,6 +76,9 @@ public class AddWorkspaceMemberCommandHandler : IRequestHandler<AddWorkspaceMemb
         _dbContext.WorkspaceMembers.Add(workspaceMember);
         await _dbContext.SaveChangesAsync(cancellationToken);
 
+        // New membership grants the role's permissions
+        _permissionCache.InvalidateUser(request.UserId);
+
         // Return response with joined data
         var response = new WorkspaceMemberResponse
         {
@@ -1,5 +1,6 @@
 using MediatR;
 using Microsoft.EntityFrameworkCore;
+using Nexora.Management.Application.Authorization;
 using Nexora.Management.Application.Common;
 using Nexora.Management.Infrastructure.Interfaces;
 
@@ -10,10 +11,12 @@ public record DeleteWorkspaceCommand(Guid Id) : IRequest<Result>;
 public class DeleteWorkspaceCommandHandler : IRequestHandler<DeleteWorkspaceCommand, Result>
 {
     private readonly IAppDbContext _db;
+    private readonly IPermissionCache _permissionCache;
 
-    public DeleteWorkspaceCommandHandler(IAppDbContext db)
+    public DeleteWorkspaceCommandHandler(IAppDbContext db, IPermissionCache permissionCache)
     {
         _db = db;
+        _permissionCache = permissionCache;
     }
 
     public async System.Threading.Tasks.Task<Result> Handle(DeleteWorkspaceCommand request, CancellationToken ct)
@@ -29,6 +32,8 @@ public class DeleteWorkspaceCommandHandler : IRequestHandler<DeleteWorkspaceComm
         _db.Workspaces.Remove(workspace);
         await _db.SaveChangesAsync(ct);
 
+        _permissionCache.InvalidateWorkspace(request.Id);
+
         return Result.Success();
     }
 }
@@ -1,6 +1,7 @@
 using MediatR;
 using Microsoft.EntityFrameworkCore;
 using Nexora.Management.Application.Workspaces.Commands.RemoveWorkspaceMember;
+using Nexora.Management.Application.Authorization;
 using Nexora.Management.Application.Common;
 using Nexora.Management.Domain.Entities;
 using Nexora.Management.Infrastructure.Persistence;
@@ -13,10 +14,12 @@ namespace Nexora.Management.Application.Workspaces.Commands.RemoveWorkspaceMembe
 public class RemoveWorkspaceMemberCommandHandler : IRequestHandler<RemoveWorkspaceMemberCommand, Result>
 {
     private readonly AppDbContext _dbContext;
+    private readonly IPermissionCache _permissionCache;
 
-    public RemoveWorkspaceMemberCommandHandler(AppDbContext dbContext)
+    public RemoveWorkspaceMemberCommandHandler(AppDbContext dbContext, IPermissionCache permissionCache)
     {
         _dbContext = dbContext;
+        _permissionCache = permissionCache;
     }
 
     public async Task<Result> Handle(RemoveWorkspaceMemberCommand command, CancellationToken cancellationToken)
@@ -51,6 +54,9 @@ public class RemoveWorkspaceMemberCommandHandler : IRequestHandler<RemoveWorkspa
         _dbContext.WorkspaceMembers.Remove(member);
         await _dbContext.SaveChangesAsync(cancellationToken);
 
+        // Removed member must lose the workspace's permissions immediately
+        _permissionCache.InvalidateUser(userId);
+
         return Result.Success();
     }
 }
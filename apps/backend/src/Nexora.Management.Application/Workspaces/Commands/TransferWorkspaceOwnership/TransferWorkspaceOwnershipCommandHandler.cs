@@ -2,6 +2,7 @@ using MediatR;
 using Microsoft.EntityFrameworkCore;
 using Nexora.Management.Application.Workspaces.Commands.TransferWorkspaceOwnership;
 using Nexora.Management.Application.Workspaces.DTOs;
+using Nexora.Management.Application.Authorization;
 using Nexora.Management.Application.Common;
 using Nexora.Management.Domain.Entities;
 using Nexora.Management.Infrastructure.Persistence;
@@ -14,10 +15,12 @@ namespace Nexora.Management.Application.Workspaces.Commands.TransferWorkspaceOwn
 public class TransferWorkspaceOwnershipCommandHandler : IRequestHandler<TransferWorkspaceOwnershipCommand, Result<WorkspaceMemberResponse>>
 {
     private readonly AppDbContext _dbContext;
+    private readonly IPermissionCache _permissionCache;
 
-    public TransferWorkspaceOwnershipCommandHandler(AppDbContext dbContext)
+    public TransferWorkspaceOwnershipCommandHandler(AppDbContext dbContext, IPermissionCache permissionCache)
     {
         _dbContext = dbContext;
+        _permissionCache = permissionCache;
     }
 
     public async Task<Result<WorkspaceMemberResponse>> Handle(TransferWorkspaceOwnershipCommand command, CancellationToken cancellationToken)
@@ -96,6 +99,10 @@ public class TransferWorkspaceOwnershipCommandHandler : IRequestHandler<Transfer
 
         await _dbContext.SaveChangesAsync(cancellationToken);
 
+        // Both the new owner and the demoted owner changed roles
+        _permissionCache.InvalidateUser(request.NewOwnerId);
+        _permissionCache.InvalidateUser(currentOwnerId);
+
         // Return response with the new owner's details
         var response = new WorkspaceMemberResponse
         {
@@ -2,6 +2,7 @@ using MediatR;
 using Microsoft.EntityFrameworkCore;
 using Nexora.Management.Application.Workspaces.Commands.UpdateWorkspaceMemberRole;
 using Nexora.Management.Application.Workspaces.DTOs;
+using Nexora.Management.Application.Authorization;
 using Nexora.Management.Application.Common;
 using Nexora.Management.Domain.Entities;
 using Nexora.Management.Infrastructure.Persistence;
@@ -14,10 +15,12 @@ namespace Nexora.Management.Application.Workspaces.Commands.UpdateWorkspaceMembe
 public class UpdateWorkspaceMemberRoleCommandHandler : IRequestHandler<UpdateWorkspaceMemberRoleCommand, Result<WorkspaceMemberResponse>>
 {
     private readonly AppDbContext _dbContext;
+    private readonly IPermissionCache _permissionCache;
 
-    public UpdateWorkspaceMemberRoleCommandHandler(AppDbContext dbContext)
+    public UpdateWorkspaceMemberRoleCommandHandler(AppDbContext dbContext, IPermissionCache permissionCache)
     {
         _dbContext = dbContext;
+        _permissionCache = permissionCache;
     }
 
     public async Task<Result<WorkspaceMemberResponse>> Handle(UpdateWorkspaceMemberRoleCommand command, CancellationToken cancellationToken)
@@ -64,6 +67,9 @@ public class UpdateWorkspaceMemberRoleCommandHandler : IRequestHandler<UpdateWor
         member.RoleId = request.RoleId;
         await _dbContext.SaveChangesAsync(cancellationToken);
 
+        // Role change alters the member's effective permissions
+        _permissionCache.InvalidateUser(userId);
+
         // Return response
         var response = new WorkspaceMemberResponse
         {
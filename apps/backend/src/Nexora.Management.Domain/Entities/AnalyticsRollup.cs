@@ -0,0 +1,36 @@
+using Nexora.Management.Domain.Common;
+
+namespace Nexora.Management.Domain.Entities;
+
+/// <summary>
+/// Precomputed task and time counters for one analytics scope.
+/// Maintained incrementally by task and timesheet commands and
+/// periodically rebuilt from scratch to correct any drift.
+/// </summary>
+public class AnalyticsRollup : BaseEntity
+{
+    public const string WorkspaceScope = "workspace";
+    public const string TaskListScope = "tasklist";
+    public const string MemberScope = "member";
+
+    public Guid WorkspaceId { get; set; }
+
+    /// <summary>
+    /// Scope kind: "workspace", "tasklist" or "member" (assignee)
+    /// </summary>
+    public string ScopeType { get; set; } = WorkspaceScope;
+
+    /// <summary>
+    /// WorkspaceId, TaskListId or UserId depending on ScopeType
+    /// </summary>
+    public Guid ScopeId { get; set; }
+
+    public int TotalTasks { get; set; }
+    public int CompletedTasks { get; set; }
+    public int InProgressTasks { get; set; }
+    public int OverdueTasks { get; set; }
+    public long ApprovedMinutes { get; set; }
+
+    // Navigation properties
+    public Workspace Workspace { get; set; } = null!;
+}
@@ -8,6 +8,11 @@ public class Attachment : BaseEntity
     public Guid UserId { get; set; }
     public string FileName { get; set; } = string.Empty;
     public string FilePath { get; set; } = string.Empty;
+
+    /// <summary>
+    /// SHA-256 of the content when FilePath is a content-addressed blob; null for legacy files
+    /// </summary>
+    public string? ContentHash { get; set; }
     public long? FileSizeBytes { get; set; }
     public string? MimeType { get; set; }
 
@@ -0,0 +1,15 @@
+using Nexora.Management.Domain.Common;
+
+namespace Nexora.Management.Domain.Entities;
+
+/// <summary>
+/// A stored file identified by the SHA-256 of its content. Attachments with the
+/// same content share one blob; the file is removed when the last reference goes.
+/// Maintained with raw SQL by the file storage service.
+/// </summary>
+public class FileBlob : BaseEntity
+{
+    public string ContentHash { get; set; } = string.Empty;
+    public long SizeBytes { get; set; }
+    public int ReferenceCount { get; set; }
+}
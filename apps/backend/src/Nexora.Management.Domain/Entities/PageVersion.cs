@@ -7,7 +7,14 @@ public class PageVersion : BaseEntity
 {
     public Guid PageId { get; set; }
     public int VersionNumber { get; set; }
+
+    /// <summary>
+    /// Full page content for keyframes; for other versions, a JSON diff against
+    /// the keyframe numbered <see cref="KeyframeVersionNumber"/>
+    /// </summary>
     public JsonDocument Content { get; set; } = JsonDocument.Parse("{}");
+    public bool IsKeyframe { get; set; } = true;
+    public int KeyframeVersionNumber { get; set; }
     public string? CommitMessage { get; set; }
     public Guid CreatedBy { get; set; }
 
@@ -20,6 +20,11 @@ public class Task : BaseEntity
     public Dictionary<string, object> CustomFieldsJsonb { get; set; } = new Dictionary<string, object>();
     public Guid CreatedBy { get; set; }
 
+    /// <summary>
+    /// TaskList change version at which this task was last written (set by the database)
+    /// </summary>
+    public long ChangeVersion { get; set; }
+
     // Navigation properties
     [Obsolete("Use TaskList instead. Project is kept for backward compatibility during migration.")]
     public Project Project { get; set; } = null!;
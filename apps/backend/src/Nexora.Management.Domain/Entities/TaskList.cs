@@ -73,6 +73,18 @@ public class TaskList : BaseEntity
     /// </summary>
     public Dictionary<string, object> SettingsJsonb { get; set; } = new Dictionary<string, object>();
 
+    /// <summary>
+    /// Monotonically increasing counter, bumped by the database on every task
+    /// insert, update, delete or move affecting this TaskList.
+    /// </summary>
+    public long ChangeVersion { get; set; }
+
+    /// <summary>
+    /// Tombstones at or below this version have been pruned; clients syncing
+    /// from an older version must take a full snapshot.
+    /// </summary>
+    public long TombstoneFloorVersion { get; set; }
+
     // Navigation properties
 
     /// <summary>
@@ -0,0 +1,17 @@
+using Nexora.Management.Domain.Common;
+
+namespace Nexora.Management.Domain.Entities;
+
+/// <summary>
+/// Records that a task left a TaskList (deleted or moved) at a given change version,
+/// so view deltas can report removals. Written by database triggers.
+/// </summary>
+public class TaskTombstone : BaseEntity
+{
+    public Guid TaskListId { get; set; }
+    public Guid TaskId { get; set; }
+    public long ChangeVersion { get; set; }
+
+    // Navigation properties
+    public TaskList TaskList { get; set; } = null!;
+}
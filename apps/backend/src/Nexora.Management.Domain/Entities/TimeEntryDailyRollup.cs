@@ -0,0 +1,27 @@
+using Nexora.Management.Domain.Common;
+
+namespace Nexora.Management.Domain.Entities;
+
+/// <summary>
+/// Precomputed time totals for one user, task and UTC day in a workspace.
+/// Maintained incrementally by the time tracking commands and periodically
+/// rebuilt from time entries to correct any drift.
+/// </summary>
+public class TimeEntryDailyRollup : BaseEntity
+{
+    public Guid WorkspaceId { get; set; }
+    public Guid UserId { get; set; }
+
+    /// <summary>
+    /// Task the time was logged against, or Guid.Empty for entries without a task
+    /// </summary>
+    public Guid TaskId { get; set; }
+
+    public DateOnly Day { get; set; }
+    public int EntryCount { get; set; }
+    public long TotalMinutes { get; set; }
+    public long BillableMinutes { get; set; }
+
+    // Navigation properties
+    public Workspace Workspace { get; set; } = null!;
+}
@@ -20,6 +20,7 @@ public interface IAppDbContext
     DbSet<TaskEntity> Tasks { get; }
     DbSet<Comment> Comments { get; }
     DbSet<Attachment> Attachments { get; }
+    DbSet<FileBlob> FileBlobs { get; }
     DbSet<ActivityLog> ActivityLogs { get; }
     DbSet<UserPresence> UserPresences { get; }
     DbSet<Notification> Notifications { get; }
@@ -31,11 +32,14 @@ public interface IAppDbContext
     DbSet<Objective> Objectives { get; }
     DbSet<KeyResult> KeyResults { get; }
     DbSet<TimeEntry> TimeEntries { get; }
+    DbSet<TimeEntryDailyRollup> TimeEntryDailyRollups { get; }
     DbSet<TimeRate> TimeRates { get; }
     DbSet<Space> Spaces { get; }
     DbSet<Folder> Folders { get; }
     DbSet<TaskList> TaskLists { get; }
     DbSet<Dashboard> Dashboards { get; }
+    DbSet<AnalyticsRollup> AnalyticsRollups { get; }
+    DbSet<TaskTombstone> TaskTombstones { get; }
 
     Task<int> SaveChangesAsync(CancellationToken cancellationToken = default);
 
@@ -47,4 +51,7 @@ public interface IAppDbContext
 
     // For raw SQL query that returns single result
     Task<T> SqlQuerySingleAsync<T>(string sql, params object[] parameters);
+
+    // For raw SQL that is composed into a LINQ query (scalar results must be aliased "Value")
+    IQueryable<T> SqlQueryRaw<T>(string sql, params object[] parameters);
 }
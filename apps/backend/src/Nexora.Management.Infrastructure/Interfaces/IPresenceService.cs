@@ -4,6 +4,7 @@ using Nexora.Management.Domain.Entities;
 
 /// <summary>
 /// Service for tracking user presence and connections
+/// Must be registered as Singleton so connection state is shared across hub invocations
 /// </summary>
 public interface IPresenceService
 {
@@ -36,4 +37,9 @@ public interface IPresenceService
     /// Clean up stale connections
     /// </summary>
     System.Threading.Tasks.Task CleanupStaleConnectionsAsync();
+
+    /// <summary>
+    /// Write pending presence changes to the database in bulk
+    /// </summary>
+    System.Threading.Tasks.Task FlushPendingChangesAsync(CancellationToken cancellationToken = default);
 }
@@ -35,6 +35,7 @@ public class AppDbContext : DbContext, IAppDbContext
     public DbSet<TaskEntity> Tasks => Set<TaskEntity>();
     public DbSet<Comment> Comments => Set<Comment>();
     public DbSet<Attachment> Attachments => Set<Attachment>();
+    public DbSet<FileBlob> FileBlobs => Set<FileBlob>();
     public DbSet<ActivityLog> ActivityLogs => Set<ActivityLog>();
     public DbSet<UserPresence> UserPresences => Set<UserPresence>();
     public DbSet<Notification> Notifications => Set<Notification>();
@@ -46,8 +47,11 @@ public class AppDbContext : DbContext, IAppDbContext
     public DbSet<Objective> Objectives => Set<Objective>();
     public DbSet<KeyResult> KeyResults => Set<KeyResult>();
     public DbSet<TimeEntry> TimeEntries => Set<TimeEntry>();
+    public DbSet<TimeEntryDailyRollup> TimeEntryDailyRollups => Set<TimeEntryDailyRollup>();
     public DbSet<TimeRate> TimeRates => Set<TimeRate>();
     public DbSet<Dashboard> Dashboards => Set<Dashboard>();
+    public DbSet<AnalyticsRollup> AnalyticsRollups => Set<AnalyticsRollup>();
+    public DbSet<TaskTombstone> TaskTombstones => Set<TaskTombstone>();
 
     protected override void OnModelCreating(ModelBuilder modelBuilder)
     {
@@ -132,4 +136,9 @@ public class AppDbContext : DbContext, IAppDbContext
     {
         return await Database.SqlQueryRaw<T>(sql, parameters).FirstOrDefaultAsync();
     }
+
+    public IQueryable<T> SqlQueryRaw<T>(string sql, params object[] parameters)
+    {
+        return Database.SqlQueryRaw<T>(sql, parameters);
+    }
 }
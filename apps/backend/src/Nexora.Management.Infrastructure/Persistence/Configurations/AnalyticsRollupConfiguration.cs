@@ -0,0 +1,45 @@
+using Microsoft.EntityFrameworkCore;
+using Microsoft.EntityFrameworkCore.Metadata.Builders;
+using Nexora.Management.Domain.Entities;
+
+namespace Nexora.Management.Infrastructure.Persistence.Configurations;
+
+public class AnalyticsRollupConfiguration : IEntityTypeConfiguration<AnalyticsRollup>
+{
+    public void Configure(EntityTypeBuilder<AnalyticsRollup> builder)
+    {
+        builder.ToTable("analytics_rollups");
+
+        builder.HasKey(r => r.Id);
+
+        builder.Property(r => r.Id)
+            .HasDefaultValueSql("uuid_generate_v4()");
+
+        builder.Property(r => r.WorkspaceId)
+            .IsRequired();
+
+        builder.Property(r => r.ScopeType)
+            .IsRequired()
+            .HasMaxLength(20);
+
+        builder.Property(r => r.ScopeId)
+            .IsRequired();
+
+        builder.Property(r => r.TotalTasks).HasDefaultValue(0);
+        builder.Property(r => r.CompletedTasks).HasDefaultValue(0);
+        builder.Property(r => r.InProgressTasks).HasDefaultValue(0);
+        builder.Property(r => r.OverdueTasks).HasDefaultValue(0);
+        builder.Property(r => r.ApprovedMinutes).HasDefaultValue(0L);
+
+        // Upsert target for incremental updates
+        builder.HasIndex(r => new { r.WorkspaceId, r.ScopeType, r.ScopeId })
+            .IsUnique()
+            .HasDatabaseName("uq_analytics_rollups_scope");
+
+        // Relationships
+        builder.HasOne(r => r.Workspace)
+            .WithMany()
+            .HasForeignKey(r => r.WorkspaceId)
+            .OnDelete(DeleteBehavior.Cascade);
+    }
+}
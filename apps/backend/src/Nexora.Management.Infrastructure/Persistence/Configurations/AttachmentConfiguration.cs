@@ -29,6 +29,9 @@ public class AttachmentConfiguration : IEntityTypeConfiguration<Attachment>
             .IsRequired()
             .HasColumnType("text");
 
+        builder.Property(a => a.ContentHash)
+            .HasMaxLength(64);
+
         builder.Property(a => a.FileSizeBytes)
             .HasColumnType("bigint");
 
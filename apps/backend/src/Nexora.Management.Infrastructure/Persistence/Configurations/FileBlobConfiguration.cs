@@ -0,0 +1,33 @@
+using Microsoft.EntityFrameworkCore;
+using Microsoft.EntityFrameworkCore.Metadata.Builders;
+using Nexora.Management.Domain.Entities;
+
+namespace Nexora.Management.Infrastructure.Persistence.Configurations;
+
+public class FileBlobConfiguration : IEntityTypeConfiguration<FileBlob>
+{
+    public void Configure(EntityTypeBuilder<FileBlob> builder)
+    {
+        builder.ToTable("file_blobs");
+
+        builder.HasKey(b => b.Id);
+
+        builder.Property(b => b.Id)
+            .HasDefaultValueSql("uuid_generate_v4()");
+
+        builder.Property(b => b.ContentHash)
+            .IsRequired()
+            .HasMaxLength(64);
+
+        builder.Property(b => b.SizeBytes)
+            .IsRequired();
+
+        builder.Property(b => b.ReferenceCount)
+            .IsRequired();
+
+        // Reference counting upserts on the hash
+        builder.HasIndex(b => b.ContentHash)
+            .IsUnique()
+            .HasDatabaseName("uq_file_blobs_content_hash");
+    }
+}
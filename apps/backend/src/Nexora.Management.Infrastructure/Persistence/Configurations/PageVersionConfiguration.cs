@@ -25,6 +25,12 @@ public class PageVersionConfiguration : IEntityTypeConfiguration<PageVersion>
             .HasColumnType("jsonb")
             .HasDefaultValueSql("'{}'::jsonb");
 
+        builder.Property(pv => pv.IsKeyframe)
+            .IsRequired();
+
+        builder.Property(pv => pv.KeyframeVersionNumber)
+            .IsRequired();
+
         builder.Property(pv => pv.CommitMessage)
             .HasColumnType("text");
 
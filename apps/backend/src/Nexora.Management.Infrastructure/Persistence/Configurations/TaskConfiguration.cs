@@ -48,6 +48,11 @@ public class TaskConfiguration : IEntityTypeConfiguration<TaskEntity>
         builder.Property(t => t.CreatedBy)
             .HasDefaultValueSql("uuid_generate_v4()");
 
+        // Assigned by the tasks_change_version trigger; read back after every save
+        builder.Property(t => t.ChangeVersion)
+            .HasDefaultValue(0L)
+            .ValueGeneratedOnAddOrUpdate();
+
         // Indexes
         builder.HasIndex(t => t.ProjectId)
             .HasDatabaseName("idx_tasks_project");
@@ -56,6 +61,10 @@ public class TaskConfiguration : IEntityTypeConfiguration<TaskEntity>
         builder.HasIndex(t => t.TaskListId)
             .HasDatabaseName("idx_tasks_tasklist");
 
+        // Delta sync: tasks changed in a list since a version
+        builder.HasIndex(t => new { t.TaskListId, t.ChangeVersion })
+            .HasDatabaseName("idx_tasks_tasklist_version");
+
         builder.HasIndex(t => t.StatusId)
             .HasDatabaseName("idx_tasks_status");
 
@@ -51,6 +51,13 @@ public class TaskListConfiguration : IEntityTypeConfiguration<TaskList>
         builder.Property(tl => tl.SettingsJsonb)
             .HasColumnType("jsonb");
 
+        // Maintained by database triggers on Tasks and TaskStatuses and by tombstone pruning
+        builder.Property(tl => tl.ChangeVersion)
+            .HasDefaultValue(0L);
+
+        builder.Property(tl => tl.TombstoneFloorVersion)
+            .HasDefaultValue(0L);
+
         // Indexes
         builder.HasIndex(tl => tl.SpaceId)
             .HasDatabaseName("idx_tasklists_space");
@@ -0,0 +1,37 @@
+using Microsoft.EntityFrameworkCore;
+using Microsoft.EntityFrameworkCore.Metadata.Builders;
+using Nexora.Management.Domain.Entities;
+
+namespace Nexora.Management.Infrastructure.Persistence.Configurations;
+
+public class TaskTombstoneConfiguration : IEntityTypeConfiguration<TaskTombstone>
+{
+    public void Configure(EntityTypeBuilder<TaskTombstone> builder)
+    {
+        builder.ToTable("task_tombstones");
+
+        builder.HasKey(t => t.Id);
+
+        builder.Property(t => t.Id)
+            .HasDefaultValueSql("uuid_generate_v4()");
+
+        builder.Property(t => t.TaskListId)
+            .IsRequired();
+
+        builder.Property(t => t.TaskId)
+            .IsRequired();
+
+        builder.Property(t => t.ChangeVersion)
+            .IsRequired();
+
+        // Delta sync: removals in a list since a version
+        builder.HasIndex(t => new { t.TaskListId, t.ChangeVersion })
+            .HasDatabaseName("idx_task_tombstones_tasklist_version");
+
+        // Relationships
+        builder.HasOne(t => t.TaskList)
+            .WithMany()
+            .HasForeignKey(t => t.TaskListId)
+            .OnDelete(DeleteBehavior.Cascade);
+    }
+}
@@ -62,6 +62,10 @@ public class TimeEntryConfiguration : IEntityTypeConfiguration<TimeEntry>
         builder.HasIndex(te => new { te.UserId, te.StartTime })
             .HasDatabaseName("idx_time_entries_user_time");
 
+        // Workspace reports and exports scan a period of one workspace
+        builder.HasIndex(te => new { te.WorkspaceId, te.StartTime })
+            .HasDatabaseName("idx_time_entries_workspace_time");
+
         // Unique constraint to prevent multiple active timers per user
         // Only one timer can have EndTime = NULL per user
         builder.HasIndex(te => new { te.UserId, te.EndTime })
@@ -0,0 +1,49 @@
+using Microsoft.EntityFrameworkCore;
+using Microsoft.EntityFrameworkCore.Metadata.Builders;
+using Nexora.Management.Domain.Entities;
+
+namespace Nexora.Management.Infrastructure.Persistence.Configurations;
+
+public class TimeEntryDailyRollupConfiguration : IEntityTypeConfiguration<TimeEntryDailyRollup>
+{
+    public void Configure(EntityTypeBuilder<TimeEntryDailyRollup> builder)
+    {
+        builder.ToTable("time_entry_daily_rollups");
+
+        builder.HasKey(r => r.Id);
+
+        builder.Property(r => r.Id)
+            .HasDefaultValueSql("uuid_generate_v4()");
+
+        builder.Property(r => r.WorkspaceId)
+            .IsRequired();
+
+        builder.Property(r => r.UserId)
+            .IsRequired();
+
+        builder.Property(r => r.TaskId)
+            .IsRequired();
+
+        builder.Property(r => r.Day)
+            .IsRequired()
+            .HasColumnType("date");
+
+        builder.Property(r => r.EntryCount).HasDefaultValue(0);
+        builder.Property(r => r.TotalMinutes).HasDefaultValue(0L);
+        builder.Property(r => r.BillableMinutes).HasDefaultValue(0L);
+
+        // Upsert target for incremental updates
+        builder.HasIndex(r => new { r.WorkspaceId, r.UserId, r.TaskId, r.Day })
+            .IsUnique()
+            .HasDatabaseName("uq_time_entry_daily_rollups_scope");
+
+        builder.HasIndex(r => new { r.WorkspaceId, r.Day })
+            .HasDatabaseName("idx_time_entry_daily_rollups_workspace_day");
+
+        // Relationships
+        builder.HasOne(r => r.Workspace)
+            .WithMany()
+            .HasForeignKey(r => r.WorkspaceId)
+            .OnDelete(DeleteBehavior.Cascade);
+    }
+}
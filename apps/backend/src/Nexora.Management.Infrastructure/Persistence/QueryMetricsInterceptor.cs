@@ -0,0 +1,83 @@
+using System.Data.Common;
+using Microsoft.EntityFrameworkCore.Diagnostics;
+
+namespace Nexora.Management.Infrastructure.Persistence;
+
+/// <summary>
+/// Charges executed commands and rows read to the current <see cref="QueryScope"/>.
+/// Stateless, so one instance can be shared by every context.
+/// </summary>
+public class QueryMetricsInterceptor : DbCommandInterceptor
+{
+    public override DbDataReader ReaderExecuted(DbCommand command, CommandExecutedEventData eventData, DbDataReader result)
+    {
+        QueryScope.Current?.RecordCommand(eventData.Duration);
+        return result;
+    }
+
+    public override ValueTask<DbDataReader> ReaderExecutedAsync(
+        DbCommand command,
+        CommandExecutedEventData eventData,
+        DbDataReader result,
+        CancellationToken cancellationToken = default)
+    {
+        QueryScope.Current?.RecordCommand(eventData.Duration);
+        return ValueTask.FromResult(result);
+    }
+
+    public override object? ScalarExecuted(DbCommand command, CommandExecutedEventData eventData, object? result)
+    {
+        QueryScope.Current?.RecordCommand(eventData.Duration);
+        return result;
+    }
+
+    public override ValueTask<object?> ScalarExecutedAsync(
+        DbCommand command,
+        CommandExecutedEventData eventData,
+        object? result,
+        CancellationToken cancellationToken = default)
+    {
+        QueryScope.Current?.RecordCommand(eventData.Duration);
+        return ValueTask.FromResult(result);
+    }
+
+    public override int NonQueryExecuted(DbCommand command, CommandExecutedEventData eventData, int result)
+    {
+        QueryScope.Current?.RecordCommand(eventData.Duration);
+        return result;
+    }
+
+    public override ValueTask<int> NonQueryExecutedAsync(
+        DbCommand command,
+        CommandExecutedEventData eventData,
+        int result,
+        CancellationToken cancellationToken = default)
+    {
+        QueryScope.Current?.RecordCommand(eventData.Duration);
+        return ValueTask.FromResult(result);
+    }
+
+    public override void CommandFailed(DbCommand command, CommandErrorEventData eventData)
+    {
+        QueryScope.Current?.RecordCommand(eventData.Duration);
+    }
+
+    public override Task CommandFailedAsync(
+        DbCommand command,
+        CommandErrorEventData eventData,
+        CancellationToken cancellationToken = default)
+    {
+        QueryScope.Current?.RecordCommand(eventData.Duration);
+        return Task.CompletedTask;
+    }
+
+    // Called for both sync and async readers; ReadCount is the number of rows EF read
+    public override InterceptionResult DataReaderDisposing(
+        DbCommand command,
+        DataReaderDisposingEventData eventData,
+        InterceptionResult result)
+    {
+        QueryScope.Current?.RecordRows(eventData.ReadCount);
+        return result;
+    }
+}
@@ -0,0 +1,83 @@
+namespace Nexora.Management.Infrastructure.Persistence;
+
+/// <summary>
+/// Database work done inside one unit of work, usually a MediatR request.
+/// Scopes flow with the async context; <see cref="QueryMetricsInterceptor"/> charges every
+/// command to the current scope and its parents, so a nested request counts towards the outer one.
+/// </summary>
+public sealed class QueryScope : IDisposable
+{
+    private static readonly AsyncLocal<QueryScope?> CurrentScope = new();
+
+    private readonly QueryScope? _parent;
+    private int _queries;
+    private long _rowsRead;
+    private long _databaseTicks;
+    private bool _disposed;
+
+    private QueryScope(QueryScope? parent)
+    {
+        _parent = parent;
+    }
+
+    /// <summary>
+    /// The innermost scope of the current async context, or null outside of any scope
+    /// </summary>
+    public static QueryScope? Current => CurrentScope.Value;
+
+    /// <summary>
+    /// Number of commands executed, including failed ones
+    /// </summary>
+    public int Queries => Volatile.Read(ref _queries);
+
+    /// <summary>
+    /// Number of rows read from data readers
+    /// </summary>
+    public long RowsRead => Interlocked.Read(ref _rowsRead);
+
+    /// <summary>
+    /// Time spent executing commands, as reported by EF Core
+    /// </summary>
+    public TimeSpan DatabaseTime => TimeSpan.FromTicks(Interlocked.Read(ref _databaseTicks));
+
+    /// <summary>
+    /// Starts a scope that stays current until it is disposed
+    /// </summary>
+    public static QueryScope Begin()
+    {
+        var scope = new QueryScope(CurrentScope.Value);
+        CurrentScope.Value = scope;
+        return scope;
+    }
+
+    internal void RecordCommand(TimeSpan duration)
+    {
+        for (var scope = this; scope != null; scope = scope._parent)
+        {
+            Interlocked.Increment(ref scope._queries);
+            Interlocked.Add(ref scope._databaseTicks, duration.Ticks);
+        }
+    }
+
+    internal void RecordRows(int rows)
+    {
+        for (var scope = this; scope != null; scope = scope._parent)
+        {
+            Interlocked.Add(ref scope._rowsRead, rows);
+        }
+    }
+
+    public void Dispose()
+    {
+        if (_disposed)
+        {
+            return;
+        }
+
+        _disposed = true;
+        if (CurrentScope.Value == this)
+        {
+            CurrentScope.Value = _parent;
+        }
+    }
+}
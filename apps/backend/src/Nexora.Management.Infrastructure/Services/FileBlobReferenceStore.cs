@@ -0,0 +1,52 @@
+using Nexora.Management.Infrastructure.Interfaces;
+
+namespace Nexora.Management.Infrastructure.Services;
+
+/// <summary>
+/// Keeps blob reference counts in file_blobs. Each operation is a single statement,
+/// so concurrent uploads and releases of the same hash never lose an update.
+/// </summary>
+public class FileBlobReferenceStore : IFileBlobReferenceStore
+{
+    private const string AddReferenceSql = """
+        INSERT INTO file_blobs ("Id", "ContentHash", "SizeBytes", "ReferenceCount", "CreatedAt", "UpdatedAt")
+        VALUES (uuid_generate_v4(), {0}, {1}, 1, now(), now())
+        ON CONFLICT ("ContentHash") DO UPDATE SET
+            "ReferenceCount" = file_blobs."ReferenceCount" + 1,
+            "UpdatedAt" = now()
+        """;
+
+    private const string ReleaseReferenceSql = """
+        UPDATE file_blobs
+        SET "ReferenceCount" = "ReferenceCount" - 1, "UpdatedAt" = now()
+        WHERE "ContentHash" = {0} AND "ReferenceCount" > 0
+        RETURNING "ReferenceCount" AS "Value"
+        """;
+
+    private const string DeleteUnreferencedSql = """
+        DELETE FROM file_blobs WHERE "ContentHash" = {0} AND "ReferenceCount" = 0
+        """;
+
+    private readonly IAppDbContext _db;
+
+    public FileBlobReferenceStore(IAppDbContext db)
+    {
+        _db = db;
+    }
+
+    public async Task AddReferenceAsync(string contentHash, long sizeBytes, CancellationToken ct = default)
+    {
+        await _db.ExecuteSqlRawAsync(AddReferenceSql, contentHash, sizeBytes);
+    }
+
+    public async Task<int?> ReleaseReferenceAsync(string contentHash, CancellationToken ct = default)
+    {
+        var remaining = await _db.SqlQueryRawAsync<int>(ReleaseReferenceSql, contentHash);
+        return remaining.Count == 0 ? null : remaining[0];
+    }
+
+    public async Task<bool> DeleteIfUnreferencedAsync(string contentHash, CancellationToken ct = default)
+    {
+        return await _db.ExecuteSqlRawAsync(DeleteUnreferencedSql, contentHash) > 0;
+    }
+}
@@ -0,0 +1,22 @@
+namespace Nexora.Management.Infrastructure.Services;
+
+/// <summary>
+/// Reference counts of content-addressed blobs, one row per content hash
+/// </summary>
+public interface IFileBlobReferenceStore
+{
+    /// <summary>
+    /// Adds a reference, creating the row for content not stored before
+    /// </summary>
+    Task AddReferenceAsync(string contentHash, long sizeBytes, CancellationToken ct = default);
+
+    /// <summary>
+    /// Drops a reference and returns how many remain, or null if the hash had none
+    /// </summary>
+    Task<int?> ReleaseReferenceAsync(string contentHash, CancellationToken ct = default);
+
+    /// <summary>
+    /// Deletes the row if it still has zero references; false if a new reference revived it
+    /// </summary>
+    Task<bool> DeleteIfUnreferencedAsync(string contentHash, CancellationToken ct = default);
+}
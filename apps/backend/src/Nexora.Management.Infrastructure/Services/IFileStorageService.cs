@@ -1,22 +1,90 @@
 namespace Nexora.Management.Infrastructure.Services;
 
+/// <summary>
+/// A file written to storage
+/// </summary>
+/// <param name="FilePath">Storage key to keep on the owning record</param>
+/// <param name="ContentHash">Lowercase hex SHA-256 of the content</param>
+/// <param name="SizeBytes">Number of bytes actually received</param>
+public record StoredFile(string FilePath, string ContentHash, long SizeBytes);
+
+/// <summary>
+/// Where and what a stored file is, for serving downloads
+/// </summary>
+public record StoredFileInfo(string PhysicalPath, string ContentType, long SizeBytes, DateTimeOffset LastModified);
+
+/// <summary>
+/// State of a chunked upload. ReceivedBytes is the offset the next chunk must start at.
+/// </summary>
+public record UploadSession(
+    Guid UploadId,
+    Guid TaskId,
+    Guid UserId,
+    string FileName,
+    string? MimeType,
+    long TotalBytes,
+    long ReceivedBytes,
+    DateTime CreatedAt);
+
+/// <summary>
+/// Thrown when more bytes arrive than a file is allowed to have
+/// </summary>
+public class FileTooLargeException : IOException
+{
+    public FileTooLargeException(long maxBytes)
+        : base($"File exceeds the maximum allowed size of {maxBytes} bytes")
+    {
+        MaxBytes = maxBytes;
+    }
+
+    public long MaxBytes { get; }
+}
+
 /// <summary>
 /// Service for handling file storage operations
 /// </summary>
 public interface IFileStorageService
 {
     /// <summary>
-    /// Uploads a file and returns the stored file path
+    /// Streams the content to storage while hashing it and adds a reference to the
+    /// blob with that hash; identical content is stored only once
+    /// </summary>
+    Task<StoredFile> StoreAsync(Stream content, long maxBytes, CancellationToken ct = default);
+
+    /// <summary>
+    /// Drops one reference to a stored file; the file is deleted when none remain.
+    /// Files without a content hash (stored before deduplication) are deleted directly.
+    /// </summary>
+    Task ReleaseAsync(string filePath, string? contentHash, CancellationToken ct = default);
+
+    /// <summary>
+    /// Resolves a stored file for download, or null if it no longer exists
+    /// </summary>
+    StoredFileInfo? GetFileInfo(string filePath, string fileName);
+
+    /// <summary>
+    /// Starts a chunked upload of a file of known size
+    /// </summary>
+    Task<UploadSession> BeginUploadAsync(Guid taskId, Guid userId, string fileName, string? mimeType, long totalBytes, CancellationToken ct = default);
+
+    /// <summary>
+    /// Gets a chunked upload, or null if it does not exist or has expired
+    /// </summary>
+    Task<UploadSession?> GetUploadAsync(Guid uploadId, CancellationToken ct = default);
+
+    /// <summary>
+    /// Appends a chunk starting at <paramref name="offset"/>. Returns false without writing
+    /// when the offset is not the session's ReceivedBytes or another chunk is being written.
     /// </summary>
-    Task<string> UploadFileAsync(Stream fileStream, string fileName, CancellationToken ct = default);
+    Task<bool> AppendUploadAsync(UploadSession session, long offset, Stream content, CancellationToken ct = default);
 
     /// <summary>
-    /// Deletes a file by its path
+    /// Moves a fully received upload into storage, as <see cref="StoreAsync"/> does
     /// </summary>
-    Task DeleteFileAsync(string filePath, CancellationToken ct = default);
+    Task<StoredFile> CompleteUploadAsync(UploadSession session, CancellationToken ct = default);
 
     /// <summary>
-    /// Gets a file stream for download
+    /// Removes chunked uploads that have not received data for longer than <paramref name="maxAge"/>
     /// </summary>
-    Task<(Stream FileStream, string ContentType)> GetFileAsync(string filePath, CancellationToken ct = default);
+    int DeleteStaleUploads(TimeSpan maxAge);
 }
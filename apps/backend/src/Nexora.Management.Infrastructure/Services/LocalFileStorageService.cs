@@ -1,3 +1,6 @@
+using System.Buffers;
+using System.Security.Cryptography;
+using System.Text.Json;
 using Microsoft.Extensions.Configuration;
 
 namespace Nexora.Management.Infrastructure.Services;
@@ -6,69 +9,300 @@ namespace Nexora.Management.Infrastructure.Services;
 /// Local filesystem implementation of file storage
 /// In production, consider using Azure Blob Storage, AWS S3, or similar
 /// </summary>
+/// <remarks>
+/// Layout under Storage:BasePath:
+/// <c>blobs/ab/cd/abcd…</c> content-addressed files (SHA-256, two-level fan-out),
+/// <c>staging/</c> single uploads being hashed, <c>uploads/</c> chunked upload sessions.
+/// Reference counts live in file_blobs (see <see cref="IFileBlobReferenceStore"/>).
+/// A blob is only unlinked after its row is deleted at zero references, and uploads
+/// take their reference before checking the file, so a concurrent upload of the same
+/// content always leaves it in place.
+/// </remarks>
 public class LocalFileStorageService : IFileStorageService
 {
+    private const int BufferSize = 81920;
+    private const string BlobsDirectory = "blobs";
+
+    private readonly IFileBlobReferenceStore _blobs;
     private readonly string _baseStoragePath;
+    private readonly string _stagingPath;
+    private readonly string _uploadsPath;
 
-    public LocalFileStorageService(IConfiguration configuration)
+    public LocalFileStorageService(IConfiguration configuration, IFileBlobReferenceStore blobs)
     {
+        _blobs = blobs;
         _baseStoragePath = configuration["Storage:BasePath"] ?? Path.Combine(Path.GetTempPath(), "nexora-uploads");
+        _stagingPath = Path.Combine(_baseStoragePath, "staging");
+        _uploadsPath = Path.Combine(_baseStoragePath, "uploads");
+
+        // Ensure directories exist
+        Directory.CreateDirectory(_stagingPath);
+        Directory.CreateDirectory(_uploadsPath);
+    }
+
+    public async Task<StoredFile> StoreAsync(Stream content, long maxBytes, CancellationToken ct = default)
+    {
+        var stagingFile = Path.Combine(_stagingPath, $"{Guid.NewGuid():N}.tmp");
 
-        // Ensure directory exists
-        if (!Directory.Exists(_baseStoragePath))
+        try
         {
-            Directory.CreateDirectory(_baseStoragePath);
+            string contentHash;
+            long sizeBytes = 0;
+
+            using (var hash = IncrementalHash.CreateHash(HashAlgorithmName.SHA256))
+            await using (var target = new FileStream(stagingFile, FileMode.CreateNew, FileAccess.Write, FileShare.None, BufferSize, FileOptions.Asynchronous))
+            {
+                var buffer = ArrayPool<byte>.Shared.Rent(BufferSize);
+                try
+                {
+                    int read;
+                    while ((read = await content.ReadAsync(buffer.AsMemory(0, BufferSize), ct)) > 0)
+                    {
+                        sizeBytes += read;
+                        if (sizeBytes > maxBytes)
+                        {
+                            throw new FileTooLargeException(maxBytes);
+                        }
+
+                        hash.AppendData(buffer, 0, read);
+                        await target.WriteAsync(buffer.AsMemory(0, read), ct);
+                    }
+                }
+                finally
+                {
+                    ArrayPool<byte>.Shared.Return(buffer);
+                }
+
+                contentHash = Convert.ToHexStringLower(hash.GetHashAndReset());
+            }
+
+            return await CommitAsync(stagingFile, contentHash, sizeBytes, ct);
+        }
+        finally
+        {
+            DeleteIfExists(stagingFile);
         }
     }
 
-    public async Task<string> UploadFileAsync(Stream fileStream, string fileName, CancellationToken ct = default)
+    public async Task ReleaseAsync(string filePath, string? contentHash, CancellationToken ct = default)
     {
-        // CRITICAL FIX: Prevent path traversal by extracting only the filename
-        var safeFileName = Path.GetFileName(fileName);
+        if (contentHash == null)
+        {
+            // Stored before deduplication: one file per attachment
+            DeleteIfExists(ResolvePath(filePath));
+            return;
+        }
 
-        // Validate filename is not empty after sanitization
-        if (string.IsNullOrWhiteSpace(safeFileName))
+        var remaining = await _blobs.ReleaseReferenceAsync(contentHash, ct);
+        if (remaining is null or > 0)
         {
-            throw new ArgumentException("Invalid filename", nameof(fileName));
+            return;
         }
 
-        // Create unique filename with timestamp to avoid conflicts
-        var timestamp = DateTime.UtcNow.ToString("yyyyMMddHHmmss");
-        var uniqueFileName = $"{timestamp}_{safeFileName}";
-        var filePath = Path.Combine(_baseStoragePath, uniqueFileName);
+        // Move the blob aside first; if an upload revives the hash meanwhile, it is put back
+        var blobPath = GetBlobPath(contentHash);
+        var trashPath = $"{blobPath}.{Guid.NewGuid():N}.deleting";
+        try
+        {
+            File.Move(blobPath, trashPath);
+        }
+        catch (FileNotFoundException)
+        {
+            await _blobs.DeleteIfUnreferencedAsync(contentHash, ct);
+            return;
+        }
 
-        // Save file
-        using var fileStreamTarget = File.Create(filePath);
-        await fileStream.CopyToAsync(fileStreamTarget, ct);
+        var deleted = await _blobs.DeleteIfUnreferencedAsync(contentHash, ct);
+        if (!deleted && !File.Exists(blobPath))
+        {
+            try
+            {
+                File.Move(trashPath, blobPath);
+                return;
+            }
+            catch (IOException) when (File.Exists(blobPath))
+            {
+                // The reviving upload put its own copy in place
+            }
+        }
 
-        return filePath;
+        DeleteIfExists(trashPath);
     }
 
-    public Task DeleteFileAsync(string filePath, CancellationToken ct = default)
+    public StoredFileInfo? GetFileInfo(string filePath, string fileName)
     {
-        if (File.Exists(filePath))
+        var file = new FileInfo(ResolvePath(filePath));
+        if (!file.Exists)
         {
-            File.Delete(filePath);
+            return null;
         }
-        return Task.CompletedTask;
+
+        return new StoredFileInfo(file.FullName, GetMimeType(fileName), file.Length, file.LastWriteTimeUtc);
+    }
+
+    public async Task<UploadSession> BeginUploadAsync(Guid taskId, Guid userId, string fileName, string? mimeType, long totalBytes, CancellationToken ct = default)
+    {
+        var session = new UploadSession(Guid.NewGuid(), taskId, userId, fileName, mimeType, totalBytes, 0, DateTime.UtcNow);
+
+        await File.WriteAllBytesAsync(GetUploadPartPath(session.UploadId), Array.Empty<byte>(), ct);
+
+        await using var metadata = File.Create(GetUploadMetadataPath(session.UploadId));
+        await JsonSerializer.SerializeAsync(metadata, session, cancellationToken: ct);
+
+        return session;
+    }
+
+    public async Task<UploadSession?> GetUploadAsync(Guid uploadId, CancellationToken ct = default)
+    {
+        var metadataPath = GetUploadMetadataPath(uploadId);
+        var part = new FileInfo(GetUploadPartPath(uploadId));
+        if (!File.Exists(metadataPath) || !part.Exists)
+        {
+            return null;
+        }
+
+        await using var metadata = File.OpenRead(metadataPath);
+        var session = await JsonSerializer.DeserializeAsync<UploadSession>(metadata, cancellationToken: ct);
+
+        return session == null ? null : session with { ReceivedBytes = part.Length };
     }
 
-    public async Task<(Stream FileStream, string ContentType)> GetFileAsync(string filePath, CancellationToken ct = default)
+    public async Task<bool> AppendUploadAsync(UploadSession session, long offset, Stream content, CancellationToken ct = default)
     {
-        if (!File.Exists(filePath))
+        FileStream target;
+        try
         {
-            throw new FileNotFoundException("File not found", filePath);
+            // Exclusive open serialises chunks for one upload across requests
+            target = new FileStream(GetUploadPartPath(session.UploadId), FileMode.Open, FileAccess.Write, FileShare.None, BufferSize, FileOptions.Asynchronous);
         }
+        catch (IOException)
+        {
+            return false;
+        }
+
+        await using (target)
+        {
+            if (target.Length != offset)
+            {
+                return false;
+            }
 
-        var fileStream = File.OpenRead(filePath);
-        var contentType = GetMimeType(filePath);
+            target.Seek(offset, SeekOrigin.Begin);
 
-        return await Task.FromResult((fileStream, contentType));
+            var buffer = ArrayPool<byte>.Shared.Rent(BufferSize);
+            try
+            {
+                var written = offset;
+                int read;
+                while ((read = await content.ReadAsync(buffer.AsMemory(0, BufferSize), ct)) > 0)
+                {
+                    written += read;
+                    if (written > session.TotalBytes)
+                    {
+                        // Drop the whole chunk; the client can resend it from the same offset
+                        target.SetLength(offset);
+                        throw new FileTooLargeException(session.TotalBytes);
+                    }
+
+                    await target.WriteAsync(buffer.AsMemory(0, read), ct);
+                }
+            }
+            finally
+            {
+                ArrayPool<byte>.Shared.Return(buffer);
+            }
+        }
+
+        return true;
+    }
+
+    public async Task<StoredFile> CompleteUploadAsync(UploadSession session, CancellationToken ct = default)
+    {
+        var partPath = GetUploadPartPath(session.UploadId);
+        string contentHash;
+        long sizeBytes;
+
+        await using (var part = new FileStream(partPath, FileMode.Open, FileAccess.Read, FileShare.None, BufferSize, FileOptions.Asynchronous | FileOptions.SequentialScan))
+        {
+            sizeBytes = part.Length;
+            contentHash = Convert.ToHexStringLower(await SHA256.HashDataAsync(part, ct));
+        }
+
+        var stored = await CommitAsync(partPath, contentHash, sizeBytes, ct);
+
+        DeleteIfExists(partPath);
+        DeleteIfExists(GetUploadMetadataPath(session.UploadId));
+
+        return stored;
+    }
+
+    public int DeleteStaleUploads(TimeSpan maxAge)
+    {
+        var cutoff = DateTime.UtcNow - maxAge;
+        var deleted = 0;
+
+        foreach (var metadataPath in Directory.EnumerateFiles(_uploadsPath, "*.json"))
+        {
+            var partPath = Path.ChangeExtension(metadataPath, ".part");
+            var lastActivity = File.Exists(partPath)
+                ? File.GetLastWriteTimeUtc(partPath)
+                : File.GetLastWriteTimeUtc(metadataPath);
+
+            if (lastActivity < cutoff)
+            {
+                DeleteIfExists(partPath);
+                DeleteIfExists(metadataPath);
+                deleted++;
+            }
+        }
+
+        return deleted;
+    }
+
+    private async Task<StoredFile> CommitAsync(string sourcePath, string contentHash, long sizeBytes, CancellationToken ct)
+    {
+        // Reference first: from here on a concurrent release cannot unlink the blob
+        await _blobs.AddReferenceAsync(contentHash, sizeBytes, ct);
+
+        var blobPath = GetBlobPath(contentHash);
+        if (!File.Exists(blobPath))
+        {
+            Directory.CreateDirectory(Path.GetDirectoryName(blobPath)!);
+            try
+            {
+                File.Move(sourcePath, blobPath);
+            }
+            catch (IOException) when (File.Exists(blobPath))
+            {
+                // Same content stored concurrently
+            }
+        }
+
+        return new StoredFile(Path.GetRelativePath(_baseStoragePath, blobPath), contentHash, sizeBytes);
+    }
+
+    private string GetBlobPath(string contentHash) =>
+        Path.Combine(_baseStoragePath, BlobsDirectory, contentHash[..2], contentHash[2..4], contentHash);
+
+    private string GetUploadPartPath(Guid uploadId) => Path.Combine(_uploadsPath, $"{uploadId:N}.part");
+
+    private string GetUploadMetadataPath(Guid uploadId) => Path.Combine(_uploadsPath, $"{uploadId:N}.json");
+
+    // Blob keys are relative to the base path; legacy attachments store absolute paths
+    private string ResolvePath(string filePath) =>
+        Path.IsPathRooted(filePath) ? filePath : Path.Combine(_baseStoragePath, filePath);
+
+    private static void DeleteIfExists(string path)
+    {
+        if (File.Exists(path))
+        {
+            File.Delete(path);
+        }
     }
 
-    private static string GetMimeType(string filePath)
+    private static string GetMimeType(string fileName)
     {
-        var extension = Path.GetExtension(filePath).ToLowerInvariant();
+        var extension = Path.GetExtension(fileName).ToLowerInvariant();
         return extension switch
         {
             ".jpg" or ".jpeg" => "image/jpeg",
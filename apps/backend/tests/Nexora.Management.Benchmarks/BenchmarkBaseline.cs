@@ -0,0 +1,75 @@
+using System.Text.Json;
+
+namespace Nexora.Management.Benchmarks;
+
+/// <summary>
+/// Stored results of an earlier run on the same dataset
+/// </summary>
+public class BenchmarkBaseline
+{
+    private static readonly JsonSerializerOptions JsonOptions = new()
+    {
+        PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
+        WriteIndented = true
+    };
+
+    public int Tasks { get; set; }
+
+    public int Seed { get; set; }
+
+    public DateTime RecordedAt { get; set; }
+
+    public Dictionary<string, BenchmarkResult> Results { get; set; } = new();
+
+    public static async Task<BenchmarkBaseline?> LoadAsync(string path, CancellationToken ct)
+    {
+        if (!File.Exists(path))
+        {
+            return null;
+        }
+
+        await using var stream = File.OpenRead(path);
+        return await JsonSerializer.DeserializeAsync<BenchmarkBaseline>(stream, JsonOptions, ct);
+    }
+
+    public async Task SaveAsync(string path, CancellationToken ct)
+    {
+        await using var stream = File.Create(path);
+        await JsonSerializer.SerializeAsync(stream, this, JsonOptions, ct);
+    }
+
+    /// <summary>
+    /// Describes how a result regressed against its baseline, or returns null if it did not.
+    /// More queries or rows always count; time only counts past both the relative tolerance
+    /// and the absolute noise floor.
+    /// </summary>
+    public static string? FindRegression(BenchmarkResult baseline, BenchmarkResult current, double tolerance, double noiseFloorMilliseconds)
+    {
+        var reasons = new List<string>();
+
+        if (current.Queries > baseline.Queries)
+        {
+            reasons.Add($"queries {baseline.Queries} -> {current.Queries}");
+        }
+
+        if (current.RowsRead > baseline.RowsRead)
+        {
+            reasons.Add($"rows {baseline.RowsRead} -> {current.RowsRead}");
+        }
+
+        if (IsSlower(baseline.MedianMilliseconds, current.MedianMilliseconds, tolerance, noiseFloorMilliseconds))
+        {
+            reasons.Add($"median {baseline.MedianMilliseconds:F1} -> {current.MedianMilliseconds:F1} ms");
+        }
+
+        if (IsSlower(baseline.P95Milliseconds, current.P95Milliseconds, tolerance, noiseFloorMilliseconds))
+        {
+            reasons.Add($"p95 {baseline.P95Milliseconds:F1} -> {current.P95Milliseconds:F1} ms");
+        }
+
+        return reasons.Count > 0 ? string.Join(", ", reasons) : null;
+    }
+
+    private static bool IsSlower(double baseline, double current, double tolerance, double noiseFloorMilliseconds) =>
+        current > baseline * (1 + tolerance) && current - baseline > noiseFloorMilliseconds;
+}
@@ -0,0 +1,118 @@
+using System.Globalization;
+
+namespace Nexora.Management.Benchmarks;
+
+/// <summary>
+/// Command line options of the benchmark runner
+/// </summary>
+public class BenchmarkOptions
+{
+    public const string ConnectionEnvironmentVariable = "NEXORA_BENCHMARK_CONNECTION";
+
+    /// <summary>
+    /// Database to seed and query; must be dedicated to benchmarking and have the migrations applied
+    /// </summary>
+    public string ConnectionString { get; set; } =
+        Environment.GetEnvironmentVariable(ConnectionEnvironmentVariable)
+        ?? "Host=localhost;Port=5432;Database=nexora_benchmark;Username=nexora;Password=nexora_dev";
+
+    /// <summary>
+    /// Number of tasks in the synthetic workspace; the rest of the hierarchy scales with it
+    /// </summary>
+    public int Tasks { get; set; } = 100_000;
+
+    /// <summary>
+    /// Seed of the generator; the same seed and size always produce the same workspace
+    /// </summary>
+    public int Seed { get; set; } = 42;
+
+    /// <summary>
+    /// Untimed runs per benchmark before measuring
+    /// </summary>
+    public int Warmup { get; set; } = 3;
+
+    /// <summary>
+    /// Timed runs per benchmark
+    /// </summary>
+    public int Iterations { get; set; } = 20;
+
+    /// <summary>
+    /// Only run benchmarks whose name contains this text
+    /// </summary>
+    public string? Filter { get; set; }
+
+    /// <summary>
+    /// Stored results to compare against
+    /// </summary>
+    public string BaselinePath { get; set; } = "baseline.json";
+
+    /// <summary>
+    /// Writes this run's results as the new baseline instead of comparing
+    /// </summary>
+    public bool UpdateBaseline { get; set; }
+
+    /// <summary>
+    /// Allowed relative slowdown of the median and p95 before a benchmark counts as regressed
+    /// </summary>
+    public double Tolerance { get; set; } = 0.25;
+
+    /// <summary>
+    /// Slowdowns smaller than this are treated as noise regardless of <see cref="Tolerance"/>
+    /// </summary>
+    public double NoiseFloorMilliseconds { get; set; } = 2;
+
+    public static BenchmarkOptions Parse(string[] args)
+    {
+        var options = new BenchmarkOptions();
+
+        for (var i = 0; i < args.Length; i++)
+        {
+            string Value() => i + 1 < args.Length
+                ? args[++i]
+                : throw new ArgumentException($"Missing value for {args[i]}");
+
+            switch (args[i])
+            {
+                case "--connection":
+                    options.ConnectionString = Value();
+                    break;
+                case "--tasks":
+                    options.Tasks = int.Parse(Value(), CultureInfo.InvariantCulture);
+                    break;
+                case "--seed":
+                    options.Seed = int.Parse(Value(), CultureInfo.InvariantCulture);
+                    break;
+                case "--warmup":
+                    options.Warmup = int.Parse(Value(), CultureInfo.InvariantCulture);
+                    break;
+                case "--iterations":
+                    options.Iterations = int.Parse(Value(), CultureInfo.InvariantCulture);
+                    break;
+                case "--filter":
+                    options.Filter = Value();
+                    break;
+                case "--baseline":
+                    options.BaselinePath = Value();
+                    break;
+                case "--update-baseline":
+                    options.UpdateBaseline = true;
+                    break;
+                case "--tolerance":
+                    options.Tolerance = double.Parse(Value(), CultureInfo.InvariantCulture);
+                    break;
+                case "--noise-floor":
+                    options.NoiseFloorMilliseconds = double.Parse(Value(), CultureInfo.InvariantCulture);
+                    break;
+                default:
+                    throw new ArgumentException($"Unknown option {args[i]}");
+            }
+        }
+
+        if (options.Tasks < 1 || options.Iterations < 1 || options.Warmup < 0 || options.Tolerance < 0)
+        {
+            throw new ArgumentException("--tasks and --iterations must be positive; --warmup and --tolerance must not be negative");
+        }
+
+        return options;
+    }
+}
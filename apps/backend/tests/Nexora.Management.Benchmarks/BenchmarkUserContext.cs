@@ -0,0 +1,15 @@
+using Nexora.Management.Application.Common;
+
+namespace Nexora.Management.Benchmarks;
+
+/// <summary>
+/// Runs every request as the synthetic workspace's owner
+/// </summary>
+public class BenchmarkUserContext : IUserContext
+{
+    public Guid UserId { get; set; }
+
+    public string? Email => null;
+
+    public string? Name => "Benchmark";
+}
@@ -0,0 +1,127 @@
+using System.Diagnostics;
+using MediatR;
+using Microsoft.Extensions.DependencyInjection;
+using Nexora.Management.Application.Analytics.Queries.GetDashboardStats;
+using Nexora.Management.Application.Analytics.Queries.GetProjectProgress;
+using Nexora.Management.Application.Analytics.Queries.GetTeamWorkload;
+using Nexora.Management.Application.Common;
+using Nexora.Management.Application.Documents.Queries;
+using Nexora.Management.Application.Goals.Queries.GetObjectiveTree;
+using Nexora.Management.Application.Tasks.Queries;
+using Nexora.Management.Application.Tasks.Queries.ViewQueries;
+using Nexora.Management.Application.TimeTracking.Queries.GetWorkspaceTimeReport;
+using Nexora.Management.Infrastructure.Persistence;
+
+namespace Nexora.Management.Benchmarks;
+
+/// <summary>
+/// One handler invocation to measure; returns the handler's error, or null on success
+/// </summary>
+public record BenchmarkCase(string Name, Func<ISender, SyntheticWorkspace, CancellationToken, Task<string?>> Run);
+
+/// <summary>
+/// Measurements of one benchmark. Queries and rows are per invocation and, for a given
+/// dataset, deterministic, so any increase is a real change in the handler's data access.
+/// </summary>
+public record BenchmarkResult(
+    string Name,
+    double MedianMilliseconds,
+    double P95Milliseconds,
+    double MeanMilliseconds,
+    int Queries,
+    long RowsRead);
+
+/// <summary>
+/// The hot read paths: task lists, board/Gantt/calendar views, analytics, time reports and trees
+/// </summary>
+public static class HandlerBenchmarks
+{
+    public static IReadOnlyList<BenchmarkCase> All { get; } = new[]
+    {
+        Case("GetTasksQuery/tasklist", w => new GetTasksQuery(w.TaskListId, null, null, null, null, false, 1, 50)),
+        Case("GetTasksQuery/assignee", w => new GetTasksQuery(null, null, w.AssigneeId, null, "dueDate", false, 1, 50)),
+        Case("GetBoardViewQuery", w => new GetBoardViewQuery(w.TaskListId)),
+        Case("GetGanttViewQuery", w => new GetGanttViewQuery(w.TaskListId)),
+        Case("GetCalendarViewQuery", w => new GetCalendarViewQuery(w.TaskListId, w.Anchor.Year, w.Anchor.Month)),
+        Case("GetDashboardStatsQuery", w => new GetDashboardStatsQuery(w.WorkspaceId)),
+        Case("GetProjectProgressQuery", w => new GetProjectProgressQuery(w.WorkspaceId)),
+        Case("GetTeamWorkloadQuery", w => new GetTeamWorkloadQuery(w.WorkspaceId)),
+        Case("GetWorkspaceTimeReportQuery", w => new GetWorkspaceTimeReportQuery(w.WorkspaceId, w.Anchor.AddDays(-90), w.Anchor, null, "user,tasklist")),
+        Case("GetPageTreeQuery", w => new GetPageTreeQuery(w.WorkspaceId)),
+        Case("GetObjectiveTreeQuery", w => new GetObjectiveTreeQuery(w.WorkspaceId, w.PeriodId))
+    };
+
+    /// <summary>
+    /// Runs a benchmark in a fresh scope per invocation, as a request would
+    /// </summary>
+    public static async Task<BenchmarkResult> RunAsync(
+        IServiceProvider services,
+        BenchmarkCase benchmark,
+        SyntheticWorkspace workspace,
+        int warmup,
+        int iterations,
+        CancellationToken ct)
+    {
+        for (var i = 0; i < warmup; i++)
+        {
+            await InvokeAsync(services, benchmark, workspace, ct);
+        }
+
+        var elapsed = new List<double>(iterations);
+        var queries = 0;
+        long rowsRead = 0;
+
+        for (var i = 0; i < iterations; i++)
+        {
+            var (milliseconds, scope) = await InvokeAsync(services, benchmark, workspace, ct);
+            elapsed.Add(milliseconds);
+            queries = Math.Max(queries, scope.Queries);
+            rowsRead = Math.Max(rowsRead, scope.RowsRead);
+        }
+
+        elapsed.Sort();
+        return new BenchmarkResult(
+            benchmark.Name,
+            Percentile(elapsed, 0.5),
+            Percentile(elapsed, 0.95),
+            elapsed.Average(),
+            queries,
+            rowsRead);
+    }
+
+    private static async Task<(double Milliseconds, QueryScope Scope)> InvokeAsync(
+        IServiceProvider services,
+        BenchmarkCase benchmark,
+        SyntheticWorkspace workspace,
+        CancellationToken ct)
+    {
+        await using var scope = services.CreateAsyncScope();
+        var sender = scope.ServiceProvider.GetRequiredService<ISender>();
+
+        using var queries = QueryScope.Begin();
+        var started = Stopwatch.GetTimestamp();
+        var error = await benchmark.Run(sender, workspace, ct);
+        var elapsed = Stopwatch.GetElapsedTime(started);
+
+        if (error != null)
+        {
+            throw new InvalidOperationException($"{benchmark.Name} failed: {error}");
+        }
+
+        return (elapsed.TotalMilliseconds, queries);
+    }
+
+    // Nearest-rank percentile of an ascending list
+    private static double Percentile(List<double> sorted, double percentile)
+    {
+        var rank = (int)Math.Ceiling(percentile * sorted.Count);
+        return sorted[Math.Clamp(rank - 1, 0, sorted.Count - 1)];
+    }
+
+    private static BenchmarkCase Case<T>(string name, Func<SyntheticWorkspace, IRequest<Result<T>>> createRequest) =>
+        new(name, async (sender, workspace, ct) =>
+        {
+            var result = await sender.Send(createRequest(workspace), ct);
+            return result.IsFailure ? result.Error ?? "unknown error" : null;
+        });
+}
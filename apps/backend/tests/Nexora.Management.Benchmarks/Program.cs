@@ -0,0 +1,119 @@
+using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.DependencyInjection;
+using Nexora.Management.Application.Common;
+using Nexora.Management.Benchmarks;
+using Nexora.Management.Infrastructure.Interfaces;
+using Nexora.Management.Infrastructure.Persistence;
+
+// Exit codes: 0 no regressions, 1 regressions found, 2 invalid arguments or baseline
+BenchmarkOptions options;
+try
+{
+    options = BenchmarkOptions.Parse(args);
+}
+catch (Exception ex) when (ex is ArgumentException or FormatException)
+{
+    Console.Error.WriteLine(ex.Message);
+    Console.Error.WriteLine("Usage: dotnet run -c Release -- [--connection <cs>] [--tasks 100000] [--seed 42] [--warmup 3] [--iterations 20]");
+    Console.Error.WriteLine("       [--filter <name>] [--baseline baseline.json] [--update-baseline] [--tolerance 0.25] [--noise-floor 2]");
+    return 2;
+}
+
+using var cancellation = new CancellationTokenSource();
+Console.CancelKeyPress += (_, e) =>
+{
+    e.Cancel = true;
+    cancellation.Cancel();
+};
+var ct = cancellation.Token;
+
+var userContext = new BenchmarkUserContext();
+var services = new ServiceCollection();
+services.AddLogging();
+services.AddSingleton<QueryMetricsInterceptor>();
+services.AddDbContext<AppDbContext>((provider, dbOptions) => dbOptions
+    // No retry strategy: the generator uses an explicit transaction
+    .UseNpgsql(options.ConnectionString, npgsql => npgsql.CommandTimeout(600))
+    .AddInterceptors(provider.GetRequiredService<QueryMetricsInterceptor>()));
+services.AddScoped<IAppDbContext>(provider => provider.GetRequiredService<AppDbContext>());
+services.AddSingleton<IUserContext>(userContext);
+services.AddMediatR(cfg => cfg.RegisterServicesFromAssembly(typeof(Result).Assembly));
+
+await using var serviceProvider = services.BuildServiceProvider();
+
+SyntheticWorkspace workspace;
+await using (var scope = serviceProvider.CreateAsyncScope())
+{
+    var db = scope.ServiceProvider.GetRequiredService<AppDbContext>();
+    workspace = await new SyntheticWorkspaceGenerator(db, options.Tasks, options.Seed)
+        .LoadOrCreateAsync(Console.WriteLine, ct);
+}
+
+userContext.UserId = workspace.OwnerId;
+
+var baseline = options.UpdateBaseline ? null : await BenchmarkBaseline.LoadAsync(options.BaselinePath, ct);
+if (baseline != null && (baseline.Tasks != options.Tasks || baseline.Seed != options.Seed))
+{
+    Console.Error.WriteLine(
+        $"Baseline {options.BaselinePath} was recorded for {baseline.Tasks} tasks with seed {baseline.Seed}; " +
+        $"rerun with those options or record a new baseline with --update-baseline");
+    return 2;
+}
+
+var benchmarks = HandlerBenchmarks.All
+    .Where(b => options.Filter == null || b.Name.Contains(options.Filter, StringComparison.OrdinalIgnoreCase))
+    .ToList();
+
+Console.WriteLine();
+Console.WriteLine($"{"Benchmark",-30} {"Median ms",10} {"P95 ms",10} {"Mean ms",10} {"Queries",8} {"Rows",10}  Status");
+
+var results = new List<BenchmarkResult>();
+var regressions = 0;
+
+foreach (var benchmark in benchmarks)
+{
+    var result = await HandlerBenchmarks.RunAsync(serviceProvider, benchmark, workspace, options.Warmup, options.Iterations, ct);
+    results.Add(result);
+
+    string status;
+    if (baseline == null)
+    {
+        status = options.UpdateBaseline ? "recorded" : "no baseline";
+    }
+    else if (!baseline.Results.TryGetValue(result.Name, out var previous))
+    {
+        status = "new";
+    }
+    else
+    {
+        var regression = BenchmarkBaseline.FindRegression(previous, result, options.Tolerance, options.NoiseFloorMilliseconds);
+        status = regression == null ? "ok" : $"REGRESSED: {regression}";
+        regressions += regression == null ? 0 : 1;
+    }
+
+    Console.WriteLine(
+        $"{result.Name,-30} {result.MedianMilliseconds,10:F2} {result.P95Milliseconds,10:F2} {result.MeanMilliseconds,10:F2} {result.Queries,8} {result.RowsRead,10}  {status}");
+}
+
+if (options.UpdateBaseline)
+{
+    // Keep entries of benchmarks skipped by --filter
+    var updated = await BenchmarkBaseline.LoadAsync(options.BaselinePath, ct);
+    if (updated == null || updated.Tasks != options.Tasks || updated.Seed != options.Seed)
+    {
+        updated = new BenchmarkBaseline { Tasks = options.Tasks, Seed = options.Seed };
+    }
+
+    updated.RecordedAt = DateTime.UtcNow;
+    foreach (var result in results)
+    {
+        updated.Results[result.Name] = result;
+    }
+
+    await updated.SaveAsync(options.BaselinePath, ct);
+    Console.WriteLine($"Baseline written to {Path.GetFullPath(options.BaselinePath)}");
+}
+
+Console.WriteLine();
+Console.WriteLine(regressions == 0 ? "No regressions" : $"{regressions} benchmark(s) regressed");
+return regressions == 0 ? 0 : 1;
@@ -0,0 +1,460 @@
+using System.Text.Json;
+using Microsoft.EntityFrameworkCore;
+using Nexora.Management.Application.Analytics.Rollups;
+using Nexora.Management.Application.TimeTracking.Reporting;
+using Nexora.Management.Domain.Entities;
+using Nexora.Management.Infrastructure.Persistence;
+using TaskEntity = Nexora.Management.Domain.Entities.Task;
+using TaskStatusEntity = Nexora.Management.Domain.Entities.TaskStatus;
+
+namespace Nexora.Management.Benchmarks;
+
+/// <summary>
+/// Ids of the generated workspace that benchmarks query
+/// </summary>
+/// <param name="WorkspaceId">The synthetic workspace</param>
+/// <param name="OwnerId">Workspace owner; benchmarks run as this user</param>
+/// <param name="PeriodId">Goal period holding every objective</param>
+/// <param name="TaskListId">First tasklist by name; every list holds about the same number of tasks</param>
+/// <param name="AssigneeId">The member with the most tasks in that list</param>
+/// <param name="Anchor">Date the generated due dates and time entries are spread around</param>
+public record SyntheticWorkspace(
+    Guid WorkspaceId,
+    Guid OwnerId,
+    Guid PeriodId,
+    Guid TaskListId,
+    Guid AssigneeId,
+    DateTime Anchor);
+
+/// <summary>
+/// Builds a reproducible workspace of a given size: spaces, folders and tasklists with
+/// statuses, tasks and subtasks, time entries and rates, a page tree and an objective tree.
+/// The same seed and size always produce the same rows, ids included.
+/// </summary>
+public class SyntheticWorkspaceGenerator
+{
+    public const int Spaces = 5;
+    public const int FoldersPerSpace = 4;
+    public const int TaskListsPerFolder = 5;
+
+    private const int BatchSize = 5000;
+    private const int MaxPageDepth = 5;
+
+    // Fixed so a dataset generated today and one generated next month are the same
+    private static readonly DateTime Anchor = new(2026, 1, 1, 0, 0, 0, DateTimeKind.Utc);
+
+    private static readonly string[] StatusNames =
+    {
+        "todo", TaskRollupSnapshot.InProgressStatusName, "review", TaskRollupSnapshot.CompleteStatusName
+    };
+
+    private static readonly string[] Priorities = { "low", "medium", "high", "urgent" };
+
+    private readonly AppDbContext _db;
+    private readonly int _taskCount;
+    private readonly int _seed;
+    private readonly Random _random;
+    private List<Guid> _taskIds = new();
+
+    public SyntheticWorkspaceGenerator(AppDbContext db, int taskCount, int seed)
+    {
+        _db = db;
+        _taskCount = taskCount;
+        _seed = seed;
+        _random = new Random(seed);
+    }
+
+    private string WorkspaceName => $"Benchmark workspace (seed {_seed}, {_taskCount} tasks)";
+
+    private int UserCount => Math.Clamp(_taskCount / 2000, 10, 200);
+
+    private int TimeEntryCount => _taskCount / 2;
+
+    private int PageCount => Math.Max(100, _taskCount / 50);
+
+    private int ObjectiveCount => Math.Max(30, _taskCount / 500);
+
+    /// <summary>
+    /// Returns the workspace for this seed and size, generating it on first use
+    /// </summary>
+    public async Task<SyntheticWorkspace> LoadOrCreateAsync(Action<string> log, CancellationToken ct)
+    {
+        var existing = await LoadAsync(ct);
+        if (existing != null)
+        {
+            log($"Reusing {WorkspaceName}");
+            return existing;
+        }
+
+        log($"Generating {WorkspaceName}");
+
+        // One transaction, so an interrupted run leaves nothing behind to collide with the next
+        await using (var transaction = await _db.Database.BeginTransactionAsync(ct))
+        {
+            await GenerateAsync(log, ct);
+            await transaction.CommitAsync(ct);
+        }
+
+        var workspace = await LoadAsync(ct)
+            ?? throw new InvalidOperationException("Generated workspace could not be read back");
+
+        log("Rebuilding analytics and time rollups");
+        await new AnalyticsRollupStore(_db).RebuildAsync(workspace.WorkspaceId, ct);
+        await new TimeRollupStore(_db).RebuildAsync(workspace.WorkspaceId, ct);
+
+        return workspace;
+    }
+
+    private async Task<SyntheticWorkspace?> LoadAsync(CancellationToken ct)
+    {
+        var workspace = await _db.Workspaces
+            .AsNoTracking()
+            .Where(w => w.Name == WorkspaceName)
+            .Select(w => new { w.Id, w.OwnerId })
+            .FirstOrDefaultAsync(ct);
+
+        if (workspace == null)
+        {
+            return null;
+        }
+
+        var taskListId = await _db.TaskLists
+            .Where(tl => tl.Space.WorkspaceId == workspace.Id)
+            .OrderBy(tl => tl.Name)
+            .Select(tl => tl.Id)
+            .FirstAsync(ct);
+
+        var assigneeId = await _db.Tasks
+            .Where(t => t.TaskListId == taskListId && t.AssigneeId != null)
+            .GroupBy(t => t.AssigneeId!.Value)
+            .OrderByDescending(g => g.Count())
+            .ThenBy(g => g.Key)
+            .Select(g => g.Key)
+            .FirstAsync(ct);
+
+        var periodId = await _db.GoalPeriods
+            .Where(p => p.WorkspaceId == workspace.Id)
+            .Select(p => p.Id)
+            .FirstAsync(ct);
+
+        return new SyntheticWorkspace(workspace.Id, workspace.OwnerId, periodId, taskListId, assigneeId, Anchor);
+    }
+
+    private async System.Threading.Tasks.Task GenerateAsync(Action<string> log, CancellationToken ct)
+    {
+        var role = await _db.Roles.FirstOrDefaultAsync(r => r.Name == "Member", ct);
+        if (role == null)
+        {
+            role = new Role { Id = NextGuid(), Name = "Member", Description = "Create tasks, comment", IsSystem = true };
+            _db.Roles.Add(role);
+        }
+
+        var users = Enumerable.Range(0, UserCount)
+            .Select(i => new User
+            {
+                Id = NextGuid(),
+                Email = $"benchmark-{_seed}-{_taskCount}-{i}@example.com",
+                Name = $"Benchmark User {i}",
+                PasswordHash = "benchmark"
+            })
+            .ToList();
+        _db.Users.AddRange(users);
+
+        var owner = users[0];
+        var workspace = new Workspace { Id = NextGuid(), Name = WorkspaceName, OwnerId = owner.Id };
+        _db.Workspaces.Add(workspace);
+        _db.WorkspaceMembers.AddRange(users.Select(u => new WorkspaceMember
+        {
+            Id = NextGuid(),
+            WorkspaceId = workspace.Id,
+            UserId = u.Id,
+            RoleId = role.Id,
+            JoinedAt = Anchor.AddDays(-365)
+        }));
+
+        var taskLists = AddHierarchy(workspace.Id, owner.Id);
+        await FlushAsync(ct);
+        log($"  {users.Count} users, {taskLists.Count} tasklists");
+
+        await AddTasksAsync(taskLists, users, ct);
+        log($"  {_taskCount} tasks");
+
+        await AddTimeAsync(workspace.Id, users, ct);
+        log($"  {TimeEntryCount} time entries");
+
+        await AddPagesAsync(workspace.Id, users, ct);
+        log($"  {PageCount} pages");
+
+        await AddObjectivesAsync(workspace.Id, users, ct);
+        log($"  {ObjectiveCount} objectives");
+    }
+
+    private List<GeneratedTaskList> AddHierarchy(Guid workspaceId, Guid ownerId)
+    {
+        var taskLists = new List<GeneratedTaskList>();
+
+        for (var s = 0; s < Spaces; s++)
+        {
+            var space = new Space { Id = NextGuid(), WorkspaceId = workspaceId, Name = $"Space {s:D2}" };
+            _db.Spaces.Add(space);
+
+            for (var f = 0; f < FoldersPerSpace; f++)
+            {
+                var folder = new Folder { Id = NextGuid(), SpaceId = space.Id, Name = $"Folder {s:D2}.{f:D2}", PositionOrder = f };
+                _db.Folders.Add(folder);
+
+                for (var l = 0; l < TaskListsPerFolder; l++)
+                {
+                    var name = $"List {s:D2}.{f:D2}.{l:D2}";
+
+                    // Legacy project per list: tasks and statuses still carry a ProjectId
+                    var project = new Project { Id = NextGuid(), WorkspaceId = workspaceId, Name = name, OwnerId = ownerId };
+                    var taskList = new TaskList
+                    {
+                        Id = NextGuid(),
+                        SpaceId = space.Id,
+                        FolderId = folder.Id,
+                        Name = name,
+                        OwnerId = ownerId,
+                        PositionOrder = l
+                    };
+                    var statuses = StatusNames
+                        .Select((statusName, index) => new TaskStatusEntity
+                        {
+                            Id = NextGuid(),
+                            ProjectId = project.Id,
+                            TaskListId = taskList.Id,
+                            Name = statusName,
+                            OrderIndex = index
+                        })
+                        .ToList();
+
+                    _db.Projects.Add(project);
+                    _db.TaskLists.Add(taskList);
+                    _db.TaskStatuses.AddRange(statuses);
+                    taskLists.Add(new GeneratedTaskList(taskList.Id, project.Id, statuses.Select(st => st.Id).ToArray()));
+                }
+            }
+        }
+
+        return taskLists;
+    }
+
+    private async System.Threading.Tasks.Task AddTasksAsync(List<GeneratedTaskList> taskLists, List<User> users, CancellationToken ct)
+    {
+        var taskIdsByList = taskLists.ToDictionary(tl => tl.Id, _ => new List<Guid>());
+
+        for (var i = 0; i < _taskCount; i++)
+        {
+            var taskList = taskLists[i % taskLists.Count];
+            var siblings = taskIdsByList[taskList.Id];
+
+            // Roughly one task in ten is a subtask of an earlier task in the same list
+            Guid? parentTaskId = siblings.Count > 0 && _random.NextDouble() < 0.1
+                ? siblings[_random.Next(siblings.Count)]
+                : null;
+
+            DateTime? dueDate = _random.NextDouble() < 0.7 ? Anchor.AddDays(_random.Next(-60, 61)) : null;
+            DateTime? startDate = dueDate.HasValue && _random.NextDouble() < 0.6 ? dueDate.Value.AddDays(-_random.Next(1, 15)) : null;
+
+            var task = new TaskEntity
+            {
+                Id = NextGuid(),
+                ProjectId = taskList.ProjectId,
+                TaskListId = taskList.Id,
+                ParentTaskId = parentTaskId,
+                Title = $"Task {i}",
+                Description = _random.NextDouble() < 0.3 ? $"Synthetic description for task {i}" : null,
+                StatusId = taskList.StatusIds[_random.Next(taskList.StatusIds.Length)],
+                Priority = Priorities[_random.Next(Priorities.Length)],
+                AssigneeId = _random.NextDouble() < 0.85 ? users[_random.Next(users.Count)].Id : null,
+                DueDate = dueDate,
+                StartDate = startDate,
+                EstimatedHours = _random.NextDouble() < 0.5 ? _random.Next(1, 40) : null,
+                PositionOrder = siblings.Count,
+                CreatedBy = users[_random.Next(users.Count)].Id
+            };
+
+            siblings.Add(task.Id);
+            _db.Tasks.Add(task);
+
+            if ((i + 1) % BatchSize == 0)
+            {
+                await FlushAsync(ct);
+            }
+        }
+
+        await FlushAsync(ct);
+        _taskIds = taskIdsByList.Values.SelectMany(ids => ids).ToList();
+    }
+
+    private async System.Threading.Tasks.Task AddTimeAsync(Guid workspaceId, List<User> users, CancellationToken ct)
+    {
+        // A rate change halfway through for every other user, so reports have to split groups
+        var rateChange = Anchor.AddDays(-90);
+        for (var u = 0; u < users.Count; u += 2)
+        {
+            _db.TimeRates.Add(new TimeRate { Id = NextGuid(), UserId = users[u].Id, HourlyRate = 60, EffectiveFrom = Anchor.AddDays(-365), EffectiveTo = rateChange });
+            _db.TimeRates.Add(new TimeRate { Id = NextGuid(), UserId = users[u].Id, HourlyRate = 75, EffectiveFrom = rateChange });
+        }
+
+        for (var i = 0; i < TimeEntryCount; i++)
+        {
+            var start = Anchor
+                .AddDays(-_random.Next(1, 181))
+                .AddMinutes(_random.Next(8 * 60, 18 * 60));
+            var minutes = _random.Next(1, 17) * 15;
+            var roll = _random.NextDouble();
+
+            _db.TimeEntries.Add(new TimeEntry
+            {
+                Id = NextGuid(),
+                UserId = users[_random.Next(users.Count)].Id,
+                TaskId = _random.NextDouble() < 0.9 ? _taskIds[_random.Next(_taskIds.Count)] : null,
+                StartTime = start,
+                EndTime = start.AddMinutes(minutes),
+                DurationMinutes = minutes,
+                IsBillable = _random.NextDouble() < 0.7,
+                Status = roll < 0.6 ? "approved" : roll < 0.9 ? "submitted" : "draft",
+                WorkspaceId = workspaceId
+            });
+
+            if ((i + 1) % BatchSize == 0)
+            {
+                await FlushAsync(ct);
+            }
+        }
+
+        await FlushAsync(ct);
+    }
+
+    private async System.Threading.Tasks.Task AddPagesAsync(Guid workspaceId, List<User> users, CancellationToken ct)
+    {
+        var pages = new List<(Guid Id, int Depth)>();
+
+        for (var i = 0; i < PageCount; i++)
+        {
+            // Most pages hang under an earlier page, which gives a few deep branches and many shallow ones
+            (Guid Id, int Depth)? parent = pages.Count > 0 && _random.NextDouble() < 0.8
+                ? pages[_random.Next(pages.Count)]
+                : null;
+            if (parent?.Depth >= MaxPageDepth)
+            {
+                parent = null;
+            }
+
+            var author = users[_random.Next(users.Count)].Id;
+            var page = new Page
+            {
+                Id = NextGuid(),
+                WorkspaceId = workspaceId,
+                ParentPageId = parent?.Id,
+                Title = $"Page {i}",
+                Slug = $"page-{i}",
+                Content = JsonDocument.Parse(JsonSerializer.Serialize(new
+                {
+                    type = "doc",
+                    content = new[]
+                    {
+                        new { type = "paragraph", content = new[] { new { type = "text", text = $"Synthetic content of page {i}" } } }
+                    }
+                })),
+                IsFavorite = _random.NextDouble() < 0.05,
+                PositionOrder = i,
+                CreatedBy = author,
+                UpdatedBy = author
+            };
+
+            pages.Add((page.Id, (parent?.Depth ?? 0) + 1));
+            _db.Pages.Add(page);
+
+            if ((i + 1) % BatchSize == 0)
+            {
+                await FlushAsync(ct);
+            }
+        }
+
+        await FlushAsync(ct);
+    }
+
+    private async System.Threading.Tasks.Task AddObjectivesAsync(Guid workspaceId, List<User> users, CancellationToken ct)
+    {
+        var period = new GoalPeriod
+        {
+            Id = NextGuid(),
+            WorkspaceId = workspaceId,
+            Name = $"FY{Anchor.Year}",
+            StartDate = Anchor,
+            EndDate = Anchor.AddYears(1).AddDays(-1)
+        };
+        _db.GoalPeriods.Add(period);
+
+        // Three levels: a tenth are roots, then a third of the rest are children of roots
+        var roots = new List<Guid>();
+        var secondLevel = new List<Guid>();
+        var rootCount = Math.Max(1, ObjectiveCount / 10);
+        var secondLevelCount = Math.Max(1, (ObjectiveCount - rootCount) / 3);
+
+        for (var i = 0; i < ObjectiveCount; i++)
+        {
+            Guid? parentId = i < rootCount
+                ? null
+                : i < rootCount + secondLevelCount
+                    ? roots[_random.Next(roots.Count)]
+                    : secondLevel[_random.Next(secondLevel.Count)];
+
+            var objective = new Objective
+            {
+                Id = NextGuid(),
+                WorkspaceId = workspaceId,
+                PeriodId = period.Id,
+                ParentObjectiveId = parentId,
+                Title = $"Objective {i}",
+                OwnerId = users[_random.Next(users.Count)].Id,
+                Progress = _random.Next(0, 101),
+                PositionOrder = i
+            };
+            _db.Objectives.Add(objective);
+            if (parentId == null)
+            {
+                roots.Add(objective.Id);
+            }
+            else if (i < rootCount + secondLevelCount)
+            {
+                secondLevel.Add(objective.Id);
+            }
+
+            for (var k = 0; k < 2; k++)
+            {
+                var target = _random.Next(10, 1000);
+                _db.KeyResults.Add(new KeyResult
+                {
+                    Id = NextGuid(),
+                    ObjectiveId = objective.Id,
+                    Title = $"Key result {i}.{k}",
+                    MetricType = "number",
+                    CurrentValue = _random.Next(0, target + 1),
+                    TargetValue = target,
+                    Unit = "count"
+                });
+            }
+        }
+
+        await FlushAsync(ct);
+    }
+
+    private async System.Threading.Tasks.Task FlushAsync(CancellationToken ct)
+    {
+        await _db.SaveChangesAsync(ct);
+        _db.ChangeTracker.Clear();
+    }
+
+    private Guid NextGuid()
+    {
+        Span<byte> bytes = stackalloc byte[16];
+        _random.NextBytes(bytes);
+        return new Guid(bytes);
+    }
+
+    private record GeneratedTaskList(Guid Id, Guid ProjectId, Guid[] StatusIds);
+}
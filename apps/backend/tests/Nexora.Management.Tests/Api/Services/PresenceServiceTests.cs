@@ -0,0 +1,103 @@
+using FluentAssertions;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Logging.Abstractions;
+using Nexora.Management.API.Common;
+using Nexora.Management.API.Services;
+using Nexora.Management.Domain.Entities;
+using Nexora.Management.Infrastructure.Interfaces;
+using Nexora.Management.Infrastructure.Persistence;
+using Task = System.Threading.Tasks.Task;
+
+namespace Nexora.Management.Tests.Api.Services;
+
+public class PresenceServiceTests : IAsyncDisposable
+{
+    private readonly ServiceProvider _serviceProvider;
+    private readonly PresenceService _presenceService;
+
+    public PresenceServiceTests()
+    {
+        var databaseName = Guid.NewGuid().ToString();
+        var services = new ServiceCollection();
+        services.AddDbContext<AppDbContext>(options => options.UseInMemoryDatabase(databaseName));
+        services.AddScoped<IAppDbContext>(provider => provider.GetRequiredService<AppDbContext>());
+        _serviceProvider = services.BuildServiceProvider();
+
+        _presenceService = new PresenceService(
+            _serviceProvider.GetRequiredService<IServiceScopeFactory>(),
+            new PresenceSettings { LastSeenWriteIntervalSeconds = 60 },
+            NullLogger<PresenceService>.Instance);
+    }
+
+    public async ValueTask DisposeAsync()
+    {
+        await _serviceProvider.DisposeAsync();
+        GC.SuppressFinalize(this);
+    }
+
+    private async Task<List<UserPresence>> GetPersistedPresencesAsync()
+    {
+        using var scope = _serviceProvider.CreateScope();
+        var dbContext = scope.ServiceProvider.GetRequiredService<AppDbContext>();
+        return await dbContext.UserPresences.AsNoTracking().ToListAsync();
+    }
+
+    [Fact]
+    public async Task RemoveConnectionAsync_WithOtherConnection_KeepsUserOnline()
+    {
+        // Arrange
+        var userId = Guid.NewGuid();
+        var workspaceId = Guid.NewGuid();
+        await _presenceService.TrackConnectionAsync(userId, workspaceId, "conn-1");
+        await _presenceService.TrackConnectionAsync(userId, workspaceId, "conn-2");
+
+        // Act
+        await _presenceService.RemoveConnectionAsync("conn-1");
+
+        // Assert
+        var online = await _presenceService.GetOnlineUsersAsync(workspaceId);
+        online.Should().ContainSingle(p => p.UserId == userId && p.IsOnline);
+    }
+
+    [Fact]
+    public async Task RemoveConnectionAsync_LastConnection_MarksUserOffline()
+    {
+        // Arrange
+        var userId = Guid.NewGuid();
+        var workspaceId = Guid.NewGuid();
+        await _presenceService.TrackConnectionAsync(userId, workspaceId, "conn-1");
+
+        // Act
+        await _presenceService.RemoveConnectionAsync("conn-1");
+        await _presenceService.FlushPendingChangesAsync();
+
+        // Assert
+        (await _presenceService.GetOnlineUsersAsync(workspaceId)).Should().BeEmpty();
+        var persisted = await GetPersistedPresencesAsync();
+        persisted.Should().ContainSingle(p => p.UserId == userId && !p.IsOnline);
+    }
+
+    [Fact]
+    public async Task UpdateLastSeenAsync_RepeatedHeartbeats_AreNotWrittenUntilIntervalElapses()
+    {
+        // Arrange
+        var userId = Guid.NewGuid();
+        var workspaceId = Guid.NewGuid();
+        await _presenceService.TrackConnectionAsync(userId, workspaceId, "conn-1");
+        await _presenceService.FlushPendingChangesAsync();
+        var firstWrite = (await GetPersistedPresencesAsync()).Single().LastSeen;
+
+        // Act
+        for (var i = 0; i < 10; i++)
+        {
+            await _presenceService.UpdateLastSeenAsync(userId);
+        }
+        await _presenceService.FlushPendingChangesAsync();
+
+        // Assert
+        var persisted = (await GetPersistedPresencesAsync()).Single();
+        persisted.IsOnline.Should().BeTrue();
+        persisted.LastSeen.Should().Be(firstWrite);
+    }
+}
@@ -0,0 +1,123 @@
+using FluentAssertions;
+using Nexora.Management.API.Common;
+using Nexora.Management.API.Hubs;
+using Nexora.Management.API.Services;
+using Nexora.Management.Application.DTOs.SignalR;
+
+namespace Nexora.Management.Tests.Api.Services;
+
+public class TaskBroadcastCoalescerTests
+{
+    private static TaskBroadcastEvent TaskEvent(Guid taskListId, string eventName, Guid taskId, string type) =>
+        new(taskListId, eventName, taskId, new TaskUpdatedMessage { TaskId = taskId, TaskListId = taskListId, Type = type });
+
+    [Fact]
+    public void Coalesce_RepeatedUpdates_KeepsLatestChangePerTask()
+    {
+        // Arrange
+        var taskListId = Guid.NewGuid();
+        var taskA = Guid.NewGuid();
+        var taskB = Guid.NewGuid();
+        var events = new List<TaskBroadcastEvent>
+        {
+            TaskEvent(taskListId, TaskHubEvents.TaskUpdated, taskA, "updated"),
+            TaskEvent(taskListId, TaskHubEvents.TaskUpdated, taskB, "updated"),
+            TaskEvent(taskListId, TaskHubEvents.TaskStatusChanged, taskA, "status_changed")
+        };
+
+        // Act
+        var batches = TaskBroadcastCoalescer.Coalesce(events);
+
+        // Assert
+        var batch = batches.Should().ContainSingle().Subject;
+        batch.TaskListId.Should().Be(taskListId);
+        batch.ResyncRequired.Should().BeFalse();
+        batch.Changes.Select(c => c.EntityId).Should().Equal(taskA, taskB);
+        batch.Changes[0].Event.Should().Be(TaskHubEvents.TaskStatusChanged);
+        ((TaskUpdatedMessage)batch.Changes[0].Message).Type.Should().Be("status_changed");
+    }
+
+    [Fact]
+    public void Coalesce_CreatedThenUpdated_StaysCreatedWithLatestMessage()
+    {
+        // Arrange
+        var taskListId = Guid.NewGuid();
+        var taskId = Guid.NewGuid();
+        var events = new List<TaskBroadcastEvent>
+        {
+            TaskEvent(taskListId, TaskHubEvents.TaskCreated, taskId, "created"),
+            TaskEvent(taskListId, TaskHubEvents.TaskUpdated, taskId, "updated")
+        };
+
+        // Act
+        var batches = TaskBroadcastCoalescer.Coalesce(events);
+
+        // Assert
+        var change = batches.Single().Changes.Should().ContainSingle().Subject;
+        change.Event.Should().Be(TaskHubEvents.TaskCreated);
+        ((TaskUpdatedMessage)change.Message).Type.Should().Be("updated");
+    }
+
+    [Fact]
+    public void Coalesce_CreatedThenDeleted_DropsTheTask()
+    {
+        // Arrange
+        var taskListId = Guid.NewGuid();
+        var taskId = Guid.NewGuid();
+        var events = new List<TaskBroadcastEvent>
+        {
+            TaskEvent(taskListId, TaskHubEvents.TaskCreated, taskId, "created"),
+            TaskEvent(taskListId, TaskHubEvents.TaskDeleted, taskId, "deleted")
+        };
+
+        // Act
+        var batches = TaskBroadcastCoalescer.Coalesce(events);
+
+        // Assert
+        batches.Should().BeEmpty();
+    }
+
+    [Fact]
+    public void Coalesce_EventsForDifferentTaskLists_ProducesOneBatchPerTaskList()
+    {
+        // Arrange
+        var firstList = Guid.NewGuid();
+        var secondList = Guid.NewGuid();
+        var events = new List<TaskBroadcastEvent>
+        {
+            TaskEvent(firstList, TaskHubEvents.TaskUpdated, Guid.NewGuid(), "updated"),
+            TaskEvent(secondList, TaskHubEvents.TaskUpdated, Guid.NewGuid(), "updated"),
+            TaskEvent(firstList, TaskHubEvents.TaskUpdated, Guid.NewGuid(), "updated")
+        };
+
+        // Act
+        var batches = TaskBroadcastCoalescer.Coalesce(events);
+
+        // Assert
+        batches.Should().HaveCount(2);
+        batches.Single(b => b.TaskListId == firstList).Changes.Should().HaveCount(2);
+        batches.Single(b => b.TaskListId == secondList).Changes.Should().HaveCount(1);
+    }
+
+    [Fact]
+    public void Publish_WhenChannelIsFull_DropsOldestAndFlagsTaskListForResync()
+    {
+        // Arrange
+        var queue = new TaskBroadcastQueue(new TaskBroadcastSettings { ChannelCapacity = 2 });
+        var droppedList = Guid.NewGuid();
+        var keptList = Guid.NewGuid();
+
+        // Act
+        queue.Publish(droppedList, TaskHubEvents.TaskUpdated, Guid.NewGuid(), new object());
+        queue.Publish(keptList, TaskHubEvents.TaskUpdated, Guid.NewGuid(), new object());
+        queue.Publish(keptList, TaskHubEvents.TaskUpdated, Guid.NewGuid(), new object());
+
+        // Assert
+        var metrics = queue.GetMetrics();
+        metrics.Published.Should().Be(3);
+        metrics.Dropped.Should().Be(1);
+        metrics.QueueDepth.Should().Be(2);
+        queue.TakeResyncTaskListIds().Should().BeEquivalentTo(new[] { droppedList });
+        queue.TakeResyncTaskListIds().Should().BeEmpty();
+    }
+}
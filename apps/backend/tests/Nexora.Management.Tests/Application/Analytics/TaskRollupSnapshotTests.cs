@@ -0,0 +1,87 @@
+using FluentAssertions;
+using Nexora.Management.Application.Analytics.Rollups;
+using Nexora.Management.Domain.Entities;
+using DomainTask = Nexora.Management.Domain.Entities.Task;
+
+namespace Nexora.Management.Tests.Application.Analytics;
+
+public class TaskRollupSnapshotTests
+{
+    private static readonly DateTime Now = new(2026, 1, 10, 12, 0, 0, DateTimeKind.Utc);
+
+    [Fact]
+    public void ComputeDeltas_OnCreate_IncrementsEveryScope()
+    {
+        // Arrange
+        var workspaceId = Guid.NewGuid();
+        var task = new DomainTask { TaskListId = Guid.NewGuid(), AssigneeId = Guid.NewGuid() };
+        var after = TaskRollupSnapshot.Create(workspaceId, task, TaskRollupSnapshot.InProgressStatusName, Now);
+
+        // Act
+        var deltas = TaskRollupSnapshot.ComputeDeltas(null, after);
+
+        // Assert
+        deltas.Should().HaveCount(3);
+        deltas.Should().OnlyContain(d => d.TotalTasks == 1 && d.InProgressTasks == 1 && d.CompletedTasks == 0);
+        deltas.Select(d => d.ScopeType).Should().BeEquivalentTo(new[]
+        {
+            AnalyticsRollup.WorkspaceScope, AnalyticsRollup.TaskListScope, AnalyticsRollup.MemberScope
+        });
+    }
+
+    [Fact]
+    public void ComputeDeltas_OnCompletion_MovesCountsWithoutChangingTotals()
+    {
+        // Arrange
+        var workspaceId = Guid.NewGuid();
+        var task = new DomainTask { TaskListId = Guid.NewGuid(), DueDate = Now.AddDays(-1) };
+        var before = TaskRollupSnapshot.Create(workspaceId, task, TaskRollupSnapshot.InProgressStatusName, Now);
+        var after = TaskRollupSnapshot.Create(workspaceId, task, TaskRollupSnapshot.CompleteStatusName, Now);
+
+        // Act
+        var deltas = TaskRollupSnapshot.ComputeDeltas(before, after);
+
+        // Assert
+        deltas.Should().HaveCount(2);
+        deltas.Should().OnlyContain(d =>
+            d.TotalTasks == 0 && d.CompletedTasks == 1 && d.InProgressTasks == -1 && d.OverdueTasks == -1);
+    }
+
+    [Fact]
+    public void ComputeDeltas_OnReassignment_MovesTaskBetweenMembers()
+    {
+        // Arrange
+        var workspaceId = Guid.NewGuid();
+        var oldAssignee = Guid.NewGuid();
+        var newAssignee = Guid.NewGuid();
+        var task = new DomainTask { TaskListId = Guid.NewGuid(), AssigneeId = oldAssignee };
+        var before = TaskRollupSnapshot.Create(workspaceId, task, null, Now);
+        task.AssigneeId = newAssignee;
+        var after = TaskRollupSnapshot.Create(workspaceId, task, null, Now);
+
+        // Act
+        var deltas = TaskRollupSnapshot.ComputeDeltas(before, after);
+
+        // Assert
+        deltas.Should().HaveCount(2);
+        deltas.Should().ContainSingle(d => d.ScopeId == oldAssignee && d.TotalTasks == -1);
+        deltas.Should().ContainSingle(d => d.ScopeId == newAssignee && d.TotalTasks == 1);
+    }
+
+    [Fact]
+    public void ComputeDeltas_WithoutRelevantChange_ReturnsNothing()
+    {
+        // Arrange
+        var workspaceId = Guid.NewGuid();
+        var task = new DomainTask { TaskListId = Guid.NewGuid(), AssigneeId = Guid.NewGuid() };
+        var before = TaskRollupSnapshot.Create(workspaceId, task, TaskRollupSnapshot.InProgressStatusName, Now);
+        task.Title = "Renamed";
+        var after = TaskRollupSnapshot.Create(workspaceId, task, TaskRollupSnapshot.InProgressStatusName, Now);
+
+        // Act
+        var deltas = TaskRollupSnapshot.ComputeDeltas(before, after);
+
+        // Assert
+        deltas.Should().BeEmpty();
+    }
+}
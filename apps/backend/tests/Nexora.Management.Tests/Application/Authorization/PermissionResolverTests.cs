@@ -0,0 +1,131 @@
+using FluentAssertions;
+using Nexora.Management.Application.Authorization;
+using Nexora.Management.Domain.Entities;
+using Nexora.Management.Tests.Helpers;
+using Task = System.Threading.Tasks.Task;
+
+namespace Nexora.Management.Tests.Application.Authorization;
+
+public class PermissionResolverTests : TestBase
+{
+    private readonly TestDataBuilder _dataBuilder;
+    private readonly PermissionCache _cache;
+    private readonly PermissionResolver _resolver;
+
+    public PermissionResolverTests()
+    {
+        _dataBuilder = new TestDataBuilder(DbContext);
+        _cache = new PermissionCache(new PermissionCacheSettings { MaxEntries = 100, TimeToLiveSeconds = 300 });
+        _resolver = new PermissionResolver(DbContext, _cache);
+    }
+
+    private async Task<(User User, Workspace Workspace, Role Role)> SeedMemberWithPermissionAsync(string resource, string action)
+    {
+        var user = _dataBuilder.CreateUser();
+        var workspace = _dataBuilder.CreateWorkspace(user.Id);
+        var role = _dataBuilder.CreateRole($"Role {Guid.NewGuid()}");
+        var permission = _dataBuilder.CreatePermission(resource, action);
+        await SaveChangesAsync();
+
+        DbContext.RolePermissions.Add(new RolePermission { RoleId = role.Id, PermissionId = permission.Id });
+        _dataBuilder.AddWorkspaceMember(workspace.Id, user.Id, role.Id);
+        await SaveChangesAsync();
+
+        return (user, workspace, role);
+    }
+
+    [Fact]
+    public async Task HasPermissionAsync_MemberWithPermission_ReturnsTrue()
+    {
+        // Arrange
+        var (user, _, _) = await SeedMemberWithPermissionAsync("tasks", "create");
+
+        // Act
+        var result = await _resolver.HasPermissionAsync(user.Id, "tasks", "create");
+
+        // Assert
+        result.Should().BeTrue();
+    }
+
+    [Fact]
+    public async Task HasPermissionAsync_MissingPermission_ReturnsFalse()
+    {
+        // Arrange
+        var (user, _, _) = await SeedMemberWithPermissionAsync("tasks", "read");
+
+        // Act
+        var result = await _resolver.HasPermissionAsync(user.Id, "tasks", "delete");
+
+        // Assert
+        result.Should().BeFalse();
+    }
+
+    [Fact]
+    public async Task HasPermissionAsync_SecondCall_IsServedFromCache()
+    {
+        // Arrange
+        var (user, _, _) = await SeedMemberWithPermissionAsync("tasks", "create");
+
+        // Act
+        await _resolver.HasPermissionAsync(user.Id, "tasks", "create");
+        await _resolver.HasPermissionAsync(user.Id, "tasks", "update");
+
+        // Assert
+        var stats = _cache.GetStatistics();
+        stats.Misses.Should().Be(1);
+        stats.Hits.Should().Be(1);
+        stats.Count.Should().Be(1);
+    }
+
+    [Fact]
+    public async Task InvalidateUser_AfterMembershipRemoved_ReloadsPermissions()
+    {
+        // Arrange
+        var (user, workspace, _) = await SeedMemberWithPermissionAsync("tasks", "create");
+        (await _resolver.HasPermissionAsync(user.Id, "tasks", "create")).Should().BeTrue();
+
+        var member = DbContext.WorkspaceMembers.Single(wm => wm.UserId == user.Id && wm.WorkspaceId == workspace.Id);
+        DbContext.WorkspaceMembers.Remove(member);
+        await SaveChangesAsync();
+
+        // Act
+        _cache.InvalidateUser(user.Id);
+        var result = await _resolver.HasPermissionAsync(user.Id, "tasks", "create");
+
+        // Assert
+        result.Should().BeFalse();
+        _cache.GetStatistics().Misses.Should().Be(2);
+    }
+
+    [Fact]
+    public async Task InvalidateWorkspace_DropsEntriesOfWorkspaceMembers()
+    {
+        // Arrange
+        var (user, workspace, _) = await SeedMemberWithPermissionAsync("tasks", "create");
+        await _resolver.GetPermissionsAsync(user.Id);
+
+        // Act
+        _cache.InvalidateWorkspace(workspace.Id);
+
+        // Assert
+        _cache.GetStatistics().Count.Should().Be(0);
+    }
+
+    [Fact]
+    public async Task GetOrLoadAsync_WhenFull_EvictsLeastRecentlyUsed()
+    {
+        // Arrange
+        var cache = new PermissionCache(new PermissionCacheSettings { MaxEntries = 2, TimeToLiveSeconds = 300 });
+        var first = Guid.NewGuid();
+
+        // Act
+        await cache.GetOrLoadAsync(first, _ => Task.FromResult(UserPermissionSet.Empty));
+        await cache.GetOrLoadAsync(Guid.NewGuid(), _ => Task.FromResult(UserPermissionSet.Empty));
+        await cache.GetOrLoadAsync(Guid.NewGuid(), _ => Task.FromResult(UserPermissionSet.Empty));
+
+        // Assert
+        var stats = cache.GetStatistics();
+        stats.Count.Should().Be(2);
+        stats.Evictions.Should().Be(1);
+    }
+}
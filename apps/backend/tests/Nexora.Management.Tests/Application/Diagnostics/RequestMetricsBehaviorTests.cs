@@ -0,0 +1,107 @@
+using FluentAssertions;
+using MediatR;
+using Microsoft.Extensions.Logging.Abstractions;
+using Nexora.Management.Application.Diagnostics;
+using Nexora.Management.Infrastructure.Persistence;
+
+namespace Nexora.Management.Tests.Application.Diagnostics;
+
+public class RequestMetricsBehaviorTests
+{
+    private record PingQuery(int Value) : IRequest<int>;
+
+    private static RequestMetricsBehavior<PingQuery, int> CreateBehavior(RequestMetricsRegistry registry, RequestMetricsSettings settings) =>
+        new(registry, settings, NullLogger<RequestMetricsBehavior<PingQuery, int>>.Instance);
+
+    [Fact]
+    public async Task Handle_RecordsEachRequestUnderItsTypeName()
+    {
+        // Arrange
+        var registry = new RequestMetricsRegistry();
+        var behavior = CreateBehavior(registry, new RequestMetricsSettings());
+
+        // Act
+        await behavior.Handle(new PingQuery(1), _ => Task.FromResult(1), CancellationToken.None);
+        await behavior.Handle(new PingQuery(2), _ => Task.FromResult(2), CancellationToken.None);
+
+        // Assert
+        var metrics = registry.GetSnapshot().Should().ContainSingle().Subject;
+        metrics.RequestName.Should().Be(nameof(PingQuery));
+        metrics.DurationMilliseconds.Count.Should().Be(2);
+        metrics.Queries.Sum.Should().Be(0);
+        metrics.Failures.Should().Be(0);
+        metrics.SlowRequests.Should().Be(0);
+    }
+
+    [Fact]
+    public async Task Handle_HandlerThrows_CountsFailureAndRethrows()
+    {
+        // Arrange
+        var registry = new RequestMetricsRegistry();
+        var behavior = CreateBehavior(registry, new RequestMetricsSettings());
+
+        // Act
+        var act = () => behavior.Handle(new PingQuery(1), _ => throw new InvalidOperationException("boom"), CancellationToken.None);
+
+        // Assert
+        await act.Should().ThrowAsync<InvalidOperationException>();
+        registry.GetSnapshot().Single().Failures.Should().Be(1);
+    }
+
+    [Fact]
+    public async Task Handle_OverLatencyThreshold_CountsSlowRequest()
+    {
+        // Arrange
+        var registry = new RequestMetricsRegistry();
+        var behavior = CreateBehavior(registry, new RequestMetricsSettings { SlowRequestMilliseconds = -1 });
+
+        // Act
+        await behavior.Handle(new PingQuery(1), _ => Task.FromResult(1), CancellationToken.None);
+
+        // Assert
+        registry.GetSnapshot().Single().SlowRequests.Should().Be(1);
+    }
+
+    [Fact]
+    public async Task Handle_RunsHandlerInsideItsOwnQueryScope()
+    {
+        // Arrange
+        var behavior = CreateBehavior(new RequestMetricsRegistry(), new RequestMetricsSettings());
+        using var outer = QueryScope.Begin();
+        QueryScope? inner = null;
+
+        // Act
+        await behavior.Handle(new PingQuery(1), _ =>
+        {
+            inner = QueryScope.Current;
+            return Task.FromResult(1);
+        }, CancellationToken.None);
+
+        // Assert
+        inner.Should().NotBeNull().And.NotBeSameAs(outer);
+        QueryScope.Current.Should().BeSameAs(outer);
+    }
+
+    [Fact]
+    public void Histogram_BoundsAreInclusiveAndQuantileReportsBucketBound()
+    {
+        // Arrange
+        var histogram = new MetricHistogram(new double[] { 1, 10, 100 });
+
+        // Act
+        foreach (var value in new double[] { 0.5, 1, 5, 10, 50, 500 })
+        {
+            histogram.Record(value);
+        }
+
+        var snapshot = histogram.Snapshot();
+
+        // Assert
+        snapshot.BucketCounts.Should().Equal(2, 2, 1, 1);
+        snapshot.Count.Should().Be(6);
+        snapshot.Sum.Should().Be(566.5);
+        snapshot.Quantile(0.5).Should().Be(10);
+        snapshot.Quantile(0.8).Should().Be(100);
+        snapshot.Quantile(1).Should().Be(100);
+    }
+}
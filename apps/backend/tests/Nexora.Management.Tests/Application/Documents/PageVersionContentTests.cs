@@ -0,0 +1,114 @@
+using System.Text.Json;
+using System.Text.Json.Nodes;
+using FluentAssertions;
+using Nexora.Management.Application.Documents.Versioning;
+using Nexora.Management.Domain.Entities;
+
+namespace Nexora.Management.Tests.Application.Documents;
+
+public class PageVersionContentTests
+{
+    private const string Keyframe = """
+        {"type":"doc","content":[
+            {"type":"heading","attrs":{"level":1},"content":[{"type":"text","text":"Release plan"}]},
+            {"type":"paragraph","content":[{"type":"text","text":"Ship the beta to internal users first, then widen the rollout."}]},
+            {"type":"paragraph","content":[{"type":"text","text":"Collect feedback in the tracker and triage it weekly."}]},
+            {"type":"paragraph","content":[{"type":"text","text":"Freeze features two weeks before the public launch."}]}
+        ]}
+        """;
+
+    private static string Edit(string json, Action<JsonNode> edit)
+    {
+        var node = JsonNode.Parse(json)!;
+        edit(node);
+        return node.ToJsonString();
+    }
+
+    private static void ShouldBeSameJson(JsonDocument actual, string expected)
+    {
+        JsonNode.DeepEquals(JsonNode.Parse(actual.RootElement.GetRawText()), JsonNode.Parse(expected))
+            .Should().BeTrue($"expected {expected} but got {actual.RootElement.GetRawText()}");
+    }
+
+    [Theory]
+    [InlineData("typo")]
+    [InlineData("insert")]
+    [InlineData("remove")]
+    [InlineData("attrs")]
+    public void EncodeDelta_ThenDecode_RoundTripsContent(string change)
+    {
+        // Arrange
+        var edited = Edit(Keyframe, doc =>
+        {
+            var blocks = doc["content"]!.AsArray();
+            switch (change)
+            {
+                case "typo":
+                    blocks[2]!["content"]![0]!["text"] = "Collect feedback in the tracker and triage it daily.";
+                    break;
+                case "insert":
+                    blocks.Insert(1, JsonNode.Parse("""{"type":"paragraph","content":[{"type":"text","text":"Owner: platform team"}]}"""));
+                    break;
+                case "remove":
+                    blocks.RemoveAt(3);
+                    break;
+                case "attrs":
+                    blocks[0]!["attrs"]!.AsObject().Remove("level");
+                    blocks[0]!["attrs"]!["align"] = "center";
+                    break;
+            }
+        });
+
+        using var keyframe = JsonDocument.Parse(Keyframe);
+        using var content = JsonDocument.Parse(edited);
+
+        // Act
+        var delta = PageVersionContent.EncodeDelta(keyframe, content, maxDeltaRatio: 0.5);
+
+        // Assert
+        delta.Should().NotBeNull();
+        delta!.RootElement.GetRawText().Length.Should().BeLessThan(edited.Length / 2);
+        ShouldBeSameJson(PageVersionContent.Decode(keyframe, delta), edited);
+    }
+
+    [Fact]
+    public void EncodeDelta_UnrelatedContent_ReturnsNullSoAKeyframeIsStored()
+    {
+        // Arrange
+        using var keyframe = JsonDocument.Parse(Keyframe);
+        using var content = JsonDocument.Parse("""{"type":"doc","content":[]}""");
+
+        // Act
+        var delta = PageVersionContent.EncodeDelta(keyframe, content, maxDeltaRatio: 0.5);
+
+        // Assert
+        delta.Should().BeNull();
+    }
+
+    [Fact]
+    public void Resolve_DeltaWhoseKeyframeWasReencoded_FollowsTheChain()
+    {
+        // Arrange
+        var pageId = Guid.NewGuid();
+        var second = Edit(Keyframe, doc => doc["content"]![1]!["content"]![0]!["text"] = "Ship the beta to everyone.");
+        var third = Edit(second, doc => doc["content"]!.AsArray().RemoveAt(0));
+
+        using var first = JsonDocument.Parse(Keyframe);
+        using var secondDocument = JsonDocument.Parse(second);
+        using var thirdDocument = JsonDocument.Parse(third);
+
+        var versions = new Dictionary<int, PageVersion>
+        {
+            [1] = new() { PageId = pageId, VersionNumber = 1, IsKeyframe = true, KeyframeVersionNumber = 1, Content = first },
+            // Version 2 was a keyframe when version 3 was diffed against it, then compacted into a diff
+            [2] = new() { PageId = pageId, VersionNumber = 2, IsKeyframe = false, KeyframeVersionNumber = 1, Content = PageVersionContent.EncodeDelta(first, secondDocument, 1)! },
+            [3] = new() { PageId = pageId, VersionNumber = 3, IsKeyframe = false, KeyframeVersionNumber = 2, Content = PageVersionContent.EncodeDelta(secondDocument, thirdDocument, 1)! }
+        };
+
+        // Act
+        var resolved = PageVersionContent.Resolve(versions[3], versions);
+
+        // Assert
+        ShouldBeSameJson(resolved, third);
+    }
+}
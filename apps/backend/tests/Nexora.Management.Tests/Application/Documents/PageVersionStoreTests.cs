@@ -0,0 +1,217 @@
+using System.Text.Json;
+using System.Text.Json.Nodes;
+using FluentAssertions;
+using Nexora.Management.Application.Documents.Versioning;
+using Nexora.Management.Domain.Entities;
+
+namespace Nexora.Management.Tests.Application.Documents;
+
+public class PageVersionStoreTests
+{
+    private const string Keyframe = """
+        {"type":"doc","content":[
+            {"type":"heading","attrs":{"level":1},"content":[{"type":"text","text":"Release plan"}]},
+            {"type":"paragraph","content":[{"type":"text","text":"Ship the beta to internal users first, then widen the rollout."}]},
+            {"type":"paragraph","content":[{"type":"text","text":"Collect feedback in the tracker and triage it weekly."}]},
+            {"type":"paragraph","content":[{"type":"text","text":"Freeze features two weeks before the public launch."}]}
+        ]}
+        """;
+
+    private static readonly PageVersionSettings Settings = new()
+    {
+        CoalesceWindowMinutes = 10,
+        KeyframeInterval = 3,
+        MaxDeltaRatio = 0.5
+    };
+
+    private static readonly DateTime Start = new(2026, 1, 5, 9, 0, 0, DateTimeKind.Utc);
+
+    private static readonly Guid Alice = Guid.NewGuid();
+    private static readonly Guid Bob = Guid.NewGuid();
+
+    private static string Revision(int revision)
+    {
+        var node = JsonNode.Parse(Keyframe)!;
+        node["content"]![2]!["content"]![0]!["text"] = $"Collect feedback in the tracker and triage it (revision {revision}).";
+        return node.ToJsonString();
+    }
+
+    private static PageVersion NewVersion(int versionNumber, Guid userId, int minute) => new()
+    {
+        VersionNumber = versionNumber,
+        CommitMessage = PageVersionStore.EditCommitMessagePrefix,
+        CreatedBy = userId,
+        CreatedAt = Start.AddMinutes(minute)
+    };
+
+    // Encodes one edit autosave per save, as CaptureAsync does without coalescing
+    private static List<PageVersion> History(params (Guid UserId, int Minute, string Content)[] saves)
+    {
+        var versions = new List<PageVersion>();
+        JsonDocument? keyframe = null;
+        var keyframeNumber = 0;
+
+        foreach (var (userId, minute, content) in saves)
+        {
+            var version = NewVersion(versions.Count + 1, userId, minute);
+            var document = JsonDocument.Parse(content);
+            var withinInterval = version.VersionNumber - keyframeNumber < Settings.KeyframeInterval;
+
+            PageVersionStore.Encode(version, document, withinInterval ? keyframe : null, keyframeNumber, Settings.MaxDeltaRatio);
+
+            if (version.IsKeyframe)
+            {
+                keyframe = document;
+                keyframeNumber = version.VersionNumber;
+            }
+
+            versions.Add(version);
+        }
+
+        return versions;
+    }
+
+    private static void ShouldResolveToOriginals(IEnumerable<PageVersion> survivors, IReadOnlyDictionary<int, string> originals)
+    {
+        var versionsByNumber = survivors.ToDictionary(v => v.VersionNumber);
+        foreach (var version in versionsByNumber.Values)
+        {
+            var resolved = PageVersionContent.Resolve(version, versionsByNumber);
+            JsonNode.DeepEquals(JsonNode.Parse(resolved.RootElement.GetRawText()), JsonNode.Parse(originals[version.VersionNumber]))
+                .Should().BeTrue($"version {version.VersionNumber} should still resolve to its original content");
+        }
+    }
+
+    [Theory]
+    [InlineData(true, true, 5, true)]
+    [InlineData(false, true, 5, false)]
+    [InlineData(true, false, 5, false)]
+    [InlineData(true, true, 10, false)]
+    public void ShouldCoalesce_OnlySameUserUninterruptedInsideWindow(
+        bool latestBySameUser,
+        bool pageLastUpdatedBySameUser,
+        int minutesSinceLatest,
+        bool expected)
+    {
+        // Arrange
+        var now = Start.AddMinutes(minutesSinceLatest);
+
+        // Act
+        var coalesce = PageVersionStore.ShouldCoalesce(
+            Alice,
+            pageLastUpdatedBySameUser ? Alice : Bob,
+            latestBySameUser ? Alice : Bob,
+            Start,
+            now,
+            Settings);
+
+        // Assert
+        coalesce.Should().Be(expected);
+    }
+
+    [Fact]
+    public void Encode_DiffLargerThanMaxDeltaRatio_StoresKeyframe()
+    {
+        // Arrange
+        using var keyframe = JsonDocument.Parse(Keyframe);
+        using var rewritten = JsonDocument.Parse("""{"type":"doc","content":[{"type":"paragraph","content":[{"type":"text","text":"Cancelled."}]}]}""");
+        var version = NewVersion(5, Alice, 0);
+
+        // Act
+        PageVersionStore.Encode(version, rewritten, keyframe, keyframeVersionNumber: 1, Settings.MaxDeltaRatio);
+
+        // Assert
+        version.IsKeyframe.Should().BeTrue();
+        version.KeyframeVersionNumber.Should().Be(5);
+        version.Content.Should().BeSameAs(rewritten);
+    }
+
+    [Fact]
+    public void Encode_SmallDiff_StoresDiffAgainstKeyframe()
+    {
+        // Arrange
+        using var keyframe = JsonDocument.Parse(Keyframe);
+        using var edited = JsonDocument.Parse(Revision(1));
+        var version = NewVersion(2, Alice, 0);
+
+        // Act
+        PageVersionStore.Encode(version, edited, keyframe, keyframeVersionNumber: 1, Settings.MaxDeltaRatio);
+
+        // Assert
+        version.IsKeyframe.Should().BeFalse();
+        version.KeyframeVersionNumber.Should().Be(1);
+        var decoded = PageVersionContent.Decode(keyframe, version.Content);
+        JsonNode.DeepEquals(JsonNode.Parse(decoded.RootElement.GetRawText()), JsonNode.Parse(Revision(1)))
+            .Should().BeTrue();
+    }
+
+    [Fact]
+    public void Compact_MergesSameUserAutosavesInsideWindow_AndKeepsSurvivorsResolvable()
+    {
+        // Arrange: version 7 starts the segment the latest version depends on
+        var saves = new (Guid UserId, int Minute, string Content)[]
+        {
+            (Alice, 0, Revision(1)),
+            (Alice, 1, Revision(2)),
+            (Alice, 2, Revision(3)),
+            (Bob, 30, Revision(4)),
+            (Alice, 31, Revision(5)),
+            (Alice, 32, Revision(6)),
+            (Bob, 60, Revision(7)),
+            (Bob, 61, Revision(8))
+        };
+        var versions = History(saves);
+        var originals = Enumerable.Range(1, saves.Length).ToDictionary(n => n, n => saves[n - 1].Content);
+
+        // Act
+        var compaction = PageVersionStore.Compact(versions, Settings);
+
+        // Assert
+        compaction.Removed.Select(v => v.VersionNumber).Should().Equal(2, 3, 6);
+        compaction.Result.Versions.Should().Be(8);
+        compaction.Result.VersionsRemoved.Should().Be(3);
+        ShouldResolveToOriginals(versions.Except(compaction.Removed), originals);
+    }
+
+    [Fact]
+    public void Compact_NeverRemovesVersionThatFrozenDiffsDependOn()
+    {
+        // Arrange: version 2 would merge into version 1, but version 3 is a diff against it
+        // and belongs to the latest version's segment, as left by a concurrent compaction
+        var contents = new Dictionary<int, string>
+        {
+            [1] = Keyframe,
+            [2] = Revision(2),
+            [3] = Revision(3),
+            [4] = Revision(4)
+        };
+        var documents = contents.ToDictionary(c => c.Key, c => JsonDocument.Parse(c.Value));
+
+        var v1 = NewVersion(1, Alice, 0);
+        v1.Content = documents[1];
+        v1.KeyframeVersionNumber = 1;
+
+        var v2 = NewVersion(2, Alice, 1);
+        v2.Content = documents[2];
+        v2.KeyframeVersionNumber = 2;
+
+        var v3 = NewVersion(3, Alice, 2);
+        v3.Content = PageVersionContent.EncodeDelta(documents[2], documents[3], 1)!;
+        v3.IsKeyframe = false;
+        v3.KeyframeVersionNumber = 2;
+
+        var v4 = NewVersion(4, Alice, 3);
+        v4.Content = PageVersionContent.EncodeDelta(documents[3], documents[4], 1)!;
+        v4.IsKeyframe = false;
+        v4.KeyframeVersionNumber = 3;
+
+        var versions = new List<PageVersion> { v1, v2, v3, v4 };
+
+        // Act
+        var compaction = PageVersionStore.Compact(versions, Settings);
+
+        // Assert
+        compaction.Removed.Should().BeEmpty();
+        ShouldResolveToOriginals(versions, contents);
+    }
+}
@@ -0,0 +1,48 @@
+using FluentAssertions;
+using Nexora.Management.Application.Search;
+
+namespace Nexora.Management.Tests.Application.Search;
+
+public class SearchCursorTests
+{
+    [Fact]
+    public void Encode_ThenDecode_RoundTripsRankExactly()
+    {
+        // Arrange
+        var cursor = new SearchCursor(0.123456789f, Guid.NewGuid());
+
+        // Act
+        var token = cursor.Encode();
+        var decoded = SearchCursor.TryDecode(token, out var result);
+
+        // Assert
+        decoded.Should().BeTrue();
+        result.Should().Be(cursor);
+        token.Should().NotContainAny("+", "/", "=");
+    }
+
+    [Theory]
+    [InlineData("not-a-cursor")]
+    [InlineData("bm9waXBl")]
+    [InlineData("")]
+    [InlineData(null)]
+    public void TryDecode_WithInvalidToken_ReturnsFalse(string? token)
+    {
+        // Act
+        var decoded = SearchCursor.TryDecode(token, out var result);
+
+        // Assert
+        decoded.Should().BeFalse();
+        result.Should().BeNull();
+    }
+
+    [Fact]
+    public void EscapeLikePattern_EscapesWildcards()
+    {
+        // Act
+        var escaped = SearchIndex.EscapeLikePattern(@"50%_off\now");
+
+        // Assert
+        escaped.Should().Be(@"50\%\_off\\now");
+    }
+}
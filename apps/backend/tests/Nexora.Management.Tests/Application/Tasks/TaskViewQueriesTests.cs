@@ -0,0 +1,128 @@
+using FluentAssertions;
+using Nexora.Management.Application.Tasks.DTOs;
+using Nexora.Management.Application.Tasks.Queries.ViewQueries;
+using Nexora.Management.Domain.Entities;
+using Nexora.Management.Tests.Helpers;
+using DomainTask = Nexora.Management.Domain.Entities.Task;
+using Task = System.Threading.Tasks.Task;
+
+namespace Nexora.Management.Tests.Application.Tasks;
+
+public class TaskViewQueriesTests : TestBase
+{
+    private async Task<TaskList> CreateTaskListAsync(long changeVersion = 10, long tombstoneFloorVersion = 0)
+    {
+        var taskList = new TaskList
+        {
+            SpaceId = Guid.NewGuid(),
+            OwnerId = Guid.NewGuid(),
+            Name = "Sprint",
+            ChangeVersion = changeVersion,
+            TombstoneFloorVersion = tombstoneFloorVersion
+        };
+        DbContext.TaskLists.Add(taskList);
+        await SaveChangesAsync();
+        return taskList;
+    }
+
+    private static GanttTaskDto GanttTask(Guid id, Guid? parentId = null) =>
+        new(id, $"Task {id}", null, null, 0, null, "medium", parentId, new List<GanttTaskDto>());
+
+    [Fact]
+    public void BuildTree_NestsChildrenInPositionOrder()
+    {
+        // Arrange
+        var root = Guid.NewGuid();
+        var child1 = Guid.NewGuid();
+        var child2 = Guid.NewGuid();
+        var grandchild = Guid.NewGuid();
+        var tasks = new List<GanttTaskDto>
+        {
+            GanttTask(grandchild, child1),
+            GanttTask(root),
+            GanttTask(child1, root),
+            GanttTask(child2, root)
+        };
+
+        // Act
+        var tree = GetGanttViewQueryHandler.BuildTree(tasks);
+
+        // Assert
+        tree.Should().ContainSingle().Which.Id.Should().Be(root);
+        tree[0].Children.Select(c => c.Id).Should().Equal(child1, child2);
+        tree[0].Children[0].Children.Should().ContainSingle().Which.Id.Should().Be(grandchild);
+    }
+
+    [Fact]
+    public void BuildTree_TaskWithParentOutsideList_IsRoot()
+    {
+        // Arrange
+        var orphan = Guid.NewGuid();
+        var tasks = new List<GanttTaskDto> { GanttTask(orphan, Guid.NewGuid()) };
+
+        // Act
+        var tree = GetGanttViewQueryHandler.BuildTree(tasks);
+
+        // Assert
+        tree.Should().ContainSingle().Which.Id.Should().Be(orphan);
+    }
+
+    [Fact]
+    public async Task GetBoardView_WithoutSince_ReturnsFullSnapshotAtCurrentVersion()
+    {
+        // Arrange
+        var taskList = await CreateTaskListAsync(changeVersion: 42);
+        DbContext.Tasks.Add(new DomainTask { TaskListId = taskList.Id, Title = "Card", Description = "Long text" });
+        await SaveChangesAsync();
+        var handler = new GetBoardViewQueryHandler(DbContext);
+
+        // Act
+        var result = await handler.Handle(new GetBoardViewQuery(taskList.Id), CancellationToken);
+
+        // Assert
+        result.IsSuccess.Should().BeTrue();
+        result.Value!.Version.Should().Be(42);
+        result.Value.IsFullSnapshot.Should().BeTrue();
+        result.Value.Tasks.Should().ContainSingle(t => t.Title == "Card");
+        result.Value.RemovedTaskIds.Should().BeEmpty();
+    }
+
+    [Fact]
+    public async Task GetBoardView_WithSince_ReturnsRemovalsAfterThatVersion()
+    {
+        // Arrange
+        var taskList = await CreateTaskListAsync(changeVersion: 20);
+        var removedBefore = Guid.NewGuid();
+        var removedAfter = Guid.NewGuid();
+        DbContext.TaskTombstones.AddRange(
+            new TaskTombstone { TaskListId = taskList.Id, TaskId = removedBefore, ChangeVersion = 5 },
+            new TaskTombstone { TaskListId = taskList.Id, TaskId = removedAfter, ChangeVersion = 15 });
+        await SaveChangesAsync();
+        var handler = new GetBoardViewQueryHandler(DbContext);
+
+        // Act
+        var result = await handler.Handle(new GetBoardViewQuery(taskList.Id, SinceVersion: 10), CancellationToken);
+
+        // Assert
+        result.IsSuccess.Should().BeTrue();
+        result.Value!.IsFullSnapshot.Should().BeFalse();
+        result.Value.RemovedTaskIds.Should().Equal(removedAfter);
+    }
+
+    [Theory]
+    [InlineData(4)]   // older than pruned tombstones
+    [InlineData(25)]  // ahead of the server
+    public async Task ResolveAsync_WithUnusableSince_FallsBackToFullSnapshot(long since)
+    {
+        // Arrange
+        var taskList = await CreateTaskListAsync(changeVersion: 20, tombstoneFloorVersion: 5);
+
+        // Act
+        var sync = await TaskViewSync.ResolveAsync(DbContext, taskList.Id, since, CancellationToken);
+
+        // Assert
+        sync.Should().NotBeNull();
+        sync!.IsFullSnapshot.Should().BeTrue();
+        sync.Version.Should().Be(20);
+    }
+}
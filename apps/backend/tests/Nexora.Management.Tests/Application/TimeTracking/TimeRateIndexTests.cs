@@ -0,0 +1,69 @@
+using FluentAssertions;
+using Nexora.Management.Application.TimeTracking.Reporting;
+using Nexora.Management.Domain.Entities;
+
+namespace Nexora.Management.Tests.Application.TimeTracking;
+
+public class TimeRateIndexTests
+{
+    private static readonly Guid UserId = Guid.NewGuid();
+    private static readonly Guid ProjectId = Guid.NewGuid();
+    private static readonly DateTime January = new(2026, 1, 1, 0, 0, 0, DateTimeKind.Utc);
+
+    private static TimeRate Rate(decimal hourlyRate, DateTime from, DateTime? to = null, Guid? userId = null, Guid? projectId = null) =>
+        new() { UserId = userId, ProjectId = projectId, HourlyRate = hourlyRate, EffectiveFrom = from, EffectiveTo = to };
+
+    [Fact]
+    public void Resolve_OverlappingRates_UsesHighestRateInForce()
+    {
+        // Arrange
+        var index = TimeRateIndex.Build(new[]
+        {
+            Rate(80m, January, userId: UserId),
+            Rate(120m, January.AddDays(10), January.AddDays(19), projectId: ProjectId),
+            Rate(100m, January.AddDays(15), userId: UserId, projectId: ProjectId)
+        });
+
+        // Act & Assert
+        index.Resolve(UserId, ProjectId, January.AddDays(5)).Should().Be(80m);
+        index.Resolve(UserId, ProjectId, January.AddDays(12)).Should().Be(120m);
+        index.Resolve(UserId, ProjectId, January.AddDays(19)).Should().Be(120m);
+        index.Resolve(UserId, ProjectId, January.AddDays(20)).Should().Be(100m);
+        index.Resolve(UserId, null, January.AddDays(12)).Should().Be(80m);
+    }
+
+    [Fact]
+    public void Resolve_NoMatchingRate_FallsBackToDefault()
+    {
+        // Arrange
+        var index = TimeRateIndex.Build(new[]
+        {
+            Rate(80m, January, userId: Guid.NewGuid()),
+            Rate(90m, January.AddDays(10), userId: UserId)
+        });
+
+        // Act & Assert
+        index.Resolve(UserId, ProjectId, January).Should().Be(TimeRateIndex.DefaultHourlyRate);
+    }
+
+    [Fact]
+    public void TryResolveConstant_RateChangeInsideRange_ReturnsFalse()
+    {
+        // Arrange
+        var changeAt = January.AddDays(3).AddHours(12);
+        var index = TimeRateIndex.Build(new[]
+        {
+            Rate(80m, January, changeAt.AddTicks(-1), userId: UserId),
+            Rate(95m, changeAt, userId: UserId)
+        });
+
+        // Act
+        var morning = index.TryResolveConstant(UserId, null, January.AddDays(3), January.AddDays(3).AddHours(11), out var morningRate);
+        var wholeDay = index.TryResolveConstant(UserId, null, January.AddDays(3), January.AddDays(3).AddHours(17), out _);
+
+        // Assert
+        morning.Should().BeTrue();
+        morningRate.Should().Be(80m);
+        wholeDay.Should().BeFalse();
+    }
+}
@@ -0,0 +1,237 @@
+using System.Security.Cryptography;
+using System.Text;
+using FluentAssertions;
+using Microsoft.Extensions.Configuration;
+using Nexora.Management.Infrastructure.Services;
+using Task = System.Threading.Tasks.Task;
+
+namespace Nexora.Management.Tests.Infrastructure.Services;
+
+public class LocalFileStorageServiceTests : IDisposable
+{
+    private readonly string _basePath = Path.Combine(Path.GetTempPath(), $"nexora-storage-tests-{Guid.NewGuid():N}");
+    private readonly InMemoryBlobReferenceStore _blobs = new();
+    private readonly LocalFileStorageService _storage;
+
+    public LocalFileStorageServiceTests()
+    {
+        var configuration = new ConfigurationBuilder()
+            .AddInMemoryCollection(new Dictionary<string, string?> { ["Storage:BasePath"] = _basePath })
+            .Build();
+
+        _storage = new LocalFileStorageService(configuration, _blobs);
+    }
+
+    public void Dispose()
+    {
+        if (Directory.Exists(_basePath))
+        {
+            Directory.Delete(_basePath, recursive: true);
+        }
+    }
+
+    [Fact]
+    public async Task StoreAsync_HashesContentAndRecordsSize()
+    {
+        // Arrange
+        var content = Encoding.UTF8.GetBytes("quarterly report");
+        var expectedHash = Convert.ToHexStringLower(SHA256.HashData(content));
+
+        // Act
+        var stored = await _storage.StoreAsync(new MemoryStream(content), maxBytes: 1024);
+
+        // Assert
+        stored.ContentHash.Should().Be(expectedHash);
+        stored.SizeBytes.Should().Be(content.Length);
+        _blobs.References[expectedHash].Should().Be(1);
+        _blobs.Sizes[expectedHash].Should().Be(content.Length);
+    }
+
+    [Fact]
+    public async Task StoreAsync_LaysOutBlobsByHashPrefix()
+    {
+        // Act
+        var stored = await _storage.StoreAsync(new MemoryStream(Encoding.UTF8.GetBytes("layout")), maxBytes: 1024);
+
+        // Assert
+        var hash = stored.ContentHash;
+        stored.FilePath.Should().Be(Path.Combine("blobs", hash[..2], hash[2..4], hash));
+        File.Exists(Path.Combine(_basePath, stored.FilePath)).Should().BeTrue();
+        _storage.GetFileInfo(stored.FilePath, "layout.txt")!.SizeBytes.Should().Be(stored.SizeBytes);
+    }
+
+    [Fact]
+    public async Task StoreAsync_OverMaxBytes_ThrowsAndStoresNothing()
+    {
+        // Act
+        var act = () => _storage.StoreAsync(new MemoryStream(new byte[11]), maxBytes: 10);
+
+        // Assert
+        (await act.Should().ThrowAsync<FileTooLargeException>()).Which.MaxBytes.Should().Be(10);
+        _blobs.References.Should().BeEmpty();
+        Directory.EnumerateFiles(_basePath, "*", SearchOption.AllDirectories).Should().BeEmpty();
+    }
+
+    [Fact]
+    public async Task StoreAsync_IdenticalContent_IsStoredOnce()
+    {
+        // Arrange
+        var content = Encoding.UTF8.GetBytes("same bytes");
+
+        // Act
+        var first = await _storage.StoreAsync(new MemoryStream(content), maxBytes: 1024);
+        var second = await _storage.StoreAsync(new MemoryStream(content), maxBytes: 1024);
+
+        // Assert
+        second.FilePath.Should().Be(first.FilePath);
+        _blobs.References[first.ContentHash].Should().Be(2);
+        Directory.EnumerateFiles(Path.Combine(_basePath, "blobs"), "*", SearchOption.AllDirectories)
+            .Should().ContainSingle();
+    }
+
+    [Fact]
+    public async Task ReleaseAsync_KeepsBlobUntilLastReferenceIsReleased()
+    {
+        // Arrange
+        var content = Encoding.UTF8.GetBytes("shared attachment");
+        var stored = await _storage.StoreAsync(new MemoryStream(content), maxBytes: 1024);
+        await _storage.StoreAsync(new MemoryStream(content), maxBytes: 1024);
+        var blobPath = Path.Combine(_basePath, stored.FilePath);
+
+        // Act
+        await _storage.ReleaseAsync(stored.FilePath, stored.ContentHash);
+        var existsAfterFirstRelease = File.Exists(blobPath);
+        await _storage.ReleaseAsync(stored.FilePath, stored.ContentHash);
+
+        // Assert
+        existsAfterFirstRelease.Should().BeTrue();
+        File.Exists(blobPath).Should().BeFalse();
+        _blobs.References.Should().NotContainKey(stored.ContentHash);
+    }
+
+    [Fact]
+    public async Task ReleaseAsync_WithoutContentHash_DeletesLegacyFile()
+    {
+        // Arrange
+        var legacyPath = Path.Combine(_basePath, "legacy.pdf");
+        await File.WriteAllBytesAsync(legacyPath, new byte[3]);
+
+        // Act
+        await _storage.ReleaseAsync(legacyPath, contentHash: null);
+
+        // Assert
+        File.Exists(legacyPath).Should().BeFalse();
+    }
+
+    [Fact]
+    public async Task AppendUploadAsync_ChunksInOrder_AdvancesReceivedBytes()
+    {
+        // Arrange
+        var session = await _storage.BeginUploadAsync(Guid.NewGuid(), Guid.NewGuid(), "report.pdf", "application/pdf", 10);
+
+        // Act
+        var first = await _storage.AppendUploadAsync(session, 0, new MemoryStream(new byte[6]));
+        var afterFirst = await _storage.GetUploadAsync(session.UploadId);
+        var second = await _storage.AppendUploadAsync(afterFirst!, 6, new MemoryStream(new byte[4]));
+        var afterSecond = await _storage.GetUploadAsync(session.UploadId);
+
+        // Assert
+        first.Should().BeTrue();
+        second.Should().BeTrue();
+        afterFirst!.ReceivedBytes.Should().Be(6);
+        afterSecond!.ReceivedBytes.Should().Be(10);
+        afterSecond.FileName.Should().Be("report.pdf");
+    }
+
+    [Fact]
+    public async Task AppendUploadAsync_WrongOffset_IsRejectedWithoutWriting()
+    {
+        // Arrange
+        var session = await _storage.BeginUploadAsync(Guid.NewGuid(), Guid.NewGuid(), "report.pdf", null, 10);
+        await _storage.AppendUploadAsync(session, 0, new MemoryStream(new byte[4]));
+
+        // Act: a retried first chunk after the server already received it
+        var accepted = await _storage.AppendUploadAsync(session, 0, new MemoryStream(new byte[4]));
+        var current = await _storage.GetUploadAsync(session.UploadId);
+
+        // Assert
+        accepted.Should().BeFalse();
+        current!.ReceivedBytes.Should().Be(4);
+    }
+
+    [Fact]
+    public async Task AppendUploadAsync_BeyondDeclaredSize_ThrowsAndKeepsPreviousChunks()
+    {
+        // Arrange
+        var session = await _storage.BeginUploadAsync(Guid.NewGuid(), Guid.NewGuid(), "report.pdf", null, 10);
+        await _storage.AppendUploadAsync(session, 0, new MemoryStream(new byte[6]));
+
+        // Act
+        var act = () => _storage.AppendUploadAsync(session, 6, new MemoryStream(new byte[8]));
+
+        // Assert
+        await act.Should().ThrowAsync<FileTooLargeException>();
+        (await _storage.GetUploadAsync(session.UploadId))!.ReceivedBytes.Should().Be(6);
+    }
+
+    [Fact]
+    public async Task DeleteStaleUploads_RemovesOnlyInactiveUploads()
+    {
+        // Arrange
+        var stale = await _storage.BeginUploadAsync(Guid.NewGuid(), Guid.NewGuid(), "old.pdf", null, 10);
+        var active = await _storage.BeginUploadAsync(Guid.NewGuid(), Guid.NewGuid(), "new.pdf", null, 10);
+        var staleTime = DateTime.UtcNow.AddDays(-2);
+        foreach (var file in Directory.EnumerateFiles(Path.Combine(_basePath, "uploads"), $"{stale.UploadId:N}.*"))
+        {
+            File.SetLastWriteTimeUtc(file, staleTime);
+        }
+
+        // Act
+        var deleted = _storage.DeleteStaleUploads(TimeSpan.FromDays(1));
+
+        // Assert
+        deleted.Should().Be(1);
+        (await _storage.GetUploadAsync(stale.UploadId)).Should().BeNull();
+        (await _storage.GetUploadAsync(active.UploadId)).Should().NotBeNull();
+    }
+
+    /// <summary>
+    /// Reference counts as file_blobs keeps them, without a database
+    /// </summary>
+    private sealed class InMemoryBlobReferenceStore : IFileBlobReferenceStore
+    {
+        public Dictionary<string, int> References { get; } = new();
+
+        public Dictionary<string, long> Sizes { get; } = new();
+
+        public Task AddReferenceAsync(string contentHash, long sizeBytes, CancellationToken ct = default)
+        {
+            References[contentHash] = References.GetValueOrDefault(contentHash) + 1;
+            Sizes.TryAdd(contentHash, sizeBytes);
+            return Task.CompletedTask;
+        }
+
+        public Task<int?> ReleaseReferenceAsync(string contentHash, CancellationToken ct = default)
+        {
+            if (!References.TryGetValue(contentHash, out var count) || count == 0)
+            {
+                return Task.FromResult<int?>(null);
+            }
+
+            References[contentHash] = count - 1;
+            return Task.FromResult<int?>(count - 1);
+        }
+
+        public Task<bool> DeleteIfUnreferencedAsync(string contentHash, CancellationToken ct = default)
+        {
+            if (References.GetValueOrDefault(contentHash, -1) != 0)
+            {
+                return Task.FromResult(false);
+            }
+
+            References.Remove(contentHash);
+            Sizes.Remove(contentHash);
+            return Task.FromResult(true);
+        }
+    }
+}
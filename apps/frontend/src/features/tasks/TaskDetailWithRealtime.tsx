@@ -1,6 +1,7 @@
 "use client";
 
 import { useEffect, useState } from "react";
+import { useQueryClient } from "@tanstack/react-query";
 import { useTaskHub } from "@/hooks/signalr/useTaskHub";
 import { usePresenceHub } from "@/hooks/signalr/usePresenceHub";
 import { ViewingAvatars } from "@/features/tasks/ViewingAvatars";
@@ -50,6 +51,7 @@ export function TaskDetailWithRealtime({
     leaveProject,
     listeners: taskListeners
   } = useTaskHub();
+  const queryClient = useQueryClient();
 
   // Initialize PresenceHub for user presence
   const {
@@ -72,6 +74,17 @@ export function TaskDetailWithRealtime({
     };
   }, [taskId, projectId, taskHubConnected, joinProject, leaveProject, joinViewing, leaveViewing]);
 
+  // Events were dropped server-side under load; refetch the tasklist instead of trusting local deltas
+  useEffect(() => {
+    const unsubscribe = taskListeners.onResyncRequired((taskListId) => {
+      if (taskListId === projectId) {
+        queryClient.invalidateQueries({ queryKey: ["tasks", projectId] });
+      }
+    });
+
+    return unsubscribe;
+  }, [taskListeners, projectId, queryClient]);
+
   // Register TaskUpdated listener
   useEffect(() => {
     const unsubscribe = taskListeners.onTaskUpdated((message) => {
@@ -1,6 +1,7 @@
 "use client";
 
 import { useEffect, useState } from "react";
+import { useQueryClient } from "@tanstack/react-query";
 import { BoardView } from "./BoardView";
 import { useTaskHub } from "@/hooks/signalr/useTaskHub";
 import { usePresenceHub } from "@/hooks/signalr/usePresenceHub";
@@ -19,13 +20,14 @@ export function BoardViewWithRealtime({
   const [typingUsers, setTypingUsers] = useState<Array<{ id: string; name: string; timestamp: Date }>>([]);
   const [viewingUsers, setViewingUsers] = useState<Array<{ id: string; name: string; email?: string }>>([]);
 
-  // Initialize TaskHub for real-time task updates
+  // Initialize TaskHub for real-time task updates (binary protocol: boards receive the most traffic)
   const {
     isConnected: taskHubConnected,
     joinProject,
     leaveProject,
     listeners: taskListeners
-  } = useTaskHub();
+  } = useTaskHub(undefined, { protocol: 'messagepack' });
+  const queryClient = useQueryClient();
 
   // Initialize PresenceHub for user presence
   const {
@@ -47,6 +49,17 @@ export function BoardViewWithRealtime({
     };
   }, [projectId, taskHubConnected, joinProject, leaveProject, joinViewing, leaveViewing]);
 
+  // Events were dropped server-side under load; refetch the tasklist instead of trusting local deltas
+  useEffect(() => {
+    const unsubscribe = taskListeners.onResyncRequired((taskListId) => {
+      if (taskListId === projectId) {
+        queryClient.invalidateQueries({ queryKey: ["tasks", projectId] });
+      }
+    });
+
+    return unsubscribe;
+  }, [taskListeners, projectId, queryClient]);
+
   // Register TaskCreated listener
   useEffect(() => {
     const unsubscribe = taskListeners.onTaskCreated((message) => {
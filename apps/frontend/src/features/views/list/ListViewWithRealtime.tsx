@@ -1,6 +1,7 @@
 "use client";
 
 import { useEffect, useState } from "react";
+import { useQueryClient } from "@tanstack/react-query";
 import { ListView } from "./ListView";
 import { useTaskHub } from "@/hooks/signalr/useTaskHub";
 import { usePresenceHub } from "@/hooks/signalr/usePresenceHub";
@@ -26,6 +27,7 @@ export function ListViewWithRealtime({
     leaveProject,
     listeners: taskListeners
   } = useTaskHub();
+  const queryClient = useQueryClient();
 
   // Initialize PresenceHub for user presence
   const {
@@ -47,6 +49,17 @@ export function ListViewWithRealtime({
     };
   }, [projectId, taskHubConnected, joinProject, leaveProject, joinViewing, leaveViewing]);
 
+  // Events were dropped server-side under load; refetch the tasklist instead of trusting local deltas
+  useEffect(() => {
+    const unsubscribe = taskListeners.onResyncRequired((taskListId) => {
+      if (taskListId === projectId) {
+        queryClient.invalidateQueries({ queryKey: ["tasks", projectId] });
+      }
+    });
+
+    return unsubscribe;
+  }, [taskListeners, projectId, queryClient]);
+
   // Register TaskCreated listener
   useEffect(() => {
     const unsubscribe = taskListeners.onTaskCreated((message) => {
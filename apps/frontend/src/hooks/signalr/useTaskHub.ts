@@ -1,9 +1,20 @@
 import { useEffect, useRef, useState, useCallback } from 'react';
 import { TaskHubConnection } from '@/lib/signalr/task-hub';
-import type { TaskUpdatedMessage, ConnectionState } from '@/lib/signalr/types';
+import type {
+  TaskUpdatedMessage,
+  TasksChangedMessage,
+  ConnectionState,
+  HubProtocolName,
+} from '@/lib/signalr/types';
 import { useAuth } from '@/features/auth/providers/auth-provider';
 
-export function useTaskHub(projectId?: string) {
+export interface UseTaskHubOptions {
+  // 'messagepack' negotiates the binary hub protocol; busy boards should prefer it
+  protocol?: HubProtocolName;
+}
+
+export function useTaskHub(projectId?: string, options: UseTaskHubOptions = {}) {
+  const { protocol = 'json' } = options;
   const { token } = useAuth();
   const hubRef = useRef<TaskHubConnection | null>(null);
   const [connectionState, setConnectionState] = useState<ConnectionState>('disconnected');
@@ -13,7 +24,7 @@ export function useTaskHub(projectId?: string) {
     if (!token || hubRef.current) return;
 
     try {
-      const hub = new TaskHubConnection(token);
+      const hub = new TaskHubConnection(token, { protocol });
       hubRef.current = hub;
 
       await hub.start();
@@ -26,7 +37,7 @@ export function useTaskHub(projectId?: string) {
       console.error('Failed to connect to TaskHub:', error);
       setConnectionState('disconnected');
     }
-  }, [token, currentProject]);
+  }, [token, currentProject, protocol]);
 
   const stopConnection = useCallback(async () => {
     if (hubRef.current) {
@@ -57,6 +68,14 @@ export function useTaskHub(projectId?: string) {
     }
   }, [currentProject]);
 
+  const onTasksChanged = useCallback((callback: (message: TasksChangedMessage) => void) => {
+    hubRef.current?.onTasksChanged(callback);
+  }, []);
+
+  const onResyncRequired = useCallback((callback: (taskListId: string) => void) => {
+    return hubRef.current?.onResyncRequired(callback);
+  }, []);
+
   const onTaskUpdated = useCallback((callback: (message: TaskUpdatedMessage) => void) => {
     hubRef.current?.onTaskUpdated(callback);
   }, []);
@@ -96,6 +115,8 @@ export function useTaskHub(projectId?: string) {
     joinProject,
     leaveProject: stopConnection,
     listeners: {
+      onTasksChanged,
+      onResyncRequired,
       onTaskUpdated,
       onTaskCreated,
       onTaskDeleted,
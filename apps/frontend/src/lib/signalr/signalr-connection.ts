@@ -1,10 +1,13 @@
 import * as signalR from '@microsoft/signalr';
-import type { ConnectionState } from './types';
+import { MessagePackHubProtocol } from '@microsoft/signalr-protocol-msgpack';
+import type { ConnectionState, HubProtocolName } from './types';
 
 export interface SignalRConnectionOptions {
   url: string;
   accessToken?: string;
   automaticReconnect?: boolean;
+  /** Wire format; 'messagepack' is binary and smaller, 'json' (default) is readable in devtools */
+  protocol?: HubProtocolName;
   onReconnecting?: (error?: Error) => void;
   onReconnected?: (connectionId?: string) => void;
   onClose?: (error?: Error) => void;
@@ -27,12 +30,18 @@ export class SignalRConnection {
     this.state = 'connecting';
 
     try {
-      this.connection = new signalR.HubConnectionBuilder()
+      const builder = new signalR.HubConnectionBuilder()
         .withUrl(this.options.url, {
           accessTokenFactory: () => this.options.accessToken || '',
           skipNegotiation: false,
           withCredentials: true,
-        })
+        });
+
+      if (this.options.protocol === 'messagepack') {
+        builder.withHubProtocol(new MessagePackHubProtocol());
+      }
+
+      this.connection = builder
         .withAutomaticReconnect({
           nextRetryDelayInMilliseconds: (retryContext) => {
             // Exponential backoff: 0s, 2s, 10s, 30s, then 60s
@@ -102,6 +111,10 @@ export class SignalRConnection {
     return this.state;
   }
 
+  getProtocol(): HubProtocolName {
+    return this.options.protocol ?? 'json';
+  }
+
   getConnectionId(): string | undefined {
     return this.connection?.connectionId ?? undefined;
   }
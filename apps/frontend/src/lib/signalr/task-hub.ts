@@ -1,12 +1,68 @@
 import { SignalRConnection } from './signalr-connection';
-import type { TaskUpdatedMessage } from './types';
+import type {
+  HubProtocolName,
+  TaskChangeEvent,
+  TaskUpdatedMessage,
+  TasksChangedMessage,
+} from './types';
+
+export interface TaskHubConnectionOptions {
+  protocol?: HubProtocolName;
+}
+
+type ChangeCallback = (message: unknown) => void;
+
+// MessagePack payloads keep the server's PascalCase property names; JSON payloads are camelCase
+function camelizeKeys(value: unknown): unknown {
+  if (Array.isArray(value)) {
+    return value.map(camelizeKeys);
+  }
+  if (value && typeof value === 'object' && !(value instanceof Date)) {
+    return Object.fromEntries(
+      Object.entries(value).map(([key, item]) => [
+        key.charAt(0).toLowerCase() + key.slice(1),
+        camelizeKeys(item),
+      ])
+    );
+  }
+  return value;
+}
 
 export class TaskHubConnection extends SignalRConnection {
-  constructor(accessToken: string) {
+  private changeCallbacks = new Map<TaskChangeEvent, ChangeCallback[]>();
+  private batchCallbacks: Array<(message: TasksChangedMessage) => void> = [];
+  private resyncCallbacks: Array<(taskListId: string) => void> = [];
+
+  constructor(accessToken: string, options: TaskHubConnectionOptions = {}) {
     super({
       url: `${process.env.NEXT_PUBLIC_API_URL}/hubs/tasks`,
       accessToken,
       automaticReconnect: true,
+      protocol: options.protocol,
+    });
+  }
+
+  async start(): Promise<void> {
+    await super.start();
+
+    // The server only sends batches; fan each change out to the per-event listeners
+    this.off('TasksChanged');
+    this.on('TasksChanged', (...args: unknown[]) => {
+      if (!args[0]) return;
+
+      const batch = (
+        this.getProtocol() === 'messagepack' ? camelizeKeys(args[0]) : args[0]
+      ) as TasksChangedMessage;
+
+      this.batchCallbacks.forEach((callback) => callback(batch));
+      batch.changes.forEach((change) => {
+        this.changeCallbacks.get(change.event)?.forEach((callback) => callback(change.message));
+      });
+
+      // Events for this tasklist were dropped under load, so the deltas above are incomplete
+      if (batch.resyncRequired) {
+        this.resyncCallbacks.forEach((callback) => callback(batch.taskListId));
+      }
     });
   }
 
@@ -18,35 +74,37 @@ export class TaskHubConnection extends SignalRConnection {
     await this.invoke('LeaveProject', projectId);
   }
 
+  onTasksChanged(callback: (message: TasksChangedMessage) => void): void {
+    this.batchCallbacks.push(callback);
+  }
+
+  // Called with the tasklist whose view must be refetched; returns an unsubscribe function
+  onResyncRequired(callback: (taskListId: string) => void): () => void {
+    this.resyncCallbacks.push(callback);
+    return () => {
+      this.resyncCallbacks = this.resyncCallbacks.filter((item) => item !== callback);
+    };
+  }
+
   onTaskUpdated(callback: (message: TaskUpdatedMessage) => void): void {
-    this.on('TaskUpdated', (...args: unknown[]) => {
-      if (args[0]) {
-        callback(args[0] as TaskUpdatedMessage);
-      }
-    });
+    this.onChange('TaskUpdated', callback);
   }
 
   onTaskCreated(callback: (message: TaskUpdatedMessage) => void): void {
-    this.on('TaskCreated', (...args: unknown[]) => {
-      if (args[0]) {
-        callback(args[0] as TaskUpdatedMessage);
-      }
-    });
+    this.onChange('TaskCreated', callback);
   }
 
   onTaskDeleted(callback: (message: TaskUpdatedMessage) => void): void {
-    this.on('TaskDeleted', (...args: unknown[]) => {
-      if (args[0]) {
-        callback(args[0] as TaskUpdatedMessage);
-      }
-    });
+    this.onChange('TaskDeleted', callback);
   }
 
   onStatusChanged(callback: (message: TaskUpdatedMessage) => void): void {
-    this.on('StatusChanged', (...args: unknown[]) => {
-      if (args[0]) {
-        callback(args[0] as TaskUpdatedMessage);
-      }
-    });
+    this.onChange('TaskStatusChanged', callback);
+  }
+
+  private onChange(event: TaskChangeEvent, callback: (message: TaskUpdatedMessage) => void): void {
+    const callbacks = this.changeCallbacks.get(event) ?? [];
+    callbacks.push(callback as ChangeCallback);
+    this.changeCallbacks.set(event, callbacks);
   }
 }
@@ -9,6 +9,31 @@ export interface TaskUpdatedMessage {
   data?: unknown;
 }
 
+export type TaskChangeEvent =
+  | 'TaskCreated'
+  | 'TaskUpdated'
+  | 'TaskDeleted'
+  | 'TaskStatusChanged'
+  | 'CommentAdded'
+  | 'CommentUpdated'
+  | 'CommentDeleted'
+  | 'AttachmentUploaded'
+  | 'AttachmentDeleted';
+
+export interface TaskChangeEntry {
+  event: TaskChangeEvent;
+  entityId: string;
+  message: unknown;
+}
+
+// Batched task changes for one tasklist; repeated changes to an entity are merged server-side
+export interface TasksChangedMessage {
+  taskListId: string;
+  changes: TaskChangeEntry[];
+  // Events were dropped under load; refetch the view instead of relying on this batch
+  resyncRequired: boolean;
+}
+
 export interface UserPresenceMessage {
   userId: string;
   userName: string;
@@ -42,3 +67,5 @@ export type ConnectionState =
   | 'connected'
   | 'reconnecting'
   | 'disconnecting';
+
+export type HubProtocolName = 'json' | 'messagepack';